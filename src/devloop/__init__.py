@@ -1,8 +1,25 @@
 """DevLoop - Background agents for development workflow automation."""
 
-from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any
 
-try:
-    __version__ = version("devloop")
-except PackageNotFoundError:
-    __version__ = "0.0.0.dev"
+if TYPE_CHECKING:
+    __version__: str
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``__version__`` on first use.
+
+    ``importlib.metadata`` is slow to import and most entry points never
+    need the version.
+    """
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        value = version("devloop")
+    except PackageNotFoundError:
+        value = "0.0.0.dev"
+    globals()["__version__"] = value
+    return value
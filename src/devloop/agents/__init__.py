@@ -1,19 +1,52 @@
 """Built-in agents."""
 
-from .agent_health_monitor import AgentHealthMonitorAgent
-from .ci_monitor import CIMonitorAgent
-from .code_rabbit import CodeRabbitAgent
-from .doc_lifecycle import DocLifecycleAgent
-from .echo import EchoAgent
-from .file_logger import FileLoggerAgent
-from .formatter import FormatterAgent
-from .git_commit_assistant import GitCommitAssistantAgent
-from .linter import LinterAgent
-from .performance_profiler import PerformanceProfilerAgent
-from .security_scanner import SecurityScannerAgent
-from .snyk import SnykAgent
-from .test_runner import TestRunnerAgent
-from .type_checker import TypeCheckerAgent
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .agent_health_monitor import AgentHealthMonitorAgent
+    from .ci_monitor import CIMonitorAgent
+    from .code_rabbit import CodeRabbitAgent
+    from .doc_lifecycle import DocLifecycleAgent
+    from .echo import EchoAgent
+    from .file_logger import FileLoggerAgent
+    from .formatter import FormatterAgent
+    from .git_commit_assistant import GitCommitAssistantAgent
+    from .linter import LinterAgent
+    from .performance_profiler import PerformanceProfilerAgent
+    from .security_scanner import SecurityScannerAgent
+    from .snyk import SnykAgent
+    from .test_runner import TestRunnerAgent
+    from .type_checker import TypeCheckerAgent
+
+# Exported name -> submodule defining it, imported on first access
+_LAZY_IMPORTS = {
+    "AgentHealthMonitorAgent": "agent_health_monitor",
+    "CIMonitorAgent": "ci_monitor",
+    "CodeRabbitAgent": "code_rabbit",
+    "DocLifecycleAgent": "doc_lifecycle",
+    "EchoAgent": "echo",
+    "FileLoggerAgent": "file_logger",
+    "FormatterAgent": "formatter",
+    "GitCommitAssistantAgent": "git_commit_assistant",
+    "LinterAgent": "linter",
+    "PerformanceProfilerAgent": "performance_profiler",
+    "SecurityScannerAgent": "security_scanner",
+    "SnykAgent": "snyk",
+    "TestRunnerAgent": "test_runner",
+    "TypeCheckerAgent": "type_checker",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name from its submodule on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "AgentHealthMonitorAgent",
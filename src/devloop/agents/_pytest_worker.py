@@ -0,0 +1,257 @@
+"""Long-lived pytest worker for TestRunnerAgent's warm-worker mode.
+
+This file runs in the project's interpreter and only needs the standard
+library and pytest. It is passed to ``python -c`` instead of being imported,
+so the worker does not load devloop or put this directory on ``sys.path``.
+
+Protocol: one JSON object per line. Requests are read from stdin; responses
+are written to the original stdout, while pytest's own output is discarded.
+
+    -> {"args": ["tests/test_app.py"], "reload": ["/abs/app.py"],
+        "order": ["tests/test_app.py::test_two"]}
+    <- {"event": "test", "test": "tests/test_app.py::test_two", ...}
+    <- {"event": "test", "test": "tests/test_app.py::test_one", ...}
+    <- {"ok": true, "exit_code": 0, "passed": 2, "failed": 0, ...}
+
+Each test's result is sent as an ``event`` line as soon as the test has
+finished, followed by the response with totals and every test's result.
+Collected tests listed in ``order`` run first, in that order.
+
+``reload`` lists files whose modules must be re-imported, normally the
+changed file and everything that imports it. Project modules that changed
+on disk without being listed cause the whole project to be re-imported;
+changed third-party or extension modules cannot be reloaded, so the worker
+answers ``{"ok": false, "recycle": "<reason>"}`` and should be replaced.
+"""
+
+import json
+import os
+import sys
+import time
+
+_EXTENSION_SUFFIXES = (".so", ".pyd")
+_ENVIRONMENT_PARTS = ("site-packages", "dist-packages")
+_MAX_FAILURE_TEXT = 4000
+
+
+def _stamp(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _is_test_file(path):
+    name = os.path.basename(path)
+    return (
+        name.startswith("test_") or name.endswith("_test.py") or name == "conftest.py"
+    )
+
+
+class _Collector:
+    """pytest plugin recording outcomes and reporting each test as it ends."""
+
+    def __init__(self, order=None, emit=None):
+        self.order = order or []
+        self.emit = emit
+        self.passed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.failures = []
+        self.tests = {}
+
+    def _failure(self, report, phase):
+        self.failed += 1
+        message = report.longreprtext[-_MAX_FAILURE_TEXT:]
+        self.failures.append(
+            {"test": report.nodeid, "phase": phase, "message": message}
+        )
+        return message
+
+    def pytest_collection_modifyitems(self, items):
+        if self.order:
+            rank = {nodeid: i for i, nodeid in enumerate(self.order)}
+            items.sort(key=lambda item: rank.get(item.nodeid, len(rank)))
+
+    def pytest_runtest_logreport(self, report):
+        test = self.tests.get(report.nodeid)
+        if test is None:
+            test = self.tests[report.nodeid] = {
+                "test": report.nodeid,
+                "outcome": "passed",
+                "duration": 0.0,
+                "line": (
+                    report.location[1] + 1 if report.location[1] is not None else None
+                ),
+            }
+        test["duration"] += report.duration
+
+        if report.failed:
+            message = self._failure(report, report.when)
+            if test["outcome"] != "failed":
+                test["outcome"] = "failed"
+                test["message"] = message
+        elif report.skipped:
+            self.skipped += 1
+            if test["outcome"] == "passed":
+                test["outcome"] = "skipped"
+        elif report.when == "call":
+            self.passed += 1
+
+        if report.when == "teardown" and self.emit:
+            self.emit(test)
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            message = self._failure(report, "collect")
+            if self.emit:
+                self.emit(
+                    {
+                        "test": report.nodeid,
+                        "outcome": "failed",
+                        "duration": 0.0,
+                        "line": None,
+                        "message": message,
+                    }
+                )
+
+
+class Worker:
+    """Tracks imported modules so each run sees current code."""
+
+    def __init__(self, project_root):
+        self.project_root = os.path.realpath(project_root)
+        # module name → (file, real path, is_project_file, (mtime, size))
+        self.modules = {}
+
+    def _is_project_file(self, real_path):
+        if not real_path.startswith(self.project_root + os.sep):
+            return False
+        parts = real_path[len(self.project_root) :].split(os.sep)
+        return not any(part in _ENVIRONMENT_PARTS for part in parts)
+
+    def record_modules(self):
+        """Remember the file and stamp of newly imported modules."""
+        for name, module in list(sys.modules.items()):
+            path = getattr(module, "__file__", None)
+            if not isinstance(path, str):
+                continue
+            known = self.modules.get(name)
+            if known is None or known[0] != path:
+                real = os.path.realpath(path)
+                self.modules[name] = (
+                    path,
+                    real,
+                    self._is_project_file(real),
+                    _stamp(path),
+                )
+
+    def prepare(self, reload_files):
+        """Drop modules that must be imported again before the next run.
+
+        Returns:
+            A reason to recycle the worker, or None
+        """
+        reload_files = {os.path.realpath(p) for p in reload_files or ()}
+        purge_project = False
+        purge = set()
+
+        for name, (path, real, is_project, stamp) in self.modules.items():
+            changed = _stamp(path) != stamp
+            if not is_project:
+                if changed:
+                    return f"{name} changed on disk"
+                continue
+            if path.endswith(_EXTENSION_SUFFIXES):
+                if changed:
+                    return f"extension module {name} changed"
+                continue
+            if _is_test_file(path) or real in reload_files:
+                purge.add(name)
+            elif changed:
+                purge_project = True
+
+        if purge_project:
+            purge = {
+                name
+                for name, (path, _, is_project, _) in self.modules.items()
+                if is_project and not path.endswith(_EXTENSION_SUFFIXES)
+            }
+        for name in purge:
+            sys.modules.pop(name, None)
+            del self.modules[name]
+        return None
+
+    def run(self, args, reload_files, order=None, emit=None):
+        recycle = self.prepare(reload_files)
+        if recycle:
+            return {"ok": False, "recycle": recycle}
+
+        import pytest
+
+        collector = _Collector(order, emit)
+        saved_path = list(sys.path)
+        start = time.monotonic()
+        try:
+            exit_code = int(pytest.main(list(args), plugins=[collector]))
+        finally:
+            sys.path[:] = saved_path
+            self.record_modules()
+        return {
+            "ok": True,
+            "exit_code": exit_code,
+            "passed": collector.passed,
+            "failed": collector.failed,
+            "skipped": collector.skipped,
+            "failures": collector.failures,
+            "tests": list(collector.tests.values()),
+            "duration": time.monotonic() - start,
+        }
+
+
+def main():
+    # Keep pytest output off the protocol stream
+    protocol = os.fdopen(os.dup(1), "w", buffering=1)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+
+    # Match the import path of the `pytest` command rather than `python -c`
+    if sys.path and sys.path[0] == "":
+        del sys.path[0]
+
+    def reply(message):
+        protocol.write(json.dumps(message) + "\n")
+
+    def report_test(test):
+        reply({"event": "test", **test})
+
+    try:
+        import pytest
+    except ImportError as e:
+        reply({"ok": False, "error": f"pytest not importable: {e}"})
+        return
+
+    worker = Worker(sys.argv[1] if len(sys.argv) > 1 else os.getcwd())
+    worker.record_modules()
+    reply({"ok": True, "ready": True, "pytest": pytest.__version__, "pid": os.getpid()})
+
+    for line in sys.stdin:
+        try:
+            request = json.loads(line)
+            response = worker.run(
+                request["args"],
+                request.get("reload"),
+                request.get("order"),
+                report_test,
+            )
+        except Exception as e:
+            response = {"ok": False, "recycle": f"worker error: {e!r}"}
+        reply(response)
+        if not response["ok"]:
+            return
+
+
+if __name__ == "__main__":
+    main()
@@ -67,7 +67,7 @@ class CodeRabbitAgent(Agent):
             performance_monitor=performance_monitor,
         )
         self.config = CodeRabbitConfig(config or {})
-        self._last_run: Dict[str, float] = {}  # path -> timestamp for debouncing
+        self.debounce_ms = self.config.debounce
 
     async def handle(self, event: Event) -> AgentResult:
         """Handle file change event by running Code Rabbit analysis."""
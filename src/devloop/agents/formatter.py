@@ -5,9 +5,16 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from devloop.agents.sandbox_helper import common_parent, stop_cancelled_process
 from devloop.core.agent import Agent, AgentResult
 from devloop.core.context_store import Finding, Severity
 from devloop.core.event import Event
+from devloop.core.result_cache import (
+    config_hash,
+    find_config_files,
+    result_cache,
+    tool_version,
+)
 
 
 class FormatterConfig:
@@ -44,6 +51,8 @@ class FormatterAgent(Agent):
     ):
         super().__init__(name, triggers, event_bus)
         self.config = FormatterConfig(config or {})
+        # Never stop black midway through rewriting a file
+        self.cancel_superseded = not self.config.format_on_save
 
         # Loop prevention mechanisms
         self._recent_formats: Dict[str, List[float]] = (
@@ -215,6 +224,134 @@ class FormatterAgent(Agent):
             )
             return result
 
+    async def handle_batch(self, events: List[Event]) -> List[AgentResult]:
+        """Format every black-handled file in the batch with one black invocation.
+
+        Files for other formatters, and anything :meth:`handle` would skip or
+        refuse, fall back to :meth:`handle`.
+        """
+        black_paths: Dict[str, Path] = {}
+        if self.config.format_on_save or self.config.report_only:
+            for event in events:
+                file_path = event.payload.get("path")
+                if not file_path:
+                    continue
+                path = Path(file_path)
+                if (
+                    not self._detect_formatting_loop(path)
+                    and self._should_format(path)
+                    and self._get_formatter_for_file(path) == "black"
+                ):
+                    black_paths[event.id] = path
+
+        statuses: Dict[Path, tuple[bool, Optional[str]]] = {}
+        if black_paths:
+            statuses = await self._run_black_batch(
+                list(dict.fromkeys(black_paths.values())),
+                check_only=self.config.report_only,
+            )
+
+        results = []
+        for event in events:
+            black_path = black_paths.get(event.id)
+            if black_path is None:
+                results.append(await self.handle(event))
+                continue
+
+            changed, error = statuses[black_path]
+            if self.config.report_only:
+                results.append(
+                    await self._report_only_result(black_path, changed, error)
+                )
+            else:
+                results.append(
+                    await self._batch_format_result(black_path, changed, error)
+                )
+        return results
+
+    async def _report_only_result(
+        self, path: Path, needs_formatting: bool, error: Optional[str]
+    ) -> AgentResult:
+        """Build the result for a file checked in report-only mode."""
+        formatter = "black"
+        if error:
+            message = f"Check failed for {path.name}: {error}"
+            success = False
+            await self._write_finding_to_context(
+                path=path,
+                formatter=formatter,
+                severity="error",
+                message=message,
+                blocking=True,
+            )
+        elif needs_formatting:
+            message = f"Would format {path.name} with {formatter} (report-only mode)"
+            success = True
+            await self._write_finding_to_context(
+                path=path,
+                formatter=formatter,
+                severity="info",
+                message=f"{path.name} needs formatting with {formatter}",
+                auto_fixable=True,
+            )
+        else:
+            message = f"No formatting needed for {path.name}"
+            success = True
+
+        return AgentResult(
+            agent_name=self.name,
+            success=success,
+            duration=0,
+            message=message,
+            data={
+                "file": str(path),
+                "formatter": formatter,
+                "needs_formatting": needs_formatting,
+                "report_only": True,
+            },
+            error=error,
+        )
+
+    async def _batch_format_result(
+        self, path: Path, reformatted: bool, error: Optional[str]
+    ) -> AgentResult:
+        """Build the result for a file formatted as part of a batch."""
+        if error:
+            message = f"Failed to format {path.name}: {error}"
+            await self._write_finding_to_context(
+                path=path,
+                formatter="black",
+                severity="error",
+                message=message,
+                blocking=True,
+            )
+            return AgentResult(
+                agent_name=self.name,
+                success=False,
+                duration=0,
+                message=message,
+                data={"file": str(path), "formatter": "black", "formatted": False},
+                error=error,
+            )
+
+        if not reformatted:
+            return AgentResult(
+                agent_name=self.name,
+                success=True,
+                duration=0,
+                message=f"{path.name} is already formatted",
+            )
+
+        # Record successful formatting operation for loop prevention
+        self._record_formatting_operation(path)
+        return AgentResult(
+            agent_name=self.name,
+            success=True,
+            duration=0,
+            message=f"Formatted {path.name} with black",
+            data={"file": str(path), "formatter": "black", "formatted": True},
+        )
+
     def _should_format(self, path: Path) -> bool:
         """Check if file should be formatted based on patterns."""
         if not path.exists():
@@ -408,6 +545,125 @@ class FormatterAgent(Agent):
         except FileNotFoundError:
             return False, "black command not found"
 
+    async def check_files(
+        self, paths: List[Path]
+    ) -> Dict[Path, tuple[bool, Optional[str]]]:
+        """Check whether Python files need formatting, without changing them.
+
+        Results cached by earlier runs on the same content are reused.
+
+        Returns:
+            Mapping of path to (needs_formatting, error)
+        """
+        return await self._run_black_batch(paths, check_only=True)
+
+    async def _run_black_batch(
+        self, paths: List[Path], check_only: bool = False
+    ) -> Dict[Path, tuple[bool, Optional[str]]]:
+        """Run black over several files, skipping files known to be formatted.
+
+        The result cache remembers, per file content, whether black would
+        change it. A file already known to be formatted is never passed to
+        black; one known to need formatting is still run in format mode.
+
+        Returns:
+            Mapping of path to (changed, error)
+        """
+        import os
+
+        env = os.environ.copy()
+        venv_bin = Path(__file__).parent.parent.parent.parent / ".venv" / "bin"
+        if venv_bin.exists():
+            env["PATH"] = f"{venv_bin}:{env.get('PATH', '')}"
+
+        version = await tool_version(["black", "--version"], env=env)
+        if not version:
+            return await self._invoke_black(paths, check_only, env)
+
+        settings = config_hash(
+            "black",
+            config_files=find_config_files(common_parent(paths), ("pyproject.toml",)),
+        )
+        lookup = await result_cache.lookup(self.name, version, settings, paths)
+        statuses: Dict[Path, tuple[bool, Optional[str]]] = {
+            path: (changed, None)
+            for path, changed in lookup.hits.items()
+            if check_only or not changed
+        }
+
+        to_run = [path for path in paths if path not in statuses]
+        if to_run:
+            fresh = await self._invoke_black(to_run, check_only, env)
+            await result_cache.store(
+                self.name,
+                lookup,
+                {
+                    path: changed
+                    for path, (changed, error) in fresh.items()
+                    if not error
+                },
+            )
+            statuses.update(fresh)
+
+        return statuses
+
+    async def _invoke_black(
+        self, paths: List[Path], check_only: bool, env: Dict[str, str]
+    ) -> Dict[Path, tuple[bool, Optional[str]]]:
+        """Run black once over several files.
+
+        black only rewrites files whose formatting changes and reports each of
+        them on stderr ("reformatted <path>", or "would reformat <path>" with
+        ``--check``), which is used to split the outcome back per file.
+        """
+        cmd = ["black", *(["--check"] if check_only else []), *map(str, paths)]
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=env,
+            )
+        except FileNotFoundError:
+            return {path: (False, "black command not found") for path in paths}
+        try:
+            _, stderr = await asyncio.wait_for(
+                proc.communicate(), timeout=self._format_timeout
+            )
+        except asyncio.CancelledError:
+            # Superseded by a newer run; don't leave black running
+            await stop_cancelled_process(proc, self.name)
+            raise
+        except asyncio.TimeoutError:
+            proc.kill()
+            error_msg = f"Formatter black timed out after {self._format_timeout}s"
+            self.logger.error(error_msg)
+            return {path: (False, error_msg) for path in paths}
+
+        changed_prefix = "would reformat " if check_only else "reformatted "
+        by_name = {str(path): path for path in paths}
+        statuses: Dict[Path, tuple[bool, Optional[str]]] = {
+            path: (False, None) for path in paths
+        }
+        for line in stderr.decode(errors="replace").splitlines():
+            if line.startswith(changed_prefix):
+                path = by_name.get(line[len(changed_prefix) :].strip())
+                if path is not None:
+                    statuses[path] = (True, None)
+            elif line.lower().startswith("error:"):
+                # "error: cannot format <path>: ..." / "Error: cannot parse: <path>:..."
+                name = max((n for n in by_name if n in line), key=len, default=None)
+                if name is not None:
+                    statuses[by_name[name]] = (False, line)
+
+        # Exit code 123 is an internal error; anything else unexpected means
+        # no file was processed
+        if proc.returncode not in (0, 1, 123):
+            error = stderr.decode(errors="replace").strip() or "Unknown error"
+            return {path: (False, error) for path in paths}
+
+        return statuses
+
     async def _run_prettier(self, path: Path) -> tuple[bool, Optional[str]]:
         """Run prettier formatter on JavaScript/TypeScript/JSON/Markdown file."""
         try:
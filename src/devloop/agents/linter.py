@@ -1,16 +1,26 @@
 """Linter agent - runs linters on file changes."""
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from devloop.agents.sandbox_helper import create_agent_sandbox_helper
+from devloop.agents.sandbox_helper import common_parent, create_agent_sandbox_helper
 from devloop.core.agent import Agent, AgentResult
 from devloop.core.context_store import Finding, Severity
 from devloop.core.event import Event
+from devloop.core.result_cache import (
+    config_hash,
+    find_config_files,
+    result_cache,
+    tool_version,
+)
 from devloop.security.sandbox import CommandNotAllowedError, SandboxTimeoutError
 
+# Files ruff reads its settings from
+RUFF_CONFIG_FILES = ("pyproject.toml", "ruff.toml", ".ruff.toml")
+
 
 class LinterConfig:
     """Configuration for LinterAgent."""
@@ -53,6 +63,8 @@ class LinterResult:
 class LinterAgent(Agent):
     """Agent that runs linters on file changes."""
 
+    concurrent_handling = True
+
     def __init__(
         self,
         name: str,
@@ -70,13 +82,20 @@ class LinterAgent(Agent):
             performance_monitor=performance_monitor,
         )
         self.config = LinterConfig(config or {})
-        self._last_run: Dict[str, float] = {}  # path -> timestamp for debouncing
+        self.debounce_ms = self.config.debounce
+        # Never stop a --fix run midway through rewriting a file
+        self.cancel_superseded = not self.config.auto_fix
         # Initialize sandbox helper for secure command execution
         self.sandbox = create_agent_sandbox_helper(
             agent_name=name,
             agent_type="linter",
         )
 
+    async def stop(self) -> None:
+        """Stop the agent and release its sandbox."""
+        await super().stop()
+        await self.sandbox.close()
+
     async def handle(self, event: Event) -> AgentResult:
         """Handle file change event by running linter."""
         # Extract file path
@@ -120,6 +139,51 @@ class LinterAgent(Agent):
                 # Re-run linter to get updated results
                 result = await self._run_linter(linter, path)
 
+        return await self._build_result(path, linter, result)
+
+    async def handle_batch(self, events: List[Event]) -> List[AgentResult]:
+        """Lint every ruff-handled file in the batch with one ruff invocation.
+
+        Files for other linters fall back to :meth:`handle`.
+        """
+        ruff_paths: Dict[str, Path] = {}
+        for event in events:
+            file_path = event.payload.get("path")
+            if not file_path:
+                continue
+            path = Path(file_path)
+            if self._should_lint(path) and self._get_linter_for_file(path) == "ruff":
+                ruff_paths[event.id] = path
+
+        lint_results: Dict[Path, LinterResult] = {}
+        if ruff_paths:
+            paths = list(dict.fromkeys(ruff_paths.values()))
+            lint_results = await self._run_ruff_batch(paths)
+
+            # Auto-fix if configured and issues found
+            if self.config.auto_fix:
+                dirty = [p for p in paths if lint_results[p].has_issues]
+                if dirty:
+                    fix_result = await self._fix_ruff(dirty)
+                    if fix_result.success:
+                        # Re-run linter to get updated results
+                        lint_results.update(await self._run_ruff_batch(dirty))
+
+        results = []
+        for event in events:
+            ruff_path = ruff_paths.get(event.id)
+            if ruff_path is None:
+                results.append(await self.handle(event))
+            else:
+                results.append(
+                    await self._build_result(ruff_path, "ruff", lint_results[ruff_path])
+                )
+        return results
+
+    async def _build_result(
+        self, path: Path, linter: str, result: LinterResult
+    ) -> AgentResult:
+        """Turn a linter result into an agent result and record its findings."""
         # Build result message
         if result.error:
             message = f"Linter error on {path.name}: {result.error}"
@@ -202,51 +266,131 @@ class LinterAgent(Agent):
             self.logger.error(f"Error running {linter}: {e}")
             return LinterResult(success=False, error=str(e))
 
+    async def lint_files(self, paths: List[Path]) -> Dict[Path, LinterResult]:
+        """Lint Python files with ruff, reusing results cached for their content."""
+        return await self._run_ruff_batch(paths)
+
     async def _run_ruff(self, path: Path) -> LinterResult:
         """Run ruff on a Python file."""
-        try:
-            # Get venv path
-            venv_path = Path(__file__).parent.parent.parent.parent / ".venv"
+        return (await self._run_ruff_batch([path]))[path]
+
+    async def _run_ruff_batch(self, paths: List[Path]) -> Dict[Path, LinterResult]:
+        """Run ruff over several Python files, skipping files with cached results."""
+        version = await tool_version(["ruff", "--version"], env=self._ruff_env())
+        if not version:
+            return await self._invoke_ruff(paths)
+
+        settings = config_hash(
+            "ruff",
+            config_files=find_config_files(common_parent(paths), RUFF_CONFIG_FILES),
+        )
+        lookup = await result_cache.lookup(self.name, version, settings, paths)
+        results = {
+            path: LinterResult(success=True, issues=issues)
+            for path, issues in lookup.hits.items()
+        }
+
+        if lookup.misses:
+            fresh = await self._invoke_ruff(lookup.misses)
+            await result_cache.store(
+                self.name,
+                lookup,
+                {path: r.issues for path, r in fresh.items() if r.success},
+            )
+            results.update(fresh)
+
+        return {path: results[path] for path in paths}
 
+    async def _invoke_ruff(self, paths: List[Path]) -> Dict[Path, LinterResult]:
+        """Run ruff once over several Python files and split issues per file."""
+        try:
             # Check if ruff is available in the sandbox
             if not await self.sandbox.check_tool_available("ruff"):
-                return LinterResult(
-                    success=False, error="ruff not installed or not allowed"
+                return self._same_result(
+                    paths,
+                    LinterResult(
+                        success=False, error="ruff not installed or not allowed"
+                    ),
                 )
 
-            # Run ruff with JSON output in sandbox
-            if venv_path.exists():
-                result = await self.sandbox.run_sandboxed_with_venv(
-                    ["ruff", "check", "--output-format", "json", str(path)],
-                    venv_path=venv_path,
-                    cwd=path.parent,
+            cwd = common_parent(paths)
+            result = await self._run_ruff_command(
+                ["ruff", "check", "--output-format", "json", *map(str, paths)], cwd
+            )
+
+            # ruff exits 1 when it finds issues; anything else but 0 is an error
+            if result.exit_code not in (0, 1):
+                error = (result.stderr or result.stdout).strip()
+                return self._same_result(
+                    paths,
+                    LinterResult(
+                        success=False,
+                        error=error or f"ruff exited with code {result.exit_code}",
+                    ),
                 )
-            else:
-                result = await self.sandbox.run_sandboxed(
-                    ["ruff", "check", "--output-format", "json", str(path)],
-                    cwd=path.parent,
+
+            try:
+                issues = json.loads(result.stdout)
+            except json.JSONDecodeError:
+                issues = None
+            if not isinstance(issues, list):
+                return self._same_result(
+                    paths,
+                    LinterResult(success=False, error="ruff produced invalid output"),
                 )
 
-            # ruff returns non-zero if issues found, but that's expected
-            if result.stdout:
-                try:
-                    issues = json.loads(result.stdout)
-                    return LinterResult(success=True, issues=issues)
-                except json.JSONDecodeError:
-                    # No issues found or invalid JSON
-                    return LinterResult(success=True, issues=[])
-            else:
-                # No output = no issues
-                return LinterResult(success=True, issues=[])
+            if len(paths) == 1:
+                return {paths[0]: LinterResult(success=True, issues=issues)}
+
+            by_file: Dict[Path, List[Dict[str, Any]]] = {p: [] for p in paths}
+            resolved = {p.resolve(): p for p in paths}
+            for issue in issues:
+                owner = resolved.get((cwd / issue.get("filename", "")).resolve())
+                if owner is not None:
+                    by_file[owner].append(issue)
+
+            return {
+                p: LinterResult(success=True, issues=file_issues)
+                for p, file_issues in by_file.items()
+            }
 
         except CommandNotAllowedError as e:
             self.logger.error(f"ruff command not allowed in sandbox: {e}")
-            return LinterResult(success=False, error="ruff command not allowed")
+            return self._same_result(
+                paths, LinterResult(success=False, error="ruff command not allowed")
+            )
         except SandboxTimeoutError:
-            return LinterResult(success=False, error="ruff execution timeout")
+            return self._same_result(
+                paths, LinterResult(success=False, error="ruff execution timeout")
+            )
         except Exception as e:
             self.logger.error(f"Error running ruff in sandbox: {e}")
-            return LinterResult(success=False, error=str(e))
+            return self._same_result(paths, LinterResult(success=False, error=str(e)))
+
+    @staticmethod
+    def _ruff_env() -> Dict[str, str]:
+        """Environment with the project venv (if any) first on PATH."""
+        env = os.environ.copy()
+        venv_bin = Path(__file__).parent.parent.parent.parent / ".venv" / "bin"
+        if venv_bin.exists():
+            env["PATH"] = f"{venv_bin}:{env.get('PATH', '')}"
+        return env
+
+    async def _run_ruff_command(self, cmd: List[str], cwd: Path):
+        """Run a ruff command in the sandbox, using the project venv if present."""
+        venv_path = Path(__file__).parent.parent.parent.parent / ".venv"
+        if venv_path.exists():
+            return await self.sandbox.run_sandboxed_with_venv(
+                cmd, venv_path=venv_path, cwd=cwd
+            )
+        return await self.sandbox.run_sandboxed(cmd, cwd=cwd)
+
+    @staticmethod
+    def _same_result(
+        paths: List[Path], result: LinterResult
+    ) -> Dict[Path, LinterResult]:
+        """Map every path to one shared (error) result."""
+        return {path: result for path in paths}
 
     async def _run_eslint(self, path: Path) -> LinterResult:
         """Run eslint on a JavaScript/TypeScript file."""
@@ -286,25 +430,11 @@ class LinterAgent(Agent):
 
     async def _auto_fix(self, linter: str, path: Path) -> LinterResult:
         """Attempt to auto-fix issues."""
-        try:
-            # Get venv path
-            venv_path = Path(__file__).parent.parent.parent.parent / ".venv"
+        if linter == "ruff":
+            return await self._fix_ruff([path])
 
-            if linter == "ruff":
-                if venv_path.exists():
-                    await self.sandbox.run_sandboxed_with_venv(
-                        ["ruff", "check", "--fix", str(path)],
-                        venv_path=venv_path,
-                        cwd=path.parent,
-                    )
-                else:
-                    await self.sandbox.run_sandboxed(
-                        ["ruff", "check", "--fix", str(path)],
-                        cwd=path.parent,
-                    )
-                return LinterResult(success=True)
-
-            elif linter == "eslint":
+        try:
+            if linter == "eslint":
                 await self.sandbox.run_sandboxed(
                     ["eslint", "--fix", str(path)],
                     cwd=path.parent,
@@ -322,6 +452,23 @@ class LinterAgent(Agent):
             self.logger.error(f"Error during auto-fix in sandbox: {e}")
             return LinterResult(success=False, error=str(e))
 
+    async def _fix_ruff(self, paths: List[Path]) -> LinterResult:
+        """Apply ruff fixes to several files in one invocation."""
+        try:
+            await self._run_ruff_command(
+                ["ruff", "check", "--fix", *map(str, paths)], common_parent(paths)
+            )
+            return LinterResult(success=True)
+
+        except CommandNotAllowedError as e:
+            self.logger.error(f"Auto-fix command not allowed in sandbox: {e}")
+            return LinterResult(success=False, error="Auto-fix command not allowed")
+        except SandboxTimeoutError:
+            return LinterResult(success=False, error="Auto-fix execution timeout")
+        except Exception as e:
+            self.logger.error(f"Error during auto-fix in sandbox: {e}")
+            return LinterResult(success=False, error=str(e))
+
     async def _write_findings_to_context(
         self, path: Path, result: LinterResult, linter: str
     ) -> None:
@@ -332,6 +479,7 @@ class LinterAgent(Agent):
         from devloop.core.context_store import context_store
 
         # Convert each linter issue to a Finding
+        findings: List[Finding] = []
         for idx, issue in enumerate(result.issues):
             # Extract issue details (format varies by linter)
             if linter == "ruff":
@@ -384,7 +532,10 @@ class LinterAgent(Agent):
                 },
             )
 
-            try:
-                await context_store.add_finding(finding)
-            except Exception as e:
-                self.logger.error(f"Failed to write finding to context: {e}")
+            findings.append(finding)
+
+        # Store the whole run in one write
+        try:
+            await context_store.add_findings(findings)
+        except Exception as e:
+            self.logger.error(f"Failed to write findings to context: {e}")
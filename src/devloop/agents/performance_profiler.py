@@ -81,6 +81,8 @@ class PerformanceResult:
 class PerformanceProfilerAgent(Agent):
     """Agent for analyzing code performance and complexity."""
 
+    concurrent_handling = True
+
     def __init__(self, config: Dict[str, Any], event_bus):
         super().__init__(
             "performance-profiler", ["file:modified", "file:created"], event_bus
@@ -0,0 +1,407 @@
+"""pytest workers for TestRunnerAgent.
+
+A worker (see ``_pytest_worker.py``) runs pytest with a plugin that reports
+each test's outcome and duration as JSON while the run is in progress, so
+the test runner does not have to parse pytest's console output.
+
+Starting pytest costs interpreter startup, plugin loading and conftest and
+project imports before the first test runs. In warm-worker mode the test
+runner keeps long-lived workers that stay imported between runs and execute
+the selected tests on request. A worker that can no longer run current
+code, because a third-party or extension module changed, has crashed, or has
+served ``max_runs`` requests, is replaced by a fresh one. Without warm
+workers, each run uses a worker that is started for that run alone.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import shutil
+import signal
+import sys
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from devloop.core.performance import get_agent_process_registry
+
+logger = logging.getLogger(__name__)
+
+WORKER_SOURCE = (Path(__file__).parent / "_pytest_worker.py").read_text()
+
+# Response lines carry failure tracebacks
+_STREAM_LIMIT = 16 * 1024 * 1024
+
+# pytest exit codes that may be caused by stale worker state rather than by
+# the tests: interrupted (includes collection errors), internal error and
+# usage error
+_RETRY_EXIT_CODES = {2, 3, 4}
+
+# Called with each test's result while a run is in progress
+ResultCallback = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class WorkerError(Exception):
+    """A worker could not be started or stopped responding."""
+
+
+# Second line of the /bin/sh launcher pip writes when the interpreter path is
+# too long for a shebang
+_SH_LAUNCHER = re.compile(rb"^'''exec' (?:\"([^\"]+)\"|(\S+))")
+
+
+def _pytest_interpreter(path: Optional[str] = None) -> Optional[str]:
+    """Find the Python interpreter that runs the ``pytest`` on PATH.
+
+    Reads the interpreter from the script's shebang, so pytest installed in
+    a virtualenv or with pipx runs under the Python it was installed for.
+    Falls back to ``python3`` on PATH, then to the interpreter running
+    devloop.
+
+    Args:
+        path: PATH to search, defaults to the current PATH
+    """
+    script = shutil.which("pytest", path=path)
+    if script is not None:
+        try:
+            with open(script, "rb") as f:
+                lines = [f.readline(4096), f.readline(4096)]
+        except OSError:
+            lines = [b"", b""]
+        args = lines[0][2:].split() if lines[0].startswith(b"#!") else []
+        if args and os.path.basename(args[0]) == b"env" and len(args) > 1:
+            found = shutil.which(os.fsdecode(args[1]), path=path)
+            args = [os.fsencode(found)] if found else []
+        elif args and os.path.basename(args[0]) == b"sh":
+            launcher = _SH_LAUNCHER.match(lines[1])
+            args = [launcher.group(1) or launcher.group(2)] if launcher else []
+        if args and os.access(args[0], os.X_OK):
+            return os.fsdecode(args[0])
+    return shutil.which("python3", path=path) or sys.executable or None
+
+
+class PytestWorker:
+    """One long-lived pytest process."""
+
+    def __init__(
+        self,
+        project_root: Path,
+        env: Dict[str, str],
+        python: Optional[str] = None,
+        agent_name: str = "test-runner",
+    ):
+        self.project_root = project_root
+        self.env = env
+        self.python = python
+        self.agent_name = agent_name
+        self.runs = 0
+        self._process: Optional[asyncio.subprocess.Process] = None
+
+    @property
+    def pid(self) -> Optional[int]:
+        """PID of the worker process, if running."""
+        return self._process.pid if self._process else None
+
+    async def start(self, timeout: float = 30.0) -> None:
+        """Start the process and wait until pytest is imported.
+
+        Raises:
+            WorkerError: If the interpreter or pytest is unavailable
+        """
+        if self.python is not None:
+            python = shutil.which(self.python, path=self.env.get("PATH"))
+            if python is None:
+                raise WorkerError(f"{self.python} not found")
+        else:
+            python = _pytest_interpreter(self.env.get("PATH"))
+            if python is None:
+                raise WorkerError("no Python interpreter found")
+
+        self._process = await asyncio.create_subprocess_exec(
+            python,
+            "-c",
+            WORKER_SOURCE,
+            str(self.project_root),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            cwd=self.project_root,
+            env=self.env,
+            limit=_STREAM_LIMIT,
+        )
+        get_agent_process_registry().add(self.agent_name, self._process.pid)
+
+        try:
+            ready = await self._read(timeout)
+        except asyncio.CancelledError:
+            await self.close()
+            raise
+        if not ready.get("ok"):
+            await self.close()
+            raise WorkerError(ready.get("error", "worker failed to start"))
+
+    async def run(
+        self,
+        args: Sequence[str],
+        reload_files: Optional[Sequence[Path]] = None,
+        timeout: float = 600.0,
+        order: Optional[Sequence[str]] = None,
+        on_test: Optional[ResultCallback] = None,
+    ) -> Dict[str, Any]:
+        """Run pytest with args in the worker.
+
+        Args:
+            args: pytest command-line arguments, e.g. test node IDs
+            reload_files: Files whose modules must be re-imported first;
+                None lets the worker decide from modification times
+            timeout: Seconds to wait for the run to finish
+            order: Node IDs to run first, in this order
+            on_test: Awaited with each test's result as it arrives
+
+        Returns:
+            The worker's response (see ``_pytest_worker.py``)
+
+        Raises:
+            WorkerError: If the worker died or timed out
+            asyncio.CancelledError: If the caller was cancelled; the run is
+                interrupted first, and the worker stays usable if pytest
+                stops cleanly
+        """
+        if self._process is None or self._process.stdin is None:
+            raise WorkerError("worker not started")
+
+        request = {
+            "args": list(args),
+            "reload": (
+                [str(p) for p in reload_files] if reload_files is not None else None
+            ),
+            "order": list(order or []),
+        }
+        self.runs += 1
+        try:
+            self._process.stdin.write(json.dumps(request).encode() + b"\n")
+            await self._process.stdin.drain()
+        except (ConnectionError, RuntimeError) as e:
+            raise WorkerError(f"worker not accepting requests: {e}") from e
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        try:
+            while True:
+                message = await self._read(max(0.0, deadline - loop.time()))
+                if message.get("event") != "test":
+                    return message
+                if on_test is not None:
+                    await on_test(message)
+        except asyncio.CancelledError:
+            await self._interrupt()
+            raise
+
+    async def _interrupt(self, timeout: float = 5.0) -> None:
+        """Stop the run in progress, as Ctrl-C would.
+
+        pytest ends the session and the worker answers as usual; the answer
+        is discarded. Workers that do not recover are closed.
+        """
+        if self._process is None:
+            return
+        get_agent_process_registry().record_cancelled(self.agent_name)
+        try:
+            self._process.send_signal(signal.SIGINT)
+            while (await self._read(timeout)).get("event") == "test":
+                pass
+        except ProcessLookupError:
+            await self.close()
+        except WorkerError:
+            pass  # Already closed by _read
+
+    async def _read(self, timeout: float) -> Dict[str, Any]:
+        """Read one message line."""
+        assert self._process is not None and self._process.stdout is not None
+        try:
+            line = await asyncio.wait_for(self._process.stdout.readline(), timeout)
+        except asyncio.TimeoutError as e:
+            await self.close()
+            raise WorkerError(f"worker did not respond within {timeout}s") from e
+        except ValueError as e:
+            await self.close()
+            raise WorkerError(f"invalid worker response: {e}") from e
+
+        if not line:
+            await self.close()
+            raise WorkerError("worker exited")
+        try:
+            response = json.loads(line)
+        except ValueError as e:
+            await self.close()
+            raise WorkerError(f"invalid worker response: {e}") from e
+        return response if isinstance(response, dict) else {"ok": False}
+
+    async def close(self) -> None:
+        """Stop the worker process."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+
+        if process.returncode is None:
+            # Last CPU sample, while the worker can still be measured
+            get_agent_process_registry().measure(self.agent_name)
+            if process.stdin is not None:
+                process.stdin.close()
+            try:
+                await asyncio.wait_for(process.wait(), timeout=2.0)
+            except asyncio.TimeoutError:
+                process.terminate()
+                try:
+                    await asyncio.wait_for(process.wait(), timeout=2.0)
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+        get_agent_process_registry().remove(self.agent_name, process.pid)
+
+
+class PytestWorkerPool:
+    """Hands test runs to warm pytest workers, replacing stale ones.
+
+    Args:
+        project_root: Directory the workers run pytest in
+        env: Environment for the workers, including PATH
+        size: Number of workers kept warm
+        max_runs: Runs after which a worker is replaced
+        agent_name: Agent the worker processes are attributed to
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        env: Dict[str, str],
+        size: int = 1,
+        max_runs: int = 100,
+        agent_name: str = "test-runner",
+    ):
+        self.project_root = project_root
+        self.env = env
+        self.size = max(1, size)
+        self.max_runs = max_runs
+        self.agent_name = agent_name
+        # None marks a slot whose worker died; the next run starts a new one
+        self._idle: asyncio.Queue[Optional[PytestWorker]] = asyncio.Queue()
+        self._workers: List[PytestWorker] = []
+        self._started = False
+        self._start_lock = asyncio.Lock()
+        self.recycled = 0
+
+    async def start(self) -> None:
+        """Start the workers.
+
+        Raises:
+            WorkerError: If no worker could be started
+        """
+        async with self._start_lock:
+            if self._started:
+                return
+            for _ in range(self.size - len(self._workers)):
+                self._idle.put_nowait(await self._spawn())
+            self._started = True
+
+    async def run(
+        self,
+        args: Sequence[str],
+        reload_files: Optional[Sequence[Path]] = None,
+        order: Optional[Sequence[str]] = None,
+        on_test: Optional[ResultCallback] = None,
+    ) -> Dict[str, Any]:
+        """Run pytest on an idle worker.
+
+        Runs that a worker cannot serve with current code, or that end in an
+        error a fresh process might not hit, are retried once on a new
+        worker. See :meth:`PytestWorker.run` for the arguments.
+
+        Raises:
+            WorkerError: If no worker could run the tests
+        """
+        await self.start()
+        worker = await self._acquire()
+        try:
+            response = await self._attempt(worker, args, reload_files, order, on_test)
+            if not response.get("ok") or (
+                response.get("exit_code") in _RETRY_EXIT_CODES and worker.runs > 1
+            ):
+                reason = response.get("recycle") or (
+                    f"pytest exit code {response.get('exit_code')}"
+                )
+                logger.info(f"Replacing pytest worker {worker.pid}: {reason}")
+                worker = await self._replace(worker)
+                response = await self._attempt(
+                    worker, args, reload_files, order, on_test
+                )
+                if not response.get("ok"):
+                    raise WorkerError(response.get("recycle", "worker failed"))
+            if worker.runs >= self.max_runs:
+                try:
+                    worker = await self._replace(worker)
+                except WorkerError as e:
+                    logger.warning(f"Could not restart pytest worker: {e}")
+            return response
+        finally:
+            self._release(worker)
+
+    async def close(self) -> None:
+        """Stop all workers."""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            await worker.close()
+        self._idle = asyncio.Queue()
+        self._started = False
+
+    async def _acquire(self) -> PytestWorker:
+        """Get an idle worker, starting one in a slot freed by a dead worker."""
+        worker = await self._idle.get()
+        if worker is not None:
+            return worker
+        try:
+            return await self._spawn()
+        except BaseException:
+            # Leave the slot for the next run
+            self._idle.put_nowait(None)
+            raise
+
+    async def _spawn(self) -> PytestWorker:
+        """Start a new worker and add it to the pool."""
+        worker = PytestWorker(self.project_root, self.env, agent_name=self.agent_name)
+        await worker.start()
+        self._workers.append(worker)
+        return worker
+
+    async def _replace(self, worker: PytestWorker) -> PytestWorker:
+        """Close worker and start a fresh one in its place."""
+        await worker.close()
+        if worker in self._workers:
+            self._workers.remove(worker)
+        self.recycled += 1
+        return await self._spawn()
+
+    async def _attempt(
+        self,
+        worker: PytestWorker,
+        args: Sequence[str],
+        reload_files: Optional[Sequence[Path]],
+        order: Optional[Sequence[str]],
+        on_test: Optional[ResultCallback],
+    ) -> Dict[str, Any]:
+        """Run on worker, turning a dead worker into a recycle response."""
+        try:
+            return await worker.run(args, reload_files, order=order, on_test=on_test)
+        except WorkerError as e:
+            return {"ok": False, "recycle": str(e)}
+
+    def _release(self, worker: PytestWorker) -> None:
+        """Return a live worker to the pool; free the slot of a dead one."""
+        if worker.pid is not None:
+            self._idle.put_nowait(worker)
+            return
+        if worker in self._workers:
+            self._workers.remove(worker)
+        # Wakes a run waiting for a worker, which starts a replacement
+        self._idle.put_nowait(None)
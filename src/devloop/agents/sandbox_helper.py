@@ -6,11 +6,13 @@ without needing to understand the details of sandbox configuration and selection
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from devloop.core.performance import get_agent_process_registry
 from devloop.security.factory import create_sandbox
 from devloop.security.sandbox import (
     CommandNotAllowedError,
@@ -48,6 +50,8 @@ class AgentSandboxHelper:
         self.config = config or SandboxConfig()
         self._sandbox: Optional[SandboxExecutor] = None
         self._sandbox_initialized = False
+        # Commands stopped because the agent's run was cancelled
+        self.cancelled = 0
 
     async def _get_sandbox(self) -> SandboxExecutor:
         """Get or create sandbox executor.
@@ -57,12 +61,23 @@ class AgentSandboxHelper:
         """
         if self._sandbox is None or not self._sandbox_initialized:
             self._sandbox = await create_sandbox(self.config, self.agent_type)
+            self._attribute_processes(self._sandbox)
             self._sandbox_initialized = True
             logger.debug(
                 f"Initialized sandbox for {self.agent_name} ({self.agent_type})"
             )
         return self._sandbox
 
+    def _attribute_processes(self, sandbox: SandboxExecutor) -> None:
+        """Charge tool processes started by the sandbox to this agent."""
+        registry = get_agent_process_registry()
+        agent_name = self.agent_name
+        sandbox.agent_name = agent_name
+        sandbox.on_process_started = lambda pid, cgroup: registry.add(
+            agent_name, pid, cgroup
+        )
+        sandbox.on_process_exited = lambda pid: registry.remove(agent_name, pid)
+
     async def run_sandboxed(
         self,
         cmd: List[str],
@@ -87,6 +102,8 @@ class AgentSandboxHelper:
             CommandNotAllowedError: If command is not in whitelist
             SandboxTimeoutError: If execution exceeds timeout
             RuntimeError: If sandbox execution fails
+            asyncio.CancelledError: If the calling task was cancelled; the
+                process is terminated (SIGTERM, then SIGKILL) first
 
         Example:
             >>> helper = AgentSandboxHelper("linter", "linter")
@@ -106,16 +123,23 @@ class AgentSandboxHelper:
             merged_env.update(env)
             env = merged_env
 
-        # Override timeout if provided
-        if timeout is not None:
-            original_timeout = self.config.timeout_seconds
-            self.config.timeout_seconds = timeout
-            try:
+        try:
+            # Override timeout if provided
+            if timeout is not None:
+                original_timeout = self.config.timeout_seconds
+                self.config.timeout_seconds = timeout
+                try:
+                    result = await sandbox.execute(cmd, cwd, env)
+                finally:
+                    self.config.timeout_seconds = original_timeout
+            else:
                 result = await sandbox.execute(cmd, cwd, env)
-            finally:
-                self.config.timeout_seconds = original_timeout
-        else:
-            result = await sandbox.execute(cmd, cwd, env)
+        except asyncio.CancelledError:
+            # The sandbox has stopped the process; count it for status
+            self.cancelled += 1
+            get_agent_process_registry().record_cancelled(self.agent_name)
+            logger.debug(f"{self.agent_name}: Cancelled {cmd[0]}")
+            raise
 
         logger.debug(
             f"{self.agent_name}: Executed {cmd[0]} in {result.duration_ms}ms "
@@ -124,6 +148,16 @@ class AgentSandboxHelper:
 
         return result
 
+    async def close(self) -> None:
+        """Release the sandbox kept warm between commands (e.g. its cgroup).
+
+        A later command sets up a new sandbox.
+        """
+        if self._sandbox is not None:
+            await self._sandbox.close()
+        self._sandbox = None
+        self._sandbox_initialized = False
+
     async def check_tool_available(self, tool_name: str) -> bool:
         """Check if a tool is available and allowed in the sandbox.
 
@@ -229,3 +263,44 @@ def create_agent_sandbox_helper(
         agent_type=agent_type,
         config=sandbox_config,
     )
+
+
+def common_parent(paths: List[Path]) -> Path:
+    """Get a working directory for a tool invoked on several files at once.
+
+    Args:
+        paths: Files passed to the tool (at least one)
+
+    Returns:
+        The file's own directory for a single path, otherwise the deepest
+        directory containing every path
+    """
+    if len(paths) == 1:
+        return paths[0].parent
+    return Path(os.path.commonpath([str(p.resolve().parent) for p in paths]))
+
+
+async def stop_cancelled_process(
+    process: asyncio.subprocess.Process, agent_name: str, grace: float = 2.0
+) -> None:
+    """Stop a tool an agent started itself, after its run was cancelled.
+
+    Sends SIGTERM so the tool can clean up, and SIGKILL if it is still
+    running after ``grace`` seconds, as sandboxes do for the tools they run.
+
+    Args:
+        process: The tool process
+        agent_name: Agent whose run was cancelled
+        grace: Seconds to wait before killing the process
+    """
+    get_agent_process_registry().record_cancelled(agent_name)
+    try:
+        if process.returncode is None:
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), grace)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+    except ProcessLookupError:
+        pass  # Process already dead
@@ -7,9 +7,10 @@ import logging
 import sys
 from datetime import datetime, UTC
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass
 
+from .sandbox_helper import common_parent, stop_cancelled_process
 from ..core.agent import Agent, AgentResult
 from ..core.context_store import (
     context_store,
@@ -18,6 +19,15 @@ from ..core.context_store import (
     ScopeType,
 )
 from ..core.event import Event
+from ..core.result_cache import (
+    config_hash,
+    find_config_files,
+    result_cache,
+    tool_version,
+)
+
+# Files bandit reads its settings from
+BANDIT_CONFIG_FILES = (".bandit", "pyproject.toml")
 
 
 @dataclass
@@ -79,6 +89,8 @@ class SecurityResult:
 class SecurityScannerAgent(Agent):
     """Agent for scanning code for security vulnerabilities."""
 
+    concurrent_handling = True
+
     def __init__(self, config: Dict[str, Any], event_bus):
         super().__init__(
             "security-scanner", ["file:modified", "file:created"], event_bus
@@ -89,65 +101,13 @@ class SecurityScannerAgent(Agent):
     async def handle(self, event: Event) -> AgentResult:
         """Handle file change events by scanning for security issues."""
         try:
-            file_path = event.payload.get("path")
-            if not file_path:
-                return AgentResult(
-                    agent_name=self.name,
-                    success=False,
-                    duration=0.0,
-                    message="No file path in event",
-                )
-
-            path = Path(file_path)
-            if not path.exists():
-                return AgentResult(
-                    agent_name=self.name,
-                    success=False,
-                    duration=0.0,
-                    message=f"File does not exist: {file_path}",
-                )
-
-            # Only scan Python files for now
-            if path.suffix != ".py":
-                return AgentResult(
-                    agent_name=self.name,
-                    success=True,
-                    duration=0.0,
-                    message=f"Skipped non-Python file: {file_path}",
-                )
-
-            # Check if file matches exclude patterns
-            if self._should_exclude_file(str(path)):
-                return AgentResult(
-                    agent_name=self.name,
-                    success=True,
-                    duration=0.0,
-                    message=f"Excluded file: {file_path}",
-                )
+            path = self._check_event_path(event)
+            if isinstance(path, AgentResult):
+                return path
 
             # Run security scan
             results = await self._run_security_scan(path)
-
-            agent_result = AgentResult(
-                agent_name=self.name,
-                success=True,
-                duration=0.0,  # Would be calculated in real implementation
-                message=f"Scanned {file_path} with {results.tool}",
-                data={
-                    "file": str(path),
-                    "tool": results.tool,
-                    "issues_found": len(results.issues),
-                    "issues": results.issues,
-                    "severity_breakdown": results._get_severity_breakdown(),
-                    "confidence_breakdown": results._get_confidence_breakdown(),
-                    "errors": results.errors,
-                },
-            )
-
-            # Write to context store for Claude Code integration
-            await self._write_findings_to_context(path, results.issues)
-
-            return agent_result
+            return await self._build_result(path, results)
         except Exception as e:
             self.logger.error(
                 f"Error handling security scan for {event.payload.get('path', 'unknown')}: {e}",
@@ -161,6 +121,102 @@ class SecurityScannerAgent(Agent):
                 error=str(e),
             )
 
+    async def handle_batch(self, events: List[Event]) -> List[AgentResult]:
+        """Scan every file in the batch with a single bandit invocation."""
+        scanned: Dict[str, Path] = {}
+        results: Dict[str, AgentResult] = {}
+        for event in events:
+            path = self._check_event_path(event)
+            if isinstance(path, AgentResult):
+                results[event.id] = path
+            else:
+                scanned[event.id] = path
+
+        if scanned:
+            try:
+                batch = await self._run_security_scan_batch(
+                    list(dict.fromkeys(scanned.values()))
+                )
+                for event_id, path in scanned.items():
+                    results[event_id] = await self._build_result(path, batch[path])
+            except Exception as e:
+                self.logger.error(
+                    f"Error running batch security scan: {e}", exc_info=True
+                )
+                for event_id in scanned:
+                    results[event_id] = AgentResult(
+                        agent_name=self.name,
+                        success=False,
+                        duration=0.0,
+                        message=f"Security scan failed: {str(e)}",
+                        error=str(e),
+                    )
+
+        return [results[event.id] for event in events]
+
+    def _check_event_path(self, event: Event) -> Union[Path, AgentResult]:
+        """Get the file to scan from an event, or the result for skipping it."""
+        file_path = event.payload.get("path")
+        if not file_path:
+            return AgentResult(
+                agent_name=self.name,
+                success=False,
+                duration=0.0,
+                message="No file path in event",
+            )
+
+        path = Path(file_path)
+        if not path.exists():
+            return AgentResult(
+                agent_name=self.name,
+                success=False,
+                duration=0.0,
+                message=f"File does not exist: {file_path}",
+            )
+
+        # Only scan Python files for now
+        if path.suffix != ".py":
+            return AgentResult(
+                agent_name=self.name,
+                success=True,
+                duration=0.0,
+                message=f"Skipped non-Python file: {file_path}",
+            )
+
+        # Check if file matches exclude patterns
+        if self._should_exclude_file(str(path)):
+            return AgentResult(
+                agent_name=self.name,
+                success=True,
+                duration=0.0,
+                message=f"Excluded file: {file_path}",
+            )
+
+        return path
+
+    async def _build_result(self, path: Path, results: SecurityResult) -> AgentResult:
+        """Build the agent result for one scanned file and record its findings."""
+        agent_result = AgentResult(
+            agent_name=self.name,
+            success=True,
+            duration=0.0,  # Would be calculated in real implementation
+            message=f"Scanned {path} with {results.tool}",
+            data={
+                "file": str(path),
+                "tool": results.tool,
+                "issues_found": len(results.issues),
+                "issues": results.issues,
+                "severity_breakdown": results._get_severity_breakdown(),
+                "confidence_breakdown": results._get_confidence_breakdown(),
+                "errors": results.errors,
+            },
+        )
+
+        # Write to context store for Claude Code integration
+        await self._write_findings_to_context(path, results.issues)
+
+        return agent_result
+
     async def _write_findings_to_context(
         self, path: Path, issues: List[Dict[str, Any]]
     ) -> None:
@@ -215,28 +271,71 @@ class SecurityScannerAgent(Agent):
 
     async def _run_security_scan(self, file_path: Path) -> SecurityResult:
         """Run security scanning tools."""
-        try:
-            results = []
+        return (await self._run_security_scan_batch([file_path]))[file_path]
 
+    async def _run_security_scan_batch(
+        self, paths: List[Path]
+    ) -> Dict[Path, SecurityResult]:
+        """Run security scanning tools once over several files."""
+        try:
             # Try bandit first (most common Python security scanner)
             if self.config.enabled_tools and "bandit" in self.config.enabled_tools:
-                bandit_result = await self._run_bandit(file_path)
-                if bandit_result:
-                    results.append(bandit_result)
-
-            # If no results from primary tools, return empty
-            if results:
-                return results[0]  # Return first successful result
+                return await self._run_bandit_batch(paths)
 
-            return SecurityResult("none", [], ["No security scanning tools available"])
+            none = SecurityResult("none", [], ["No security scanning tools available"])
+            return {path: none for path in paths}
         except Exception as e:
             self.logger.error(
-                f"Error running security scan on {file_path}: {e}", exc_info=True
+                f"Error running security scan on {len(paths)} file(s): {e}",
+                exc_info=True,
             )
-            return SecurityResult("error", [], [f"Security scan error: {str(e)}"])
+            failed = SecurityResult("error", [], [f"Security scan error: {str(e)}"])
+            return {path: failed for path in paths}
 
     async def _run_bandit(self, file_path: Path) -> Optional[SecurityResult]:
         """Run Bandit security scanner."""
+        return (await self._run_bandit_batch([file_path]))[file_path]
+
+    async def _run_bandit_batch(self, paths: List[Path]) -> Dict[Path, SecurityResult]:
+        """Run Bandit over several files, skipping files with cached results."""
+        version = await tool_version([sys.executable, "-m", "bandit", "--version"])
+        if not version:
+            return await self._invoke_bandit(paths)
+
+        settings = config_hash(
+            self.config.severity_threshold,
+            self.config.confidence_threshold,
+            self.config.exclude_patterns,
+            self.config.max_issues,
+            config_files=find_config_files(common_parent(paths), BANDIT_CONFIG_FILES),
+        )
+        lookup = await result_cache.lookup(self.name, version, settings, paths)
+        results = {
+            path: SecurityResult("bandit", issues)
+            for path, issues in lookup.hits.items()
+        }
+
+        if lookup.misses:
+            fresh = await self._invoke_bandit(lookup.misses)
+            await result_cache.store(
+                self.name,
+                lookup,
+                {
+                    path: result.issues
+                    for path, result in fresh.items()
+                    if result.tool == "bandit" and not result.errors
+                },
+            )
+            results.update(fresh)
+
+        return {path: results[path] for path in paths}
+
+    async def _invoke_bandit(self, paths: List[Path]) -> Dict[Path, SecurityResult]:
+        """Run Bandit once over several files and split issues per file."""
+
+        def same(result: SecurityResult) -> Dict[Path, SecurityResult]:
+            return {path: result for path in paths}
+
         try:
             # Check if bandit is available
             import subprocess  # nosec B404 - Required for running security analysis tools
@@ -245,10 +344,13 @@ class SecurityScannerAgent(Agent):
                 [sys.executable, "-c", "import bandit"], capture_output=True, text=True
             )  # nosec B603 - Running trusted system Python with safe arguments
             if result.returncode != 0:
-                return SecurityResult(
-                    "bandit", [], ["Bandit not installed - run: pip install bandit"]
+                return same(
+                    SecurityResult(
+                        "bandit", [], ["Bandit not installed - run: pip install bandit"]
+                    )
                 )
 
+            cwd = common_parent(paths)
             cmd = [
                 sys.executable,
                 "-m",
@@ -256,7 +358,7 @@ class SecurityScannerAgent(Agent):
                 "-f",
                 "json",
                 "-r",
-                str(file_path),
+                *map(str, paths),
                 "--severity-level",
                 self.config.severity_threshold,
                 "--confidence-level",
@@ -270,56 +372,67 @@ class SecurityScannerAgent(Agent):
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                cwd=file_path.parent,
+                cwd=cwd,
             )
 
-            stdout, stderr = await process.communicate()
-
-            if process.returncode == 0:
-                # Parse JSON output
-                try:
-                    data = json.loads(stdout.decode())
-                    issues = []
-
-                    # Extract issues from bandit output
-                    for result in data.get("results", []):
-                        filename = result.get("filename", "")
-                        if str(file_path) in filename or filename.endswith(
-                            str(file_path)
-                        ):
-                            for issue in result.get("issues", []):
-                                issues.append(
-                                    {
-                                        "code": issue.get("code", ""),
-                                        "filename": issue.get("filename", ""),
-                                        "line_number": issue.get("line_number", 0),
-                                        "line_range": issue.get("line_range", []),
-                                        "test_id": issue.get("test_id", ""),
-                                        "test_name": issue.get("test_name", ""),
-                                        "severity": issue.get(
-                                            "issue_severity", "unknown"
-                                        ),
-                                        "confidence": issue.get(
-                                            "issue_confidence", "unknown"
-                                        ),
-                                        "text": issue.get("issue_text", ""),
-                                        "cwe": issue.get("cwe", {}),
-                                        "more_info": issue.get("more_info", ""),
-                                    }
-                                )
-
-                    return SecurityResult("bandit", issues[: self.config.max_issues])
-
-                except json.JSONDecodeError:
-                    return SecurityResult(
+            try:
+                stdout, stderr = await process.communicate()
+            except asyncio.CancelledError:
+                # Superseded by a newer run; don't leave bandit running
+                await stop_cancelled_process(process, self.name)
+                raise
+
+            # bandit exits with 1 when it reports issues
+            if process.returncode not in (0, 1):
+                error_msg = stderr.decode().strip()
+                return same(
+                    SecurityResult("bandit", [], [f"Bandit failed: {error_msg}"])
+                )
+
+            # Parse JSON output
+            try:
+                data = json.loads(stdout.decode())
+            except json.JSONDecodeError:
+                return same(
+                    SecurityResult(
                         "bandit",
                         [],
                         [f"Failed to parse bandit output: {stdout.decode()[:200]}"],
                     )
+                )
 
-            else:
-                error_msg = stderr.decode().strip()
-                return SecurityResult("bandit", [], [f"Bandit failed: {error_msg}"])
+            by_file: Dict[Path, List[Dict[str, Any]]] = {path: [] for path in paths}
+            resolved = {path.resolve(): path for path in paths}
+            for issue in data.get("results", []):
+                filename = issue.get("filename", "")
+                if len(paths) == 1:
+                    owner: Optional[Path] = paths[0]
+                else:
+                    owner = resolved.get((cwd / filename).resolve())
+                if owner is None:
+                    continue
+                by_file[owner].append(
+                    {
+                        "code": issue.get("code", ""),
+                        "filename": filename,
+                        "line_number": issue.get("line_number", 0),
+                        "line_range": issue.get("line_range", []),
+                        "test_id": issue.get("test_id", ""),
+                        "test_name": issue.get("test_name", ""),
+                        "severity": issue.get("issue_severity", "unknown"),
+                        "confidence": issue.get("issue_confidence", "unknown"),
+                        "text": issue.get("issue_text", ""),
+                        "cwe": issue.get("cwe", {}),
+                        "more_info": issue.get("more_info", ""),
+                    }
+                )
+
+            return {
+                path: SecurityResult("bandit", file_issues[: self.config.max_issues])
+                for path, file_issues in by_file.items()
+            }
 
         except Exception as e:
-            return SecurityResult("bandit", [], [f"Bandit execution error: {str(e)}"])
+            return same(
+                SecurityResult("bandit", [], [f"Bandit execution error: {str(e)}"])
+            )
@@ -85,7 +85,7 @@ class SnykAgent(Agent):
             performance_monitor=performance_monitor,
         )
         self.config = SnykConfig(config or {})
-        self._last_run: Dict[str, float] = {}  # path -> timestamp for debouncing
+        self.debounce_ms = self.config.debounce
 
     async def handle(self, event: Event) -> AgentResult:
         """Handle file change event by running Snyk scan."""
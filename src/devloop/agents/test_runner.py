@@ -2,17 +2,23 @@
 
 import asyncio
 import json
-import re
 from datetime import datetime
 from fnmatch import fnmatch
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from devloop.agents.pytest_pool import (
+    PytestWorker,
+    PytestWorkerPool,
+    ResultCallback,
+    WorkerError,
+)
 from devloop.core.agent import Agent, AgentResult
 from devloop.core.context_store import Finding, Severity
 from devloop.core.event import Event
 from devloop.core.import_graph import ImportGraph
 from devloop.core.project_context import ProjectContext
+from devloop.core.test_history import TestHistory, TestRecord, run_order
 
 
 class TestRunnerConfig:
@@ -59,6 +65,12 @@ class TestRunnerConfig:
         self.devloop_development = context_config.get("devloopDevelopment", False)
         self.respect_site_packages = context_config.get("respectSitePackages", True)
 
+        # Opt-in long-lived pytest processes
+        warm_config = config.get("warmWorkers", {})
+        self.warm_workers = warm_config.get("enabled", False)
+        self.warm_worker_count = warm_config.get("workers", 1)
+        self.warm_worker_max_runs = warm_config.get("maxRuns", 100)
+
         # Auto-detect available frameworks if enabled
         if self.auto_detect_frameworks:
             detected = self._auto_detect_frameworks()
@@ -134,6 +146,7 @@ class TestResult:
         duration: float = 0.0,
         failures: List[Dict[str, Any]] | None = None,
         error: str | None = None,
+        tests: List[Dict[str, Any]] | None = None,
     ):
         self.success = success
         self.passed = passed
@@ -142,6 +155,7 @@ class TestResult:
         self.duration = duration
         self.failures = failures or []
         self.error = error
+        self.tests = tests or []
 
     @property
     def total(self) -> int:
@@ -172,18 +186,70 @@ class TestRunnerAgent(Agent):
         # Initialize project context for test discovery
         self.project_context = ProjectContext(Path.cwd())
 
+        # Per-test outcomes and durations, used to order runs
+        devloop_dir = Path.cwd() / ".devloop"
+        self._history: TestHistory | None = (
+            TestHistory(devloop_dir / "test_history.db")
+            if devloop_dir.is_dir()
+            else None
+        )
+
         # Build import graph for smart test discovery
         self._import_graph: ImportGraph | None = None
         if self.config.related_tests_only:
             try:
                 project_root = Path.cwd()
                 src_dirs = self._detect_src_dirs(project_root)
-                self._import_graph = ImportGraph(project_root, src_dirs=src_dirs)
+                self._import_graph = ImportGraph(
+                    project_root,
+                    src_dirs=src_dirs,
+                    cache_path=(
+                        devloop_dir / "import_graph.json"
+                        if devloop_dir.is_dir()
+                        else None
+                    ),
+                )
                 self._import_graph.build()
             except Exception as e:
                 self.logger.warning(f"Failed to build import graph: {e}")
                 self._import_graph = None
 
+        # Warm pytest workers, created on start when enabled
+        self._worker_pool: PytestWorkerPool | None = None
+        self._worker_pool_start: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Start the agent and, if enabled, warm up pytest workers."""
+        await super().start()
+        if self.config.warm_workers and self._worker_pool is None:
+            self._worker_pool = PytestWorkerPool(
+                Path.cwd(),
+                self._test_env(),
+                size=self.config.warm_worker_count,
+                max_runs=self.config.warm_worker_max_runs,
+                agent_name=self.name,
+            )
+            self._worker_pool_start = asyncio.create_task(self._start_worker_pool())
+
+    async def stop(self) -> None:
+        """Stop the agent and its pytest workers."""
+        await super().stop()
+        if self._worker_pool_start and not self._worker_pool_start.done():
+            self._worker_pool_start.cancel()
+        if self._worker_pool:
+            await self._worker_pool.close()
+            self._worker_pool = None
+        if self._history:
+            await self._history.close()
+
+    async def _start_worker_pool(self) -> None:
+        """Start workers in the background so the first run finds them warm."""
+        assert self._worker_pool is not None
+        try:
+            await self._worker_pool.start()
+        except WorkerError as e:
+            self.logger.warning(f"Warm pytest workers unavailable: {e}")
+
     async def handle(self, event: Event) -> AgentResult:
         """Handle file change event by running tests."""
         if not self.config.run_on_save:
@@ -286,10 +352,44 @@ class TestRunnerAgent(Agent):
     async def _write_findings_to_context(
         self, path: Path, test_result: TestResult, framework: str
     ) -> None:
-        """Write test failures to the context store."""
+        """Write test failures to the context store, one finding per test."""
         from devloop.core.context_store import context_store
 
-        if test_result.failed > 0:
+        if test_result.failures:
+            lines = {t["test"]: t.get("line") for t in test_result.tests}
+            failures: Dict[str, Dict[str, Any]] = {}
+            for failure in test_result.failures:
+                failures.setdefault(failure["test"], failure)
+
+            findings = []
+            for test, failure in failures.items():
+                phase = failure["phase"]
+                findings.append(
+                    Finding(
+                        id=f"{self.name}-{test}-failed",
+                        agent=self.name,
+                        timestamp=str(datetime.now()),
+                        file=str(Path.cwd() / test.split("::", 1)[0]),
+                        line=lines.get(test),
+                        severity=Severity.ERROR,
+                        category="test",
+                        message=(
+                            f"{test} failed"
+                            if phase == "call"
+                            else f"{test} failed during {phase}"
+                        ),
+                        detail=failure["message"],
+                        context={
+                            "framework": framework,
+                            "test": test,
+                            "phase": phase,
+                            "source": str(path),
+                            "blocking": True,
+                        },
+                    )
+                )
+            await context_store.add_findings(findings)
+        elif test_result.failed > 0:
             # Create a finding for test failures
             finding = Finding(
                 id=f"{self.name}-{path}-failed",
@@ -488,74 +588,148 @@ class TestRunnerAgent(Agent):
             self.logger.error(f"Error running {framework}: {e}")
             return TestResult(success=False, error=str(e))
 
-    async def _run_pytest(
-        self, test_files: List[Path], source_path: Path
-    ) -> TestResult:
-        """Run pytest."""
-        try:
-            # Get updated environment with venv bin in PATH
-            import os
+    def _test_env(self) -> Dict[str, str]:
+        """Environment for test processes, with the venv bin in PATH."""
+        import os
 
-            env = os.environ.copy()
-            venv_bin = Path(__file__).parent.parent.parent.parent / ".venv" / "bin"
-            if venv_bin.exists():
-                env["PATH"] = f"{venv_bin}:{env.get('PATH', '')}"
+        env = os.environ.copy()
+        venv_bin = Path(__file__).parent.parent.parent.parent / ".venv" / "bin"
+        if venv_bin.exists():
+            env["PATH"] = f"{venv_bin}:{env.get('PATH', '')}"
+        return env
 
-            # Check if pytest is installed
-            check = await asyncio.create_subprocess_exec(
-                "pytest",
-                "--version",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=env,
+    @staticmethod
+    def _node_path(path: Path) -> Optional[str]:
+        """Path as it appears in pytest node IDs, if inside the project."""
+        try:
+            return path.resolve().relative_to(Path.cwd().resolve()).as_posix()
+        except (OSError, ValueError):
+            return None
+
+    async def _test_records(self, test_files: List[Path]) -> Dict[str, TestRecord]:
+        """History of the tests in test_files."""
+        if self._history is None or not test_files:
+            return {}
+        files = [f for f in map(self._node_path, test_files) if f]
+        try:
+            await self._history.initialize()
+            return await self._history.get_for_files(files)
+        except Exception as e:
+            self.logger.warning(f"Test history unavailable: {e}")
+            return {}
+
+    def _test_reporter(self, records: Dict[str, TestRecord]) -> ResultCallback:
+        """Publish failures, and tests that stopped failing, as they arrive."""
+
+        async def report(test: Dict[str, Any]) -> None:
+            record = records.get(test["test"])
+            previous = record.outcome if record else None
+            if test["outcome"] != "failed" and previous != "failed":
+                return
+            await self.event_bus.emit(
+                Event(
+                    type=f"agent:{self.name}:test",
+                    payload={
+                        "test": test["test"],
+                        "outcome": test["outcome"],
+                        "previous": previous,
+                        "duration": test["duration"],
+                        "message": test.get("message", ""),
+                    },
+                    source=self.name,
+                )
             )
-            await check.communicate()
 
-            if check.returncode != 0:
-                return TestResult(success=False, error="pytest not installed")
-
-            # Build command
-            cmd = ["pytest", "-v", "--tb=short"]
-
-            if test_files:
-                # Run specific test files
-                cmd.extend([str(f) for f in test_files])
-            else:
-                # Run all tests in project
-                cmd.append(str(source_path.parent))
+        return report
 
-            # Run pytest
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=env,
-            )
-
-            stdout, stderr = await proc.communicate()
-            output = stdout.decode() if stdout else ""
+    async def _run_pytest_warm(
+        self,
+        args: List[str],
+        source_path: Path,
+        order: List[str],
+        on_test: ResultCallback,
+    ) -> Optional[Dict[str, Any]]:
+        """Run pytest in a warm worker.
+
+        Returns:
+            The worker's response, or None if no worker could run the tests
+        """
+        assert self._worker_pool is not None
 
-            # Parse output
-            passed = self._count_pattern(output, r"(\d+) passed")
-            failed = self._count_pattern(output, r"(\d+) failed")
-            skipped = self._count_pattern(output, r"(\d+) skipped")
+        # Modules that hold references to the changed file's code
+        reload_files = None
+        if self._import_graph and source_path.suffix == ".py":
+            reload_files = self._import_graph.get_dependents(source_path)
 
-            # Extract duration
-            duration_match = re.search(r"in ([\d.]+)s", output)
-            duration = float(duration_match.group(1)) if duration_match else 0.0
+        try:
+            return await self._worker_pool.run(args, reload_files, order, on_test)
+        except WorkerError as e:
+            self.logger.warning(f"Warm pytest worker failed, starting pytest: {e}")
+            return None
 
-            success = proc.returncode == 0
+    async def _run_pytest(
+        self, test_files: List[Path], source_path: Path
+    ) -> TestResult:
+        """Run pytest.
 
+        Tests that failed last time run first, then tests known to cover
+        source_path, each fastest first. Results are read from the worker's
+        reporting plugin rather than from pytest's output, and failures are
+        published as events while the run continues.
+        """
+        source = (
+            None if self._is_test_file(source_path) else self._node_path(source_path)
+        )
+        records = await self._test_records(test_files)
+        order = run_order(records.values(), source)
+        on_test = self._test_reporter(records)
+
+        targets = [str(f) for f in test_files] or [str(source_path.parent)]
+        args = ["-q", "--tb=short", *targets]
+
+        response = None
+        if self._worker_pool is not None:
+            response = await self._run_pytest_warm(args, source_path, order, on_test)
+        if response is None:
+            worker = PytestWorker(Path.cwd(), self._test_env(), agent_name=self.name)
+            try:
+                await worker.start()
+                response = await worker.run(args, order=order, on_test=on_test)
+            except WorkerError as e:
+                return TestResult(success=False, error=f"pytest unavailable: {e}")
+            finally:
+                await worker.close()
+
+        if not response.get("ok"):
             return TestResult(
-                success=success,
-                passed=passed,
-                failed=failed,
-                skipped=skipped,
-                duration=duration,
+                success=False,
+                error=response.get("error") or response.get("recycle", "pytest failed"),
             )
 
-        except FileNotFoundError:
-            return TestResult(success=False, error="pytest command not found")
+        if self._history is not None:
+            # Interrupted runs and collection errors leave tests unreported
+            complete = response["exit_code"] in (0, 1)
+            try:
+                await self._history.initialize()
+                await self._history.record(
+                    response["tests"],
+                    source=source,
+                    complete_files=[
+                        f for f in map(self._node_path, test_files) if f and complete
+                    ],
+                )
+            except Exception as e:
+                self.logger.warning(f"Failed to update test history: {e}")
+
+        return TestResult(
+            success=response["exit_code"] == 0,
+            passed=response["passed"],
+            failed=response["failed"],
+            skipped=response["skipped"],
+            duration=response["duration"],
+            failures=response["failures"],
+            tests=response["tests"],
+        )
 
     async def _run_jest(self, test_files: List[Path], source_path: Path) -> TestResult:
         """Run jest."""
@@ -615,8 +789,3 @@ class TestRunnerAgent(Agent):
 
         except FileNotFoundError:
             return TestResult(success=False, error="jest command not found")
-
-    def _count_pattern(self, text: str, pattern: str) -> int:
-        """Count occurrences of a pattern in text."""
-        match = re.search(pattern, text)
-        return int(match.group(1)) if match else 0
@@ -4,10 +4,10 @@
 import logging
 import sys
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass, field
 
-from devloop.agents.sandbox_helper import create_agent_sandbox_helper
+from devloop.agents.sandbox_helper import common_parent, create_agent_sandbox_helper
 from devloop.core.agent import Agent, AgentResult
 from devloop.core.event import Event
 from devloop.security.sandbox import CommandNotAllowedError, SandboxTimeoutError
@@ -71,64 +71,21 @@ class TypeCheckerAgent(Agent):
             agent_type="type_checker",
         )
 
+    async def stop(self) -> None:
+        """Stop the agent and release its sandbox."""
+        await super().stop()
+        await self.sandbox.close()
+
     async def handle(self, event: Event) -> AgentResult:
         """Handle file change events by running type checks."""
         try:
-            file_path = event.payload.get("path")
-            if not file_path:
-                return AgentResult(
-                    agent_name=self.name,
-                    success=False,
-                    duration=0.0,
-                    message="No file path in event",
-                )
-
-            path = Path(file_path)
-            if not path.exists():
-                return AgentResult(
-                    agent_name=self.name,
-                    success=False,
-                    duration=0.0,
-                    message=f"File does not exist: {file_path}",
-                )
-
-            # Only check Python files for now
-            if path.suffix != ".py":
-                return AgentResult(
-                    agent_name=self.name,
-                    success=True,
-                    duration=0.0,
-                    message=f"Skipped non-Python file: {file_path}",
-                )
-
-            # Check if file matches exclude patterns
-            if self._should_exclude_file(str(path)):
-                return AgentResult(
-                    agent_name=self.name,
-                    success=True,
-                    duration=0.0,
-                    message=f"Excluded file: {file_path}",
-                )
+            path = self._check_event_path(event)
+            if isinstance(path, AgentResult):
+                return path
 
             # Run type check
             results = await self._run_type_check(path)
-
-            agent_result = AgentResult(
-                agent_name=self.name,
-                success=True,
-                duration=0.0,  # Would be calculated in real implementation
-                message=f"Type checked {file_path} with {results.tool}",
-                data={
-                    "file": str(path),
-                    "tool": results.tool,
-                    "issues_found": len(results.issues),
-                    "issues": results.issues,
-                    "severity_breakdown": results._get_severity_breakdown(),
-                    "errors": results.errors,
-                },
-            )
-
-            return agent_result
+            return self._build_result(path, results)
         except Exception as e:
             self.logger.error(
                 f"Error handling type check for {event.payload.get('path', 'unknown')}: {e}",
@@ -142,6 +99,94 @@ class TypeCheckerAgent(Agent):
                 error=str(e),
             )
 
+    async def handle_batch(self, events: List[Event]) -> List[AgentResult]:
+        """Type check every file in the batch with a single mypy invocation."""
+        checked: Dict[str, Path] = {}
+        results: Dict[str, AgentResult] = {}
+        for event in events:
+            path = self._check_event_path(event)
+            if isinstance(path, AgentResult):
+                results[event.id] = path
+            else:
+                checked[event.id] = path
+
+        if checked:
+            try:
+                batch = await self._run_type_check_batch(
+                    list(dict.fromkeys(checked.values()))
+                )
+                for event_id, path in checked.items():
+                    results[event_id] = self._build_result(path, batch[path])
+            except Exception as e:
+                self.logger.error(f"Error running batch type check: {e}", exc_info=True)
+                for event_id in checked:
+                    results[event_id] = AgentResult(
+                        agent_name=self.name,
+                        success=False,
+                        duration=0.0,
+                        message=f"Type check failed: {str(e)}",
+                        error=str(e),
+                    )
+
+        return [results[event.id] for event in events]
+
+    def _check_event_path(self, event: Event) -> Union[Path, AgentResult]:
+        """Get the file to check from an event, or the result for skipping it."""
+        file_path = event.payload.get("path")
+        if not file_path:
+            return AgentResult(
+                agent_name=self.name,
+                success=False,
+                duration=0.0,
+                message="No file path in event",
+            )
+
+        path = Path(file_path)
+        if not path.exists():
+            return AgentResult(
+                agent_name=self.name,
+                success=False,
+                duration=0.0,
+                message=f"File does not exist: {file_path}",
+            )
+
+        # Only check Python files for now
+        if path.suffix != ".py":
+            return AgentResult(
+                agent_name=self.name,
+                success=True,
+                duration=0.0,
+                message=f"Skipped non-Python file: {file_path}",
+            )
+
+        # Check if file matches exclude patterns
+        if self._should_exclude_file(str(path)):
+            return AgentResult(
+                agent_name=self.name,
+                success=True,
+                duration=0.0,
+                message=f"Excluded file: {file_path}",
+            )
+
+        return path
+
+    def _build_result(self, path: Path, results: TypeCheckResult) -> AgentResult:
+        """Build the agent result for one checked file."""
+        return AgentResult(
+            agent_name=self.name,
+            success=True,
+            duration=0.0,  # Would be calculated in real implementation
+            message=f"Type checked {path} with {results.tool}",
+            data={
+                "file": str(path),
+                "tool": results.tool,
+                "issues_found": len(results.issues),
+                "issues": results.issues,
+                "severity_breakdown": results._get_severity_breakdown(),
+                "errors": results.errors,
+            },
+        )
+
     def _should_exclude_file(self, file_path: str) -> bool:
         """Check if file should be excluded from type checking."""
         if not self.config.exclude_patterns:
@@ -162,40 +207,45 @@ class TypeCheckerAgent(Agent):
 
     async def _run_type_check(self, file_path: Path) -> TypeCheckResult:
         """Run type checking tools."""
-        results = []
+        return (await self._run_type_check_batch([file_path]))[file_path]
 
+    async def _run_type_check_batch(
+        self, paths: List[Path]
+    ) -> Dict[Path, TypeCheckResult]:
+        """Run type checking tools once over several files."""
         # Try mypy first (most common Python type checker)
         if "mypy" in self.config.enabled_tools:
-            mypy_result = await self._run_mypy(file_path)
-            if mypy_result:
-                results.append(mypy_result)
+            return await self._run_mypy_batch(paths)
 
-        # If no results from primary tools, return empty
-        if results:
-            return results[0]  # Return first successful result
-
-        return TypeCheckResult("none", [], ["No type checking tools available"])
+        none = TypeCheckResult("none", [], ["No type checking tools available"])
+        return {path: none for path in paths}
 
     async def _run_mypy(self, file_path: Path) -> Optional[TypeCheckResult]:
         """Run MyPy type checker."""
+        return (await self._run_mypy_batch([file_path]))[file_path]
+
+    async def _run_mypy_batch(self, paths: List[Path]) -> Dict[Path, TypeCheckResult]:
+        """Run MyPy once over several files and split issues per file."""
+        cwd = common_parent(paths)
         try:
             # Check if mypy is available
 
             check_result = await self.sandbox.run_sandboxed(
                 [sys.executable, "-c", "import mypy"],
-                cwd=file_path.parent,
+                cwd=cwd,
                 timeout=5,
             )
             if check_result.exit_code != 0:
-                return TypeCheckResult(
+                missing = TypeCheckResult(
                     "mypy", [], ["MyPy not installed - run: pip install mypy"]
                 )
+                return {path: missing for path in paths}
 
             cmd = [
                 sys.executable,
                 "-m",
                 "mypy",
-                str(file_path),
+                *map(str, paths),
                 "--show-error-codes",
                 "--no-error-summary",
             ]
@@ -206,49 +256,67 @@ class TypeCheckerAgent(Agent):
             # Run mypy in sandbox
             result = await self.sandbox.run_sandboxed(
                 cmd,
-                cwd=file_path.parent,
+                cwd=cwd,
             )
-            issues = []
-
-            # Parse mypy output (line by line)
-            output_lines = result.stdout.strip().split("\n")
-            for line in output_lines:
-                if line.strip() and not line.startswith("Success:"):
-                    # Parse mypy error format: file:line: error: message [error-code]
-                    parts = line.split(":", 3)
-                    if len(parts) >= 4:
-                        filename = parts[0].strip()
-                        try:
-                            line_number = int(parts[1].strip())
-                        except ValueError:
-                            line_number = 0
-
-                        error_type = parts[2].strip()
-                        message_and_code = parts[3].strip()
-
-                        # Extract error code if present
-                        error_code = ""
-                        if "[" in message_and_code and "]" in message_and_code:
-                            message, code_part = message_and_code.rsplit("[", 1)
-                            error_code = code_part.rstrip("]")
-                            message = message.strip()
-                        else:
-                            message = message_and_code
-
-                        issues.append(
-                            {
-                                "filename": filename,
-                                "line_number": line_number,
-                                "severity": error_type,
-                                "message": message,
-                                "error_code": error_code,
-                                "tool": "mypy",
-                            }
-                        )
-
-            return TypeCheckResult("mypy", issues[: self.config.max_issues])
+            issues = self._parse_mypy_output(result.stdout)
+
+            # Issues in imported modules belong to those modules, however
+            # the files were batched
+            by_file: Dict[Path, List[Dict[str, Any]]] = {path: [] for path in paths}
+            resolved = {path.resolve(): path for path in paths}
+            for issue in issues:
+                owner = resolved.get((cwd / issue["filename"]).resolve())
+                if owner is not None:
+                    by_file[owner].append(issue)
+
+            return {
+                path: TypeCheckResult("mypy", file_issues[: self.config.max_issues])
+                for path, file_issues in by_file.items()
+            }
 
         except (CommandNotAllowedError, SandboxTimeoutError) as e:
-            return TypeCheckResult("mypy", [], [f"MyPy sandbox error: {str(e)}"])
+            failed = TypeCheckResult("mypy", [], [f"MyPy sandbox error: {str(e)}"])
+            return {path: failed for path in paths}
         except Exception as e:
-            return TypeCheckResult("mypy", [], [f"MyPy execution error: {str(e)}"])
+            failed = TypeCheckResult("mypy", [], [f"MyPy execution error: {str(e)}"])
+            return {path: failed for path in paths}
+
+    @staticmethod
+    def _parse_mypy_output(stdout: str) -> List[Dict[str, Any]]:
+        """Parse mypy output (line by line) into issue dicts."""
+        issues = []
+        output_lines = stdout.strip().split("\n")
+        for line in output_lines:
+            if line.strip() and not line.startswith("Success:"):
+                # Parse mypy error format: file:line: error: message [error-code]
+                parts = line.split(":", 3)
+                if len(parts) >= 4:
+                    filename = parts[0].strip()
+                    try:
+                        line_number = int(parts[1].strip())
+                    except ValueError:
+                        line_number = 0
+
+                    error_type = parts[2].strip()
+                    message_and_code = parts[3].strip()
+
+                    # Extract error code if present
+                    error_code = ""
+                    if "[" in message_and_code and "]" in message_and_code:
+                        message, code_part = message_and_code.rsplit("[", 1)
+                        error_code = code_part.rstrip("]")
+                        message = message.strip()
+                    else:
+                        message = message_and_code
+
+                    issues.append(
+                        {
+                            "filename": filename,
+                            "line_number": line_number,
+                            "severity": error_type,
+                            "message": message,
+                            "error_code": error_code,
+                            "tool": "mypy",
+                        }
+                    )
+        return issues
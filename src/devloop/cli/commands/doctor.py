@@ -3,6 +3,7 @@
 import json
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 
@@ -289,7 +290,9 @@ def check(
         ("pytest", ["pytest", "--version"]),
         ("jq", ["jq", "--version"]),
     ]
-    tool_results = [(name, *_check_tool(name, cmd)) for name, cmd in tools]
+    with ThreadPoolExecutor(max_workers=len(tools)) as pool:
+        checks = list(pool.map(lambda tool: _check_tool(*tool), tools))
+    tool_results = [(name, *check) for (name, _), check in zip(tools, checks)]
     tools_ok = all(ok for _, ok, _ in tool_results)
     _print_check(
         "Required tools",
@@ -0,0 +1,470 @@
+"""Fast pre-commit checks that reuse the daemon's results.
+
+Staged Python files whose staged blob matches the working tree have the same
+content the daemon already format-checked and linted, so their black and
+ruff results come straight from the shared result cache (keyed with the tool
+versions the running daemon reports) and the tools only run on files without
+a cached result. Partially staged files are checked
+from their staged blob instead. Type checking and the tests affected by the
+staged files run alongside, so the slowest check bounds the total time.
+They see the working tree, so for partially staged files they check more
+than will be committed; their output notes when that happens.
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+import typer
+from rich.console import Console
+
+from devloop.agents.formatter import FormatterAgent
+from devloop.agents.linter import LinterAgent
+from devloop.agents.test_runner import TestRunnerAgent
+from devloop.core.config import Config
+from devloop.core.event import EventBus
+from devloop.core.import_graph import ImportGraph
+from devloop.core.query_server import query_daemon
+from devloop.core.result_cache import remember_tool_versions, result_cache
+
+console = Console()
+
+# Checks run by default, in display order
+CHECKS = ("format", "lint", "typecheck", "tests")
+
+
+class PrecommitError(Exception):
+    """Raised when the staged files cannot be determined."""
+
+
+@dataclass
+class StagedFile:
+    """A staged Python file.
+
+    Attributes:
+        path: Absolute path in the working tree
+        name: Path relative to the repository root, as git reports it
+        blob: Object id of the staged content
+        matches_worktree: Whether the working tree holds the staged content
+    """
+
+    path: Path
+    name: str
+    blob: str
+    matches_worktree: bool
+
+
+@dataclass
+class CheckResult:
+    """Outcome of one pre-commit check."""
+
+    name: str
+    passed: bool = True
+    skipped: bool = False
+    files: int = 0
+    problems: List[str] = field(default_factory=list)
+    duration: float = 0.0
+    note: str = ""
+
+
+async def _run(
+    cmd: Sequence[str],
+    cwd: Path,
+    stdin: Optional[bytes] = None,
+    env: Optional[Dict[str, str]] = None,
+) -> tuple[int, bytes, bytes]:
+    """Run a command and return its exit code and output."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        stdin=asyncio.subprocess.PIPE if stdin is not None else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env,
+    )
+    stdout, stderr = await proc.communicate(stdin)
+    return proc.returncode or 0, stdout, stderr
+
+
+async def _git(repo_root: Path, *args: str) -> bytes:
+    """Run a git command, raising PrecommitError if it fails."""
+    try:
+        code, stdout, stderr = await _run(["git", *args], repo_root)
+    except FileNotFoundError as e:
+        raise PrecommitError("git not found") from e
+    if code != 0:
+        raise PrecommitError(stderr.decode(errors="replace").strip())
+    return stdout
+
+
+def _tool_env(repo_root: Path) -> Dict[str, str]:
+    """Environment with the project venv (if any) first on PATH."""
+    env = os.environ.copy()
+    venv_bin = repo_root / ".venv" / "bin"
+    if venv_bin.exists():
+        env["PATH"] = f"{venv_bin}:{env.get('PATH', '')}"
+    return env
+
+
+def _has_tool(name: str, env: Dict[str, str]) -> bool:
+    """Whether a tool is on the PATH of env."""
+    return shutil.which(name, path=env.get("PATH")) is not None
+
+
+async def get_repo_root(path: Path) -> Path:
+    """Get the top-level directory of the git repository containing path."""
+    return Path((await _git(path, "rev-parse", "--show-toplevel")).decode().strip())
+
+
+async def get_staged_files(repo_root: Path) -> List[StagedFile]:
+    """List staged (added, copied, modified or renamed) Python files.
+
+    The staged blob id of each file is compared with the hash of its working
+    tree content to tell fully staged files from partially staged ones.
+    """
+    names = [
+        name
+        for name in (
+            await _git(
+                repo_root, "diff", "--cached", "--name-only", "--diff-filter=ACMR", "-z"
+            )
+        )
+        .decode()
+        .split("\0")
+        if name.endswith(".py")
+    ]
+    if not names:
+        return []
+
+    blobs: Dict[str, str] = {}
+    for entry in (
+        (await _git(repo_root, "ls-files", "-s", "-z", "--", *names))
+        .decode()
+        .split("\0")
+    ):
+        if entry:
+            info, name = entry.split("\t", 1)
+            blobs[name] = info.split()[1]
+
+    on_disk = [name for name in names if (repo_root / name).is_file()]
+    worktree: Dict[str, str] = {}
+    if on_disk:
+        hashes = await _git(repo_root, "hash-object", "--", *on_disk)
+        worktree = dict(zip(on_disk, hashes.decode().split()))
+
+    return [
+        StagedFile(
+            path=repo_root / name,
+            name=name,
+            blob=blobs[name],
+            matches_worktree=worktree.get(name) == blobs[name],
+        )
+        for name in names
+        if name in blobs
+    ]
+
+
+def _by_directory(files: List[StagedFile]) -> List[List[Path]]:
+    """Group files by directory.
+
+    Tools find their config from the directory of the files they run on, so
+    checking each directory separately produces the same cache keys as the
+    daemon's per-file runs.
+    """
+    groups: Dict[Path, List[Path]] = defaultdict(list)
+    for staged in files:
+        groups[staged.path.parent].append(staged.path)
+    return list(groups.values())
+
+
+async def _blob(repo_root: Path, staged: StagedFile) -> bytes:
+    """Read the staged content of a file."""
+    return await _git(repo_root, "cat-file", "blob", staged.blob)
+
+
+async def check_format(
+    repo_root: Path, files: List[StagedFile], agent_config: Dict[str, Any]
+) -> CheckResult:
+    """Check that staged files are formatted with black."""
+    result = CheckResult("format", files=len(files))
+    env = _tool_env(repo_root)
+    if not _has_tool("black", env):
+        result.skipped = True
+        return result
+
+    formatter = FormatterAgent("formatter", [], EventBus(), agent_config)
+    fresh = [f for f in files if f.matches_worktree]
+    batches = await asyncio.gather(
+        *(formatter.check_files(paths) for paths in _by_directory(fresh))
+    )
+    for statuses in batches:
+        for path, (needs_format, error) in statuses.items():
+            if error:
+                result.problems.append(error)
+            elif needs_format:
+                result.problems.append(f"would reformat {path.relative_to(repo_root)}")
+
+    for staged in files:
+        if staged.matches_worktree:
+            continue
+        code, _, stderr = await _run(
+            ["black", "--check", "--quiet", "--stdin-filename", staged.name, "-"],
+            repo_root,
+            stdin=await _blob(repo_root, staged),
+            env=env,
+        )
+        if code == 1:
+            result.problems.append(f"would reformat {staged.name} (staged)")
+        elif code != 0:
+            result.problems.append(stderr.decode(errors="replace").strip())
+
+    result.passed = not result.problems
+    return result
+
+
+def _format_ruff_issue(issue: Dict[str, Any], name: str) -> str:
+    """Render a ruff JSON issue as path:row:col: code message."""
+    location = issue.get("location") or {}
+    return (
+        f"{name}:{location.get('row', '?')}:{location.get('column', '?')}: "
+        f"{issue.get('code') or ''} {issue.get('message', '')}".rstrip()
+    )
+
+
+async def check_lint(
+    repo_root: Path, files: List[StagedFile], agent_config: Dict[str, Any]
+) -> CheckResult:
+    """Lint staged files with ruff."""
+    result = CheckResult("lint", files=len(files))
+    env = _tool_env(repo_root)
+    if not _has_tool("ruff", env):
+        result.skipped = True
+        return result
+
+    linter = LinterAgent("linter", [], EventBus(), agent_config)
+    fresh = [f for f in files if f.matches_worktree]
+    batches = await asyncio.gather(
+        *(linter.lint_files(paths) for paths in _by_directory(fresh))
+    )
+    for lint_results in batches:
+        for path, lint_result in lint_results.items():
+            name = str(path.relative_to(repo_root))
+            if not lint_result.success:
+                result.problems.append(f"{name}: {lint_result.error}")
+                continue
+            result.problems.extend(
+                _format_ruff_issue(issue, name) for issue in lint_result.issues
+            )
+
+    for staged in files:
+        if staged.matches_worktree:
+            continue
+        code, stdout, stderr = await _run(
+            ["ruff", "check", "--output-format", "json"]
+            + ["--stdin-filename", staged.name, "-"],
+            repo_root,
+            stdin=await _blob(repo_root, staged),
+            env=env,
+        )
+        # ruff exits 1 when it finds issues; anything else but 0 is an error
+        if code not in (0, 1):
+            error = stderr.decode(errors="replace").strip()
+            result.problems.append(
+                f"{staged.name} (staged): {error or f'ruff exited with code {code}'}"
+            )
+            continue
+        try:
+            issues = json.loads(stdout)
+        except json.JSONDecodeError:
+            issues = None
+        if not isinstance(issues, list):
+            result.problems.append(
+                f"{staged.name} (staged): ruff produced invalid output"
+            )
+            continue
+        result.problems.extend(
+            _format_ruff_issue(issue, f"{staged.name} (staged)") for issue in issues
+        )
+
+    result.passed = not result.problems
+    return result
+
+
+def _worktree_note(files: List[StagedFile]) -> str:
+    """Note for checks that read partially staged files from the working tree."""
+    partial = [f.name for f in files if not f.matches_worktree]
+    if not partial:
+        return ""
+    return f"checked the working tree copy of partially staged {', '.join(partial)}"
+
+
+async def check_types(repo_root: Path, files: List[StagedFile]) -> CheckResult:
+    """Type check staged files with mypy."""
+    result = CheckResult("typecheck", files=len(files), note=_worktree_note(files))
+    env = _tool_env(repo_root)
+    if not _has_tool("mypy", env):
+        result.skipped = True
+        return result
+
+    code, stdout, stderr = await _run(
+        ["mypy", *(f.name for f in files)], repo_root, env=env
+    )
+    if code != 0:
+        result.passed = False
+        result.problems = [
+            line
+            for line in stdout.decode(errors="replace").splitlines()
+            if line and not line.startswith("Found ")
+        ]
+        # Exit code 1: type errors; anything else is a config or usage error
+        if code != 1:
+            result.problems += stderr.decode(errors="replace").splitlines() or [
+                f"mypy exited with code {code}"
+            ]
+    return result
+
+
+def _affected_tests(repo_root: Path, files: List[StagedFile]) -> List[Path]:
+    """Staged test files plus the tests that import any staged file."""
+    devloop_dir = repo_root / ".devloop"
+    graph = ImportGraph(
+        repo_root,
+        src_dirs=TestRunnerAgent._detect_src_dirs(repo_root),
+        cache_path=devloop_dir / "import_graph.json" if devloop_dir.is_dir() else None,
+    )
+    graph.build()
+    tests = set(graph.get_affected_tests_for(f.path for f in files))
+    for staged in files:
+        if staged.path.name.startswith("test_") or staged.path.stem.endswith("_test"):
+            tests.add(staged.path)
+    return sorted(t for t in tests if t.exists())
+
+
+async def check_tests(repo_root: Path, files: List[StagedFile]) -> CheckResult:
+    """Run the tests affected by the staged files."""
+    result = CheckResult("tests", note=_worktree_note(files))
+    env = _tool_env(repo_root)
+    if not _has_tool("pytest", env):
+        result.skipped = True
+        return result
+
+    tests = await asyncio.to_thread(_affected_tests, repo_root, files)
+    result.files = len(tests)
+    if not tests:
+        return result
+
+    code, stdout, _ = await _run(
+        ["pytest", "-q", "--no-header", *map(str, tests)], repo_root, env=env
+    )
+    # Exit code 5: no tests collected
+    if code not in (0, 5):
+        result.passed = False
+        result.problems = stdout.decode(errors="replace").splitlines()[-50:]
+    return result
+
+
+async def run_precommit(
+    path: Path, checks: Sequence[str] = CHECKS
+) -> List[CheckResult]:
+    """Run the pre-commit checks on the staged files of a repository.
+
+    Args:
+        path: Any directory inside the repository
+        checks: Names of the checks to run (see ``CHECKS``)
+
+    Returns:
+        Results in the order of ``checks``; empty if no Python files are staged
+
+    Raises:
+        PrecommitError: If the staged files cannot be read from git
+    """
+    repo_root = await get_repo_root(path)
+    files = await get_staged_files(repo_root)
+    if not files:
+        return []
+
+    config = Config(str(repo_root / ".devloop" / "agents.json")).load()
+    agents = config.get("agents", {})
+
+    def agent_config(name: str) -> Dict[str, Any]:
+        return dict((agents.get(name) or {}).get("config", {}))
+
+    runners: Dict[str, Callable[[], Awaitable[CheckResult]]] = {
+        "format": lambda: check_format(repo_root, files, agent_config("formatter")),
+        "lint": lambda: check_lint(repo_root, files, agent_config("linter")),
+        "typecheck": lambda: check_types(repo_root, files),
+        "tests": lambda: check_tests(repo_root, files),
+    }
+
+    async def timed(name: str) -> CheckResult:
+        start = time.perf_counter()
+        result = await runners[name]()
+        result.duration = time.perf_counter() - start
+        return result
+
+    # Key results exactly like the daemon, without re-probing tool versions
+    response = await asyncio.to_thread(query_daemon, repo_root, "tool_versions")
+    if response and response.get("ok"):
+        remember_tool_versions(response.get("tool_versions", []))
+
+    # Share the daemon's cache so results computed here warm it as well
+    if (repo_root / ".devloop").is_dir():
+        result_cache.db_path = repo_root / ".devloop" / "result_cache.db"
+        await result_cache.initialize()
+    try:
+        return list(await asyncio.gather(*(timed(name) for name in checks)))
+    finally:
+        await result_cache.close()
+
+
+def precommit(
+    path: Path = typer.Argument(Path.cwd(), help="Project directory"),
+    skip: List[str] = typer.Option(
+        [], "--skip", help=f"Check to skip (one of: {', '.join(CHECKS)})"
+    ),
+):
+    """Check staged files, reusing the daemon's results where still valid."""
+    unknown = [name for name in skip if name not in CHECKS]
+    if unknown:
+        console.print(f"[red]Unknown check(s):[/red] {', '.join(unknown)}")
+        raise typer.Exit(2)
+
+    start = time.perf_counter()
+    try:
+        results = asyncio.run(
+            run_precommit(path, [name for name in CHECKS if name not in skip])
+        )
+    except PrecommitError as e:
+        console.print(f"[red]✗[/red] Could not read staged files: {e}")
+        raise typer.Exit(1)
+
+    if not results:
+        console.print("[dim]No staged Python files[/dim]")
+        return
+
+    for result in results:
+        if result.skipped:
+            console.print(f"[yellow]-[/yellow] {result.name}: tool not available")
+        elif result.passed:
+            console.print(
+                f"[green]✓[/green] {result.name} "
+                f"[dim]({result.files} files, {result.duration:.2f}s)[/dim]"
+            )
+        else:
+            console.print(f"[red]✗[/red] {result.name}")
+            for problem in result.problems:
+                console.print(f"    {problem}", markup=False, highlight=False)
+        if result.note and not result.skipped:
+            console.print(f"    note: {result.note}", style="dim", highlight=False)
+
+    elapsed = time.perf_counter() - start
+    if not all(r.passed for r in results):
+        console.print(f"\n[red]Pre-commit checks failed[/red] ({elapsed:.2f}s)")
+        raise typer.Exit(1)
+    console.print(f"\n[green]Pre-commit checks passed[/green] ({elapsed:.2f}s)")
@@ -1,77 +1,106 @@
-"""CLI entry point - v2 with real agents."""
+"""CLI entry point - v2 with real agents.
+
+Subcommand groups, agents and rich are imported only when a command needs
+them, so short commands (``version``, the hook entry points) start fast.
+"""
 
 import asyncio
+import importlib
+import json
 import logging
 import signal
 import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 import typer
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.table import Table
-
-from devloop.agents import (
-    AgentHealthMonitorAgent,
-    CodeRabbitAgent,
-    FormatterAgent,
-    GitCommitAssistantAgent,
-    LinterAgent,
-    PerformanceProfilerAgent,
-    SecurityScannerAgent,
-    SnykAgent,
-    TestRunnerAgent,
-    TypeCheckerAgent,
-)
-from devloop.collectors import FileSystemCollector
-from devloop.core import (
-    AgentManager,
-    Config,
-    ConfigWrapper,
-    EventBus,
-    context_store,
-    event_store,
-    get_action_logger,
-)
+from typer.core import TyperGroup
+
+from devloop.core import context_store, event_store, result_cache
+from devloop.core.action_logger import get_action_logger
 from devloop.core.amp_integration import check_agent_findings, show_agent_status
-from devloop.core.daemon_health import DaemonHealthCheck, check_daemon_health
-from devloop.core.error_handler import ErrorCode, ErrorSeverity, get_error_handler
-from devloop.core.error_notifier import ErrorNotifier
-from devloop.core.event_replayer import EventReplayer
-from devloop.core.transactional_io import initialize_transaction_system
-
-from .commands import audit as audit_cmd
-from .commands import custom_agents as custom_agents_cmd
-from .commands import feedback as feedback_cmd
-from .commands import insights as insights_cmd
-from .commands import marketplace as marketplace_cmd
-from .commands import mcp_server as mcp_server_cmd
-from .commands import metrics as metrics_cmd
-from .commands import release as release_cmd
-from .commands import summary as summary_cmd
-from .commands import telemetry as telemetry_cmd
-from .commands import doctor as doctor_cmd
-from .commands import tools as tools_cmd
+from devloop.core.config import Config, ConfigWrapper
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from devloop.core.event import EventBus
+    from devloop.core.manager import AgentManager
+
+# Subcommand name -> (module in devloop.cli.commands, attribute). Typer
+# attributes become command groups, functions single commands.
+_LAZY_SUBCOMMANDS: Dict[str, Tuple[str, str]] = {
+    "summary": ("summary", "app"),
+    "custom": ("custom_agents", "app"),
+    "feedback": ("feedback", "app"),
+    "insights": ("insights", "app"),
+    "agent": ("marketplace", "app"),
+    "mcp-server": ("mcp_server", "app"),
+    "metrics": ("metrics", "app"),
+    "release": ("release", "app"),
+    "telemetry": ("telemetry", "app"),
+    "doctor": ("doctor", "app"),
+    "tools": ("tools", "app"),
+    "precommit": ("precommit", "precommit"),
+}
+
+
+class _LazyGroup(TyperGroup):
+    """Top-level group that imports subcommand modules on first use."""
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        """List eager commands followed by the not yet loaded subcommands."""
+        names = super().list_commands(ctx)
+        return names + [name for name in _LAZY_SUBCOMMANDS if name not in names]
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        """Get a command, importing its module if it is a lazy subcommand."""
+        if cmd_name in _LAZY_SUBCOMMANDS and cmd_name not in self.commands:
+            module_name, attr = _LAZY_SUBCOMMANDS[cmd_name]
+            module = importlib.import_module(f"devloop.cli.commands.{module_name}")
+            target = getattr(module, attr)
+            command: Any
+            if isinstance(target, typer.Typer):
+                command = typer.main.get_group(target)
+                command.name = cmd_name
+            else:
+                single = typer.Typer()
+                single.command(name=cmd_name)(target)
+                command = typer.main.get_command(single)
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+class _LazyConsole:
+    """Stand-in for a rich ``Console``, created on first use.
+
+    Importing rich costs more than many commands take to run.
+    """
+
+    def __init__(self) -> None:
+        self._console: Optional["Console"] = None
+
+    def resolve(self) -> "Console":
+        """Get the real console, creating it first if needed."""
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return self._console
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate to the real console."""
+        return getattr(self.resolve(), name)
+
 
 _typer_app = typer.Typer(
-    help="DevLoop - Development workflow automation", add_completion=False
+    help="DevLoop - Development workflow automation",
+    add_completion=False,
+    cls=_LazyGroup,
 )
-console = Console()
-
-_typer_app.add_typer(summary_cmd.app, name="summary")
-_typer_app.add_typer(custom_agents_cmd.app, name="custom")
-_typer_app.add_typer(feedback_cmd.app, name="feedback")
-_typer_app.add_typer(insights_cmd.app, name="insights")
-_typer_app.add_typer(marketplace_cmd.app, name="agent")
-_typer_app.add_typer(mcp_server_cmd.app, name="mcp-server")
-_typer_app.add_typer(metrics_cmd.app, name="metrics")
-_typer_app.add_typer(release_cmd.app, name="release")
-_typer_app.add_typer(telemetry_cmd.app, name="telemetry")
-_typer_app.add_typer(doctor_cmd.app, name="doctor")
-_typer_app.add_typer(tools_cmd.app, name="tools")
+console = _LazyConsole()
 
 # Wrap Typer app to handle Click-based audit command
 # Note: We can't use add_typer with Click groups due to Typer version compatibility
@@ -97,6 +126,8 @@ class _WrappedApp:
         try:
             if len(sys.argv) > 1 and sys.argv[1] == "audit":
                 # Delegate to Click for audit command
+                from .commands import audit as audit_cmd
+
                 audit_cmd.audit(sys.argv[2:], standalone_mode=False)
                 exit_code = 0
                 return
@@ -202,12 +233,14 @@ def health():
 
 def setup_logging(verbose: bool = False):
     """Setup logging configuration."""
+    from rich.logging import RichHandler
+
     level = logging.DEBUG if verbose else logging.INFO
 
     logging.basicConfig(
         level=level,
         format="%(message)s",
-        handlers=[RichHandler(console=console, rich_tracebacks=True)],
+        handlers=[RichHandler(console=console.resolve(), rich_tracebacks=True)],
     )
 
 
@@ -344,8 +377,11 @@ def watch(
         console.print("\n[yellow]Shutting down...[/yellow]")
     except Exception as e:
         # Display critical startup errors with help
+        from devloop.core.error_handler import get_error_handler
+        from devloop.core.error_notifier import ErrorNotifier
+
         error_handler = get_error_handler()
-        error_notifier = ErrorNotifier(console)
+        error_notifier = ErrorNotifier(console.resolve())
 
         if error_handler.has_critical_error():
             critical_error = error_handler.get_critical_error()
@@ -414,6 +450,8 @@ def _load_watch_config(path: Path, config_path: Path | None) -> ConfigWrapper:
     Raises:
         SystemExit: On configuration errors (handled by error_handler)
     """
+    from devloop.core.error_handler import ErrorCode, ErrorSeverity, get_error_handler
+
     error_handler = get_error_handler()
 
     try:
@@ -450,23 +488,24 @@ def _load_watch_config(path: Path, config_path: Path | None) -> ConfigWrapper:
         raise  # Unreachable but satisfies type checker
 
 
-# Agent registry: maps agent names to (class, default_triggers, uses_name_param)
-_AGENT_REGISTRY: dict[str, tuple[type, list[str], bool]] = {
-    "linter": (LinterAgent, ["file:modified"], True),
-    "formatter": (FormatterAgent, ["file:modified"], True),
-    "test-runner": (TestRunnerAgent, ["file:modified"], True),
-    "agent-health-monitor": (AgentHealthMonitorAgent, ["agent:*:completed"], True),
-    "type-checker": (TypeCheckerAgent, [], False),
-    "security-scanner": (SecurityScannerAgent, [], False),
-    "git-commit-assistant": (GitCommitAssistantAgent, [], False),
-    "performance-profiler": (PerformanceProfilerAgent, [], False),
-    "snyk": (SnykAgent, ["file:modified", "file:created"], True),
-    "code-rabbit": (CodeRabbitAgent, ["file:modified", "file:created"], True),
+# Agent registry: maps agent names to (class name in devloop.agents,
+# default_triggers, uses_name_param)
+_AGENT_REGISTRY: dict[str, tuple[str, list[str], bool]] = {
+    "linter": ("LinterAgent", ["file:modified"], True),
+    "formatter": ("FormatterAgent", ["file:modified"], True),
+    "test-runner": ("TestRunnerAgent", ["file:modified"], True),
+    "agent-health-monitor": ("AgentHealthMonitorAgent", ["agent:*:completed"], True),
+    "type-checker": ("TypeCheckerAgent", [], False),
+    "security-scanner": ("SecurityScannerAgent", [], False),
+    "git-commit-assistant": ("GitCommitAssistantAgent", [], False),
+    "performance-profiler": ("PerformanceProfilerAgent", [], False),
+    "snyk": ("SnykAgent", ["file:modified", "file:created"], True),
+    "code-rabbit": ("CodeRabbitAgent", ["file:modified", "file:created"], True),
 }
 
 
 def _register_agents(
-    config: ConfigWrapper, event_bus: EventBus, agent_manager: AgentManager
+    config: ConfigWrapper, event_bus: "EventBus", agent_manager: "AgentManager"
 ) -> None:
     """Register all enabled agents based on configuration.
 
@@ -477,8 +516,11 @@ def _register_agents(
         event_bus: Event bus for agent communication
         agent_manager: Agent manager to register agents with
     """
+    import devloop.agents
+    from devloop.core.event import EventQueue
+
     for agent_name, (
-        agent_class,
+        class_name,
         default_triggers,
         uses_name_param,
     ) in _AGENT_REGISTRY.items():
@@ -488,6 +530,7 @@ def _register_agents(
         agent_config = config.get_agent_config(agent_name) or {}
         triggers = agent_config.get("triggers", default_triggers)
         inner_config = agent_config.get("config", {})
+        agent_class = getattr(devloop.agents, class_name)
 
         if uses_name_param:
             agent = agent_class(
@@ -499,11 +542,29 @@ def _register_agents(
         else:
             agent = agent_class(config=inner_config, event_bus=event_bus)
 
+        # "debounce" is a common option honoured by the agent base class
+        if "debounce" in inner_config:
+            agent.debounce_ms = inner_config["debounce"]
+
+        # Batch and queue settings live next to "triggers" since several
+        # agents reject unknown keys in their own config
+        if "batchWindow" in agent_config:
+            agent.batch_window_ms = agent_config["batchWindow"]
+        if "maxBatchSize" in agent_config:
+            agent.max_batch_size = agent_config["maxBatchSize"]
+        if "maxConcurrency" in agent_config:
+            agent.max_concurrency = agent_config["maxConcurrency"]
+        if "queueSize" in agent_config or "overflowPolicy" in agent_config:
+            agent.configure_queue(
+                agent_config.get("queueSize", EventQueue.DEFAULT_MAX_SIZE),
+                agent_config.get("overflowPolicy", "drop-oldest"),
+            )
+
         agent_manager.register(agent)
 
 
 def _register_pipelines(
-    config: ConfigWrapper, event_bus: EventBus, agent_manager: AgentManager
+    config: ConfigWrapper, event_bus: "EventBus", agent_manager: "AgentManager"
 ) -> list:
     """Register pipelines from configuration.
 
@@ -572,17 +633,23 @@ async def _initialize_stores(path: Path) -> None:
     event_store.db_path = path / ".devloop" / "events.db"
     await event_store.initialize()
 
+    result_cache.db_path = path / ".devloop" / "result_cache.db"
+    await result_cache.initialize()
+
     console.print(f"[dim]Context store: {context_store.context_dir}[/dim]")
     console.print(f"[dim]Event store: {event_store.db_path}[/dim]")
+    console.print(f"[dim]Result cache: {result_cache.db_path}[/dim]")
 
 
-async def _replay_events(event_bus: EventBus, agent_manager: AgentManager) -> None:
+async def _replay_events(event_bus: "EventBus", agent_manager: "AgentManager") -> None:
     """Replay missed events and report gaps.
 
     Args:
         event_bus: Event bus for event replay
         agent_manager: Agent manager with registered agents
     """
+    from devloop.core.event_replayer import EventReplayer
+
     replayer = EventReplayer(event_bus, agent_manager)
     replay_stats = await replayer.replay_all_agents()
 
@@ -623,6 +690,13 @@ async def watch_async(path: Path, config_path: Path | None) -> None:
         path: Project directory to watch
         config_path: Optional path to configuration file
     """
+    from devloop.collectors.filesystem import FileSystemCollector
+    from devloop.core.daemon_health import DaemonHealthCheck
+    from devloop.core.event import EventBus
+    from devloop.core.manager import AgentManager
+    from devloop.core.query_server import QueryServer
+    from devloop.core.transactional_io import initialize_transaction_system
+
     # Load configuration
     config = _load_watch_config(path, config_path)
 
@@ -654,6 +728,10 @@ async def watch_async(path: Path, config_path: Path | None) -> None:
     health_check = DaemonHealthCheck(path, heartbeat_interval=30)
     await health_check.start()
 
+    # Serve hook queries from the in-memory context store
+    query_server = QueryServer(path, context_store)
+    await query_server.start()
+
     # Register all enabled agents
     _register_agents(config, event_bus, agent_manager)
 
@@ -689,6 +767,7 @@ async def watch_async(path: Path, config_path: Path | None) -> None:
     # Stop everything
     cleanup_task.cancel()
     await health_check.stop()
+    await query_server.stop()
     for pipeline in pipelines:
         await pipeline.stop()
     await agent_manager.stop_all()
@@ -700,6 +779,13 @@ async def watch_async(path: Path, config_path: Path | None) -> None:
     except asyncio.CancelledError:
         pass
 
+    # Flush queued events to disk
+    await event_store.close()
+    await result_cache.close()
+
+    # Write pending findings snapshots
+    await context_store.close()
+
 
 def _setup_devloop_directory(path: Path) -> Path:
     """Create and configure .devloop directory."""
@@ -1229,33 +1315,58 @@ fi
 # Consume stdin
 cat > /dev/null
 
-# Fast check: Does context exist? Prefer .last_update marker (fastest)
-CONTEXT_DIR="$PROJECT_DIR/.devloop/context"
-MARKER_FILE="$CONTEXT_DIR/.last_update"
-CONTEXT_INDEX="$CONTEXT_DIR/index.json"
-
-if [[ -f "$MARKER_FILE" ]]; then
-    CHECK_FILE="$MARKER_FILE"
-elif [[ -f "$CONTEXT_INDEX" ]]; then
-    CHECK_FILE="$CONTEXT_INDEX"
-else
-    exit 0
+# Fastest check: ask the running daemon for live counts
+QUERY_SOCKET="$PROJECT_DIR/.devloop/query.sock"
+CHECK_NOW_COUNT=""
+if [[ -S "$QUERY_SOCKET" ]]; then
+    CHECK_NOW_COUNT=$(QUERY_SOCKET="$QUERY_SOCKET" python3 -S 2>/dev/null <<'PYTHON_EOF'
+import json
+import os
+import socket
+try:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(0.5)
+        client.connect(os.environ["QUERY_SOCKET"])
+        client.sendall(b'{"query": "counts"}\\n')
+        with client.makefile("rb") as stream:
+            response = json.loads(stream.readline())
+    print(int(response["counts"]["immediate"]))
+except (OSError, ValueError, KeyError, TypeError):
+    pass
+PYTHON_EOF
+)
 fi
 
-# Fast check: Is context stale (>30 min)?
-if [[ "$OSTYPE" == "darwin"* ]]; then
-    LAST_UPDATED=$(stat -f %m "$CHECK_FILE" 2>/dev/null || echo "0")
-else
-    LAST_UPDATED=$(stat -c %Y "$CHECK_FILE" 2>/dev/null || echo "0")
-fi
-NOW=$(date +%s)
-AGE_SECONDS=$((NOW - LAST_UPDATED))
-if [[ $AGE_SECONDS -gt 1800 ]]; then
-    exit 0
-fi
+# Daemon not running: fall back to the context files
+if [[ -z "$CHECK_NOW_COUNT" ]]; then
+    # Fast check: Does context exist? Prefer .last_update marker (fastest)
+    CONTEXT_DIR="$PROJECT_DIR/.devloop/context"
+    MARKER_FILE="$CONTEXT_DIR/.last_update"
+    CONTEXT_INDEX="$CONTEXT_DIR/index.json"
+
+    if [[ -f "$MARKER_FILE" ]]; then
+        CHECK_FILE="$MARKER_FILE"
+    elif [[ -f "$CONTEXT_INDEX" ]]; then
+        CHECK_FILE="$CONTEXT_INDEX"
+    else
+        exit 0
+    fi
 
-# Quick grep for check_now count
-CHECK_NOW_COUNT=$(grep -o '"check_now"[^}]*"count": [0-9]*' "$CONTEXT_INDEX" 2>/dev/null | grep -o '[0-9]*$' || echo "0")
+    # Fast check: Is context stale (>30 min)?
+    if [[ "$OSTYPE" == "darwin"* ]]; then
+        LAST_UPDATED=$(stat -f %m "$CHECK_FILE" 2>/dev/null || echo "0")
+    else
+        LAST_UPDATED=$(stat -c %Y "$CHECK_FILE" 2>/dev/null || echo "0")
+    fi
+    NOW=$(date +%s)
+    AGE_SECONDS=$((NOW - LAST_UPDATED))
+    if [[ $AGE_SECONDS -gt 1800 ]]; then
+        exit 0
+    fi
+
+    # Quick grep for check_now count
+    CHECK_NOW_COUNT=$(grep -o '"check_now"[^}]*"count": [0-9]*' "$CONTEXT_INDEX" 2>/dev/null | grep -o '[0-9]*$' || echo "0")
+fi
 
 if [[ "$CHECK_NOW_COUNT" -gt 0 ]]; then
     date +%s > "$DEBOUNCE_FILE"
@@ -1272,7 +1383,8 @@ exit 0
 # PostToolUse hook: Show relevant findings after file modifications
 #
 # Shows existing findings for the edited file after Edit/Write completes.
-# Silent when no findings exist.
+# Silent when no findings exist. Asks the running daemon over its query
+# socket and falls back to reading .devloop/context when it is not running.
 #
 PROJECT_DIR="${CLAUDE_PROJECT_DIR:-.}"
 cd "$PROJECT_DIR" || exit 0
@@ -1281,12 +1393,30 @@ INPUT_FILE=$(mktemp)
 cat > "$INPUT_FILE"
 export INPUT_FILE PROJECT_DIR
 
-python3 << 'PYTHON_EOF'
+python3 -S << 'PYTHON_EOF'
 import json
 import os
+import socket
 import sys
 from pathlib import Path
 
+def query_daemon(project_dir, request):
+    socket_path = project_dir / ".devloop" / "query.sock"
+    if not hasattr(socket, "AF_UNIX") or not socket_path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(0.5)
+            client.connect(str(socket_path))
+            client.sendall(json.dumps(request).encode() + b"\\n")
+            with client.makefile("rb") as stream:
+                response = json.loads(stream.readline())
+    except (OSError, ValueError):
+        return None
+    if isinstance(response, dict) and response.get("ok"):
+        return response
+    return None
+
 def get_findings_for_file(file_path, context_dir):
     findings = []
     try:
@@ -1359,10 +1489,16 @@ if not isinstance(tool_input, dict):
 file_path = tool_input.get("file_path") or tool_input.get("path", "")
 if not file_path:
     sys.exit(0)
-context_dir = project_dir / ".devloop" / "context"
-if not context_dir.exists():
-    sys.exit(0)
-findings = get_findings_for_file(file_path, context_dir)
+response = query_daemon(
+    project_dir, {"query": "findings", "file": os.path.abspath(file_path)}
+)
+if response is not None:
+    findings = response.get("findings", [])
+else:
+    context_dir = project_dir / ".devloop" / "context"
+    if not context_dir.exists():
+        sys.exit(0)
+    findings = get_findings_for_file(file_path, context_dir)
 if findings:
     output = format_output(findings, file_path)
     if output:
@@ -1671,6 +1807,10 @@ def init(
 @app.command()
 def status():
     """Show configuration and agent status."""
+    from rich.table import Table
+
+    from devloop.core.manager import RESOURCE_REPORT_FILE
+
     # Load configuration
     config_manager = Config()
     config_dict = config_manager.load()
@@ -1689,10 +1829,67 @@ def status():
 
     console.print(table)
 
+    cache_db = Path.cwd() / ".devloop" / "result_cache.db"
+    if cache_db.exists():
+        stats = asyncio.run(_result_cache_stats(cache_db))
+        console.print(
+            f"\nResult cache: {stats['entries']} entries, "
+            f"{stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hit_rate']:.0%} hit rate)"
+        )
+
+    _print_agent_resources(Path.cwd() / ".devloop" / RESOURCE_REPORT_FILE)
+
+
+def _print_agent_resources(report_file: Path) -> None:
+    """Print per-agent resource usage last written by the daemon."""
+    from rich.table import Table
+
+    if not report_file.exists():
+        return
+    try:
+        report = json.loads(report_file.read_text())
+    except (OSError, json.JSONDecodeError):
+        return
+
+    age = int(time.time() - report.get("timestamp", 0))
+    table = Table(title=f"Agent Resource Usage (updated {age}s ago)")
+    table.add_column("Agent", style="cyan")
+    table.add_column("Processes", justify="right")
+    table.add_column("CPU %", justify="right", style="yellow")
+    table.add_column("Memory (MB)", justify="right", style="blue")
+    table.add_column("CPU time (s)", justify="right")
+
+    for agent_name, usage in sorted(report.get("agents", {}).items()):
+        cpu_seconds = usage.get("cpu_seconds")
+        table.add_row(
+            agent_name,
+            str(usage.get("processes", 0)),
+            f"{usage.get('cpu_percent', 0.0):.1f}",
+            f"{usage.get('memory_mb', 0.0):.1f}",
+            f"{cpu_seconds:.2f}" if cpu_seconds is not None else "-",
+        )
+
+    console.print(table)
+
+
+async def _result_cache_stats(db_path: Path) -> Dict[str, Any]:
+    """Read result cache statistics without a running daemon."""
+    from devloop.core.result_cache import ResultCache
+
+    cache = ResultCache(db_path)
+    await cache.initialize()
+    try:
+        return await cache.get_stats()
+    finally:
+        await cache.close()
+
 
 @app.command()
 def daemon_status(path: Path = typer.Argument(Path.cwd(), help="Project directory")):
     """Check daemon health and status."""
+    from devloop.core.daemon_health import check_daemon_health
+
     health_result = check_daemon_health(path)
 
     status = health_result["status"]
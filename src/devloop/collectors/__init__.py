@@ -1,11 +1,36 @@
 """Event collectors."""
 
-from .base import BaseCollector
-from .filesystem import FileSystemCollector
-from .git import GitCollector
-from .manager import CollectorManager
-from .process import ProcessCollector
-from .system import SystemCollector
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import BaseCollector
+    from .filesystem import FileSystemCollector
+    from .git import GitCollector
+    from .manager import CollectorManager
+    from .process import ProcessCollector
+    from .system import SystemCollector
+
+# Exported name -> submodule defining it, imported on first access
+_LAZY_IMPORTS = {
+    "BaseCollector": "base",
+    "FileSystemCollector": "filesystem",
+    "GitCollector": "git",
+    "CollectorManager": "manager",
+    "ProcessCollector": "process",
+    "SystemCollector": "system",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name from its submodule on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "BaseCollector",
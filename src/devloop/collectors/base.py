@@ -36,6 +36,10 @@ class BaseCollector(ABC):
         """Check if collector is running."""
         return self._running
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Get collector-specific counters (empty by default)."""
+        return {}
+
     def _set_running(self, running: bool) -> None:
         """Set running state."""
         self._running = running
@@ -0,0 +1,174 @@
+"""Per-path coalescing of filesystem events."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Coroutine, Dict, Optional, Set
+
+EmitCallback = Callable[[str, str, Dict[str, Any]], Coroutine[Any, Any, None]]
+
+
+@dataclass
+class _PendingEvent:
+    """A coalesced event waiting for its path to go quiet."""
+
+    event_type: str
+    path: str
+    extra: Dict[str, Any] = field(default_factory=dict)
+    first_seen: float = field(default_factory=time.monotonic)
+    count: int = 1
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class PathEventCoalescer:
+    """Collapse bursts of filesystem events per path within a time window.
+
+    Editors typically save with a burst such as ``create tmp -> modify tmp ->
+    move tmp over target``. Instead of emitting each raw event, the coalescer
+    keeps one pending event per path and emits it once the path has been quiet
+    for ``window`` seconds (or ``max_delay`` seconds after the first event, so
+    a continuously written file still produces events).
+
+    Merge rules for a path with a pending event:
+
+    - ``created`` + ``modified`` -> ``created``
+    - ``deleted`` + ``created`` -> ``modified`` (atomic replace)
+    - ``created`` + ``deleted`` -> nothing (transient file)
+    - ``moved`` of a pending ``created`` file -> ``modified`` on the destination
+
+    All methods must be called from the event loop thread.
+    """
+
+    def __init__(
+        self,
+        emit: EmitCallback,
+        window: float = 0.1,
+        max_delay: Optional[float] = None,
+    ):
+        self._emit = emit
+        self.window = window
+        self.max_delay = max_delay if max_delay is not None else window * 10
+        self._pending: Dict[str, _PendingEvent] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats: Dict[str, int] = {"received": 0, "emitted": 0, "suppressed": 0}
+
+    def add(
+        self, event_type: str, path: str, extra: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Record a raw filesystem event."""
+        self._stats["received"] += 1
+
+        if event_type == "file:moved":
+            self._record_move(path, (extra or {}).get("dest_path"))
+        else:
+            self._record(event_type, path, dict(extra or {}), count=1)
+
+    def _record(
+        self, event_type: str, path: str, extra: Dict[str, Any], count: int
+    ) -> None:
+        """Merge ``count`` raw events of one type into the pending event for a path."""
+        pending = self._pending.get(path)
+        if pending is None:
+            self._schedule(path, _PendingEvent(event_type, path, extra, count=count))
+            return
+
+        pending.count += count
+        if event_type == "file:modified" and pending.event_type in (
+            "file:created",
+            "file:moved",
+        ):
+            pass  # Keep the more specific pending type
+        elif event_type == "file:created" and pending.event_type == "file:deleted":
+            pending.event_type = "file:modified"
+            pending.extra = extra
+        elif event_type == "file:deleted" and pending.event_type == "file:created":
+            self._drop(path)  # Transient file: never tell anyone
+            return
+        else:
+            pending.event_type = event_type
+            pending.path = path
+            pending.extra = extra
+
+        self._schedule(path, pending)
+
+    def _record_move(self, src_path: str, dest_path: Optional[str]) -> None:
+        """Handle a move, folding temp-file saves into the destination."""
+        src_pending = self._pending.pop(src_path, None)
+        carried = 1
+        if src_pending is not None:
+            if src_pending.timer:
+                src_pending.timer.cancel()
+            carried += src_pending.count
+
+        if not dest_path:
+            self._record("file:moved", src_path, {}, count=carried)
+        elif src_pending is not None and src_pending.event_type == "file:created":
+            # Editor save: tmp file renamed over the target
+            self._record("file:modified", dest_path, {}, count=carried)
+        else:
+            # Key by destination so later edits of the new path merge in
+            pending = self._pending.get(dest_path)
+            if pending is None:
+                pending = _PendingEvent("file:moved", src_path, count=0)
+            pending.event_type = "file:moved"
+            pending.path = src_path
+            pending.extra = {"dest_path": dest_path}
+            pending.count += carried
+            self._schedule(dest_path, pending)
+
+    def _drop(self, key: str) -> None:
+        """Discard a pending event, counting all of its raw events as suppressed."""
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        if pending.timer:
+            pending.timer.cancel()
+        self._stats["suppressed"] += pending.count
+
+    def _schedule(self, key: str, pending: _PendingEvent) -> None:
+        """(Re)arm the flush timer for a pending event."""
+        self._pending[key] = pending
+        if pending.timer:
+            pending.timer.cancel()
+
+        elapsed = time.monotonic() - pending.first_seen
+        delay = max(0.0, min(self.window, self.max_delay - elapsed))
+        loop = asyncio.get_running_loop()
+        pending.timer = loop.call_later(delay, self._flush_key, key)
+
+    def _flush_key(self, key: str) -> None:
+        """Emit the pending event for a path."""
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+
+        extra = {**pending.extra, "coalesced": pending.count}
+        self._stats["emitted"] += 1
+        self._stats["suppressed"] += pending.count - 1
+        task: asyncio.Task[None] = asyncio.get_running_loop().create_task(
+            self._emit(pending.event_type, pending.path, extra)
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush_all(self) -> None:
+        """Emit every pending event immediately and wait for delivery."""
+        for key in list(self._pending):
+            pending = self._pending[key]
+            if pending.timer:
+                pending.timer.cancel()
+            self._flush_key(key)
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of paths with a pending event."""
+        return len(self._pending)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get counters: raw events received, events emitted and suppressed."""
+        return {**self._stats, "pending": len(self._pending)}
@@ -1,19 +1,51 @@
 """Filesystem event collector using watchdog."""
 
 import asyncio
+import fnmatch
+import os
+import re
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, FrozenSet, List, Optional, Pattern, Tuple
 
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
 from devloop.collectors.base import BaseCollector
+from devloop.collectors.coalescer import PathEventCoalescer
 from devloop.core.event import EventBus
 from devloop.security.path_validator import PathValidator
 
 
+def _compile_ignore_patterns(
+    patterns: List[str],
+) -> Tuple[FrozenSet[str], Optional[Pattern[str]]]:
+    """Split ignore patterns into directory names and one compiled glob.
+
+    ``*/name/*`` patterns (all the defaults) match paths with ``name`` as a
+    directory component. Other patterns are fnmatch globs, combined into a
+    single regular expression.
+    """
+    directories = set()
+    globs = []
+    for pattern in patterns:
+        match = re.fullmatch(r"\*/([^*?\[/]+)/\*", pattern)
+        if match:
+            directories.add(match.group(1))
+        else:
+            globs.append(fnmatch.translate(pattern))
+    return frozenset(directories), re.compile("|".join(globs)) if globs else None
+
+
 class FileSystemCollector(BaseCollector, FileSystemEventHandler):
-    """Collects filesystem events and emits them to the event bus."""
+    """Collects filesystem events and emits them to the event bus.
+
+    Raw watchdog events are coalesced per path for ``debounce_ms``
+    milliseconds (default 100) before being emitted, so an editor's save
+    burst produces a single event. Set ``debounce_ms`` to 0 to disable.
+
+    Paths are validated with a directory-caching ``PathValidator``;
+    directory create, delete and move events invalidate its cache.
+    """
 
     def __init__(self, event_bus: EventBus, config: Dict[str, Any] | None = None):
         super().__init__("filesystem", event_bus, config)
@@ -30,6 +62,11 @@ class FileSystemCollector(BaseCollector, FileSystemEventHandler):
                 "*/venv/*",
             ],
         )
+        self._ignored_dirs, self._ignore_glob = _compile_ignore_patterns(
+            self.ignore_patterns
+        )
+        self.debounce_ms = self.config.get("debounce_ms", 100)
+        self._coalescer: PathEventCoalescer | None = None
         self.observer = Observer()
         self._loop: asyncio.AbstractEventLoop | None = (
             None  # Store reference to the event loop
@@ -41,22 +78,36 @@ class FileSystemCollector(BaseCollector, FileSystemEventHandler):
             project_root,
             allow_symlinks=False,  # Reject symlinks for security
             blocked_patterns=["*.exe", "*.dll", "*.so"],  # Block executables
+            cache_directories=True,
         )
 
     def should_ignore(self, path: str) -> bool:
-        """Check if path should be ignored."""
-        path_obj = Path(path)
-
-        for pattern in self.ignore_patterns:
-            # Simple pattern matching (could be improved with fnmatch)
-            pattern_clean = pattern.replace("*/", "").replace("/*", "")
-            if pattern_clean in str(path_obj):
-                return True
+        """Check if path should be ignored.
+
+        Glob patterns are tried against the full path and the path relative
+        to the project root; no filesystem access is needed.
+        """
+        if not self._ignored_dirs.isdisjoint(path.split(os.sep)[:-1]):
+            return True
+        if self._ignore_glob is None:
+            return False
+        if self._ignore_glob.match(path):
+            return True
+        root = f"{self.path_validator.project_root}{os.sep}"
+        return path.startswith(root) and bool(
+            self._ignore_glob.match(path[len(root) :])
+        )
 
-        return False
+    def _invalidate(self, event: FileSystemEvent) -> None:
+        """Drop cached directory resolutions a create/delete/move affects."""
+        self.path_validator.invalidate(event.src_path, event.is_directory)
+        dest_path = getattr(event, "dest_path", "")
+        if isinstance(dest_path, str) and dest_path:
+            self.path_validator.invalidate(dest_path, event.is_directory)
 
     def on_created(self, event: FileSystemEvent) -> None:
         """Handle file/directory created."""
+        self._invalidate(event)
         if event.is_directory or self.should_ignore(event.src_path):
             return
 
@@ -81,14 +132,13 @@ class FileSystemCollector(BaseCollector, FileSystemEventHandler):
 
     def on_deleted(self, event: FileSystemEvent) -> None:
         """Handle file/directory deleted."""
+        self._invalidate(event)
         if event.is_directory or self.should_ignore(event.src_path):
             return
 
-        # Validate path before emitting event (deleted files won't exist, so just check pattern)
-        try:
-            path_obj = Path(event.src_path).resolve()
-            path_obj.relative_to(self.path_validator.project_root)
-        except (ValueError, OSError):
+        # Validate path before emitting event (deleted files resolve like
+        # their directory)
+        if not self.path_validator.is_within_project(event.src_path):
             self.logger.warning(
                 f"Ignoring deleted path outside project: {event.src_path}"
             )
@@ -98,6 +148,7 @@ class FileSystemCollector(BaseCollector, FileSystemEventHandler):
 
     def on_moved(self, event: FileSystemEvent) -> None:
         """Handle file/directory moved/renamed."""
+        self._invalidate(event)
         if event.is_directory or self.should_ignore(event.src_path):
             return
 
@@ -125,18 +176,37 @@ class FileSystemCollector(BaseCollector, FileSystemEventHandler):
         self, event_type: str, path: str, extra_payload: Dict[str, Any] | None = None
     ) -> None:
         """Emit a filesystem event to the event bus (synchronous version for watchdog threads)."""
+        # Schedule work from watchdog thread to asyncio event loop
+        # This is thread-safe and handles the watchdog (threading) -> asyncio bridge
+        if not (self._loop and self._loop.is_running()):
+            return
+
+        if self._coalescer is not None:
+            self._loop.call_soon_threadsafe(
+                self._coalescer.add, event_type, path, extra_payload
+            )
+        else:
+            asyncio.run_coroutine_threadsafe(
+                self._emit_path_event(event_type, path, extra_payload),
+                self._loop,
+            )
+
+    async def _emit_path_event(
+        self, event_type: str, path: str, extra_payload: Dict[str, Any] | None = None
+    ) -> None:
+        """Build the payload for a path event and emit it."""
         payload = {"path": path, "absolute_path": str(Path(path).absolute())}
 
         if extra_payload:
             payload.update(extra_payload)
 
-        # Schedule coroutine from watchdog thread to asyncio event loop
-        # This is thread-safe and handles the watchdog (threading) -> asyncio bridge
-        if self._loop and self._loop.is_running():
-            asyncio.run_coroutine_threadsafe(
-                self._emit_event(event_type, payload, "normal", "filesystem"),
-                self._loop,
-            )
+        await self._emit_event(event_type, payload, "normal", "filesystem")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get event coalescing counters."""
+        if self._coalescer is None:
+            return {}
+        return self._coalescer.get_stats()
 
     async def start(self) -> None:
         """Start watching filesystem."""
@@ -148,6 +218,11 @@ class FileSystemCollector(BaseCollector, FileSystemEventHandler):
         # Capture the current event loop for thread-safe event emission
         self._loop = asyncio.get_running_loop()
 
+        if self.debounce_ms > 0:
+            self._coalescer = PathEventCoalescer(
+                self._emit_path_event, window=self.debounce_ms / 1000
+            )
+
         # Schedule watches for all paths
         for path in self.watch_paths:
             watch_path = Path(path).absolute()
@@ -168,4 +243,13 @@ class FileSystemCollector(BaseCollector, FileSystemEventHandler):
         self._set_running(False)
         self.observer.stop()
         self.observer.join()
-        self.logger.info("Filesystem collector stopped")
+
+        if self._coalescer is not None:
+            await self._coalescer.flush_all()
+            stats = self._coalescer.get_stats()
+            self.logger.info(
+                f"Filesystem collector stopped ({stats['received']} raw events, "
+                f"{stats['suppressed']} suppressed by coalescing)"
+            )
+        else:
+            self.logger.info("Filesystem collector stopped")
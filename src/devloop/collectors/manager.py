@@ -142,6 +142,7 @@ class CollectorManager:
                 "running": collector.is_running,
                 "type": type(collector).__name__,
                 "config": collector.config,
+                "stats": collector.get_stats(),
             }
             for name, collector in self.collectors.items()
         }
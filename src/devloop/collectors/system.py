@@ -53,7 +53,8 @@ class SystemCollector(BaseCollector):
 
         try:
             return {
-                "cpu_percent": psutil.cpu_percent(interval=1),
+                # Non-blocking: CPU use since the previous check
+                "cpu_percent": psutil.cpu_percent(interval=None),
                 "memory_percent": psutil.virtual_memory().percent,
                 "memory_used": psutil.virtual_memory().used,
                 "memory_total": psutil.virtual_memory().total,
@@ -1,52 +1,137 @@
-"""Core framework components."""
+"""Core framework components.
+
+Submodules are imported the first time one of their names is used, so
+``import devloop.core`` and commands that need only part of it stay
+cheap. The ``context_store``, ``event_store`` and ``result_cache``
+singletons share a name with their module and are imported eagerly, so
+those attributes are always the instances.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from .action_logger import ActionLogger, CLIAction, get_action_logger, log_cli_command
-from .agent import Agent, AgentResult
-from .amp_thread_mapper import (
-    AgentAction,
-    AmpThreadEntry,
-    AmpThreadMapper,
-    ThreadInsight,
-    UserManualAction,
-    get_amp_thread_mapper,
-)
-from .config import Config, ConfigWrapper
-from .config_schema import (
-    CURRENT_SCHEMA_VERSION,
-    ConfigMigrationError,
-    ConfigValidationError,
-    migrate_config,
-    validate_config,
-)
 from .context_store import context_store
-from .daemon_health import DaemonHealthCheck, check_daemon_health
-from .event import Event, EventBus, Priority
-from .import_graph import ImportGraph
 from .event_store import event_store
-from .manager import AgentManager
-from .pipeline import Pipeline, PipelineResult, PipelineStageResult
-from .pattern_analyzer import (
-    Pattern,
-    PatternAnalyzer,
-    PatternContext,
-    PatternDefinitions,
-    PatternMatch,
-)
-from .pattern_detector import (
-    DetectedPattern,
-    PatternDetector,
-    get_pattern_detector,
-)
-from .tool_registry import ToolDefinition, ToolRegistry, ToolRunnerConfig
-from .tool_runner import ToolRunResult, ToolRunner
-from .transactional_io import (
-    ChecksumMismatchError,
-    SelfHealing,
-    TransactionalFile,
-    TransactionError,
-    TransactionRecovery,
-    initialize_transaction_system,
-)
+from .result_cache import ResultCache, result_cache
+
+if TYPE_CHECKING:
+    from .action_logger import (
+        ActionLogger,
+        CLIAction,
+        get_action_logger,
+        log_cli_command,
+    )
+    from .agent import Agent, AgentResult
+    from .amp_thread_mapper import (
+        AgentAction,
+        AmpThreadEntry,
+        AmpThreadMapper,
+        ThreadInsight,
+        UserManualAction,
+        get_amp_thread_mapper,
+    )
+    from .config import Config, ConfigWrapper
+    from .config_schema import (
+        CURRENT_SCHEMA_VERSION,
+        ConfigMigrationError,
+        ConfigValidationError,
+        migrate_config,
+        validate_config,
+    )
+    from .daemon_health import DaemonHealthCheck, check_daemon_health
+    from .event import Event, EventBus, EventQueue, OverflowPolicy, Priority
+    from .import_graph import ImportGraph
+    from .manager import AgentManager
+    from .pipeline import Pipeline, PipelineResult, PipelineStageResult
+    from .pattern_analyzer import (
+        Pattern,
+        PatternAnalyzer,
+        PatternContext,
+        PatternDefinitions,
+        PatternMatch,
+    )
+    from .pattern_detector import (
+        DetectedPattern,
+        PatternDetector,
+        get_pattern_detector,
+    )
+    from .test_history import TestHistory
+    from .tool_registry import ToolDefinition, ToolRegistry, ToolRunnerConfig
+    from .tool_runner import ToolRunResult, ToolRunner
+    from .transactional_io import (
+        ChecksumMismatchError,
+        SelfHealing,
+        TransactionalFile,
+        TransactionError,
+        TransactionRecovery,
+        initialize_transaction_system,
+    )
+
+# Exported name -> submodule defining it
+_LAZY_IMPORTS = {
+    "ActionLogger": "action_logger",
+    "CLIAction": "action_logger",
+    "get_action_logger": "action_logger",
+    "log_cli_command": "action_logger",
+    "Agent": "agent",
+    "AgentResult": "agent",
+    "AgentAction": "amp_thread_mapper",
+    "AmpThreadEntry": "amp_thread_mapper",
+    "AmpThreadMapper": "amp_thread_mapper",
+    "ThreadInsight": "amp_thread_mapper",
+    "UserManualAction": "amp_thread_mapper",
+    "get_amp_thread_mapper": "amp_thread_mapper",
+    "Config": "config",
+    "ConfigWrapper": "config",
+    "CURRENT_SCHEMA_VERSION": "config_schema",
+    "ConfigMigrationError": "config_schema",
+    "ConfigValidationError": "config_schema",
+    "migrate_config": "config_schema",
+    "validate_config": "config_schema",
+    "DaemonHealthCheck": "daemon_health",
+    "check_daemon_health": "daemon_health",
+    "Event": "event",
+    "EventBus": "event",
+    "EventQueue": "event",
+    "OverflowPolicy": "event",
+    "Priority": "event",
+    "ImportGraph": "import_graph",
+    "AgentManager": "manager",
+    "Pipeline": "pipeline",
+    "PipelineResult": "pipeline",
+    "PipelineStageResult": "pipeline",
+    "Pattern": "pattern_analyzer",
+    "PatternAnalyzer": "pattern_analyzer",
+    "PatternContext": "pattern_analyzer",
+    "PatternDefinitions": "pattern_analyzer",
+    "PatternMatch": "pattern_analyzer",
+    "DetectedPattern": "pattern_detector",
+    "PatternDetector": "pattern_detector",
+    "get_pattern_detector": "pattern_detector",
+    "TestHistory": "test_history",
+    "ToolDefinition": "tool_registry",
+    "ToolRegistry": "tool_registry",
+    "ToolRunnerConfig": "tool_registry",
+    "ToolRunResult": "tool_runner",
+    "ToolRunner": "tool_runner",
+    "ChecksumMismatchError": "transactional_io",
+    "SelfHealing": "transactional_io",
+    "TransactionalFile": "transactional_io",
+    "TransactionError": "transactional_io",
+    "TransactionRecovery": "transactional_io",
+    "initialize_transaction_system": "transactional_io",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name from its submodule on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "Action Logger",
@@ -68,6 +153,7 @@ __all__ = [
     "DetectedPattern",
     "Event",
     "EventBus",
+    "EventQueue",
     "event_store",
     "ImportGraph",
     "get_action_logger",
@@ -81,14 +167,18 @@ __all__ = [
     "PatternDefinitions",
     "PatternDetector",
     "PatternMatch",
+    "OverflowPolicy",
     "Priority",
     "AgentManager",
     "Pipeline",
     "PipelineResult",
     "PipelineStageResult",
+    "ResultCache",
+    "result_cache",
     "ChecksumMismatchError",
     "initialize_transaction_system",
     "SelfHealing",
+    "TestHistory",
     "ThreadInsight",
     "ToolDefinition",
     "ToolRegistry",
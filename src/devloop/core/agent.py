@@ -6,11 +6,14 @@ import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
+from contextlib import AsyncExitStack
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
 
-from .event import Event, EventBus
+from .event import Event, EventBus, EventQueue, OverflowPolicy
 from .feedback import FeedbackAPI
+from .file_lock_manager import get_file_lock_manager
 from .performance import AgentResourceTracker, PerformanceMonitor
 from .telemetry import get_telemetry_logger
 
@@ -73,6 +76,14 @@ class AgentResult:
 class Agent(ABC):
     """Base agent class with performance monitoring and feedback."""
 
+    # Subclasses whose handle() may run for several events at once set this;
+    # max_concurrency is ignored otherwise
+    concurrent_handling = False
+
+    # Cancel a running handler once every path it handles has a newer event
+    # queued. Agents that write to the files they handle turn this off.
+    cancel_superseded = True
+
     def __init__(
         self,
         name: str,
@@ -91,21 +102,73 @@ class Agent(ABC):
         self.enabled = True
         self.logger = logging.getLogger(f"agent.{name}")
         self._running = False
-        self._event_queue: asyncio.Queue[Event] = asyncio.Queue()
+        self._event_queue = EventQueue()
         self._last_processed_sequence = 0  # For event replay tracking
         self._process_task: Optional[asyncio.Task] = None  # Background task reference
 
+        # Per-path debounce (milliseconds); subclasses set this from their config
+        self.debounce_ms: int = 0
+        self.debounce_suppressed = 0
+        self._debounce_pending: Dict[str, Event] = {}
+        self._debounce_timers: Dict[str, asyncio.TimerHandle] = {}
+        self._debounce_released: Set[str] = set()
+
+        # Batch mode (opt-in): collect events for this many milliseconds and
+        # hand them to handle_batch() together
+        self.batch_window_ms: int = 0
+        self.max_batch_size: int = 500
+
+        # Events handled in parallel (only for concurrent_handling agents);
+        # events for the same path are always handled one at a time
+        self.max_concurrency: int = 1
+        self._handler_tasks: Set[asyncio.Task] = set()
+
+        # Running handler → sequence number per path it has not been
+        # superseded on
+        self._in_flight: Dict[asyncio.Task, Dict[str, int]] = {}
+        self.cancelled_runs = 0
+
+    def configure_queue(
+        self,
+        max_size: int = EventQueue.DEFAULT_MAX_SIZE,
+        overflow_policy: OverflowPolicy | str = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        """Set the size and overflow policy of the agent's event queue.
+
+        Must be called before the agent is started.
+
+        Args:
+            max_size: Maximum number of queued events (0 for unbounded)
+            overflow_policy: "drop-oldest", "coalesce" or "block"
+        """
+        if self._running:
+            raise RuntimeError(f"Cannot reconfigure queue of running agent {self.name}")
+        self._event_queue = EventQueue(max_size, OverflowPolicy(overflow_policy))
+
     @abstractmethod
     async def handle(self, event: Event) -> AgentResult:
         """Handle an event. Must be implemented by subclasses."""
         pass
 
+    async def handle_batch(self, events: List[Event]) -> List[AgentResult]:
+        """Handle a batch of events collected during ``batch_window_ms``.
+
+        The default implementation calls :meth:`handle` for each event.
+        Agents backed by a command-line tool override this to pass every
+        path to a single tool invocation.
+
+        Returns:
+            One result per event, in the same order
+        """
+        return [await self.handle(event) for event in events]
+
     async def start(self) -> None:
         """Start the agent."""
         if self._running:
             return
 
         self._running = True
+        self._event_queue.on_queued = self._supersede_in_flight
 
         # Subscribe to configured triggers
         for trigger in self.triggers:
@@ -126,6 +189,13 @@ class Agent(ABC):
         for trigger in self.triggers:
             await self.event_bus.unsubscribe(trigger, self._event_queue)
 
+        # Drop events still waiting out their debounce window
+        for timer in self._debounce_timers.values():
+            timer.cancel()
+        self._debounce_timers.clear()
+        self._debounce_pending.clear()
+        self._debounce_released.clear()
+
         # Cancel and await the background task
         if self._process_task and not self._process_task.done():
             self._process_task.cancel()
@@ -134,10 +204,19 @@ class Agent(ABC):
             except asyncio.CancelledError:
                 pass  # Expected when task is cancelled
 
+        # Cancel handlers still running in the worker pool
+        for task in list(self._handler_tasks):
+            task.cancel()
+        if self._handler_tasks:
+            await asyncio.gather(*self._handler_tasks, return_exceptions=True)
+
         self.logger.info(f"Agent {self.name} stopped")
 
     async def _process_events(self) -> None:
         """Process events from the queue with performance monitoring."""
+        concurrency = self._effective_concurrency()
+        slots = asyncio.Semaphore(concurrency)
+
         while self._running:
             try:
                 # Wait for event with timeout to allow checking _running
@@ -148,94 +227,289 @@ class Agent(ABC):
             if not self.enabled:
                 continue
 
-            # Execute handler with performance monitoring
+            if self._defer_for_debounce(event):
+                continue
+
+            if self.batch_window_ms > 0:
+                events = await self._collect_batch(event)
+            else:
+                events = [event]
+
+            if concurrency == 1:
+                # In a task of its own, so a newer event can cancel it
+                task = asyncio.create_task(self._run_handlers(events))
+                self._handler_tasks.add(task)
+                task.add_done_callback(self._handler_tasks.discard)
+                await asyncio.wait({task})
+                continue
+
+            # Wait for a free worker before taking more events off the queue,
+            # so priorities and overflow policies still apply to the backlog
+            await slots.acquire()
+            task = asyncio.create_task(self._run_serialized(events, slots))
+            self._handler_tasks.add(task)
+            task.add_done_callback(self._handler_tasks.discard)
+
+    def _effective_concurrency(self) -> int:
+        """Number of events this agent may handle at once."""
+        if self.max_concurrency > 1 and not self.concurrent_handling:
+            self.logger.warning(
+                f"Agent {self.name} does not support concurrent handling; "
+                f"ignoring max_concurrency={self.max_concurrency}"
+            )
+            return 1
+        return max(1, self.max_concurrency)
+
+    async def _run_serialized(
+        self, events: List[Event], slots: asyncio.Semaphore
+    ) -> None:
+        """Run handlers in a worker slot, holding this agent's lock on each path."""
+        try:
+            paths = sorted(
+                {
+                    str(Path(event.payload["path"]).resolve())
+                    for event in events
+                    if isinstance(event.payload, dict) and event.payload.get("path")
+                }
+            )
+            lock_manager = get_file_lock_manager()
+            async with AsyncExitStack() as stack:
+                # Fixed lock order so overlapping batches cannot deadlock
+                for path in paths:
+                    await stack.enter_async_context(
+                        lock_manager.serialize(Path(path), self.name)
+                    )
+                await self._run_handlers(events)
+        finally:
+            slots.release()
+
+    async def _collect_batch(self, first: Event) -> List[Event]:
+        """Accumulate events for ``batch_window_ms`` after the first one.
+
+        Events for the same path are collapsed so only the latest is handled.
+        Collection stops early once ``max_batch_size`` distinct events are held.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_window_ms / 1000
+        batch: Dict[str, Event] = {}
+
+        def add(event: Event) -> None:
+            path = (
+                event.payload.get("path") if isinstance(event.payload, dict) else None
+            )
+            key = path or event.id
+            batch.pop(key, None)
+            batch[key] = event
+
+        add(first)
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+
             try:
-                operation_name = f"agent.{self.name}.handle"
+                event = await asyncio.wait_for(self._event_queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+
+            if self.enabled and not self._defer_for_debounce(event):
+                add(event)
+
+        return list(batch.values())
 
-                # Mark agent as active for resource tracking
+    def _supersede_in_flight(self, event: Event) -> None:
+        """Cancel running handlers made stale by a newly queued event.
+
+        A handler is cancelled once every path it is handling has a newer
+        event queued; its tool processes are stopped by the sandbox (or
+        worker) that started them.
+        """
+        path = event.payload.get("path") if isinstance(event.payload, dict) else None
+        if not path or not self.cancel_superseded:
+            return
+
+        for task, paths in list(self._in_flight.items()):
+            if path not in paths or event.sequence < paths[path]:
+                continue
+            del paths[path]
+            if not paths and not task.done():
+                task.cancel()
+                self.cancelled_runs += 1
+                self.logger.debug(f"Cancelled superseded run for {path}")
+
+    async def _run_handlers(self, events: List[Event]) -> None:
+        """Run the handler for one event or a batch, with performance monitoring."""
+        task = asyncio.current_task()
+        paths = {
+            event.payload["path"]: event.sequence
+            for event in events
+            if isinstance(event.payload, dict) and event.payload.get("path")
+        }
+        if task is not None and paths:
+            self._in_flight[task] = paths
+        try:
+            await self._run_monitored(events)
+        finally:
+            if task is not None:
+                self._in_flight.pop(task, None)
+
+    async def _run_monitored(self, events: List[Event]) -> None:
+        """Run the handler and report its results."""
+        batched = self.batch_window_ms > 0
+        try:
+            operation_name = (
+                f"agent.{self.name}.handle_batch"
+                if batched
+                else f"agent.{self.name}.handle"
+            )
+            metadata: Dict[str, Any] = {
+                "event_type": events[-1].type,
+                "agent_name": self.name,
+            }
+            if batched:
+                metadata["batch_size"] = len(events)
+
+            # Mark agent as active for resource tracking
+            if self.resource_tracker:
+                self.resource_tracker.mark_agent_active(self.name)
+
+            try:
+                if self.performance_monitor:
+                    async with self.performance_monitor.monitor_operation(
+                        operation_name, metadata=metadata
+                    ) as metrics:
+                        results = await self._invoke_handler(events, batched)
+                        failed = next((r for r in results if not r.success), None)
+                        metrics.complete(
+                            failed is None, failed.error if failed else None
+                        )
+                        duration = metrics.duration
+                else:
+                    start_time = time.time()
+                    results = await self._invoke_handler(events, batched)
+                    duration = time.time() - start_time
+            finally:
+                # Mark agent as inactive after handling
                 if self.resource_tracker:
-                    self.resource_tracker.mark_agent_active(self.name)
-
-                try:
-                    if self.performance_monitor:
-                        async with self.performance_monitor.monitor_operation(
-                            operation_name,
-                            metadata={
-                                "event_type": event.type,
-                                "agent_name": self.name,
-                            },
-                        ) as metrics:
-                            result = await self.handle(event)
-                            metrics.complete(result.success, result.error)
-
-                            # Update result duration from metrics
-                            if metrics.duration:
-                                result.duration = metrics.duration
-                    else:
-                        start_time = time.time()
-                        result = await self.handle(event)
-                        result.duration = time.time() - start_time
-                finally:
-                    # Mark agent as inactive after handling
-                    if self.resource_tracker:
-                        self.resource_tracker.mark_agent_inactive(self.name)
-
-                # Update performance store if available
-                if self.feedback_api:
-                    await self.feedback_api.feedback_store.update_performance(
-                        self.name, result.success, result.duration
-                    )
+                    self.resource_tracker.mark_agent_inactive(self.name)
 
-                # Log telemetry event
-                try:
-                    telemetry = get_telemetry_logger()
-                    telemetry.log_agent_execution(
-                        agent=self.name,
-                        duration_ms=int(result.duration * 1000),
-                        findings=(
-                            result.data.get("findings_count", 0) if result.data else 0
-                        ),
-                        severity_levels=(
-                            result.data.get("severity_levels", [])
-                            if result.data
-                            else []
-                        ),
-                        success=result.success,
-                        details={"message": result.message, **(result.data or {})},
-                    )
-                except Exception as e:
-                    self.logger.warning(f"Failed to log telemetry: {e}")
+            for result in results:
+                # A batch shares one tool invocation; split its cost evenly
+                if duration:
+                    result.duration = duration / len(results)
+                await self._report_result(result)
 
-                # Publish result
-                await self._publish_result(result)
+            # Track last processed event for replay (non-blocking)
+            last_event = max(events, key=lambda e: e.sequence)
+            if last_event.sequence >= self._last_processed_sequence:
+                self._last_processed_sequence = last_event.sequence
+                asyncio.create_task(self._save_replay_state(last_event))
 
-                # Track last processed event for replay (non-blocking)
-                self._last_processed_sequence = event.sequence
-                asyncio.create_task(self._save_replay_state(event))
+        except Exception as e:
+            self.logger.error(f"Error in {self.name}: {e}", exc_info=True)
+
+            error_result = AgentResult(
+                agent_name=self.name,
+                success=False,
+                duration=0.1,  # Default duration for errors
+                error=str(e),
+            )
 
-                # Log result
-                status = "✓" if result.success else "✗"
-                self.logger.info(
-                    f"{status} {self.name}: {result.message} ({result.duration:.2f}s)"
+            # Update performance store for failed operations
+            if self.feedback_api:
+                await self.feedback_api.feedback_store.update_performance(
+                    self.name, False, error_result.duration
                 )
 
-            except Exception as e:
-                self.logger.error(f"Error in {self.name}: {e}", exc_info=True)
+            await self._publish_result(error_result)
+
+    async def _invoke_handler(
+        self, events: List[Event], batched: bool
+    ) -> List[AgentResult]:
+        """Dispatch to ``handle_batch`` or ``handle``."""
+        if batched:
+            return list(await self.handle_batch(events))
+        return [await self.handle(events[0])]
+
+    async def _report_result(self, result: AgentResult) -> None:
+        """Record feedback and telemetry for a result, then publish it."""
+        # Update performance store if available
+        if self.feedback_api:
+            await self.feedback_api.feedback_store.update_performance(
+                self.name, result.success, result.duration
+            )
 
-                error_result = AgentResult(
-                    agent_name=self.name,
-                    success=False,
-                    duration=0.1,  # Default duration for errors
-                    error=str(e),
-                )
+        # Log telemetry event
+        try:
+            telemetry = get_telemetry_logger()
+            telemetry.log_agent_execution(
+                agent=self.name,
+                duration_ms=int(result.duration * 1000),
+                findings=(result.data.get("findings_count", 0) if result.data else 0),
+                severity_levels=(
+                    result.data.get("severity_levels", []) if result.data else []
+                ),
+                success=result.success,
+                details={"message": result.message, **(result.data or {})},
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to log telemetry: {e}")
 
-                # Update performance store for failed operations
-                if self.feedback_api:
-                    await self.feedback_api.feedback_store.update_performance(
-                        self.name, False, error_result.duration
-                    )
+        # Publish result
+        await self._publish_result(result)
+
+        # Log result
+        status = "✓" if result.success else "✗"
+        self.logger.info(
+            f"{status} {self.name}: {result.message} ({result.duration:.2f}s)"
+        )
+
+    def _defer_for_debounce(self, event: Event) -> bool:
+        """Hold path events until the path has been quiet for ``debounce_ms``.
+
+        Only the latest event for a path is handled; earlier ones within the
+        window are counted in ``debounce_suppressed``.
+
+        Returns:
+            True if the event was deferred and should not be handled now
+        """
+        if self.debounce_ms <= 0:
+            return False
+
+        path = event.payload.get("path") if isinstance(event.payload, dict) else None
+        if not path:
+            return False
+
+        if event.id in self._debounce_released:
+            self._debounce_released.discard(event.id)
+            return False
 
-                await self._publish_result(error_result)
+        if path in self._debounce_pending:
+            self.debounce_suppressed += 1
+
+        timer = self._debounce_timers.pop(path, None)
+        if timer:
+            timer.cancel()
+
+        self._debounce_pending[path] = event
+        self._debounce_timers[path] = asyncio.get_running_loop().call_later(
+            self.debounce_ms / 1000, self._release_debounced, path
+        )
+        return True
+
+    def _release_debounced(self, path: str) -> None:
+        """Requeue the latest event for a path once its window has passed."""
+        self._debounce_timers.pop(path, None)
+        event = self._debounce_pending.pop(path, None)
+        if event is None or not self._running:
+            return
+
+        self._debounce_released.add(event.id)
+        try:
+            self._event_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # "block" policy: wait for room instead of losing the event
+            asyncio.create_task(self._event_queue.put(event))
 
     async def _save_replay_state(self, event: Event) -> None:
         """Save the last processed event sequence for recovery."""
@@ -167,6 +167,42 @@ class ConfigValidator:
             elif not isinstance(agent_config["config"], dict):
                 self.errors.append(f"agents.{agent_name}.config must be a dictionary")
 
+            if "batchWindow" in agent_config:
+                window = agent_config["batchWindow"]
+                if not isinstance(window, int) or window < 0:
+                    self.errors.append(
+                        f"agents.{agent_name}.batchWindow must be a non-negative integer, got {window}"
+                    )
+
+            if "maxBatchSize" in agent_config:
+                max_size = agent_config["maxBatchSize"]
+                if not isinstance(max_size, int) or max_size <= 0:
+                    self.errors.append(
+                        f"agents.{agent_name}.maxBatchSize must be a positive integer, got {max_size}"
+                    )
+
+            if "maxConcurrency" in agent_config:
+                concurrency = agent_config["maxConcurrency"]
+                if not isinstance(concurrency, int) or concurrency <= 0:
+                    self.errors.append(
+                        f"agents.{agent_name}.maxConcurrency must be a positive integer, got {concurrency}"
+                    )
+
+            if "queueSize" in agent_config:
+                queue_size = agent_config["queueSize"]
+                if not isinstance(queue_size, int) or queue_size < 0:
+                    self.errors.append(
+                        f"agents.{agent_name}.queueSize must be a non-negative integer, got {queue_size}"
+                    )
+
+            if "overflowPolicy" in agent_config:
+                valid_policies = ["drop-oldest", "coalesce", "block"]
+                policy = agent_config["overflowPolicy"]
+                if policy not in valid_policies:
+                    self.errors.append(
+                        f"agents.{agent_name}.overflowPolicy must be one of {valid_policies}, got '{policy}'"
+                    )
+
     def _validate_global(self, global_config: Dict[str, Any]) -> None:
         """Validate global section."""
         # Mode validation
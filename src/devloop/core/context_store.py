@@ -5,16 +5,34 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import sqlite3
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Literal
+from typing import Any, Callable, Dict, Iterable, List, Literal, Set, Tuple, TypeVar
 
 from devloop.security.path_validator import PathValidationError, PathValidator
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+_INSERT_FINDING_SQL = (
+    "INSERT INTO findings "
+    "(id, tier, agent, file, severity, category, timestamp, data) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Finding attributes with an in-memory secondary index
+_INDEXED_FIELDS = ("file", "severity", "category", "agent")
+
+# Upper bound on cached file path resolutions
+_RESOLVED_PATH_CACHE_SIZE = 4096
+
+# PRAGMA user_version of a database that tier JSON files were imported into
+_TIER_FILES_IMPORTED = 1
+
 
 class Severity(str, Enum):
     """Finding severity levels."""
@@ -148,10 +166,19 @@ class ContextStore:
     - relevant: Mention at task completion
     - background: Show only on explicit request
     - auto_fixed: Log of silent fixes
+
+    Findings are stored in ``findings.db`` (SQLite, indexed by file, tier,
+    severity and category), so adding a finding writes one row. The tier JSON
+    files, ``index.json`` and the ``.last_update`` marker read by hooks and
+    other tools are snapshots regenerated at most once per ``index_debounce``
+    seconds; call :meth:`flush` to write them immediately.
     """
 
     def __init__(
-        self, context_dir: Path | str | None = None, enable_path_validation: bool = True
+        self,
+        context_dir: Path | str | None = None,
+        enable_path_validation: bool = True,
+        index_debounce: float = 0.5,
     ):
         """
         Initialize context store.
@@ -159,6 +186,8 @@ class ContextStore:
         Args:
             context_dir: Directory for context files. Defaults to .devloop/context
             enable_path_validation: Enable path validation for security (default: True)
+            index_debounce: Seconds to coalesce snapshot/index writes (0 writes
+                them on every change)
         """
         if context_dir is None:
             context_dir = Path.cwd() / ".devloop" / "context"
@@ -166,8 +195,11 @@ class ContextStore:
 
         # Initialize path validator for security
         project_root = Path.cwd().resolve()
+        # Shares the directory cache the filesystem collector invalidates
         self.path_validator = PathValidator(
-            project_root, allow_symlinks=False  # Disallow symlinks for security
+            project_root,
+            allow_symlinks=False,  # Disallow symlinks for security
+            cache_directories=True,
         )
         self.enable_path_validation = enable_path_validation
 
@@ -190,10 +222,42 @@ class ContextStore:
             Tier.BACKGROUND: [],
             Tier.AUTO_FIXED: [],
         }
+        # tier -> field -> value -> findings (keyed by id(), insertion ordered)
+        self._indexes: Dict[Tier, Dict[str, Dict[Any, Dict[int, Finding]]]] = {
+            tier: {name: {} for name in _INDEXED_FIELDS} for tier in Tier
+        }
+        self._resolved_paths: Dict[str, Path] = {}
+
+        self.index_debounce = index_debounce
+        self._connection: sqlite3.Connection | None = None
+        self._dirty_tiers: Set[Tier] = set()
+        self._index_dirty = False
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_loop: asyncio.AbstractEventLoop | None = None
+        self._flush_tasks: Set[asyncio.Task] = set()
         logger.info(f"Context store initialized at {self.context_dir}")
 
+    @property
+    def db_path(self) -> Path:
+        """Path of the findings database."""
+        return self.context_dir / "findings.db"
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Get the database connection, raising an exception if not initialized."""
+        if self._connection is None:
+            raise RuntimeError(
+                "Context store not initialized. Call initialize() first."
+            )
+        return self._connection
+
     async def initialize(self) -> None:
-        """Create context directory structure if it doesn't exist."""
+        """Create the context directory and open the findings database.
+
+        Findings persisted by an earlier run are loaded into memory. Tier JSON
+        files written by older versions are imported the first time the
+        database is opened, and never again.
+        """
         try:
             self.context_dir.mkdir(parents=True, exist_ok=True)
             # Set proper permissions (rwxr-xr-x) so all agents can write
@@ -203,6 +267,93 @@ class ContextStore:
             logger.error(f"Failed to create context directory: {e}")
             raise
 
+        async with self._lock:
+            if self._connection is None:
+                await self._run_db(self._init_db)
+
+        await self.load_from_disk()
+
+    def _init_db(self) -> None:
+        """Open the database and create the schema (runs in thread pool)."""
+        connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS findings (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            id TEXT NOT NULL,
+            tier TEXT NOT NULL,
+            agent TEXT NOT NULL,
+            file TEXT NOT NULL,
+            severity TEXT NOT NULL,
+            category TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            data TEXT NOT NULL
+            )
+        """)
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_findings_tier ON findings(tier, timestamp)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_findings_file ON findings(file)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_findings_severity ON findings(severity)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_findings_category ON findings(category)"
+        )
+        connection.commit()
+        self._connection = connection
+
+        # Import only once; later an empty table means findings were cleared
+        (version,) = connection.execute("PRAGMA user_version").fetchone()
+        if version < _TIER_FILES_IMPORTED:
+            (count,) = connection.execute("SELECT COUNT(*) FROM findings").fetchone()
+            if count == 0:
+                self._import_tier_files()
+            connection.execute(f"PRAGMA user_version = {_TIER_FILES_IMPORTED}")
+
+    def _import_tier_files(self) -> None:
+        """Import findings from tier JSON files written before the database existed."""
+        rows = []
+        for tier in Tier:
+            for finding in self._read_tier_file(tier):
+                rows.append(self._finding_row(tier, finding))
+
+        if rows and self._connection:
+            with self.connection:
+                self.connection.executemany(_INSERT_FINDING_SQL, rows)
+            logger.info(f"Imported {len(rows)} findings from tier JSON files")
+
+    async def _run_db(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a database operation in the thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    @staticmethod
+    def _finding_to_dict(finding: Finding) -> Dict[str, Any]:
+        """Convert a finding to its JSON representation."""
+        return {
+            **asdict(finding),
+            "severity": finding.severity.value,
+            "scope_type": finding.scope_type.value,
+        }
+
+    @classmethod
+    def _finding_row(cls, tier: Tier, finding: Finding) -> Tuple[str, ...]:
+        """Build the database row for a finding."""
+        return (
+            finding.id,
+            tier.value,
+            finding.agent,
+            finding.file,
+            finding.severity.value,
+            finding.category,
+            finding.timestamp,
+            json.dumps(cls._finding_to_dict(finding)),
+        )
+
     async def add_finding(
         self,
         finding: Finding | Dict[str, Any],
@@ -215,6 +366,85 @@ class ContextStore:
             finding: Finding object or dict with finding data
             user_context: Optional user context for relevance scoring
         """
+        await self.add_findings([finding], user_context)
+
+    async def add_findings(
+        self,
+        findings: Iterable[Finding | Dict[str, Any]],
+        user_context: UserContext | None = None,
+    ) -> int:
+        """
+        Add several findings with a single database write.
+
+        Args:
+            findings: Finding objects or dicts with finding data
+            user_context: Optional user context for relevance scoring
+
+        Returns:
+            Number of findings stored (findings outside the project are skipped)
+        """
+        accepted: List[Tuple[Tier, Finding]] = []
+        for finding in findings:
+            prepared = self._prepare_finding(finding, user_context)
+            if prepared is not None:
+                accepted.append((self.assign_tier(prepared), prepared))
+
+        if not accepted:
+            return 0
+
+        async with self._lock:
+            for tier, finding in accepted:
+                self._findings[tier].append(finding)
+                self._index_finding(tier, finding)
+
+            if self._connection:
+                rows = [self._finding_row(tier, finding) for tier, finding in accepted]
+                await self._run_db(self._insert_rows_sync, rows)
+
+            touched = {tier for tier, _ in accepted}
+            for tier in touched:
+                # Aggressively manage memory: trim old findings when tier gets large
+                # Keep only the most recent findings to prevent unbounded memory growth
+                if len(self._findings[tier]) > 500:  # Per-tier threshold
+                    self._trim_tier_memory(tier, keep_count=250)
+                    if self._connection:
+                        await self._run_db(self._trim_tier_sync, tier, 250)
+
+            self._dirty_tiers |= touched
+            self._index_dirty = True
+
+        for tier, finding in accepted:
+            logger.debug(
+                f"Added finding {finding.id} to {tier.value} "
+                f"(relevance: {finding.relevance_score:.2f})"
+            )
+
+        await self._schedule_flush()
+        return len(accepted)
+
+    def _insert_rows_sync(self, rows: List[Tuple[str, ...]]) -> None:
+        """Insert finding rows in one transaction."""
+        with self.connection:
+            self.connection.executemany(_INSERT_FINDING_SQL, rows)
+
+    def _trim_tier_sync(self, tier: Tier, keep_count: int) -> None:
+        """Delete all but the most recent findings of a tier from the database."""
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM findings WHERE tier = ? AND seq NOT IN ("
+                "SELECT seq FROM findings WHERE tier = ? "
+                "ORDER BY timestamp DESC, seq ASC LIMIT ?)",
+                (tier.value, tier.value, keep_count),
+            )
+
+    def _prepare_finding(
+        self, finding: Finding | Dict[str, Any], user_context: UserContext | None
+    ) -> Finding | None:
+        """Validate a finding and compute its relevance score.
+
+        Returns:
+            The finding, or None if it refers to a file outside the project
+        """
         # Convert dict to Finding if needed
         if isinstance(finding, dict):
             finding = Finding(**finding)
@@ -227,32 +457,16 @@ class ContextStore:
                     logger.warning(
                         f"Ignoring finding with file path outside project: {finding.file}"
                     )
-                    return
+                    return None
             except (PathValidationError, OSError) as e:
                 logger.warning(f"Invalid file path in finding: {finding.file}: {e}")
-                return
+                return None
 
         # Compute relevance score
         if user_context:
             finding.relevance_score = self.compute_relevance(finding, user_context)
 
-        # Assign to tier
-        tier = self.assign_tier(finding)
-
-        async with self._lock:
-            self._findings[tier].append(finding)
-            await self._write_tier(tier)
-
-            # Aggressively manage memory: trim old findings when tier gets large
-            # Keep only the most recent findings to prevent unbounded memory growth
-            if len(self._findings[tier]) > 500:  # Per-tier threshold
-                self._trim_tier_memory(tier, keep_count=250)
-
-            await self._update_index()
-
-        logger.debug(
-            f"Added finding {finding.id} to {tier.value} (relevance: {finding.relevance_score:.2f})"
-        )
+        return finding
 
     def compute_relevance(self, finding: Finding, user_context: UserContext) -> float:
         """
@@ -315,12 +529,37 @@ class ContextStore:
                 self._findings[tier], key=lambda f: f.timestamp, reverse=True
             )
             self._findings[tier] = sorted_findings[:keep_count]
+            self._rebuild_tier_index(tier)
             removed = len(sorted_findings) - keep_count
             logger.debug(
                 f"Trimmed {tier.value} tier: removed {removed} old findings from memory "
                 f"(kept {keep_count} most recent)"
             )
 
+    def _index_finding(self, tier: Tier, finding: Finding) -> None:
+        """Add a finding to the secondary indexes of its tier."""
+        indexes = self._indexes[tier]
+        for name in _INDEXED_FIELDS:
+            indexes[name].setdefault(getattr(finding, name), {})[id(finding)] = finding
+
+    def _unindex_finding(self, tier: Tier, finding: Finding) -> None:
+        """Remove a finding from the secondary indexes of its tier."""
+        indexes = self._indexes[tier]
+        for name in _INDEXED_FIELDS:
+            value = getattr(finding, name)
+            bucket = indexes[name].get(value)
+            if bucket is None:
+                continue
+            bucket.pop(id(finding), None)
+            if not bucket:
+                del indexes[name][value]
+
+    def _rebuild_tier_index(self, tier: Tier) -> None:
+        """Rebuild a tier's secondary indexes from its findings list."""
+        self._indexes[tier] = {name: {} for name in _INDEXED_FIELDS}
+        for finding in self._findings[tier]:
+            self._index_finding(tier, finding)
+
     def assign_tier(self, finding: Finding) -> Tier:
         """
         Assign finding to a tier based on relevance and properties.
@@ -352,31 +591,111 @@ class ContextStore:
             return Tier.BACKGROUND
 
     async def get_findings(
-        self, tier: Tier | None = None, file_filter: str | None = None
+        self,
+        tier: Tier | None = None,
+        file_filter: str | None = None,
+        severity: Severity | str | None = None,
+        category: str | None = None,
+        agent: str | None = None,
+        limit: int | None = None,
     ) -> List[Finding]:
         """
         Get findings from the store.
 
+        File, severity, category and agent filters are answered from
+        in-memory indexes, so only matching findings are visited.
+
         Args:
             tier: Optional tier filter
             file_filter: Optional file path filter
+            severity: Optional severity filter
+            category: Optional category filter
+            agent: Optional agent name filter
+            limit: Optional maximum number of findings to return
 
         Returns:
             List of findings matching filters
         """
+        criteria = {
+            name: value
+            for name, value in zip(
+                _INDEXED_FIELDS, (file_filter, severity, category, agent)
+            )
+            if value
+        }
+        tiers = [tier] if tier else list(Tier)
+        findings: List[Finding] = []
+
         async with self._lock:
-            if tier:
-                findings = self._findings[tier].copy()
-            else:
-                findings = []
-                for tier_findings in self._findings.values():
-                    findings.extend(tier_findings)
+            for t in tiers:
+                remaining = None if limit is None else limit - len(findings)
+                if remaining is not None and remaining <= 0:
+                    break
+
+                if not criteria:
+                    findings.extend(self._findings[t][:remaining])
+                    continue
+
+                buckets = [
+                    self._indexes[t][name].get(value, {})
+                    for name, value in criteria.items()
+                ]
+                if not all(buckets):
+                    continue
 
-            if file_filter:
-                findings = [f for f in findings if f.file == file_filter]
+                # Walk the smallest bucket and check the other criteria
+                for finding in min(buckets, key=len).values():
+                    if all(getattr(finding, n) == v for n, v in criteria.items()):
+                        findings.append(finding)
+                        if limit is not None and len(findings) >= limit:
+                            break
 
             return findings
 
+    async def get_findings_for_path(
+        self, path: Path | str, tiers: Iterable[Tier] | None = None
+    ) -> List[Finding]:
+        """
+        Get findings whose file resolves to the same path as ``path``.
+
+        Agents record files as absolute or project-relative paths, so the
+        file index is matched on resolved paths. Resolutions are cached,
+        making repeated lookups a walk over the indexed file names only.
+
+        Args:
+            path: File to look up (absolute or relative to the project root)
+            tiers: Tiers to search (defaults to all tiers)
+
+        Returns:
+            List of findings for the file
+        """
+        target = self._resolve_finding_path(str(path))
+        findings: List[Finding] = []
+
+        async with self._lock:
+            for t in tiers or list(Tier):
+                for name, bucket in self._indexes[t]["file"].items():
+                    if self._resolve_finding_path(name) == target:
+                        findings.extend(bucket.values())
+
+        return findings
+
+    def _resolve_finding_path(self, name: str) -> Path:
+        """Resolve a file name against the project root, with caching."""
+        resolved = self._resolved_paths.get(name)
+        if resolved is None:
+            path = Path(name)
+            if not path.is_absolute():
+                path = self.path_validator.project_root / path
+            try:
+                resolved = path.resolve()
+            except (OSError, ValueError):
+                resolved = path
+            if len(self._resolved_paths) >= _RESOLVED_PATH_CACHE_SIZE:
+                self._resolved_paths.clear()
+            self._resolved_paths[name] = resolved
+        return resolved
+
     async def clear_findings(
         self, tier: Tier | None = None, file_filter: str | None = None
     ) -> int:
@@ -404,17 +723,107 @@ class ContextStore:
                         f for f in self._findings[t] if f.file != file_filter
                     ]
                     count += original_count - len(self._findings[t])
+                    for finding in list(
+                        self._indexes[t]["file"].get(file_filter, {}).values()
+                    ):
+                        self._unindex_finding(t, finding)
                 else:
                     count += len(self._findings[t])
                     self._findings[t] = []
+                    self._rebuild_tier_index(t)
 
-                await self._write_tier(t)
+            if self._connection:
+                await self._run_db(self._delete_sync, tiers_to_clear, file_filter)
 
-            await self._update_index()
+            self._dirty_tiers.update(tiers_to_clear)
+            self._index_dirty = True
 
+        await self._schedule_flush()
         logger.info(f"Cleared {count} finding(s)")
         return count
 
+    def _delete_sync(self, tiers: List[Tier], file_filter: str | None) -> None:
+        """Delete findings of the given tiers (optionally for one file)."""
+        placeholders = ",".join("?" * len(tiers))
+        query = f"DELETE FROM findings WHERE tier IN ({placeholders})"  # nosec B608
+        params: List[str] = [t.value for t in tiers]
+        if file_filter:
+            query += " AND file = ?"
+            params.append(file_filter)
+        with self.connection:
+            self.connection.execute(query, params)
+
+    async def _schedule_flush(self) -> None:
+        """Arrange for snapshots and the index to be written after a change."""
+        if self.index_debounce <= 0:
+            await self.flush()
+        else:
+            self._arm_flush_timer()
+
+    def schedule_index_update(self) -> None:
+        """Request an ``index.json``/``.last_update`` refresh without new findings.
+
+        Must be called from a running event loop.
+        """
+        self._index_dirty = True
+        self._arm_flush_timer()
+
+    def _arm_flush_timer(self) -> None:
+        """Start the flush timer unless one is already pending.
+
+        Only the first change after a flush arms the timer, so changes arriving
+        continuously are still written every ``index_debounce`` seconds.
+        """
+        loop = asyncio.get_running_loop()
+        if self._flush_handle is not None and self._flush_loop is loop:
+            return
+
+        self._flush_loop = loop
+        self._flush_handle = loop.call_later(self.index_debounce, self._start_flush)
+
+    def _start_flush(self) -> None:
+        """Timer callback: run a flush in the background."""
+        self._flush_handle = None
+        task = asyncio.get_running_loop().create_task(self._flush_in_background())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_in_background(self) -> None:
+        """Flush, logging instead of raising (nobody awaits the timer)."""
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Failed to write context snapshots: {e}")
+
+    async def flush(self) -> None:
+        """Write pending tier snapshots, ``index.json`` and ``.last_update`` now."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        async with self._lock:
+            tiers = [tier for tier in Tier if tier in self._dirty_tiers]
+            if not tiers and not self._index_dirty:
+                return
+
+            # Flags are cleared only after a successful write, so a failed
+            # flush is retried by the next one
+            for tier in tiers:
+                await self._write_tier(tier)
+                self._dirty_tiers.discard(tier)
+            await self._update_index()
+            self._index_dirty = False
+
+    async def close(self) -> None:
+        """Write pending snapshots and close the findings database."""
+        try:
+            await self.flush()
+        finally:
+            async with self._lock:
+                if self._connection:
+                    self._connection.close()
+                    self._connection = None
+
     async def _write_tier(self, tier: Tier) -> None:
         """Write a tier's findings to disk."""
         tier_file = self.context_dir / f"{tier.value}.json"
@@ -424,19 +833,12 @@ class ContextStore:
             findings_data = {
                 "tier": tier.value,
                 "count": len(self._findings[tier]),
-                "findings": [
-                    {
-                        **asdict(f),
-                        "severity": f.severity.value,
-                        "scope_type": f.scope_type.value,
-                    }
-                    for f in self._findings[tier]
-                ],
+                "findings": [self._finding_to_dict(f) for f in self._findings[tier]],
             }
 
             # Write atomically (write to temp, then rename)
             temp_file = tier_file.with_suffix(".tmp")
-            temp_file.write_text(json.dumps(findings_data, indent=2))
+            temp_file.write_text(json.dumps(findings_data))
             temp_file.replace(tier_file)
 
             logger.debug(f"Wrote {len(self._findings[tier])} findings to {tier_file}")
@@ -566,35 +968,66 @@ class ContextStore:
             raise
 
     async def load_from_disk(self) -> None:
-        """Load all findings from disk into memory."""
-        async with self._lock:
-            for tier in Tier:
-                tier_file = self.context_dir / f"{tier.value}.json"
-
-                if not tier_file.exists():
-                    continue
-
-                try:
-                    data = json.loads(tier_file.read_text())
-                    findings = []
-
-                    for f_data in data.get("findings", []):
-                        # Convert severity and scope_type back to enums
-                        if "severity" in f_data:
-                            f_data["severity"] = Severity(f_data["severity"])
-                        if "scope_type" in f_data:
-                            f_data["scope_type"] = ScopeType(f_data["scope_type"])
+        """Load all findings from disk into memory.
 
-                        findings.append(Finding(**f_data))
+        Reads the findings database when it is open, otherwise the tier JSON
+        snapshots.
+        """
+        async with self._lock:
+            if self._connection:
+                loaded = await self._run_db(self._load_rows_sync)
+                for tier in Tier:
+                    self._findings[tier] = loaded.get(tier, [])
+                    self._rebuild_tier_index(tier)
+                    if self._findings[tier]:
+                        logger.info(
+                            f"Loaded {len(self._findings[tier])} {tier.value} findings"
+                        )
+                return
 
-                    self._findings[tier] = findings
+            for tier in Tier:
+                if (self.context_dir / f"{tier.value}.json").exists():
+                    self._findings[tier] = self._read_tier_file(tier)
+                    self._rebuild_tier_index(tier)
                     logger.info(
-                        f"Loaded {len(findings)} findings from {tier.value}.json"
+                        f"Loaded {len(self._findings[tier])} findings from {tier.value}.json"
                     )
 
-                except Exception as e:
-                    logger.error(f"Failed to load {tier_file}: {e}")
-                    # Continue with other tiers
+    def _load_rows_sync(self) -> Dict[Tier, List[Finding]]:
+        """Read all findings from the database, oldest first."""
+        loaded: Dict[Tier, List[Finding]] = {}
+        cursor = self.connection.execute("SELECT tier, data FROM findings ORDER BY seq")
+        for tier_value, data in cursor:
+            try:
+                finding = self._finding_from_dict(json.loads(data))
+                loaded.setdefault(Tier(tier_value), []).append(finding)
+            except (ValueError, TypeError) as e:
+                logger.error(f"Skipping unreadable finding: {e}")
+        return loaded
+
+    def _read_tier_file(self, tier: Tier) -> List[Finding]:
+        """Read findings from a tier JSON snapshot."""
+        tier_file = self.context_dir / f"{tier.value}.json"
+        if not tier_file.exists():
+            return []
+
+        try:
+            data = json.loads(tier_file.read_text())
+            return [self._finding_from_dict(f) for f in data.get("findings", [])]
+        except Exception as e:
+            logger.error(f"Failed to load {tier_file}: {e}")
+            # Continue with other tiers
+            return []
+
+    @staticmethod
+    def _finding_from_dict(f_data: Dict[str, Any]) -> Finding:
+        """Rebuild a finding from its JSON representation."""
+        # Convert severity and scope_type back to enums
+        if "severity" in f_data:
+            f_data["severity"] = Severity(f_data["severity"])
+        if "scope_type" in f_data:
+            f_data["scope_type"] = ScopeType(f_data["scope_type"])
+        return Finding(**f_data)
 
     async def cleanup_old_findings(self, hours_to_keep: int = 168) -> int:
         """
@@ -623,19 +1056,31 @@ class ContextStore:
                     if f.timestamp > cutoff_iso  # ISO strings compare correctly
                 ]
 
-                count += original_count - len(self._findings[tier])
+                removed = original_count - len(self._findings[tier])
+                if removed:
+                    self._dirty_tiers.add(tier)
+                    self._rebuild_tier_index(tier)
+                count += removed
 
-                # Write cleaned tier to disk
-                await self._write_tier(tier)
+            if self._connection:
+                await self._run_db(self._delete_older_sync, cutoff_iso)
 
-            # Update index after cleanup
-            await self._update_index()
+            self._index_dirty = True
+
+        await self._schedule_flush()
 
         if count > 0:
             logger.info(f"Cleaned up {count} findings older than {hours_to_keep} hours")
 
         return count
 
+    def _delete_older_sync(self, cutoff_iso: str) -> None:
+        """Delete findings with a timestamp at or before the cutoff."""
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM findings WHERE timestamp <= ?", (cutoff_iso,)
+            )
+
 
 # Global instance
 context_store = ContextStore()
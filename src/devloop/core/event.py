@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import time
 import uuid
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 
 class Priority(Enum):
@@ -36,8 +38,166 @@ class Event:
         return self.priority.value > other.priority.value
 
 
+class OverflowPolicy(Enum):
+    """What an :class:`EventQueue` does with a new event when it is full."""
+
+    DROP_OLDEST = "drop-oldest"
+    COALESCE = "coalesce"
+    BLOCK = "block"
+
+
+class EventQueue(asyncio.Queue):
+    """Bounded priority queue of events for a single consumer.
+
+    Events are served by :class:`Priority` (highest first), then by sequence
+    number, so a CRITICAL git hook event overtakes queued file events. When
+    the queue is full the overflow policy decides what happens:
+
+    - ``drop-oldest``: the oldest event of the lowest queued priority is
+      dropped to make room (or the new event, if it has an even lower
+      priority).
+    - ``coalesce``: a new event replaces any queued event for the same path,
+      keeping its place in line; if there is none, ``drop-oldest`` applies.
+    - ``block``: ``put_nowait`` raises ``QueueFull`` and producers wait
+      in ``put`` (``EventBus.emit`` falls back to that).
+
+    Coalescing applies whenever the policy is ``coalesce``, not only when the
+    queue is full, so a path is never queued twice.
+
+    ``on_queued``, if set, is called with each event that was queued (or
+    coalesced into a queued event), but not with events that were dropped.
+    """
+
+    DEFAULT_MAX_SIZE = 1000
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAX_SIZE,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ):
+        super().__init__(maxsize)
+        self.policy = policy
+        self.dropped = 0
+        self.coalesced = 0
+        self.on_queued: Optional[Callable[[Event], None]] = None
+
+    # asyncio.Queue storage hooks (same extension point as PriorityQueue)
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: List[List[Any]] = []
+        self._by_path: Dict[str, List[Any]] = {}
+        self._counter = itertools.count()
+
+    def _put(self, event: Event) -> None:
+        path = _event_path(event)
+        entry = [-event.priority.value, event.sequence, next(self._counter), event]
+        heapq.heappush(self._queue, entry)
+        if path:
+            self._by_path[path] = entry
+
+    def _get(self) -> Event:
+        entry = heapq.heappop(self._queue)
+        event: Event = entry[3]
+        path = _event_path(event)
+        if path and self._by_path.get(path) is entry:
+            del self._by_path[path]
+        return event
+
+    def put_nowait(self, item: Event) -> None:
+        """Put an event without blocking, applying the overflow policy."""
+        if self.policy is OverflowPolicy.COALESCE and self._coalesce(item):
+            queued = True
+        elif self.full() and self.policy is not OverflowPolicy.BLOCK:
+            queued = self._replace_oldest(item)
+        else:
+            super().put_nowait(item)
+            queued = True
+
+        if queued and self.on_queued is not None:
+            self.on_queued(item)
+
+    def _coalesce(self, event: Event) -> bool:
+        """Replace a queued event for the same path. Returns True if replaced."""
+        path = _event_path(event)
+        entry = self._by_path.get(path) if path else None
+        if entry is None:
+            return False
+
+        # Keep the earlier place in line, but never lower its priority
+        entry[3] = event
+        if -event.priority.value < entry[0]:
+            entry[0] = -event.priority.value
+            heapq.heapify(self._queue)
+        self.coalesced += 1
+        return True
+
+    def _replace_oldest(self, event: Event) -> bool:
+        """Make room in a full queue by dropping its least urgent event.
+
+        Returns:
+            True if the event was queued, False if it was the one dropped
+        """
+        victim = max(self._queue, key=lambda e: (e[0], -e[1], -e[2]))
+        if -event.priority.value > victim[0]:
+            self.dropped += 1  # New event is less urgent than anything queued
+            return False
+
+        old_path = _event_path(victim[3])
+        if old_path and self._by_path.get(old_path) is victim:
+            del self._by_path[old_path]
+
+        victim[:] = [-event.priority.value, event.sequence, next(self._counter), event]
+        new_path = _event_path(event)
+        if new_path:
+            self._by_path[new_path] = victim
+        heapq.heapify(self._queue)
+        self.dropped += 1
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth, limits and overflow counters."""
+        return {
+            "depth": self.qsize(),
+            "max_size": self.maxsize,
+            "policy": self.policy.value,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
+
+
+def _event_path(event: Event) -> Optional[str]:
+    """Get the file path an event refers to, if any."""
+    if isinstance(event.payload, dict):
+        return event.payload.get("path")
+    return None
+
+
+class _PrefixTrieNode:
+    """Node in the prefix trie used for ``prefix*`` subscriptions."""
+
+    __slots__ = ("children", "queues")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _PrefixTrieNode] = {}
+        self.queues: List[asyncio.Queue] = []
+
+
 class EventBus:
-    """Central event bus for publishing and subscribing to events."""
+    """Central event bus for publishing and subscribing to events.
+
+    Subscriptions are compiled into a dispatch index so that ``emit`` does not
+    have to scan every pattern:
+
+    - exact patterns (``file:created``) live in a dict,
+    - prefix patterns (``file:*``) live in a character trie,
+    - the global wildcard (``*``) is a plain list.
+
+    The resolved fan-out list for each event type is cached and the cache is
+    dropped whenever the subscriptions change.
+    """
+
+    # Upper bound on cached fan-out lists (event types are few in practice)
+    MAX_DISPATCH_CACHE_SIZE = 1024
 
     def __init__(self):
         self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
@@ -45,16 +205,84 @@ class EventBus:
         self._sequence_counter: int = 0  # Global sequence counter
         self._lock = asyncio.Lock()  # Protect sequence counter
 
+        # Dispatch index, rebuilt on subscribe/unsubscribe
+        self._exact_index: Dict[str, List[asyncio.Queue]] = {}
+        self._prefix_trie = _PrefixTrieNode()
+        self._wildcard_queues: List[asyncio.Queue] = []
+        self._dispatch_cache: Dict[str, Tuple[asyncio.Queue, ...]] = {}
+
     async def subscribe(self, event_type: str, queue: asyncio.Queue) -> None:
         """Subscribe to events of a specific type."""
         if event_type not in self._subscribers:
             self._subscribers[event_type] = set()
-        self._subscribers[event_type].add(queue)
+        if queue not in self._subscribers[event_type]:
+            self._subscribers[event_type].add(queue)
+            self._rebuild_index()
 
     async def unsubscribe(self, event_type: str, queue: asyncio.Queue) -> None:
         """Unsubscribe from events."""
         if event_type in self._subscribers:
-            self._subscribers[event_type].discard(queue)
+            if queue in self._subscribers[event_type]:
+                self._subscribers[event_type].discard(queue)
+                if not self._subscribers[event_type]:
+                    del self._subscribers[event_type]
+                self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Recompile the dispatch index from the subscription table."""
+        exact_index: Dict[str, List[asyncio.Queue]] = {}
+        prefix_trie = _PrefixTrieNode()
+        wildcard_queues: List[asyncio.Queue] = []
+
+        for pattern, queues in self._subscribers.items():
+            if pattern == "*":
+                wildcard_queues.extend(queues)
+            elif pattern.endswith("*"):
+                node = prefix_trie
+                for char in pattern[:-1]:
+                    node = node.children.setdefault(char, _PrefixTrieNode())
+                node.queues.extend(queues)
+            else:
+                exact_index.setdefault(pattern, []).extend(queues)
+
+        self._exact_index = exact_index
+        self._prefix_trie = prefix_trie
+        self._wildcard_queues = wildcard_queues
+        self._dispatch_cache = {}
+
+    def _resolve_queues(self, event_type: str) -> Tuple[asyncio.Queue, ...]:
+        """Get the de-duplicated fan-out list for an event type."""
+        cached = self._dispatch_cache.get(event_type)
+        if cached is not None:
+            return cached
+
+        seen: Set[int] = set()
+        resolved: List[asyncio.Queue] = []
+
+        def add(queues: List[asyncio.Queue]) -> None:
+            for queue in queues:
+                if id(queue) not in seen:
+                    seen.add(id(queue))
+                    resolved.append(queue)
+
+        add(self._exact_index.get(event_type, []))
+
+        # Walk the trie along the event type, collecting every prefix match
+        node: Optional[_PrefixTrieNode] = self._prefix_trie
+        add(self._prefix_trie.queues)
+        for char in event_type:
+            node = node.children.get(char) if node else None
+            if node is None:
+                break
+            add(node.queues)
+
+        add(self._wildcard_queues)
+
+        if len(self._dispatch_cache) >= self.MAX_DISPATCH_CACHE_SIZE:
+            self._dispatch_cache.clear()
+        fan_out = tuple(resolved)
+        self._dispatch_cache[event_type] = fan_out
+        return fan_out
 
     async def emit(self, event: Event) -> None:
         """Emit an event to all subscribers."""
@@ -68,28 +296,23 @@ class EventBus:
         if len(self._event_log) > 100:  # Keep last 100 events
             self._event_log.pop(0)
 
-        # Store event in event store (async, non-blocking)
+        # Queue event for batched storage (non-blocking, no task per event)
         from .event_store import event_store
 
-        # Don't await - fire and forget for performance
-        asyncio.create_task(event_store.store_event(event))
-
-        # Emit to matching subscribers (supporting patterns)
-        notified_queues = set()
+        event_store.enqueue(event)
 
-        for pattern, queues in self._subscribers.items():
-            if self._matches_pattern(event.type, pattern):
-                for queue in list(queues):
-                    if queue not in notified_queues:  # Avoid duplicate notifications
-                        try:
-                            await queue.put(event)
-                            notified_queues.add(queue)
-                        except (
-                            asyncio.QueueFull,
-                            asyncio.CancelledError,
-                            RuntimeError,
-                        ):
-                            pass  # Queue might be closed or in a bad state
+        # Emit to matching subscribers via the precompiled dispatch index
+        for queue in self._resolve_queues(event.type):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Bounded queue: fall back to waiting for room
+                try:
+                    await queue.put(event)
+                except (asyncio.CancelledError, RuntimeError):
+                    pass
+            except RuntimeError:
+                pass  # Queue might be closed or in a bad state
 
     def _matches_pattern(self, event_type: str, pattern: str) -> bool:
         """Check if event type matches a subscription pattern."""
@@ -6,9 +6,10 @@ import asyncio
 import json
 import logging
 import sqlite3
+from collections import deque
 from datetime import datetime, UTC
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from .event import Event
 
@@ -16,13 +17,42 @@ logger = logging.getLogger(__name__)
 
 
 class EventStore:
-    """SQLite-based event store for persistent event logging."""
+    """SQLite-based event store for persistent event logging.
 
-    def __init__(self, db_path: Path):
+    Writes go through a bounded write-behind queue: events are buffered in
+    memory and a background writer commits them in a single transaction per
+    ``batch_size`` events or ``flush_interval`` seconds, whichever comes first.
+    Reads flush pending writes first so callers always see their own events.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        batch_size: int = 256,
+        flush_interval: float = 0.05,
+        max_pending: int = 10000,
+    ):
         self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
         self._lock = asyncio.Lock()
         self._connection: Optional[sqlite3.Connection] = None
 
+        # Write-behind queue state
+        self._pending: Deque[Event] = deque()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._has_pending: Optional[asyncio.Event] = None
+        self._batch_full: Optional[asyncio.Event] = None
+        self._write_stats: Dict[str, int] = {
+            "enqueued": 0,
+            "written": 0,
+            "dropped": 0,
+            "failed": 0,
+            "batches": 0,
+            "backpressure_waits": 0,
+        }
+
     @property
     def connection(self) -> sqlite3.Connection:
         """Get the database connection, raising an exception if not initialized."""
@@ -44,6 +74,11 @@ class EventStore:
     def _init_db(self) -> None:
         """Initialize database schema (runs in thread pool)."""
         self._connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+
+        # WAL lets readers proceed during batch commits; NORMAL sync is safe
+        # with WAL and avoids an fsync per transaction
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
         self.connection.execute("""
         CREATE TABLE IF NOT EXISTS events (
         id TEXT PRIMARY KEY,
@@ -84,57 +119,170 @@ class EventStore:
         self.connection.commit()
         logger.info(f"Event store initialized at {self.db_path}")
 
+    def enqueue(self, event: Event) -> bool:
+        """Queue an event for batched storage without blocking.
+
+        Returns:
+            True if the event was queued, False if it was dropped because the
+            store is not initialized or the write queue is full.
+        """
+        if not self._connection:
+            logger.warning("Event store not initialized, skipping event storage")
+            return False
+
+        if len(self._pending) >= self.max_pending:
+            self._write_stats["dropped"] += 1
+            if self._write_stats["dropped"] % 1000 == 1:
+                logger.warning(
+                    f"Event store write queue full ({self.max_pending} pending), "
+                    f"dropped {self._write_stats['dropped']} events so far"
+                )
+            return False
+
+        self._pending.append(event)
+        self._write_stats["enqueued"] += 1
+        self._ensure_writer()
+
+        if self._has_pending is not None:
+            self._has_pending.set()
+            if len(self._pending) >= self.batch_size and self._batch_full:
+                self._batch_full.set()
+
+        return True
+
     async def store_event(self, event: Event) -> None:
-        """Store an event in the database."""
-        async with self._lock:
-            if not self._connection:
-                logger.warning("Event store not initialized, skipping event storage")
-                return
+        """Store an event in the database.
 
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._store_event_sync, event)
+        Unlike :meth:`enqueue`, this applies backpressure: when the write queue
+        is full it waits for a flush instead of dropping the event.
+        """
+        if not self._connection:
+            logger.warning("Event store not initialized, skipping event storage")
+            return
 
-    def _store_event_sync(self, event: Event) -> None:
-        """Store event synchronously (runs in thread pool)."""
-        try:
-            # Convert event to dict for JSON storage
-            event_dict = {
-                "id": event.id,
-                "type": event.type,
-                "timestamp": event.timestamp,
-                "source": event.source,
-                "payload": event.payload,
-                "priority": (
-                    event.priority.value
-                    if hasattr(event.priority, "value")
-                    else event.priority
-                ),
-                "sequence": event.sequence,
-                "created_at": datetime.now(UTC).timestamp(),
-            }
+        if len(self._pending) >= self.max_pending:
+            self._write_stats["backpressure_waits"] += 1
+            await self.flush()
 
-            self.connection.execute(
-                """
-                INSERT OR REPLACE INTO events
-                (id, type, timestamp, source, payload, priority, sequence, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    event_dict["id"],
-                    event_dict["type"],
-                    event_dict["timestamp"],
-                    event_dict["source"],
-                    json.dumps(event_dict["payload"]),
-                    event_dict["priority"],
-                    event_dict["sequence"],
-                    event_dict["created_at"],
-                ),
-            )
+        self.enqueue(event)
 
-            self.connection.commit()
+    def _ensure_writer(self) -> None:
+        """Start the background writer on the running loop if needed."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop: events stay queued until the next flush
+
+        task = self._writer_task
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+
+        self._has_pending = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        if self._pending:
+            self._has_pending.set()
+        self._writer_task = loop.create_task(self._run_writer())
+
+    async def _run_writer(self) -> None:
+        """Background loop that group-commits queued events."""
+        assert self._has_pending is not None and self._batch_full is not None
+        has_pending, batch_full = self._has_pending, self._batch_full
+
+        while True:
+            await has_pending.wait()
+
+            # Give the batch a chance to fill before committing
+            if len(self._pending) < self.batch_size:
+                try:
+                    await asyncio.wait_for(
+                        batch_full.wait(), timeout=self.flush_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write all queued events to the database.
+
+        Returns:
+            Number of events written.
+        """
+        async with self._lock:
+            return await self._flush_locked()
+
+    async def _flush_locked(self) -> int:
+        """Flush queued events; caller must hold ``self._lock``."""
+        written = 0
+        loop = asyncio.get_running_loop()
+
+        while self._pending and self._connection:
+            batch = [
+                self._pending.popleft()
+                for _ in range(min(self.batch_size, len(self._pending)))
+            ]
+            written += await loop.run_in_executor(None, self._write_batch_sync, batch)
+
+        if not self._pending:
+            if self._has_pending is not None:
+                self._has_pending.clear()
+            if self._batch_full is not None:
+                self._batch_full.clear()
+
+        return written
+
+    def _write_batch_sync(self, events: List[Event]) -> int:
+        """Insert a batch of events in one transaction (runs in thread pool)."""
+        created_at = datetime.now(UTC).timestamp()
+        rows: List[Tuple[Any, ...]] = []
+
+        for event in events:
+            try:
+                rows.append(
+                    (
+                        event.id,
+                        event.type,
+                        event.timestamp,
+                        event.source,
+                        json.dumps(event.payload),
+                        (
+                            event.priority.value
+                            if hasattr(event.priority, "value")
+                            else event.priority
+                        ),
+                        event.sequence,
+                        created_at,
+                    )
+                )
+            except (TypeError, ValueError) as e:
+                self._write_stats["failed"] += 1
+                logger.error(f"Failed to serialize event {event.id}: {e}")
+
+        if not rows:
+            return 0
 
+        try:
+            with self.connection:
+                self.connection.executemany(
+                    """
+                    INSERT OR REPLACE INTO events
+                    (id, type, timestamp, source, payload, priority, sequence, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                    rows,
+                )
         except Exception as e:
-            logger.error(f"Failed to store event {event.id}: {e}")
+            self._write_stats["failed"] += len(rows)
+            logger.error(f"Failed to store batch of {len(rows)} events: {e}")
+            return 0
+
+        self._write_stats["written"] += len(rows)
+        self._write_stats["batches"] += 1
+        return len(rows)
+
+    def get_write_stats(self) -> Dict[str, int]:
+        """Get write-behind queue counters (pending, written, dropped, ...)."""
+        return {**self._write_stats, "pending": len(self._pending)}
 
     async def get_events(
         self,
@@ -149,6 +297,8 @@ class EventStore:
             if not self._connection:
                 return []
 
+            await self._flush_locked()
+
             loop = asyncio.get_event_loop()
             return await loop.run_in_executor(
                 None, self._get_events_sync, event_type, source, limit, offset, since
@@ -225,6 +375,8 @@ class EventStore:
             if not self._connection:
                 return {}
 
+            await self._flush_locked()
+
             loop = asyncio.get_event_loop()
             return await loop.run_in_executor(None, self._get_event_stats_sync)
 
@@ -270,6 +422,7 @@ class EventStore:
                 "database_size": (
                     self.db_path.stat().st_size if self.db_path.exists() else 0
                 ),
+                "write_queue": self.get_write_stats(),
             }
 
         except Exception as e:
@@ -286,6 +439,8 @@ class EventStore:
                 days_to_keep * 24 * 60 * 60
             )
 
+            await self._flush_locked()
+
             loop = asyncio.get_event_loop()
             return await loop.run_in_executor(
                 None,
@@ -401,6 +556,8 @@ class EventStore:
             if not self._connection:
                 return []
 
+            await self._flush_locked()
+
             loop = asyncio.get_event_loop()
             return await loop.run_in_executor(
                 None, self._get_missed_events_sync, agent_name, limit
@@ -468,6 +625,8 @@ class EventStore:
             if not self._connection:
                 return {}
 
+            await self._flush_locked()
+
             loop = asyncio.get_event_loop()
             return await loop.run_in_executor(None, self._detect_gaps_sync)
 
@@ -501,12 +660,25 @@ class EventStore:
             return {}
 
     async def close(self) -> None:
-        """Close the database connection."""
+        """Flush pending events and close the database connection."""
         async with self._lock:
             if self._connection:
+                await self._flush_locked()
                 self._connection.close()
                 self._connection = None
-                logger.info("Event store closed")
+                logger.info(
+                    f"Event store closed ({self._write_stats['written']} written, "
+                    f"{self._write_stats['dropped']} dropped)"
+                )
+
+        # The writer is idle now (we held the lock), so cancelling is safe
+        task, self._writer_task = self._writer_task, None
+        if task and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
 
 
 # Global instance
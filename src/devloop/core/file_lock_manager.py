@@ -11,8 +11,9 @@ import hashlib
 import logging
 import asyncio
 import time
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional, Set, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -85,6 +86,10 @@ class FileLockManager:
         # Global lock for metadata updates
         self._metadata_lock = asyncio.Lock()
 
+        # Per-(owner, file) locks serializing an agent's work on a file,
+        # with the number of holders and waiters for cleanup
+        self._serial_locks: Dict[Tuple[str, str], Tuple[asyncio.Lock, List[int]]] = {}
+
     async def acquire_lock(
         self,
         file_path: Path,
@@ -200,6 +205,35 @@ class FileLockManager:
         except RuntimeError as e:
             self.logger.error(f"Error releasing lock for {file_path.name}: {e}")
 
+    @asynccontextmanager
+    async def serialize(self, file_path: Path, owner: str) -> AsyncIterator[None]:
+        """Serialize one owner's work on a file.
+
+        Unlike :meth:`acquire_lock`, this waits for the previous holder instead
+        of reporting a conflict, and only excludes the same owner, so an agent
+        processing several events concurrently never handles one file twice
+        at the same time while other agents are unaffected.
+
+        Args:
+            file_path: Path to file being processed
+            owner: Name of the agent processing it
+        """
+        key = (owner, str(file_path.resolve()))
+        entry = self._serial_locks.get(key)
+        if entry is None:
+            entry = (asyncio.Lock(), [0])
+            self._serial_locks[key] = entry
+        lock, users = entry
+
+        users[0] += 1
+        try:
+            async with lock:
+                yield
+        finally:
+            users[0] -= 1
+            if users[0] == 0:
+                del self._serial_locks[key]
+
     async def check_version(
         self, file_path: Path, expected_etag: Optional[str] = None
     ) -> Tuple[bool, Optional[FileVersion]]:
@@ -379,6 +413,7 @@ class FileLockManager:
             self._readers.clear()
             self._file_versions.clear()
             self._modification_queue.clear()
+            self._serial_locks.clear()
 
             self.logger.info("Reset all file locks and versions")
 
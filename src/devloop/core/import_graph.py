@@ -3,17 +3,130 @@
 Builds a reverse dependency graph from Python source files using AST parsing.
 When a file changes, walks the graph to find all test files that transitively
 depend on it.
+
+``from package import name`` is resolved to the file that defines ``name``:
+a submodule, or the module a package ``__init__.py`` re-exports it from. A
+file importing ``ContextStore`` from ``devloop.core`` therefore depends on
+``core/context_store.py`` rather than on everything ``core/__init__.py``
+pulls in. Side effects of executing package ``__init__`` files are not
+tracked as dependencies.
+
+Parsed imports can be persisted to a JSON cache (normally
+``.devloop/import_graph.json``) keyed by path, mtime, size and content hash,
+so a restart only re-parses files that changed since the last build.
 """
 
 from __future__ import annotations
 
 import ast
+import hashlib
+import json
 import logging
-from collections import defaultdict
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable
 
 logger = logging.getLogger(__name__)
 
+# Bump when the cached data changes meaning
+_CACHE_VERSION = 2
+
+# Below this many files to parse, a process pool costs more than it saves
+_PARALLEL_PARSE_THRESHOLD = 200
+
+# Longest chain of package re-exports followed for one imported name
+_MAX_REEXPORT_DEPTH = 8
+
+# (module_name, is_relative, level, names). names holds (name, bound_name)
+# pairs for `from module import name as bound_name` and is empty for
+# `import module`.
+ParsedImport = tuple[str, bool, int, tuple[tuple[str, str], ...]]
+
+
+@dataclass
+class _CachedFile:
+    """Parsed imports of one file plus the stat/hash they were parsed from."""
+
+    mtime_ns: int
+    size: int
+    digest: str
+    imports: list[ParsedImport]
+
+
+def _parse_source(source: str, filename: str) -> list[ParsedImport]:
+    """Extract import statements from Python source.
+
+    Raises:
+        SyntaxError: If the source cannot be parsed
+    """
+    tree = ast.parse(source, filename=filename)
+    imports: list[ParsedImport] = []
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.append((alias.name, False, 0, ()))
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module or ""
+            level = node.level or 0
+            is_relative = level > 0
+            names = tuple(
+                (alias.name, alias.asname or alias.name) for alias in node.names
+            )
+            imports.append((module, is_relative, level, names))
+
+    return imports
+
+
+def _scan_file(
+    path: str, known_digest: str | None
+) -> tuple[str | None, list[ParsedImport] | None, str | None]:
+    """Hash a file and parse its imports unless its content is already known.
+
+    Runs in pool workers, so problems are returned rather than logged.
+
+    Returns:
+        (digest, imports, error). digest is None if the file could not be
+        read; imports is None if the digest equals known_digest.
+    """
+    try:
+        data = Path(path).read_bytes()
+    except OSError as e:
+        return None, [], str(e)
+
+    digest = hashlib.sha256(data).hexdigest()
+    if digest == known_digest:
+        return digest, None, None
+
+    try:
+        source = data.decode("utf-8", errors="replace")
+        return digest, _parse_source(source, path), None
+    except (SyntaxError, ValueError) as e:
+        return digest, [], str(e)
+
+
+def _pool_context():
+    """Multiprocessing context for parse workers.
+
+    Forking avoids re-importing devloop in every worker on Linux, but a
+    child forked from a multi-threaded process (like the daemon) can inherit
+    locks held by other threads, so those use a fork server instead. Other
+    platforms keep their default start method.
+    """
+    if sys.platform.startswith("linux"):
+        if threading.active_count() == 1:
+            return multiprocessing.get_context("fork")
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context()
+
 
 class ImportGraph:
     """Reverse dependency graph for Python imports.
@@ -24,11 +137,19 @@ class ImportGraph:
     Args:
         project_root: Root directory of the project.
         src_dirs: List of source directories to scan (e.g. [project/src]).
+        cache_path: Optional JSON file for persisting parsed imports between
+            builds. No cache is used if omitted.
     """
 
-    def __init__(self, project_root: Path, src_dirs: list[Path] | None = None):
+    def __init__(
+        self,
+        project_root: Path,
+        src_dirs: list[Path] | None = None,
+        cache_path: Path | None = None,
+    ):
         self.project_root = project_root.resolve()
         self.src_dirs = [d.resolve() for d in (src_dirs or [])]
+        self.cache_path = cache_path
 
         # Forward map: file → set of resolved file paths it imports
         self._imports: dict[Path, set[Path]] = {}
@@ -36,16 +157,92 @@ class ImportGraph:
         # Reverse map: file → set of files that import it
         self._importers: dict[Path, set[Path]] = defaultdict(set)
 
+        # Parsed import statements of every indexed file
+        self._parsed: dict[Path, list[ParsedImport]] = {}
+
+        # Package __init__.py → files whose imported names were looked up in
+        # it, re-resolved when the package's re-exports or modules change
+        self._lookups: dict[Path, set[Path]] = defaultdict(set)
+
+        # Queried file → every file that transitively imports it (plus itself).
+        # Entries are dropped when an edge into their closure changes.
+        self._closures: dict[Path, frozenset[Path]] = {}
+        self._affected_tests: dict[Path, list[Path]] = {}
+
+        # Import → resolved file, only kept during build(). Keyed by
+        # (module, level, package dir); package dir is None for absolute imports
+        self._resolution_memo: (
+            dict[tuple[str, int, Path | None], Path | None] | None
+        ) = None
+        # Same, per imported name: key + name → (file, consulted __init__ files)
+        self._name_memo: (
+            dict[tuple[str, int, Path | None, str], tuple[Path | None, list[Path]]]
+            | None
+        ) = None
+
     def build(self) -> None:
-        """Scan all .py files and build the full import graph."""
+        """Scan all .py files and build the full import graph.
+
+        With a cache, files whose mtime and size (or, failing that, content
+        hash) match the cached entry reuse its imports. The rest are parsed,
+        in a process pool when there are many of them.
+        """
         py_files = self._discover_py_files()
+        cached = self._load_cache()
+        entries: dict[Path, _CachedFile] = {}
+        misses: list[tuple[Path, os.stat_result, _CachedFile | None]] = []
 
         for py_file in py_files:
-            self._index_file(py_file)
+            try:
+                stat = py_file.stat()
+            except OSError:
+                continue
+            entry = cached.get(py_file)
+            if (
+                entry is not None
+                and entry.mtime_ns == stat.st_mtime_ns
+                and entry.size == stat.st_size
+            ):
+                entries[py_file] = entry
+            else:
+                misses.append((py_file, stat, entry))
+
+        scanned = self._scan_files(
+            [(str(path), entry.digest if entry else None) for path, _, entry in misses]
+        )
+        for (path, stat, entry), (digest, imports, error) in zip(misses, scanned):
+            if error:
+                logger.debug(f"Skipping {path}: {error}")
+            if imports is None and entry is not None:
+                imports = entry.imports
+            if digest is not None:
+                entries[path] = _CachedFile(
+                    stat.st_mtime_ns, stat.st_size, digest, imports or []
+                )
+
+        self._closures.clear()
+        self._affected_tests.clear()
+        # Re-exports are looked up in the parsed imports of __init__ files,
+        # so every file must be parsed before any edges are resolved
+        self._parsed.update((path, entry.imports) for path, entry in entries.items())
+        self._resolution_memo, self._name_memo = {}, {}
+        try:
+            for path, entry in entries.items():
+                self._add_edges(path, entry.imports)
+        finally:
+            self._resolution_memo, self._name_memo = None, None
+
+        logger.debug(
+            f"Import graph built from {len(entries)} files ({len(misses)} not cached)"
+        )
+        if misses or len(entries) != len(cached):
+            self._save_cache(entries)
 
     def update_file(self, path: Path) -> None:
         """Re-parse a single file and update its edges in the graph."""
         resolved = path.resolve()
+        is_new = resolved not in self._parsed
+        touched = {resolved, *self._imports.get(resolved, ())}
 
         # Remove old edges for this file
         self._remove_edges(resolved)
@@ -53,40 +250,127 @@ class ImportGraph:
         # Re-index if file still exists
         if resolved.exists():
             self._index_file(resolved)
+            touched.update(self._imports[resolved])
+        else:
+            self._parsed.pop(resolved, None)
+
+        touched |= self._reindex_dependents(
+            resolved, added_or_removed=is_new or not resolved.exists()
+        )
+        self._invalidate_closures(touched)
 
     def remove_file(self, path: Path) -> None:
         """Remove a file and all its edges from the graph."""
         resolved = path.resolve()
+        touched = {resolved, *self._imports.get(resolved, ())}
         self._remove_edges(resolved)
         self._imports.pop(resolved, None)
         self._importers.pop(resolved, None)
+        self._parsed.pop(resolved, None)
+        touched |= self._reindex_dependents(resolved, added_or_removed=True)
+        self._invalidate_closures(touched)
 
     def get_affected_tests(self, changed_file: Path) -> list[Path]:
         """Find all test files that transitively depend on changed_file.
 
         Does a BFS on the reverse import graph starting from changed_file,
         collecting any reachable files that match test naming conventions.
+        The reachable set is memoized until an edge inside it changes.
         """
         resolved = changed_file.resolve()
-        visited: set[Path] = set()
-        queue = [resolved]
-        test_files: list[Path] = []
+        test_files = self._affected_tests.get(resolved)
+        if test_files is None:
+            test_files = self._affected_tests[resolved] = sorted(
+                f
+                for f in self._closure_of(resolved)
+                if f != resolved and self._is_test_file(f)
+            )
 
-        while queue:
-            current = queue.pop(0)
-            if current in visited:
-                continue
-            visited.add(current)
+        return list(test_files)
 
-            if current != resolved and self._is_test_file(current):
-                test_files.append(current)
+    def get_dependents(self, changed_file: Path) -> list[Path]:
+        """Find changed_file and every file that transitively imports it.
+
+        These are the modules that hold references to changed_file's code
+        and must be re-imported to see the change.
+        """
+        return sorted(self._closure_of(changed_file.resolve()))
+
+    def get_affected_tests_for(self, changed_files: Iterable[Path]) -> list[Path]:
+        """Find all test files that transitively depend on any changed file.
+
+        Equivalent to the union of get_affected_tests() over changed_files,
+        computed in a single traversal. A changed test file is only included
+        if it transitively imports a changed file.
+        """
+        starts = {path.resolve() for path in changed_files}
+        reentered: set[Path] = set()
+        closure = self._reverse_closure(starts, reentered)
+
+        return sorted(
+            f
+            for f in closure
+            if (f not in starts or f in reentered) and self._is_test_file(f)
+        )
+
+    def _closure_of(self, path: Path) -> frozenset[Path]:
+        """Memoized reverse closure of a single resolved path."""
+        closure = self._closures.get(path)
+        if closure is None:
+            closure = self._closures[path] = frozenset(self._reverse_closure([path]))
+        return closure
+
+    def _reverse_closure(
+        self, starts: Iterable[Path], reentered: set[Path] | None = None
+    ) -> set[Path]:
+        """All files reachable from starts over reverse edges, including starts.
+
+        Memoized closures of files met along the way are reused rather than
+        walked again. Starts that are reached over an edge are added to
+        reentered, if given.
+        """
+        visited = set(starts)
+        start_set = frozenset(visited)
+        queue = deque(visited)
+
+        while queue:
+            current = queue.popleft()
 
             # Walk reverse edges: who imports this file?
-            for importer in self._importers.get(current, set()):
-                if importer not in visited:
+            for importer in self._importers.get(current, ()):
+                if importer in visited:
+                    if reentered is not None and importer in start_set:
+                        reentered.add(importer)
+                    continue
+                closure = self._closures.get(importer)
+                if closure is not None:
+                    if reentered is not None:
+                        reentered.update(start_set & closure)
+                    visited |= closure
+                else:
+                    visited.add(importer)
                     queue.append(importer)
 
-        return sorted(test_files)
+        return visited
+
+    def _invalidate_closures(self, touched: set[Path]) -> None:
+        """Drop memoized closures containing any of the touched files.
+
+        Changing a file's imports adds or removes reverse edges into its old
+        and new targets, so callers pass the file plus both sets of targets.
+        """
+        if not self._closures:
+            return
+        self._closures = {
+            start: closure
+            for start, closure in self._closures.items()
+            if touched.isdisjoint(closure)
+        }
+        self._affected_tests = {
+            start: tests
+            for start, tests in self._affected_tests.items()
+            if start in self._closures
+        }
 
     def _discover_py_files(self) -> list[Path]:
         """Find all .py files in the project."""
@@ -102,20 +386,227 @@ class ImportGraph:
 
         return [f.resolve() for f in py_files]
 
+    def _scan_files(
+        self, jobs: list[tuple[str, str | None]]
+    ) -> list[tuple[str | None, list[ParsedImport] | None, str | None]]:
+        """Run _scan_file over (path, known_digest) jobs, in parallel if many."""
+        if len(jobs) >= _PARALLEL_PARSE_THRESHOLD and (os.cpu_count() or 1) > 1:
+            paths, digests = zip(*jobs)
+            try:
+                with ProcessPoolExecutor(mp_context=_pool_context()) as pool:
+                    return list(pool.map(_scan_file, paths, digests, chunksize=32))
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"Parallel import parsing failed, parsing serially: {e}")
+
+        return [_scan_file(path, digest) for path, digest in jobs]
+
+    def _load_cache(self) -> dict[Path, _CachedFile]:
+        """Load cached file entries, or nothing if the cache is unusable."""
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+
+        try:
+            data = json.loads(self.cache_path.read_text())
+            if data.get("version") != _CACHE_VERSION:
+                return {}
+            return {
+                Path(path): _CachedFile(
+                    mtime_ns=entry["mtime_ns"],
+                    size=entry["size"],
+                    digest=entry["sha256"],
+                    imports=[
+                        (
+                            module,
+                            bool(relative),
+                            level,
+                            tuple((name, bound) for name, bound in names),
+                        )
+                        for module, relative, level, names in entry["imports"]
+                    ],
+                )
+                for path, entry in data["files"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable import graph cache: {e}")
+            return {}
+
+    def _save_cache(self, entries: dict[Path, _CachedFile]) -> None:
+        """Atomically write file entries to the cache."""
+        if self.cache_path is None:
+            return
+
+        data = {
+            "version": _CACHE_VERSION,
+            "files": {
+                str(path): {
+                    "mtime_ns": entry.mtime_ns,
+                    "size": entry.size,
+                    "sha256": entry.digest,
+                    "imports": entry.imports,
+                }
+                for path, entry in entries.items()
+            },
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(
+                dir=self.cache_path.parent, prefix=".import_graph.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp, self.cache_path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write import graph cache: {e}")
+
     def _index_file(self, path: Path) -> None:
         """Parse a file's imports and add edges to the graph."""
         resolved = path.resolve()
-        imports = self._parse_imports(resolved)
+        self._add_edges(resolved, self._parse_imports(resolved))
+
+    def _add_edges(self, path: Path, imports: list[ParsedImport]) -> None:
+        """Resolve a file's parsed imports and add edges to the graph."""
+        self._parsed[path] = imports
         resolved_imports: set[Path] = set()
 
-        for module_name, is_relative, level in imports:
-            target = self._resolve_import(module_name, resolved, is_relative, level)
-            if target and target.exists():
-                target = target.resolve()
-                resolved_imports.add(target)
-                self._importers[target].add(resolved)
+        for module_name, is_relative, level, names in imports:
+            if not names:
+                target = self._resolve_target(module_name, path, is_relative, level)
+                if target:
+                    resolved_imports.add(target)
+                continue
+
+            for name, _ in names:
+                target, consulted = self._resolve_name(
+                    module_name, path, is_relative, level, name
+                )
+                if target:
+                    resolved_imports.add(target)
+                for init_file in consulted:
+                    self._lookups[init_file].add(path)
+
+        for target in resolved_imports:
+            self._importers[target].add(path)
+        self._imports[path] = resolved_imports
+
+    def _reindex_dependents(self, path: Path, added_or_removed: bool) -> set[Path]:
+        """Re-resolve files whose imported names were looked up via path.
 
-        self._imports[resolved] = resolved_imports
+        Edits to a package __init__.py can change its re-exports; adding or
+        removing a module can change what `from package import name` finds.
+
+        Returns:
+            Old and new import targets of the re-resolved files
+        """
+        dependents = set(self._lookups.get(path, ()))
+        if added_or_removed:
+            dependents |= self._lookups.get(path.parent / "__init__.py", set())
+        dependents.discard(path)
+
+        touched: set[Path] = set()
+        for dependent in dependents:
+            if dependent not in self._parsed:
+                continue
+            touched |= self._imports.get(dependent, set())
+            self._remove_edges(dependent)
+            self._add_edges(dependent, self._parsed[dependent])
+            touched |= self._imports[dependent]
+        return touched
+
+    def _resolve_name(
+        self,
+        module_name: str,
+        importing_file: Path,
+        is_relative: bool,
+        level: int,
+        name: str,
+        depth: int = 0,
+    ) -> tuple[Path | None, list[Path]]:
+        """Resolve `from module_name import name` to the file defining name.
+
+        Like Python, looks for name in the package first (following its
+        re-exports), then for a submodule called name. Anything else is
+        taken to be defined in the module itself.
+
+        Returns:
+            (file, package __init__ files consulted along the way)
+        """
+        memo = self._name_memo
+        key = (
+            module_name,
+            level,
+            importing_file.parent if is_relative else None,
+            name,
+        )
+        if memo is not None and key in memo:
+            return memo[key]
+
+        base = self._resolve_target(module_name, importing_file, is_relative, level)
+        result: tuple[Path | None, list[Path]] = (base, [])
+
+        if base is not None and base.name == "__init__.py" and name != "*":
+            result = (base, [base])
+            reexport = self._find_reexport(base, name)
+            if reexport is not None and depth < _MAX_REEXPORT_DEPTH:
+                source, original = reexport
+                target, consulted = self._resolve_name(*source, original, depth + 1)
+                result = (target or base, [base, *consulted])
+            else:
+                submodule = f"{module_name}.{name}" if module_name else name
+                target = self._resolve_target(
+                    submodule, importing_file, is_relative, level
+                )
+                if target is not None:
+                    result = (target, [base])
+        elif base is None and name != "*":
+            # Namespace package (no __init__.py): only submodules can match
+            submodule = f"{module_name}.{name}" if module_name else name
+            result = (
+                self._resolve_target(submodule, importing_file, is_relative, level),
+                [],
+            )
+
+        if memo is not None:
+            memo[key] = result
+        return result
+
+    def _find_reexport(
+        self, init_file: Path, name: str
+    ) -> tuple[tuple[str, Path, bool, int], str] | None:
+        """Find the `from x import y as name` in a package __init__.py.
+
+        Returns:
+            ((module_name, init_file, is_relative, level), original name), or
+            None if the package does not import name from elsewhere
+        """
+        for module_name, is_relative, level, names in self._parsed.get(init_file, ()):
+            for original, bound in names:
+                if bound == name and original != "*":
+                    return (module_name, init_file, is_relative, level), original
+        return None
+
+    def _resolve_target(
+        self, module_name: str, importing_file: Path, is_relative: bool, level: int
+    ) -> Path | None:
+        """Resolve an import to an existing, fully resolved file path.
+
+        Results only depend on the importing file's directory (or nothing,
+        for absolute imports), so they are memoized during a build.
+        """
+        memo = self._resolution_memo
+        key = (module_name, level, importing_file.parent if is_relative else None)
+        if memo is not None and key in memo:
+            return memo[key]
+
+        target = self._resolve_import(module_name, importing_file, is_relative, level)
+        result = target.resolve() if target and target.exists() else None
+
+        if memo is not None:
+            memo[key] = result
+        return result
 
     def _remove_edges(self, path: Path) -> None:
         """Remove all forward edges from a file (its imports)."""
@@ -123,32 +614,18 @@ class ImportGraph:
         for target in old_imports:
             self._importers[target].discard(path)
 
-    def _parse_imports(self, path: Path) -> list[tuple[str, bool, int]]:
+    def _parse_imports(self, path: Path) -> list[ParsedImport]:
         """Parse import statements from a Python file using AST.
 
-        Returns list of (module_name, is_relative, level) tuples.
+        Returns list of (module_name, is_relative, level, names) tuples.
         """
         try:
             source = path.read_text(encoding="utf-8", errors="replace")
-            tree = ast.parse(source, filename=str(path))
-        except (SyntaxError, OSError) as e:
+            return _parse_source(source, str(path))
+        except (SyntaxError, ValueError, OSError) as e:
             logger.debug(f"Skipping {path}: {e}")
             return []
 
-        imports: list[tuple[str, bool, int]] = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append((alias.name, False, 0))
-            elif isinstance(node, ast.ImportFrom):
-                module = node.module or ""
-                level = node.level or 0
-                is_relative = level > 0
-                imports.append((module, is_relative, level))
-
-        return imports
-
     def _resolve_import(
         self, module_name: str, importing_file: Path, is_relative: bool, level: int
     ) -> Path | None:
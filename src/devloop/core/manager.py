@@ -1,7 +1,9 @@
 """Agent manager for centralized control with feedback and performance."""
 
 import asyncio
+import json
 import logging
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Type
 
@@ -10,7 +12,14 @@ from devloop.core.config import ResourceLimitConfig
 from devloop.core.context_store import context_store
 from devloop.core.event import Event, EventBus
 from devloop.core.feedback import FeedbackAPI, FeedbackStore
-from devloop.core.performance import AgentResourceTracker, PerformanceMonitor
+from devloop.core.performance import (
+    AgentResourceTracker,
+    PerformanceMonitor,
+    get_agent_process_registry,
+)
+
+# Per-agent resource usage written by the daemon, relative to .devloop/
+RESOURCE_REPORT_FILE = "agent_resources.json"
 
 
 class AgentManager:
@@ -101,14 +110,8 @@ class AgentManager:
             self._listen_for_agent_completion(queue)
         )
 
-        # Start resource limit enforcement if configured
-        if (
-            self.resource_limits.max_cpu_percent is not None
-            or self.resource_limits.max_memory_mb is not None
-        ):
-            self._enforcement_task = asyncio.create_task(
-                self._enforce_resource_limits()
-            )
+        # Track per-agent resource usage (and enforce limits if configured)
+        self._enforcement_task = asyncio.create_task(self._enforce_resource_limits())
 
         tasks = [agent.start() for agent in self.agents.values() if agent.enabled]
         await asyncio.gather(*tasks)
@@ -187,6 +190,12 @@ class AgentManager:
                 "enabled": agent.enabled,
                 "paused": name in self._paused_agents,
                 "triggers": agent.triggers,
+                "debounce_suppressed": agent.debounce_suppressed,
+                "queue": agent._event_queue.get_stats(),
+                "max_concurrency": agent.max_concurrency,
+                "in_flight": len(agent._handler_tasks),
+                "cancelled_runs": agent.cancelled_runs,
+                "cancelled_tool_runs": get_agent_process_registry().cancelled(name),
             }
             for name, agent in self.agents.items()
         }
@@ -238,26 +247,28 @@ class AgentManager:
             await queue.get()
             try:
                 # Update consolidated results for Claude Code integration
-                await context_store._update_index()
+                context_store.schedule_index_update()
             except Exception as e:
                 self.logger.error(f"Failed to write consolidated results: {e}")
             finally:
                 queue.task_done()
 
     async def _enforce_resource_limits(self):
-        """Background task to enforce resource limits on agents."""
-        if (
-            self.resource_limits.max_cpu_percent is None
-            and self.resource_limits.max_memory_mb is None
-        ):
-            # No limits configured, skip enforcement
-            return
+        """Background task to enforce resource limits on agents.
 
-        self.logger.info(
-            f"Resource limit enforcement started (CPU: {self.resource_limits.max_cpu_percent}%, "
-            f"Memory: {self.resource_limits.max_memory_mb}MB, "
-            f"Interval: {self.resource_limits.check_interval_seconds}s)"
+        Each check also writes per-agent usage to ``agent_resources.json`` for
+        ``devloop status``, whether or not limits are configured.
+        """
+        enforce = (
+            self.resource_limits.max_cpu_percent is not None
+            or self.resource_limits.max_memory_mb is not None
         )
+        if enforce:
+            self.logger.info(
+                f"Resource limit enforcement started (CPU: {self.resource_limits.max_cpu_percent}%, "
+                f"Memory: {self.resource_limits.max_memory_mb}MB, "
+                f"Interval: {self.resource_limits.check_interval_seconds}s)"
+            )
 
         while True:
             try:
@@ -267,6 +278,10 @@ class AgentManager:
                 if self.resource_tracker is None:
                     continue
 
+                await self._write_resource_report()
+                if not enforce:
+                    continue
+
                 for agent_name, agent in self.agents.items():
                     if not agent.enabled or not agent._running:
                         continue
@@ -333,9 +348,28 @@ class AgentManager:
                             )
 
             except asyncio.CancelledError:
-                self.logger.info("Resource limit enforcement stopped")
+                if enforce:
+                    self.logger.info("Resource limit enforcement stopped")
                 break
             except Exception as e:
                 self.logger.error(
                     f"Error in resource limit enforcement: {e}", exc_info=True
                 )
+
+    async def _write_resource_report(self) -> None:
+        """Write per-agent resource usage for ``devloop status``."""
+        if self.resource_tracker is None:
+            return
+
+        report = {
+            "timestamp": time.time(),
+            "agents": self.resource_tracker.report(self.agents),
+        }
+        report_file = self.project_dir / ".devloop" / RESOURCE_REPORT_FILE
+        try:
+            report_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = report_file.with_suffix(".tmp")
+            temp_file.write_text(json.dumps(report, indent=2))
+            temp_file.replace(report_file)
+        except OSError as e:
+            self.logger.debug(f"Failed to write resource report: {e}")
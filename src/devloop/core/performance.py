@@ -4,14 +4,37 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
+import math
 import psutil
+import sqlite3
+import threading
 import time
+from collections import deque
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
-import aiofiles
+from devloop.security.cgroups_helper import CgroupsManager, CgroupsResources
+
+logger = logging.getLogger(__name__)
+
+# Relative accuracy of the duration percentile sketch (~5%)
+_SKETCH_GAMMA = 1.1
+_SKETCH_LOG_GAMMA = math.log(_SKETCH_GAMMA)
+_SKETCH_MIN_VALUE = 1e-6
 
 
 @dataclass
@@ -26,13 +49,94 @@ class ResourceUsage:
     disk_write_mb: float = 0.0
     network_bytes_sent: int = 0
     network_bytes_recv: int = 0
+    cpu_time: float = 0.0  # Cumulative process CPU seconds
+    system_cpu_percent: float = 0.0
 
     @classmethod
     def snapshot(cls) -> ResourceUsage:
-        """Create a resource usage snapshot."""
-        process = psutil.Process()
-        memory_info = process.memory_info()
-        cpu_percent = process.cpu_percent(interval=0.1)
+        """Return the latest resource usage sample without blocking.
+
+        Samples come from the shared background :class:`ResourceSampler`,
+        which is started on first use.
+        """
+        return get_resource_sampler().latest()
+
+
+class ResourceSampler:
+    """Sample process and system counters on a background thread.
+
+    Samples are taken every ``interval`` seconds into a ring buffer of
+    ``history`` entries, so readers get the latest sample in O(1) instead of
+    sleeping in ``psutil``'s ``cpu_percent(interval=...)``. CPU percentages
+    are computed from cumulative CPU time between consecutive samples.
+
+    Sample timestamps are derived from a monotonic clock anchored to the wall
+    clock when the sampler starts, so the thread never reads the wall clock.
+    """
+
+    def __init__(self, interval: float = 0.5, history: int = 120):
+        self.interval = interval
+        self._samples: Deque[ResourceUsage] = deque(maxlen=history)
+        self._process = psutil.Process()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._start_lock = threading.Lock()
+        self._wall_anchor = time.time()
+        self._monotonic_anchor = time.monotonic()
+
+    @property
+    def running(self) -> bool:
+        """Whether the sampling thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the sampling thread (no-op if it is already running)."""
+        with self._start_lock:
+            if self.running:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="devloop-resource-sampler", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=self.interval + 1.0)
+        self._thread = None
+
+    def latest(self) -> ResourceUsage:
+        """Return the most recent sample, starting the sampler if needed."""
+        if not self.running:
+            self.start()
+        try:
+            return self._samples[-1]
+        except IndexError:
+            # Nothing sampled yet; take one now (non-blocking)
+            return self.sample()
+
+    def samples(self) -> List[ResourceUsage]:
+        """Return the buffered samples, oldest first."""
+        return list(self._samples)
+
+    def sample(self) -> ResourceUsage:
+        """Take one sample and append it to the ring buffer."""
+        now = self._wall_anchor + (time.monotonic() - self._monotonic_anchor)
+        cpu_times = self._process.cpu_times()
+        cpu_time = cpu_times.user + cpu_times.system
+        memory_info = self._process.memory_info()
+
+        cpu_percent = 0.0
+        try:
+            previous = self._samples[-1]
+            elapsed = now - previous.timestamp
+            if elapsed > 0:
+                cpu_percent = (cpu_time - previous.cpu_time) / elapsed * 100
+        except IndexError:
+            pass
 
         # Get system-wide I/O counters (since process I/O counters might not be available)
         try:
@@ -56,16 +160,49 @@ class ResourceUsage:
             network_bytes_sent = 0
             network_bytes_recv = 0
 
-        return cls(
-            timestamp=time.time(),
+        usage = ResourceUsage(
+            timestamp=now,
             cpu_percent=cpu_percent,
             memory_mb=memory_info.rss / (1024 * 1024),  # Convert to MB
-            memory_percent=process.memory_percent(),
+            memory_percent=self._process.memory_percent(),
             disk_read_mb=disk_read_mb,
             disk_write_mb=disk_write_mb,
             network_bytes_sent=network_bytes_sent,
             network_bytes_recv=network_bytes_recv,
+            cpu_time=cpu_time,
+            # Non-blocking: relative to the previous call on this thread
+            system_cpu_percent=psutil.cpu_percent(interval=None),
         )
+        self._samples.append(usage)
+        return usage
+
+    def _run(self) -> None:
+        """Sampling loop."""
+        while not self._stop.is_set():
+            try:
+                self.sample()
+            except (psutil.Error, OSError) as e:
+                logger.debug(f"Resource sampling failed: {e}")
+            self._stop.wait(self.interval)
+
+
+_resource_sampler: Optional[ResourceSampler] = None
+_resource_sampler_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _total_memory_bytes() -> int:
+    """Total physical memory (constant for the life of the process)."""
+    return int(psutil.virtual_memory().total)
+
+
+def get_resource_sampler() -> ResourceSampler:
+    """Get the shared resource sampler for this process."""
+    global _resource_sampler
+    with _resource_sampler_lock:
+        if _resource_sampler is None:
+            _resource_sampler = ResourceSampler()
+        return _resource_sampler
 
 
 @dataclass
@@ -91,25 +228,189 @@ class PerformanceMetrics:
         self.success = success
         self.error_message = error_message
 
-        if self.resource_usage_start and self.resource_usage_end:
-            self.cpu_used = (
-                self.resource_usage_end.cpu_percent
-                - self.resource_usage_start.cpu_percent
-            )
-            self.memory_used_mb = (
-                self.resource_usage_end.memory_mb - self.resource_usage_start.memory_mb
-            )
+        start, end = self.resource_usage_start, self.resource_usage_end
+        if start and end:
+            # Average CPU between the samples bracketing the operation; when
+            # both reads hit the same sample use its rolling CPU percentage
+            elapsed = end.timestamp - start.timestamp
+            if elapsed > 0:
+                self.cpu_used = (end.cpu_time - start.cpu_time) / elapsed * 100
+            else:
+                self.cpu_used = end.cpu_percent
+            self.memory_used_mb = end.memory_mb - start.memory_mb
+
+
+@dataclass
+class MetricsRollup:
+    """Aggregated metrics for one operation over one minute (or a window).
+
+    Durations are kept in a log-bucketed histogram (each bucket spans a
+    factor of ``_SKETCH_GAMMA``), so rollups merge by adding counts and
+    percentiles stay within a few percent of the exact value.
+    """
+
+    count: int = 0
+    success_count: int = 0
+    duration_count: int = 0
+    duration_sum: float = 0.0
+    duration_min: Optional[float] = None
+    duration_max: Optional[float] = None
+    cpu_count: int = 0
+    cpu_sum: float = 0.0
+    memory_count: int = 0
+    memory_sum: float = 0.0
+    duration_buckets: Dict[int, int] = field(default_factory=dict)
+
+    def add(self, metrics: PerformanceMetrics) -> None:
+        """Add one completed operation."""
+        self.count += 1
+        if metrics.success:
+            self.success_count += 1
+        if metrics.duration is not None:
+            self._add_duration(metrics.duration)
+        if metrics.cpu_used is not None:
+            self.cpu_count += 1
+            self.cpu_sum += metrics.cpu_used
+        if metrics.memory_used_mb is not None:
+            self.memory_count += 1
+            self.memory_sum += metrics.memory_used_mb
+
+    def _add_duration(self, duration: float) -> None:
+        self.duration_count += 1
+        self.duration_sum += duration
+        self.duration_min = (
+            duration if self.duration_min is None else min(self.duration_min, duration)
+        )
+        self.duration_max = (
+            duration if self.duration_max is None else max(self.duration_max, duration)
+        )
+        bucket = math.ceil(
+            math.log(max(duration, _SKETCH_MIN_VALUE)) / _SKETCH_LOG_GAMMA
+        )
+        self.duration_buckets[bucket] = self.duration_buckets.get(bucket, 0) + 1
+
+    def merge(self, other: MetricsRollup) -> None:
+        """Merge another rollup into this one."""
+        self.count += other.count
+        self.success_count += other.success_count
+        self.duration_count += other.duration_count
+        self.duration_sum += other.duration_sum
+        for value in (other.duration_min, other.duration_max):
+            if value is not None:
+                self.duration_min = (
+                    value
+                    if self.duration_min is None
+                    else min(self.duration_min, value)
+                )
+                self.duration_max = (
+                    value
+                    if self.duration_max is None
+                    else max(self.duration_max, value)
+                )
+        self.cpu_count += other.cpu_count
+        self.cpu_sum += other.cpu_sum
+        self.memory_count += other.memory_count
+        self.memory_sum += other.memory_sum
+        for bucket, count in other.duration_buckets.items():
+            self.duration_buckets[bucket] = self.duration_buckets.get(bucket, 0) + count
+
+    def duration_percentile(self, quantile: float) -> float:
+        """Estimate a duration percentile (quantile between 0 and 1)."""
+        total = sum(self.duration_buckets.values())
+        if total == 0:
+            return 0.0
+
+        rank = quantile * (total - 1)
+        seen = 0
+        for bucket in sorted(self.duration_buckets):
+            seen += self.duration_buckets[bucket]
+            if seen > rank:
+                # Midpoint of the bucket, clamped to the observed range
+                estimate = 2 * _SKETCH_GAMMA**bucket / (_SKETCH_GAMMA + 1)
+                low = self.duration_min if self.duration_min is not None else estimate
+                high = self.duration_max if self.duration_max is not None else estimate
+                return min(max(estimate, low), high)
+        return self.duration_max or 0.0
+
+    def to_row(self) -> Tuple[Any, ...]:
+        """Serialize the aggregate columns of a ``rollups`` row."""
+        return (
+            self.count,
+            self.success_count,
+            self.duration_count,
+            self.duration_sum,
+            self.duration_min,
+            self.duration_max,
+            self.cpu_count,
+            self.cpu_sum,
+            self.memory_count,
+            self.memory_sum,
+            json.dumps(self.duration_buckets),
+        )
+
+    @classmethod
+    def from_row(cls, row: Iterable[Any]) -> MetricsRollup:
+        """Rebuild a rollup from the aggregate columns of a ``rollups`` row."""
+        (
+            count,
+            success_count,
+            duration_count,
+            duration_sum,
+            duration_min,
+            duration_max,
+            cpu_count,
+            cpu_sum,
+            memory_count,
+            memory_sum,
+            sketch,
+        ) = row
+        return cls(
+            count=count,
+            success_count=success_count,
+            duration_count=duration_count,
+            duration_sum=duration_sum,
+            duration_min=duration_min,
+            duration_max=duration_max,
+            cpu_count=cpu_count,
+            cpu_sum=cpu_sum,
+            memory_count=memory_count,
+            memory_sum=memory_sum,
+            duration_buckets={int(k): v for k, v in json.loads(sketch).items()},
+        )
+
+
+_ROLLUP_COLUMNS = (
+    "count, success_count, duration_count, duration_sum, duration_min, "
+    "duration_max, cpu_count, cpu_sum, memory_count, memory_sum, duration_sketch"
+)
 
 
 class PerformanceMonitor:
-    """Monitor performance and resource usage."""
+    """Monitor performance and resource usage.
+
+    Completed operations are folded into per-operation, per-minute rollups in
+    ``metrics.db``, so summaries and trends for any window are computed from
+    at most one row per operation and minute instead of every recorded
+    operation. A ``metrics.jsonl`` file written by older versions is imported
+    once and renamed to ``metrics.jsonl.migrated``.
+    """
 
     def __init__(self, storage_path: Path, retention_days: int = 30):
         self.storage_path = storage_path
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.db_path = storage_path / "metrics.db"
         self.metrics_file = storage_path / "metrics.jsonl"
         self.retention_days = retention_days
         self._last_cleanup_time = time.time()
+        self._lock = asyncio.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Get the database connection, raising an exception if not opened."""
+        if self._connection is None:
+            raise RuntimeError("Metrics database not opened")
+        return self._connection
 
     @asynccontextmanager
     async def monitor_operation(
@@ -146,7 +447,7 @@ class PerformanceMonitor:
         usage = ResourceUsage.snapshot()
 
         # Get system-wide metrics
-        system_cpu = psutil.cpu_percent(interval=0.1)
+        system_cpu = usage.system_cpu_percent
         system_memory = psutil.virtual_memory()
         system_disk = psutil.disk_usage("/")
 
@@ -172,15 +473,11 @@ class PerformanceMonitor:
         self, operation_name: Optional[str] = None, hours: int = 24
     ) -> Dict[str, Any]:
         """Get performance summary for operations."""
-        cutoff_time = time.time() - (hours * 3600)
+        cutoff_minute = int((time.time() - hours * 3600) // 60)
 
-        operations = await self._load_recent_metrics(cutoff_time)
-        if operation_name:
-            operations = [
-                op for op in operations if op.operation_name == operation_name
-            ]
+        rollup = await self._run_db(self._summarize_sync, cutoff_minute, operation_name)
 
-        if not operations:
+        if rollup.count == 0:
             return {
                 "operation_name": operation_name or "all",
                 "time_range_hours": hours,
@@ -189,120 +486,186 @@ class PerformanceMonitor:
                 "average_duration": 0.0,
                 "average_cpu_usage": 0.0,
                 "average_memory_usage_mb": 0.0,
+                "p50_duration": 0.0,
+                "p95_duration": 0.0,
             }
 
-        successful_ops = [op for op in operations if op.success]
-        success_rate = len(successful_ops) / len(operations) * 100
-
-        durations = [op.duration for op in operations if op.duration is not None]
-        avg_duration = sum(durations) / len(durations) if durations else 0.0
-
-        cpu_usages = [op.cpu_used for op in operations if op.cpu_used is not None]
-        avg_cpu = sum(cpu_usages) / len(cpu_usages) if cpu_usages else 0.0
-
-        memory_usages = [
-            op.memory_used_mb for op in operations if op.memory_used_mb is not None
-        ]
-        avg_memory = sum(memory_usages) / len(memory_usages) if memory_usages else 0.0
+        success_rate = rollup.success_count / rollup.count * 100
+        avg_duration = (
+            rollup.duration_sum / rollup.duration_count
+            if rollup.duration_count
+            else 0.0
+        )
+        avg_cpu = rollup.cpu_sum / rollup.cpu_count if rollup.cpu_count else 0.0
+        avg_memory = (
+            rollup.memory_sum / rollup.memory_count if rollup.memory_count else 0.0
+        )
 
         return {
             "operation_name": operation_name or "all",
             "time_range_hours": hours,
-            "total_operations": len(operations),
+            "total_operations": rollup.count,
             "success_rate": round(success_rate, 1),
             "average_duration": round(avg_duration, 2),
             "average_cpu_usage": round(avg_cpu, 1),
             "average_memory_usage_mb": round(avg_memory, 2),
+            "p50_duration": round(rollup.duration_percentile(0.5), 2),
+            "p95_duration": round(rollup.duration_percentile(0.95), 2),
         }
 
     async def get_resource_trends(self, hours: int = 24) -> List[Dict[str, Any]]:
         """Get resource usage trends over time."""
-        cutoff_time = time.time() - (hours * 3600)
-        operations = await self._load_recent_metrics(cutoff_time)
-
-        # Group by hour
-        hourly_data: Dict[int, Dict[str, Any]] = {}
-        for op in operations:
-            if op.resource_usage_start:
-                hour = int(op.start_time // 3600)
-                if hour not in hourly_data:
-                    hourly_data[hour] = {
-                        "hour": hour,
-                        "timestamp": hour * 3600,
-                        "operations": 0,
-                        "avg_cpu": 0.0,
-                        "avg_memory_mb": 0.0,
-                        "cpu_samples": [],
-                        "memory_samples": [],
-                    }
-
-                hourly_data[hour]["operations"] += 1
-                if op.cpu_used is not None:
-                    hourly_data[hour]["cpu_samples"].append(op.cpu_used)
-                if op.memory_used_mb is not None:
-                    hourly_data[hour]["memory_samples"].append(op.memory_used_mb)
-
-        # Calculate averages
+        cutoff_minute = int((time.time() - hours * 3600) // 60)
+        rows = await self._run_db(self._hourly_trends_sync, cutoff_minute)
+
         trends = []
-        for hour_data in hourly_data.values():
-            if hour_data["cpu_samples"]:
-                hour_data["avg_cpu"] = sum(hour_data["cpu_samples"]) / len(
-                    hour_data["cpu_samples"]
-                )
-            if hour_data["memory_samples"]:
-                hour_data["avg_memory_mb"] = sum(hour_data["memory_samples"]) / len(
-                    hour_data["memory_samples"]
-                )
+        for hour, operations, cpu_count, cpu_sum, memory_count, memory_sum in rows:
+            trends.append(
+                {
+                    "hour": hour,
+                    "timestamp": hour * 3600,
+                    "operations": operations,
+                    "avg_cpu": cpu_sum / cpu_count if cpu_count else 0.0,
+                    "avg_memory_mb": memory_sum / memory_count if memory_count else 0.0,
+                }
+            )
+        return trends
+
+    async def _run_db(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Open the database if needed and run an operation in the thread pool."""
+        async with self._lock:
+            loop = asyncio.get_event_loop()
+            if self._connection is None:
+                await loop.run_in_executor(None, self._init_db)
+            return await loop.run_in_executor(None, func, *args)
+
+    def _init_db(self) -> None:
+        """Open the database, create the schema and import legacy metrics."""
+        self._connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS rollups (
+            operation_name TEXT NOT NULL,
+            minute INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            success_count INTEGER NOT NULL,
+            duration_count INTEGER NOT NULL,
+            duration_sum REAL NOT NULL,
+            duration_min REAL,
+            duration_max REAL,
+            cpu_count INTEGER NOT NULL,
+            cpu_sum REAL NOT NULL,
+            memory_count INTEGER NOT NULL,
+            memory_sum REAL NOT NULL,
+            duration_sketch TEXT NOT NULL,
+            PRIMARY KEY (operation_name, minute)
+            )
+        """)
+        self.connection.execute("""
+            CREATE INDEX IF NOT EXISTS idx_rollups_minute ON rollups(minute)
+        """)
+        self.connection.commit()
 
-            del hour_data["cpu_samples"]
-            del hour_data["memory_samples"]
-            trends.append(hour_data)
+        if self.metrics_file.exists():
+            self._migrate_jsonl()
 
-        return sorted(trends, key=lambda x: x["timestamp"])
+    def _migrate_jsonl(self) -> None:
+        """Fold a legacy ``metrics.jsonl`` into rollups, streaming it line by line."""
+        cutoff_time = time.time() - (self.retention_days * 24 * 3600)
+        rollups: Dict[Tuple[str, int], MetricsRollup] = {}
+        imported = 0
+
+        with open(self.metrics_file) as f:
+            for line in f:
+                try:
+                    data = json.loads(line)
+                    if data["start_time"] < cutoff_time:
+                        continue
+                    metrics = PerformanceMetrics(
+                        operation_name=data["operation_name"],
+                        start_time=data["start_time"],
+                        duration=data.get("duration"),
+                        cpu_used=data.get("cpu_used"),
+                        memory_used_mb=data.get("memory_used_mb"),
+                        success=data.get("success"),
+                    )
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
 
-    async def _store_metrics(self, metrics: PerformanceMetrics) -> None:
-        """Store performance metrics."""
-        metrics_dict = {
-            "operation_name": metrics.operation_name,
-            "start_time": metrics.start_time,
-            "end_time": metrics.end_time,
-            "duration": metrics.duration,
-            "success": metrics.success,
-            "error_message": metrics.error_message,
-            "metadata": metrics.metadata,
-        }
+                key = (metrics.operation_name, int(metrics.start_time // 60))
+                rollups.setdefault(key, MetricsRollup()).add(metrics)
+                imported += 1
 
-        if metrics.resource_usage_start:
-            metrics_dict["resource_usage_start"] = {
-                "timestamp": metrics.resource_usage_start.timestamp,
-                "cpu_percent": metrics.resource_usage_start.cpu_percent,
-                "memory_mb": metrics.resource_usage_start.memory_mb,
-                "memory_percent": metrics.resource_usage_start.memory_percent,
-                "disk_read_mb": metrics.resource_usage_start.disk_read_mb,
-                "disk_write_mb": metrics.resource_usage_start.disk_write_mb,
-                "network_bytes_sent": metrics.resource_usage_start.network_bytes_sent,
-                "network_bytes_recv": metrics.resource_usage_start.network_bytes_recv,
-            }
+        with self.connection:
+            for (operation_name, minute), rollup in rollups.items():
+                self._merge_rollup_sync(operation_name, minute, rollup)
 
-        if metrics.resource_usage_end:
-            metrics_dict["resource_usage_end"] = {
-                "timestamp": metrics.resource_usage_end.timestamp,
-                "cpu_percent": metrics.resource_usage_end.cpu_percent,
-                "memory_mb": metrics.resource_usage_end.memory_mb,
-                "memory_percent": metrics.resource_usage_end.memory_percent,
-                "disk_read_mb": metrics.resource_usage_end.disk_read_mb,
-                "disk_write_mb": metrics.resource_usage_end.disk_write_mb,
-                "network_bytes_sent": metrics.resource_usage_end.network_bytes_sent,
-                "network_bytes_recv": metrics.resource_usage_end.network_bytes_recv,
-            }
+        self.metrics_file.replace(
+            self.metrics_file.with_name(self.metrics_file.name + ".migrated")
+        )
+        logger.info(f"Imported {imported} operations from {self.metrics_file}")
+
+    def _merge_rollup_sync(
+        self, operation_name: str, minute: int, rollup: MetricsRollup
+    ) -> None:
+        """Merge a rollup into the stored row for its operation and minute."""
+        row = self.connection.execute(
+            f"SELECT {_ROLLUP_COLUMNS} FROM rollups "  # nosec B608
+            "WHERE operation_name = ? AND minute = ?",
+            (operation_name, minute),
+        ).fetchone()
+
+        if row is not None:
+            stored = MetricsRollup.from_row(row)
+            stored.merge(rollup)
+            rollup = stored
+
+        self.connection.execute(
+            f"INSERT OR REPLACE INTO rollups (operation_name, minute, {_ROLLUP_COLUMNS}) "  # nosec B608
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (operation_name, minute, *rollup.to_row()),
+        )
 
-        if metrics.cpu_used is not None:
-            metrics_dict["cpu_used"] = metrics.cpu_used
-        if metrics.memory_used_mb is not None:
-            metrics_dict["memory_used_mb"] = metrics.memory_used_mb
+    def _summarize_sync(
+        self, cutoff_minute: int, operation_name: Optional[str]
+    ) -> MetricsRollup:
+        """Merge all rollups since the cutoff into one."""
+        query = f"SELECT {_ROLLUP_COLUMNS} FROM rollups WHERE minute >= ?"  # nosec B608
+        params: List[Any] = [cutoff_minute]
+        if operation_name:
+            query += " AND operation_name = ?"
+            params.append(operation_name)
+
+        total = MetricsRollup()
+        for row in self.connection.execute(query, params):
+            total.merge(MetricsRollup.from_row(row))
+        return total
+
+    def _hourly_trends_sync(self, cutoff_minute: int) -> List[Tuple[Any, ...]]:
+        """Aggregate rollups since the cutoff per hour."""
+        cursor = self.connection.execute(
+            """
+            SELECT minute / 60 AS hour, SUM(count), SUM(cpu_count), SUM(cpu_sum),
+                   SUM(memory_count), SUM(memory_sum)
+            FROM rollups WHERE minute >= ?
+            GROUP BY hour ORDER BY hour
+            """,
+            (cutoff_minute,),
+        )
+        return cursor.fetchall()
+
+    async def _store_metrics(self, metrics: PerformanceMetrics) -> None:
+        """Fold an operation's metrics into its per-minute rollup."""
+        rollup = MetricsRollup()
+        rollup.add(metrics)
+        minute = int(metrics.start_time // 60)
+
+        def store() -> None:
+            with self.connection:
+                self._merge_rollup_sync(metrics.operation_name, minute, rollup)
 
-        async with aiofiles.open(self.metrics_file, "a") as f:
-            await f.write(json.dumps(metrics_dict) + "\n")
+        await self._run_db(store)
 
         # Cleanup old metrics periodically (every 5 minutes instead of after every write)
         now = time.time()
@@ -310,85 +673,251 @@ class PerformanceMonitor:
             await self._cleanup_old_metrics()
             self._last_cleanup_time = now
 
-    async def _load_recent_metrics(
-        self, cutoff_time: float
-    ) -> List[PerformanceMetrics]:
-        """Load metrics newer than cutoff time."""
-        metrics: List[PerformanceMetrics] = []
+    async def _cleanup_old_metrics(self) -> None:
+        """Remove rollups older than retention period."""
+        cutoff_minute = int((time.time() - self.retention_days * 24 * 3600) // 60)
 
-        if not self.metrics_file.exists():
-            return metrics
+        def cleanup() -> None:
+            with self.connection:
+                self.connection.execute(
+                    "DELETE FROM rollups WHERE minute < ?", (cutoff_minute,)
+                )
 
-        async with aiofiles.open(self.metrics_file, "r") as f:
-            lines = await f.readlines()
+        await self._run_db(cleanup)
 
-        for line in lines:
-            try:
-                data = json.loads(line.strip())
-                if data["start_time"] >= cutoff_time:
-                    start_usage = None
-                    end_usage = None
-
-                    if "resource_usage_start" in data:
-                        start_usage = ResourceUsage(**data["resource_usage_start"])
-
-                    if "resource_usage_end" in data:
-                        end_usage = ResourceUsage(**data["resource_usage_end"])
-
-                    metrics.append(
-                        PerformanceMetrics(
-                            operation_name=data["operation_name"],
-                            start_time=data["start_time"],
-                            end_time=data.get("end_time"),
-                            duration=data.get("duration"),
-                            resource_usage_start=start_usage,
-                            resource_usage_end=end_usage,
-                            cpu_used=data.get("cpu_used"),
-                            memory_used_mb=data.get("memory_used_mb"),
-                            success=data.get("success"),
-                            error_message=data.get("error_message"),
-                            metadata=data.get("metadata", {}),
-                        )
-                    )
-            except (json.JSONDecodeError, KeyError):
-                continue
 
-        return metrics
+@dataclass
+class _TrackedProcess:
+    """A tool subprocess attributed to an agent."""
 
-    async def _cleanup_old_metrics(self) -> None:
-        """Remove metrics older than retention period."""
-        cutoff_time = time.time() - (self.retention_days * 24 * 3600)
+    process: Optional[psutil.Process]
+    cgroup: Optional[CgroupsManager] = None
+    cpu_seconds: float = 0.0  # Last measured, including the process's children
 
-        if not self.metrics_file.exists():
-            return
 
-        # Read all metrics
-        async with aiofiles.open(self.metrics_file, "r") as f:
-            lines = await f.readlines()
+@dataclass
+class _TrackedCgroup:
+    """A sandbox cgroup holding some of an agent's processes."""
+
+    # CPU time already used when its first current process started; sandboxes
+    # keep their cgroup across commands
+    cpu_baseline_usec: int
+    pids: Set[int] = field(default_factory=set)
+    cpu_seconds: float = 0.0  # Last measured
+
+
+class AgentProcessRegistry:
+    """Record which agent spawned each tool subprocess.
+
+    Sandboxes report processes started on behalf of an agent (see
+    ``AgentSandboxHelper``), and :meth:`measure` sums CPU time and memory over
+    an agent's live processes. When the sandbox placed processes in a cgroup,
+    the cgroup's counters are read once for all of them, which also covers
+    processes they spawned.
+
+    An exited process stays charged to the agent with its final CPU time. For
+    a cgroup that is its usage once its last process has exited. A process
+    without a cgroup is charged its own CPU time as last measured, or as
+    measured when it is reported, if it can still be read then. Only the
+    process's own counters are used: the daemon's other children, which are
+    not tracked here, must not be charged to an agent.
+    """
+
+    def __init__(self) -> None:
+        self._processes: Dict[str, Dict[int, _TrackedProcess]] = {}
+        self._cgroups: Dict[str, Dict[CgroupsManager, _TrackedCgroup]] = {}
+        self._finished_cpu_seconds: Dict[str, float] = {}
+        self._cancelled: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(
+        self, agent_name: str, pid: int, cgroup: Optional[CgroupsManager] = None
+    ) -> None:
+        """Attribute a started process to an agent."""
+        try:
+            process: Optional[psutil.Process] = psutil.Process(pid)
+        except psutil.Error:
+            process = None
+        baseline = 0
+        if cgroup is not None:
+            usage = self._read_cgroup(cgroup)
+            if usage is not None:
+                baseline = usage.cpu_usage_usec
+        with self._lock:
+            self._processes.setdefault(agent_name, {})[pid] = _TrackedProcess(
+                process, cgroup
+            )
+            if cgroup is not None:
+                groups = self._cgroups.setdefault(agent_name, {})
+                groups.setdefault(cgroup, _TrackedCgroup(baseline)).pids.add(pid)
+
+    def remove(self, agent_name: str, pid: int) -> None:
+        """Forget an exited process, keeping its final CPU time charged."""
+        with self._lock:
+            tracked = self._processes.get(agent_name, {}).pop(pid, None)
+            if tracked is not None:
+                self._retire(agent_name, pid, tracked)
+
+    def record_cancelled(self, agent_name: str) -> None:
+        """Count a tool run stopped because a newer run superseded it."""
+        with self._lock:
+            self._cancelled[agent_name] = self._cancelled.get(agent_name, 0) + 1
+
+    def cancelled(self, agent_name: str) -> int:
+        """Number of an agent's tool runs stopped before they finished."""
+        with self._lock:
+            return self._cancelled.get(agent_name, 0)
+
+    def pids(self, agent_name: str) -> List[int]:
+        """Get the live processes attributed to an agent.
+
+        Processes that exited without being reported are dropped here.
+        """
+        with self._lock:
+            processes = self._processes.get(agent_name, {})
+            for pid, tracked in list(processes.items()):
+                if tracked.process is None or not tracked.process.is_running():
+                    del processes[pid]
+                    self._retire(agent_name, pid, tracked)
+            return list(processes)
+
+    def _retire(self, agent_name: str, pid: int, tracked: _TrackedProcess) -> None:
+        """Charge an exited process's final CPU time to its agent (lock held)."""
+        cpu_seconds = tracked.cpu_seconds
+        if tracked.cgroup is not None:
+            groups = self._cgroups.get(agent_name, {})
+            group = groups.get(tracked.cgroup)
+            if group is not None:
+                group.pids.discard(pid)
+                if not group.pids:
+                    del groups[tracked.cgroup]
+                    usage = self._read_cgroup(tracked.cgroup)
+                    if usage is not None:
+                        group.cpu_seconds = max(
+                            group.cpu_seconds, self._cgroup_cpu_seconds(group, usage)
+                        )
+                    cpu_seconds += group.cpu_seconds
+        else:
+            # Counters are still readable until the process has been reaped
+            final_cpu_seconds, _ = self._measure_process(tracked)
+            cpu_seconds = max(cpu_seconds, final_cpu_seconds)
+
+        self._finished_cpu_seconds[agent_name] = (
+            self._finished_cpu_seconds.get(agent_name, 0.0) + cpu_seconds
+        )
+
+    def measure(self, agent_name: str) -> Tuple[float, float]:
+        """Measure an agent's subprocesses.
+
+        Returns:
+            Tuple of (cumulative CPU seconds, current memory in MB)
+        """
+        with self._lock:
+            tracked = list(self._processes.get(agent_name, {}).values())
+            groups = list(self._cgroups.get(agent_name, {}).items())
+
+        memory_bytes = 0
+        unreadable: Set[CgroupsManager] = set()
+        for cgroup, group in groups:
+            usage = self._read_cgroup(cgroup)
+            if usage is None:
+                unreadable.add(cgroup)
+                continue
+            group.cpu_seconds = max(
+                group.cpu_seconds, self._cgroup_cpu_seconds(group, usage)
+            )
+            memory_bytes += int(usage.memory_peak_mb * 1024 * 1024)
 
-        # Filter recent metrics
-        recent_lines = []
-        for line in lines:
+        # Processes in a readable cgroup are already counted with it
+        for entry in tracked:
+            if entry.cgroup is not None and entry.cgroup not in unreadable:
+                continue
+            cpu_seconds, rss = self._measure_process(entry)
+            entry.cpu_seconds = max(entry.cpu_seconds, cpu_seconds)
+            memory_bytes += rss
+
+        with self._lock:
+            live = sum(
+                entry.cpu_seconds
+                for entry in self._processes.get(agent_name, {}).values()
+            ) + sum(
+                group.cpu_seconds
+                for group in self._cgroups.get(agent_name, {}).values()
+            )
+            finished = self._finished_cpu_seconds.get(agent_name, 0.0)
+        return finished + live, memory_bytes / (1024 * 1024)
+
+    @staticmethod
+    def _read_cgroup(cgroup: CgroupsManager) -> Optional[CgroupsResources]:
+        """Get a cgroup's usage, or None if its counters cannot be read."""
+        try:
+            usage = cgroup.get_resource_usage()
+        except RuntimeError:
+            return None
+        if usage.cpu_usage_usec or usage.memory_peak_mb:
+            return usage
+        return None
+
+    @staticmethod
+    def _cgroup_cpu_seconds(group: _TrackedCgroup, usage: CgroupsResources) -> float:
+        """CPU seconds a cgroup used since its first current process started."""
+        return max(usage.cpu_usage_usec - group.cpu_baseline_usec, 0) / 1_000_000
+
+    @staticmethod
+    def _measure_process(entry: _TrackedProcess) -> Tuple[float, int]:
+        """Get (CPU seconds, RSS bytes) for a process and its children."""
+        if entry.process is None:
+            return entry.cpu_seconds, 0
+
+        cpu_seconds = 0.0
+        rss = 0
+        try:
+            processes = [entry.process, *entry.process.children(recursive=True)]
+        except psutil.Error:
+            return entry.cpu_seconds, 0
+        for process in processes:
             try:
-                data = json.loads(line.strip())
-                if data["start_time"] >= cutoff_time:
-                    recent_lines.append(line)
-            except (json.JSONDecodeError, KeyError):
+                with process.oneshot():
+                    times = process.cpu_times()
+                    cpu_seconds += times.user + times.system
+                    rss += process.memory_info().rss
+            except psutil.Error:
                 continue
+        return cpu_seconds, rss
 
-        # Write back recent metrics
-        async with aiofiles.open(self.metrics_file, "w") as f:
-            await f.writelines(recent_lines)
+
+_agent_process_registry: Optional[AgentProcessRegistry] = None
+
+
+def get_agent_process_registry() -> AgentProcessRegistry:
+    """Get the shared agent process registry for this process."""
+    global _agent_process_registry
+    with _resource_sampler_lock:
+        if _agent_process_registry is None:
+            _agent_process_registry = AgentProcessRegistry()
+        return _agent_process_registry
 
 
 class AgentResourceTracker:
-    """Track per-agent resource usage for enforcement."""
+    """Track per-agent resource usage for enforcement.
 
-    def __init__(self, cache_ttl_seconds: float = 1.0):
+    Usage is attributed from the tool subprocesses each agent spawned (see
+    :class:`AgentProcessRegistry`). Work an agent does inside the daemon
+    process itself cannot be separated from other agents and is not counted.
+    """
+
+    def __init__(
+        self,
+        cache_ttl_seconds: float = 1.0,
+        process_registry: Optional[AgentProcessRegistry] = None,
+    ):
         """Initialize the tracker with a cache TTL."""
         self.cache_ttl_seconds = cache_ttl_seconds
+        self.process_registry = process_registry or get_agent_process_registry()
         self._usage_cache: Dict[str, tuple[ResourceUsage, float]] = {}
         self._active_agents: Dict[str, float] = {}  # agent_name -> start_time
+        # agent_name -> (cumulative CPU seconds, monotonic time) at last measurement
+        self._cpu_marks: Dict[str, Tuple[float, float]] = {}
 
     def mark_agent_active(self, agent_name: str) -> None:
         """Mark an agent as currently active."""
@@ -403,19 +932,21 @@ class AgentResourceTracker:
     ) -> Optional[ResourceUsage]:
         """Get current resource usage for an agent.
 
-        This returns a snapshot of the process's resource usage when the agent is active.
-        Since agents run as asyncio tasks in the same process, we can't directly measure
-        per-agent usage, but we sample when the agent is known to be active.
+        Memory is the combined RSS of the agent's running subprocesses; CPU is
+        the agent's subprocess CPU time since the previous measurement, as a
+        percentage of one core.
 
         Args:
             agent_name: Name of the agent
-            force_refresh: Force a new snapshot instead of using cache
+            force_refresh: Force a new measurement instead of using cache
 
         Returns:
-            ResourceUsage snapshot if agent is active, None otherwise
+            ResourceUsage if the agent is active or has running subprocesses,
+            None otherwise
         """
-        # Check if agent is currently active
-        if agent_name not in self._active_agents:
+        if agent_name not in self._active_agents and not self.process_registry.pids(
+            agent_name
+        ):
             return None
 
         # Check cache
@@ -425,11 +956,38 @@ class AgentResourceTracker:
             if now - cached_time < self.cache_ttl_seconds:
                 return cached_usage
 
-        # Take a new snapshot
-        usage = ResourceUsage.snapshot()
+        cpu_seconds, memory_mb = self.process_registry.measure(agent_name)
+        mark = time.monotonic()
+        cpu_percent = 0.0
+        previous = self._cpu_marks.get(agent_name)
+        if previous is not None and mark > previous[1]:
+            cpu_percent = (cpu_seconds - previous[0]) / (mark - previous[1]) * 100
+        self._cpu_marks[agent_name] = (cpu_seconds, mark)
+
+        usage = ResourceUsage(
+            timestamp=now,
+            cpu_percent=cpu_percent,
+            memory_mb=memory_mb,
+            memory_percent=memory_mb * 1024 * 1024 / _total_memory_bytes() * 100,
+            cpu_time=cpu_seconds,
+        )
         self._usage_cache[agent_name] = (usage, now)
         return usage
 
+    def report(self, agent_names: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Summarize current usage per agent for ``devloop status``."""
+        report: Dict[str, Dict[str, Any]] = {}
+        for agent_name in agent_names:
+            usage = self.get_agent_usage(agent_name)
+            report[agent_name] = {
+                "active": agent_name in self._active_agents,
+                "processes": len(self.process_registry.pids(agent_name)),
+                "cpu_percent": round(usage.cpu_percent, 1) if usage else 0.0,
+                "memory_mb": round(usage.memory_mb, 1) if usage else 0.0,
+                "cpu_seconds": round(usage.cpu_time, 2) if usage else None,
+            }
+        return report
+
     def is_exceeding_limits(
         self,
         agent_name: str,
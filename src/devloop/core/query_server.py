@@ -0,0 +1,242 @@
+"""Local query endpoint for the watch daemon.
+
+Hooks run once per tool call, so re-reading and re-resolving the tier JSON
+files on every edit adds noticeable latency on large projects. While the
+daemon is running it answers findings-by-file, count and status queries from
+the in-memory :class:`ContextStore` over a Unix domain socket at
+``.devloop/query.sock``. It also reports the tool versions behind its result
+cache keys, so ``devloop precommit`` can reuse cached results without
+probing each tool first.
+
+The protocol is one JSON object per line in each direction::
+
+    {"query": "findings", "file": "src/app.py"}
+    {"ok": true, "findings": [...]}
+
+Clients that cannot connect should fall back to reading the snapshot files
+in ``.devloop/context``.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from devloop.core.context_store import ContextStore, Finding, Tier
+from devloop.core.result_cache import known_tool_versions
+
+logger = logging.getLogger(__name__)
+
+QUERY_SOCKET_FILE = "query.sock"
+
+# Longest socket path accepted by AF_UNIX on Linux and macOS
+_MAX_SOCKET_PATH = 104
+
+# Tiers shown to hooks for an edited file
+_FILE_TIERS = (Tier.IMMEDIATE, Tier.RELEVANT)
+
+_SEVERITY_ORDER = {"error": 0, "warning": 1, "info": 2, "style": 3}
+
+
+def get_query_socket_path(project_dir: Path) -> Path:
+    """Get the query socket path for a project."""
+    return project_dir / ".devloop" / QUERY_SOCKET_FILE
+
+
+def _finding_payload(finding: Finding) -> Dict[str, Any]:
+    """Fields of a finding sent to hooks."""
+    return {
+        "id": finding.id,
+        "agent": finding.agent,
+        "file": finding.file,
+        "line": finding.line,
+        "column": finding.column,
+        "severity": finding.severity.value,
+        "category": finding.category,
+        "message": finding.message,
+        "suggestion": finding.suggestion,
+    }
+
+
+class QueryServer:
+    """Serves context queries over a Unix domain socket."""
+
+    def __init__(self, project_dir: Path, context_store: ContextStore):
+        """Initialize query server.
+
+        Args:
+            project_dir: Project directory where .devloop is located
+            context_store: Store the queries are answered from
+        """
+        self.project_dir = project_dir
+        self.socket_path = get_query_socket_path(project_dir)
+        self.context_store = context_store
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._start_time: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the server is accepting connections."""
+        return self._server is not None
+
+    async def start(self) -> bool:
+        """Start listening on the query socket.
+
+        Returns:
+            True if the server started; False if Unix sockets are unavailable,
+            the socket path is too long, or another daemon owns the socket.
+        """
+        if self._server is not None:
+            logger.warning("Query server already running")
+            return True
+
+        if not hasattr(socket, "AF_UNIX"):
+            logger.info("Unix sockets not supported; query server disabled")
+            return False
+
+        if len(os.fsencode(self.socket_path)) >= _MAX_SOCKET_PATH:
+            logger.warning(
+                f"Query socket path too long, hooks will read files: {self.socket_path}"
+            )
+            return False
+
+        if self.socket_path.exists():
+            if query_daemon(self.project_dir, "status") is not None:
+                logger.warning(f"Query socket already in use: {self.socket_path}")
+                return False
+            # Left behind by a daemon that did not shut down cleanly
+            self.socket_path.unlink()
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, path=str(self.socket_path)
+        )
+        self.socket_path.chmod(0o600)
+        self._start_time = time.time()
+        logger.info(f"Started query server at {self.socket_path}")
+        return True
+
+    async def stop(self) -> None:
+        """Stop the server and remove the socket file."""
+        if self._server is None:
+            return
+
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+        self.socket_path.unlink(missing_ok=True)
+        logger.info("Stopped query server")
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer each request line until the client disconnects."""
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("request must be a JSON object")
+                    response = await self.handle_request(request)
+                except ValueError as e:
+                    response = {"ok": False, "error": f"Invalid request: {e}"}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError) as e:
+            logger.debug(f"Query connection closed: {e}")
+        finally:
+            writer.close()
+
+    async def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer a single query.
+
+        Args:
+            request: Query with a ``query`` key of ``findings`` (plus
+                ``file``), ``counts``, ``status`` or ``tool_versions``
+
+        Returns:
+            Response dict with ``ok`` set
+        """
+        query = request.get("query")
+        try:
+            if query == "findings":
+                file_path = request.get("file")
+                if not isinstance(file_path, str) or not file_path:
+                    return {"ok": False, "error": "findings query requires 'file'"}
+                return {"ok": True, "findings": await self._findings(file_path)}
+            if query == "counts":
+                return {"ok": True, "counts": await self._counts()}
+            if query == "status":
+                return {"ok": True, **await self._status()}
+            if query == "tool_versions":
+                return {"ok": True, "tool_versions": known_tool_versions()}
+        except Exception as e:
+            logger.error(f"Query {query!r} failed: {e}")
+            return {"ok": False, "error": str(e)}
+
+        return {"ok": False, "error": f"Unknown query: {query!r}"}
+
+    async def _findings(self, file_path: str) -> List[Dict[str, Any]]:
+        """Findings for a file, most severe first."""
+        findings = await self.context_store.get_findings_for_path(
+            file_path, _FILE_TIERS
+        )
+        payload = [_finding_payload(f) for f in findings]
+        return sorted(
+            payload,
+            key=lambda f: (_SEVERITY_ORDER.get(f["severity"], 2), f["line"] or 9999),
+        )
+
+    async def _counts(self) -> Dict[str, int]:
+        """Number of findings in each tier."""
+        return {
+            tier.value: len(await self.context_store.get_findings(tier=tier))
+            for tier in Tier
+        }
+
+    async def _status(self) -> Dict[str, Any]:
+        """Daemon process and findings summary."""
+        uptime = time.time() - self._start_time if self._start_time else 0.0
+        return {
+            "pid": os.getpid(),
+            "uptime_seconds": uptime,
+            "counts": await self._counts(),
+        }
+
+
+def query_daemon(
+    project_dir: Path, query: str, timeout: float = 0.5, **params: Any
+) -> Optional[Dict[str, Any]]:
+    """Send a query to a running daemon.
+
+    Args:
+        project_dir: Project directory where .devloop is located
+        query: Query name (``findings``, ``counts``, ``status`` or
+            ``tool_versions``)
+        timeout: Seconds to wait for connect and reply
+        **params: Extra request fields, e.g. ``file`` for ``findings``
+
+    Returns:
+        The response dict, or None if no daemon answered
+    """
+    socket_path = get_query_socket_path(project_dir)
+    if not hasattr(socket, "AF_UNIX") or not socket_path.exists():
+        return None
+
+    request = json.dumps({"query": query, **params}).encode() + b"\n"
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(str(socket_path))
+            client.sendall(request)
+            with client.makefile("rb") as stream:
+                line = stream.readline()
+        response = json.loads(line)
+    except (OSError, ValueError):
+        return None
+
+    return response if isinstance(response, dict) else None
@@ -0,0 +1,352 @@
+"""Persistent cache of per-file tool results keyed by file content."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheLookup:
+    """Outcome of looking up a set of files in the result cache.
+
+    Attributes:
+        hits: Cached result per file
+        misses: Files the tool still has to run on
+        keys: Cache key per file, computed from the content read at lookup time
+    """
+
+    hits: Dict[Path, Any] = field(default_factory=dict)
+    misses: List[Path] = field(default_factory=list)
+    keys: Dict[Path, str] = field(default_factory=dict)
+
+
+class ResultCache:
+    """SQLite-backed cache of tool results for individual files.
+
+    Entries are keyed on (agent, tool version, config hash, file path, file
+    content hash), so touching a file or switching branches back and forth
+    does not re-run a tool on bytes it has already seen. The path is part of
+    the key because tool output (and per-file ignores) refer to it.
+
+    Only tools whose output for a file depends on nothing but that file and
+    the tool configuration should be cached; cross-module checkers such as
+    mypy are not.
+
+    The cache holds at most ``max_entries`` results and evicts the least
+    recently used ones. Hit and miss counts are persisted so ``devloop
+    status`` can report them from outside the daemon.
+    """
+
+    def __init__(self, db_path: Path, max_entries: int = 50_000):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._lock = asyncio.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Get the database connection, raising an exception if not initialized."""
+        if self._connection is None:
+            raise RuntimeError("Result cache not initialized. Call initialize() first.")
+        return self._connection
+
+    async def initialize(self) -> None:
+        """Open (and create if needed) the cache database."""
+        async with self._lock:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, self._init_db)
+
+    def _init_db(self) -> None:
+        """Initialize database schema (runs in thread pool)."""
+        self._connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+            key TEXT PRIMARY KEY,
+            agent TEXT NOT NULL,
+            value TEXT NOT NULL,
+            last_used REAL NOT NULL
+            )
+        """)
+        self.connection.execute("""
+            CREATE INDEX IF NOT EXISTS idx_results_last_used ON results(last_used)
+        """)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS stats (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self.connection.commit()
+        logger.info(f"Result cache initialized at {self.db_path}")
+
+    async def lookup(
+        self, agent: str, tool_version: str, config_hash: str, paths: List[Path]
+    ) -> CacheLookup:
+        """Split files into cached results and files that need a tool run.
+
+        Files that cannot be read are always misses (the tool reports them).
+        If the cache is not initialized every file is a miss.
+        """
+        if not self._connection:
+            return CacheLookup(misses=list(paths))
+
+        loop = asyncio.get_event_loop()
+        keys = await loop.run_in_executor(
+            None, _compute_keys, agent, tool_version, config_hash, paths
+        )
+
+        async with self._lock:
+            if not self._connection:
+                return CacheLookup(misses=list(paths))
+            found = await loop.run_in_executor(
+                None, self._lookup_sync, list(keys.values()), len(paths)
+            )
+
+        lookup = CacheLookup(keys=keys)
+        for path in paths:
+            key = keys.get(path)
+            if key is not None and key in found:
+                lookup.hits[path] = found[key]
+            else:
+                lookup.misses.append(path)
+        return lookup
+
+    def _lookup_sync(self, keys: List[str], requested: int) -> Dict[str, Any]:
+        """Fetch cached values, refresh their LRU stamp and count hits/misses."""
+        found: Dict[str, Any] = {}
+        with self.connection:
+            for chunk in _chunks(keys, 500):
+                placeholders = ",".join("?" * len(chunk))
+                query = f"SELECT key, value FROM results WHERE key IN ({placeholders})"  # nosec B608
+                cursor = self.connection.execute(query, chunk)
+                for key, value in cursor.fetchall():
+                    found[key] = json.loads(value)
+
+            now = time.time()
+            self.connection.executemany(
+                "UPDATE results SET last_used = ? WHERE key = ?",
+                [(now, key) for key in found],
+            )
+            self._bump_stats({"hits": len(found), "misses": requested - len(found)})
+        return found
+
+    async def store(
+        self, agent: str, lookup: CacheLookup, results: Dict[Path, Any]
+    ) -> None:
+        """Cache tool results for files from an earlier :meth:`lookup`.
+
+        Args:
+            agent: Agent that produced the results
+            lookup: The lookup the tool run was based on
+            results: JSON-serializable result per file; files without a key
+                (unreadable at lookup time) are skipped
+        """
+        rows = [
+            (lookup.keys[path], agent, json.dumps(value))
+            for path, value in results.items()
+            if path in lookup.keys
+        ]
+        if not rows or not self._connection:
+            return
+
+        async with self._lock:
+            if not self._connection:
+                return
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, self._store_sync, rows)
+
+    def _store_sync(self, rows: List[Tuple[str, str, str]]) -> None:
+        """Insert results and evict least recently used entries over the limit."""
+        now = time.time()
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO results (key, agent, value, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                [(key, agent, value, now) for key, agent, value in rows],
+            )
+
+            cursor = self.connection.execute("SELECT COUNT(*) FROM results")
+            count = cursor.fetchone()[0]
+            excess = count - self.max_entries
+            if excess > 0:
+                self.connection.execute(
+                    "DELETE FROM results WHERE key IN "
+                    "(SELECT key FROM results ORDER BY last_used ASC LIMIT ?)",
+                    (excess,),
+                )
+                self._bump_stats({"evictions": excess})
+
+    def _bump_stats(self, deltas: Dict[str, int]) -> None:
+        """Add to persisted counters (caller holds a transaction)."""
+        self.connection.executemany(
+            "INSERT INTO stats (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            [(name, delta) for name, delta in deltas.items() if delta],
+        )
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get entry count, hit/miss/eviction counters and hit rate."""
+        async with self._lock:
+            if not self._connection:
+                return {}
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(None, self._get_stats_sync)
+
+    def _get_stats_sync(self) -> Dict[str, Any]:
+        """Get cache statistics synchronously."""
+        counters = dict(
+            self.connection.execute("SELECT name, value FROM stats").fetchall()
+        )
+        entries = self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        hits = counters.get("hits", 0)
+        misses = counters.get("misses", 0)
+        lookups = hits + misses
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "misses": misses,
+            "evictions": counters.get("evictions", 0),
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+
+    async def clear(self) -> None:
+        """Remove all cached results and reset the counters."""
+        async with self._lock:
+            if not self._connection:
+                return
+            with self.connection:
+                self.connection.execute("DELETE FROM results")
+                self.connection.execute("DELETE FROM stats")
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        async with self._lock:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
+
+
+def config_hash(*parts: Any, config_files: Iterable[Path] = ()) -> str:
+    """Hash tool options together with the contents of tool config files.
+
+    Args:
+        parts: JSON-serializable options that change tool output
+        config_files: Config files the tool reads; missing files are skipped
+
+    Returns:
+        Hex digest identifying this configuration
+    """
+    hasher = hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode())
+    for config_file in config_files:
+        try:
+            data = config_file.read_bytes()
+        except OSError:
+            continue
+        hasher.update(str(config_file).encode())
+        hasher.update(data)
+    return hasher.hexdigest()
+
+
+def find_config_files(start: Path, names: Sequence[str]) -> List[Path]:
+    """Find tool config files in ``start`` and each of its parents."""
+    found = []
+    for directory in [start.resolve(), *start.resolve().parents]:
+        for name in names:
+            candidate = directory / name
+            if candidate.is_file():
+                found.append(candidate)
+    return found
+
+
+_tool_versions: Dict[Tuple[str, ...], str] = {}
+
+
+async def tool_version(cmd: Sequence[str], env: Optional[Dict[str, str]] = None) -> str:
+    """Get (and memoize) the version string printed by ``cmd``.
+
+    Args:
+        cmd: Version command, e.g. ``["ruff", "--version"]``
+        env: Environment for the probe (e.g. with a venv on PATH)
+
+    Returns:
+        The command's output, or "" if it could not be run (callers should
+        then skip caching)
+    """
+    key = tuple(cmd)
+    if key in _tool_versions:
+        return _tool_versions[key]
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+        )
+        stdout, stderr = await proc.communicate()
+    except OSError:
+        return ""
+
+    if proc.returncode != 0:
+        return ""
+
+    version = (stdout or stderr).decode(errors="replace").strip()
+    _tool_versions[key] = version
+    return version
+
+
+def known_tool_versions() -> List[Tuple[List[str], str]]:
+    """Get the (command, version) pairs memoized by :func:`tool_version`."""
+    return [(list(cmd), version) for cmd, version in _tool_versions.items()]
+
+
+def remember_tool_versions(versions: Iterable[Tuple[Sequence[str], str]]) -> None:
+    """Seed the :func:`tool_version` memo, e.g. with versions from the daemon.
+
+    Processes that share the daemon's cache then build the same keys
+    without starting every tool just to ask for its version.
+    """
+    for cmd, version in versions:
+        if version:
+            _tool_versions.setdefault(tuple(cmd), version)
+
+
+def _compute_keys(
+    agent: str, tool_version: str, config_hash: str, paths: List[Path]
+) -> Dict[Path, str]:
+    """Hash the content of each readable file into its cache key."""
+    prefix = f"{agent}\0{tool_version}\0{config_hash}\0"
+    keys = {}
+    for path in paths:
+        try:
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError:
+            continue
+        keys[path] = hashlib.sha256(
+            f"{prefix}{path.resolve()}\0{digest}".encode()
+        ).hexdigest()
+    return keys
+
+
+def _chunks(items: List[str], size: int) -> Iterable[List[str]]:
+    """Split a list into chunks (SQLite limits bound parameters per query)."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+# Global instance
+result_cache = ResultCache(Path(".devloop/result_cache.db"))
@@ -0,0 +1,247 @@
+"""Per-test history of outcomes, durations and the sources each test covers."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TestRecord:
+    """What is known about one test from earlier runs.
+
+    Attributes:
+        test: pytest node ID, e.g. ``tests/test_app.py::test_value``
+        file: Test file part of the node ID
+        outcome: ``passed``, ``failed`` or ``skipped`` in the last run
+        duration: Seconds the last run took, including setup and teardown
+        last_run: When the test last ran (epoch seconds)
+        sources: Changed source files the test was run for, most recent first
+    """
+
+    __test__ = False  # Not a pytest test class
+
+    test: str
+    file: str
+    outcome: str
+    duration: float
+    last_run: float
+    sources: List[str] = field(default_factory=list)
+
+
+class TestHistory:
+    """SQLite-backed record of every test's last outcome and duration.
+
+    The test runner uses it to order runs so that tests which failed last
+    time, then tests known to cover the changed file, then the fastest
+    tests, report first.
+    """
+
+    __test__ = False  # Not a pytest test class
+
+    def __init__(self, db_path: Path, max_sources: int = 20):
+        self.db_path = db_path
+        self.max_sources = max_sources
+        self._lock = asyncio.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Get the database connection, raising an exception if not initialized."""
+        if self._connection is None:
+            raise RuntimeError("Test history not initialized. Call initialize() first.")
+        return self._connection
+
+    async def initialize(self) -> None:
+        """Open (and create if needed) the history database."""
+        async with self._lock:
+            if self._connection:
+                return
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, self._init_db)
+
+    def _init_db(self) -> None:
+        """Initialize database schema (runs in thread pool)."""
+        self._connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS tests (
+            test TEXT PRIMARY KEY,
+            file TEXT NOT NULL,
+            outcome TEXT NOT NULL,
+            duration REAL NOT NULL,
+            last_run REAL NOT NULL,
+            sources TEXT NOT NULL DEFAULT '[]'
+            )
+        """)
+        self.connection.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tests_file ON tests(file)
+        """)
+        self.connection.commit()
+        logger.info(f"Test history initialized at {self.db_path}")
+
+    async def get_for_files(self, files: Sequence[str]) -> Dict[str, TestRecord]:
+        """Get the records of every known test in the given test files.
+
+        Args:
+            files: Test file paths as they appear in node IDs
+
+        Returns:
+            Record per node ID; empty if the history is not initialized
+        """
+        if not files or not self._connection:
+            return {}
+
+        async with self._lock:
+            if not self._connection:
+                return {}
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(None, self._get_sync, list(files))
+
+    def _get_sync(self, files: List[str]) -> Dict[str, TestRecord]:
+        """Fetch records for files (runs in thread pool)."""
+        records: Dict[str, TestRecord] = {}
+        for start in range(0, len(files), 500):
+            chunk = files[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            query = (
+                "SELECT test, file, outcome, duration, last_run, sources "
+                f"FROM tests WHERE file IN ({placeholders})"  # nosec B608
+            )
+            for row in self.connection.execute(query, chunk).fetchall():
+                test, file, outcome, duration, last_run, sources = row
+                record = TestRecord(
+                    test=test,
+                    file=file,
+                    outcome=outcome,
+                    duration=duration,
+                    last_run=last_run,
+                    sources=json.loads(sources),
+                )
+                records[record.test] = record
+        return records
+
+    async def record(
+        self,
+        results: Iterable[Dict[str, Any]],
+        source: Optional[str] = None,
+        complete_files: Sequence[str] = (),
+    ) -> None:
+        """Store the results of a run.
+
+        Args:
+            results: Per-test results with ``test``, ``outcome`` and
+                ``duration`` keys, as reported by the pytest worker
+            source: Changed source file the run was for, added to the
+                sources of every test that ran
+            complete_files: Test files that were run in full; their tests
+                missing from ``results`` no longer exist and are forgotten
+        """
+        rows = [
+            (r["test"], r["test"].split("::", 1)[0], r["outcome"], r["duration"])
+            for r in results
+            if "::" in r.get("test", "")
+        ]
+        if not (rows or complete_files) or not self._connection:
+            return
+
+        async with self._lock:
+            if not self._connection:
+                return
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(
+                None, self._record_sync, rows, source, list(complete_files)
+            )
+
+    def _record_sync(
+        self,
+        rows: List[Tuple[str, str, str, float]],
+        source: Optional[str],
+        complete_files: List[str],
+    ) -> None:
+        """Upsert results and drop tests that disappeared (runs in thread pool)."""
+        now = time.time()
+        with self.connection:
+            known = self._get_sync(sorted({file for _, file, _, _ in rows}))
+            updates = []
+            for test, file, outcome, duration in rows:
+                sources = known[test].sources if test in known else []
+                if source:
+                    sources = [source, *(s for s in sources if s != source)]
+                updates.append(
+                    (
+                        test,
+                        file,
+                        outcome,
+                        duration,
+                        now,
+                        json.dumps(sources[: self.max_sources]),
+                    )
+                )
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO tests "
+                "(test, file, outcome, duration, last_run, sources) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                updates,
+            )
+
+            seen = {test for test, _, _, _ in rows}
+            for file in complete_files:
+                stale = [
+                    (test,)
+                    for (test,) in self.connection.execute(
+                        "SELECT test FROM tests WHERE file = ?", (file,)
+                    ).fetchall()
+                    if test not in seen
+                ]
+                self.connection.executemany("DELETE FROM tests WHERE test = ?", stale)
+
+    async def clear(self) -> None:
+        """Forget all tests."""
+        async with self._lock:
+            if not self._connection:
+                return
+            with self.connection:
+                self.connection.execute("DELETE FROM tests")
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        async with self._lock:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
+
+
+def run_order(records: Iterable[TestRecord], source: Optional[str] = None) -> List[str]:
+    """Order known tests for the earliest useful feedback.
+
+    Tests that failed last time come first, then tests that ran for
+    ``source`` before, each group fastest first.
+
+    Args:
+        records: History of the tests about to run
+        source: Changed source file the run is for
+
+    Returns:
+        Node IDs in the order they should run
+    """
+    ordered = sorted(
+        records,
+        key=lambda r: (
+            r.outcome != "failed",
+            source is None or source not in r.sources,
+            r.duration,
+            r.test,
+        ),
+    )
+    return [r.test for r in ordered]
@@ -9,6 +9,7 @@ Provides:
 
 import json
 import re
+import shlex
 import shutil
 import subprocess
 from dataclasses import dataclass
@@ -18,6 +19,8 @@ from typing import Any, Dict, Optional, Tuple
 from rich.console import Console
 from rich.table import Table
 
+from devloop.core.tool_probe import DEFAULT_CACHE_PATH, ToolProbe
+
 console = Console()
 
 
@@ -148,8 +151,6 @@ class ToolDependencyManager:
         try:
             cmd = command or tool_name
             # Handle commands with spaces (e.g., "python -m ruff")
-            import shlex
-
             cmd_parts = shlex.split(cmd) + ["--version"]
             result = subprocess.run(
                 cmd_parts,
@@ -161,13 +162,16 @@ class ToolDependencyManager:
             if result.returncode != 0:
                 return None
 
-            # Extract version from output (handles various formats)
-            output = result.stdout + result.stderr
-            match = re.search(r"(\d+\.\d+\.\d+|\d+\.\d+)", output)
-            return match.group(1) if match else None
+            return ToolDependencyManager._extract_version(result.stdout + result.stderr)
         except (subprocess.TimeoutExpired, Exception):
             return None
 
+    @staticmethod
+    def _extract_version(output: str) -> Optional[str]:
+        """Extract a version number from ``--version`` output (various formats)."""
+        match = re.search(r"(\d+\.\d+\.\d+|\d+\.\d+)", output)
+        return match.group(1) if match else None
+
     @staticmethod
     def parse_version(version_str: Optional[str]) -> Tuple[int, ...]:
         """Parse version string into tuple for comparison."""
@@ -199,20 +203,25 @@ class ToolDependencyManager:
         if not installed:
             return False, None
 
-        min_v = min_version or tool.min_version
-        max_v = max_version or tool.max_version
+        compatible = cls._is_compatible(
+            installed, min_version or tool.min_version, max_version or tool.max_version
+        )
+        return compatible, installed
 
+    @classmethod
+    def _is_compatible(
+        cls,
+        installed: str,
+        min_version: Optional[str],
+        max_version: Optional[str],
+    ) -> bool:
+        """Check an installed version against optional bounds."""
         installed_tuple = cls.parse_version(installed)
-        min_tuple = cls.parse_version(min_v)
-        max_tuple = cls.parse_version(max_v)
-
-        if installed_tuple < min_tuple:
-            return False, installed
-
-        if max_v and installed_tuple > max_tuple:
-            return False, installed
-
-        return True, installed
+        if installed_tuple < cls.parse_version(min_version):
+            return False
+        if max_version and installed_tuple > cls.parse_version(max_version):
+            return False
+        return True
 
     @classmethod
     def _get_tool_info(cls, tool_name: str) -> Optional[ToolInfo]:
@@ -223,23 +232,42 @@ class ToolDependencyManager:
         return None
 
     @classmethod
-    def check_all_tools(cls) -> Dict[str, Dict[str, Any]]:
-        """Check all tools and return status."""
-        results = {}
+    def check_all_tools(
+        cls, cache_path: Optional[Path] = DEFAULT_CACHE_PATH
+    ) -> Dict[str, Dict[str, Any]]:
+        """Check all tools and return status.
 
-        for category, tools in [
+        Versions of all available tools are probed concurrently and cached
+        in ``cache_path`` until the tool binaries change.
+        """
+        categories = [
             ("python", cls.PYTHON_TOOLS),
             ("external", cls.EXTERNAL_TOOLS),
             ("optional", cls.OPTIONAL_TOOLS),
-        ]:
+        ]
+        commands = {
+            tool_name: shlex.split(tool_info.command or tool_name) + ["--version"]
+            for _, tools in categories
+            for tool_name, tool_info in tools.items()
+            if cls.check_tool_available(tool_info.name, tool_info.command)
+        }
+        probed = ToolProbe(cache_path).run(list(commands.values()))
+
+        results = {}
+        for category, tools in categories:
             for tool_name, tool_info in tools.items():
-                available = cls.check_tool_available(tool_info.name, tool_info.command)
+                available = tool_name in commands
                 version = None
                 compatible = False
 
                 if available:
-                    version = cls.get_tool_version(tool_info.name, tool_info.command)
-                    compatible, _ = cls.check_version_compatibility(tool_name)
+                    probe = probed.get(" ".join(commands[tool_name]))
+                    if probe is not None and probe.ok:
+                        version = cls._extract_version(probe.stdout + probe.stderr)
+                    if version:
+                        compatible = cls._is_compatible(
+                            version, tool_info.min_version, tool_info.max_version
+                        )
 
                 results[tool_name] = {
                     "available": available,
@@ -0,0 +1,280 @@
+"""Concurrent, cached ``--version`` probes for external tools.
+
+Tool discovery runs commands like ``poetry --version`` or
+``python -m ruff --version`` to learn whether a tool works and which
+version is installed. Each probe starts a process and some (Poetry,
+npm) take around a second, so probes run in parallel threads and their
+output is cached on disk (normally ``~/.devloop/tool_versions.json``).
+
+A cached result is reused while the command still resolves, through the
+current ``PATH``, to the same binary with the same inode and mtime. For
+``python -m module`` commands the directory the module is installed in is
+stamped too, so installing or upgrading the module re-probes it: the
+module's own directory when the command runs this interpreter, otherwise
+the site-packages of the virtualenv the command's Python belongs to.
+Results of ``-m`` commands whose modules cannot be located that way are not
+cached. A warm start therefore only stats files and starts no processes.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".devloop" / "tool_versions.json"
+
+# Bump when the cached data changes meaning
+_CACHE_VERSION = 1
+
+# Stat fields of the resolved binary (and module directory) a result is valid for
+Fingerprint = Tuple[str, int, int, Optional[Tuple[str, int]]]
+
+# Module stamp of a ``-m`` command whose installation cannot be located;
+# results with it are not cached
+_UNKNOWN_STAMP = ("", -1)
+
+_INCLUDE_SYSTEM_SITE = re.compile(
+    r"^\s*include-system-site-packages\s*=\s*true\s*$", re.IGNORECASE | re.MULTILINE
+)
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of running one probe command."""
+
+    returncode: int
+    stdout: str
+    stderr: str
+
+    @property
+    def ok(self) -> bool:
+        """Whether the command exited successfully."""
+        return self.returncode == 0
+
+
+def fingerprint(command: Sequence[str]) -> Optional[Fingerprint]:
+    """Identify the installation a command would run.
+
+    Args:
+        command: Command line, resolved through the current ``PATH``
+
+    Returns:
+        Resolved binary path, inode and mtime, plus the stamp of the
+        directory holding the module for ``python -m`` commands; None if
+        the binary is not found
+    """
+    binary = shutil.which(command[0])
+    if binary is None:
+        return None
+    try:
+        stat = os.stat(binary)
+    except OSError:
+        return None
+    return (binary, stat.st_ino, stat.st_mtime_ns, _module_stamp(binary, command))
+
+
+def _module_stamp(binary: str, command: Sequence[str]) -> Optional[Tuple[str, int]]:
+    """Stamp the directory a ``-m`` module is installed in.
+
+    Returns:
+        None for commands without ``-m``, ``_UNKNOWN_STAMP`` if the module's
+        installation cannot be located
+    """
+    if "-m" not in command[1:-1]:
+        return None
+    module = command[command.index("-m", 1) + 1].split(".")[0]
+    try:
+        # Virtualenvs share their base interpreter's binary, so compare
+        # environments rather than binaries
+        venv = _venv_root(binary)
+        if venv is not None:
+            if os.path.realpath(venv) == os.path.realpath(sys.prefix):
+                return _find_module_stamp(module)
+            return _site_packages_stamp(venv)
+        own = os.path.realpath(binary) == os.path.realpath(sys.executable)
+        if own and sys.prefix == sys.base_prefix:
+            return _find_module_stamp(module)
+    except (ImportError, ValueError, OSError):
+        pass
+    return _UNKNOWN_STAMP
+
+
+def _venv_root(binary: str) -> Optional[Path]:
+    """The virtualenv a Python binary belongs to, if any."""
+    root = Path(binary).parent.parent
+    return root if (root / "pyvenv.cfg").is_file() else None
+
+
+def _find_module_stamp(module: str) -> Tuple[str, int]:
+    """Stamp the directory holding a module importable by this interpreter."""
+    spec = importlib.util.find_spec(module)
+    if spec is None or spec.origin is None:
+        return ("", 0)
+    location = Path(spec.origin).parent
+    if spec.submodule_search_locations is not None:
+        location = location.parent
+    return (str(location), location.stat().st_mtime_ns)
+
+
+def _site_packages_stamp(venv: Path) -> Tuple[str, int]:
+    """Stamp another virtualenv's site-packages.
+
+    Installing, upgrading or removing a distribution adds or removes its
+    ``.dist-info`` directory, which changes the directory's mtime.
+    """
+    # Modules may also come from the base interpreter's site-packages
+    if _INCLUDE_SYSTEM_SITE.search((venv / "pyvenv.cfg").read_text()):
+        return _UNKNOWN_STAMP
+    sites = [
+        *sorted(venv.glob("lib/python*/site-packages")),
+        venv / "Lib/site-packages",
+    ]
+    for site in sites:
+        if site.is_dir():
+            return (str(site), site.stat().st_mtime_ns)
+    return _UNKNOWN_STAMP
+
+
+def _cacheable(print_: Fingerprint) -> bool:
+    """Whether a result for this fingerprint may be cached."""
+    return print_[3] != _UNKNOWN_STAMP
+
+
+class ToolProbe:
+    """Runs version probes concurrently and caches them across processes."""
+
+    def __init__(
+        self,
+        cache_path: Optional[Path] = DEFAULT_CACHE_PATH,
+        timeout: float = 5.0,
+    ):
+        """Initialize the probe.
+
+        Args:
+            cache_path: JSON file to persist results in; None disables caching
+            timeout: Seconds each command may run before it counts as failed
+        """
+        self.cache_path = cache_path
+        self.timeout = timeout
+        self.runs = 0  # Commands actually executed, for diagnostics
+
+    def run(self, commands: Sequence[Sequence[str]]) -> Dict[str, ProbeResult]:
+        """Probe every command, reusing cached results where still valid.
+
+        Args:
+            commands: Command lines to run, e.g. ``["poetry", "--version"]``
+
+        Returns:
+            Result per command (joined with spaces); commands whose binary
+            is missing, that time out or cannot start are left out
+        """
+        keys = {" ".join(command): list(command) for command in commands}
+        prints: Dict[str, Fingerprint] = {}
+        for key, command in keys.items():
+            print_ = fingerprint(command)
+            if print_ is not None:
+                prints[key] = print_
+        cached = self._load_cache()
+
+        results: Dict[str, ProbeResult] = {}
+        stale: List[str] = []
+        for key, print_ in prints.items():
+            entry = cached.get(key)
+            if entry is not None and entry[0] == print_ and _cacheable(print_):
+                results[key] = entry[1]
+            else:
+                stale.append(key)
+
+        if stale:
+            self.runs += len(stale)
+            with ThreadPoolExecutor(max_workers=len(stale)) as pool:
+                probed = list(pool.map(lambda key: self._execute(keys[key]), stale))
+            for key, result in zip(stale, probed):
+                if result is not None:
+                    results[key] = result
+                    if _cacheable(prints[key]):
+                        cached[key] = (prints[key], result)
+            self._save_cache(cached)
+
+        return results
+
+    def _execute(self, command: List[str]) -> Optional[ProbeResult]:
+        """Run one command (in a worker thread)."""
+        try:
+            proc = subprocess.run(
+                command,
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+                check=False,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug(f"{command[0]} not available: {e}")
+            return None
+        return ProbeResult(proc.returncode, proc.stdout, proc.stderr)
+
+    def _load_cache(self) -> Dict[str, Tuple[Fingerprint, ProbeResult]]:
+        """Load cached results, or nothing if the cache is unusable."""
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+
+        try:
+            data = json.loads(self.cache_path.read_text())
+            if data.get("version") != _CACHE_VERSION:
+                return {}
+            entries = {}
+            for key, entry in data["commands"].items():
+                binary, ino, mtime_ns, stamp = entry["fingerprint"]
+                entries[key] = (
+                    (binary, ino, mtime_ns, tuple(stamp) if stamp else None),
+                    ProbeResult(entry["returncode"], entry["stdout"], entry["stderr"]),
+                )
+            return entries
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable tool version cache: {e}")
+            return {}
+
+    def _save_cache(self, entries: Dict[str, Tuple[Fingerprint, ProbeResult]]) -> None:
+        """Atomically write results to the cache."""
+        if self.cache_path is None:
+            return
+
+        data = {
+            "version": _CACHE_VERSION,
+            "commands": {
+                key: {
+                    "fingerprint": print_,
+                    "returncode": result.returncode,
+                    "stdout": result.stdout,
+                    "stderr": result.stderr,
+                }
+                for key, (print_, result) in entries.items()
+            },
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(
+                dir=self.cache_path.parent, prefix=".tool_versions.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp, self.cache_path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write tool version cache: {e}")
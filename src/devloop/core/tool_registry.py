@@ -14,6 +14,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from devloop.core.tool_probe import DEFAULT_CACHE_PATH, ToolProbe
+
 logger = logging.getLogger(__name__)
 
 
@@ -200,14 +202,21 @@ class ToolRegistry:
         ),
     }
 
-    def __init__(self, registry_file: Optional[Path] = None):
+    def __init__(
+        self,
+        registry_file: Optional[Path] = None,
+        cache_path: Optional[Path] = DEFAULT_CACHE_PATH,
+    ):
         """Initialize tool registry.
 
         Args:
             registry_file: Path to custom tool registry file (YAML/JSON).
                           If not provided, uses built-in tools only.
+            cache_path: Where runner versions are cached between runs.
+                       None probes every runner each time.
         """
         self.registry_file = registry_file
+        self.cache_path = cache_path
         self.tools: Dict[str, ToolDefinition] = self.BUILTIN_TOOLS.copy()
         self.available_runners: Dict[str, ToolRunnerConfig] = {}
 
@@ -239,7 +248,11 @@ class ToolRegistry:
             raise ValueError(f"Invalid registry file: {e}") from e
 
     def _detect_available_runners(self) -> None:
-        """Detect available runners on the system."""
+        """Detect available runners on the system.
+
+        Runners are probed concurrently, and results are reused from the
+        probe cache while the runner binaries are unchanged.
+        """
         runner_checks = {
             "poetry": ("poetry", "--version"),
             "pip": ("pip", "--version"),
@@ -247,28 +260,23 @@ class ToolRegistry:
             "yarn": ("yarn", "--version"),
         }
 
-        import subprocess
-
+        results = ToolProbe(self.cache_path, timeout=2).run(
+            list(runner_checks.values())
+        )
         for runner_name, cmd in runner_checks.items():
-            try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=2,
-                    check=False,
-                )
-                if result.returncode == 0:
-                    version = result.stdout.strip().split("\n")[0]
-                    self.available_runners[runner_name] = ToolRunnerConfig(
-                        name=runner_name,
-                        available=True,
-                        version=version,
-                        check_command=" ".join(cmd),
-                    )
-                    logger.debug(f"Found {runner_name}: {version}")
-            except Exception as e:
-                logger.debug(f"{runner_name} not available: {e}")
+            check_command = " ".join(cmd)
+            result = results.get(check_command)
+            if result is None or not result.ok:
+                logger.debug(f"{runner_name} not available")
+                continue
+            version = result.stdout.strip().split("\n")[0]
+            self.available_runners[runner_name] = ToolRunnerConfig(
+                name=runner_name,
+                available=True,
+                version=version,
+                check_command=check_command,
+            )
+            logger.debug(f"Found {runner_name}: {version}")
 
         # Direct execution is always "available"
         self.available_runners["direct"] = ToolRunnerConfig(
@@ -271,10 +271,9 @@ class DevLoopLanguageServer(LanguageServer):
 
         try:
             # Get findings for this file
-            all_findings = await self.context_store.get_findings(tier=Tier.IMMEDIATE)
-
-            # Filter findings for this file
-            file_findings = [f for f in all_findings if f.file == str(file_path)]
+            file_findings = await self.context_store.get_findings(
+                tier=Tier.IMMEDIATE, file_filter=str(file_path)
+            )
 
             # Convert to diagnostics
             diagnostics = FindingMapper.to_diagnostics(file_findings)
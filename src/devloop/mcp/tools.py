@@ -128,24 +128,21 @@ async def get_findings(
         except ValueError:
             logger.warning(f"Invalid tier value: {tier}")
 
-    # Get findings from context store
-    findings = await context_store.get_findings(tier=tier_enum, file_filter=file)
-
-    # Apply additional filters (severity and category are not supported by
-    # ContextStore.get_findings directly, so we filter here)
+    severity_enum: Optional[Severity] = None
     if severity:
         try:
             severity_enum = Severity(severity.lower())
-            findings = [f for f in findings if f.severity == severity_enum]
         except ValueError:
             logger.warning(f"Invalid severity value: {severity}")
 
-    if category:
-        findings = [f for f in findings if f.category == category]
-
-    # Apply limit
-    if limit and limit > 0:
-        findings = findings[:limit]
+    # Filters and limit are applied by the store's indexes
+    findings = await context_store.get_findings(
+        tier=tier_enum,
+        file_filter=file,
+        severity=severity_enum,
+        category=category,
+        limit=limit if limit and limit > 0 else None,
+    )
 
     # Convert to dictionaries
     return [_finding_to_dict(f) for f in findings]
@@ -1,30 +1,68 @@
 """Security module for sandboxed agent execution, path validation, and token management."""
 
-from devloop.security.factory import create_sandbox
-from devloop.security.path_validator import (
-    PathTraversalError,
-    PathValidationError,
-    PathValidator,
-    SymlinkError,
-    is_safe_path,
-    safe_path_join,
-    validate_safe_patterns,
-)
-from devloop.security.sandbox import (
-    SandboxConfig,
-    SandboxExecutor,
-    SandboxResult,
-)
-from devloop.security.token_manager import (
-    TokenInfo,
-    TokenManager,
-    TokenType,
-    get_github_token,
-    get_pypi_token,
-    get_token_manager,
-    sanitize_command,
-    sanitize_log,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from devloop.security.factory import create_sandbox
+    from devloop.security.path_validator import (
+        PathTraversalError,
+        PathValidationError,
+        PathValidator,
+        SymlinkError,
+        is_safe_path,
+        safe_path_join,
+        validate_safe_patterns,
+    )
+    from devloop.security.sandbox import (
+        SandboxConfig,
+        SandboxExecutor,
+        SandboxResult,
+    )
+    from devloop.security.token_manager import (
+        TokenInfo,
+        TokenManager,
+        TokenType,
+        get_github_token,
+        get_pypi_token,
+        get_token_manager,
+        sanitize_command,
+        sanitize_log,
+    )
+
+# Exported name -> submodule defining it, imported on first access
+_LAZY_IMPORTS = {
+    "create_sandbox": "factory",
+    "PathTraversalError": "path_validator",
+    "PathValidationError": "path_validator",
+    "PathValidator": "path_validator",
+    "SymlinkError": "path_validator",
+    "is_safe_path": "path_validator",
+    "safe_path_join": "path_validator",
+    "validate_safe_patterns": "path_validator",
+    "SandboxConfig": "sandbox",
+    "SandboxExecutor": "sandbox",
+    "SandboxResult": "sandbox",
+    "TokenInfo": "token_manager",
+    "TokenManager": "token_manager",
+    "TokenType": "token_manager",
+    "get_github_token": "token_manager",
+    "get_pypi_token": "token_manager",
+    "get_token_manager": "token_manager",
+    "sanitize_command": "token_manager",
+    "sanitize_log": "token_manager",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name from its submodule on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "create_sandbox",
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
+import os
 import shutil
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from devloop.security.audit_logger import get_audit_logger
 from devloop.security.cgroups_helper import CgroupsManager
@@ -21,6 +26,52 @@ from devloop.security.sandbox import (
 
 logger = logging.getLogger(__name__)
 
+# Working directories whose validated bwrap argv each sandbox keeps warm
+MAX_WARM_DIRECTORIES = 64
+
+# Distinguishes the cgroups of sandboxes created by one process
+_sandbox_ids = itertools.count()
+
+
+@dataclass(frozen=True)
+class _CommandTemplate:
+    """A validated working directory and the bwrap arguments for it.
+
+    Attributes:
+        cwd: Resolved working directory
+        identity: (st_dev, st_ino) of the directory when it was validated
+        lineage: (st_dev, st_ino) of the resolved directory and each of its
+            ancestors, not following symlinks
+        argv: bwrap arguments up to and including ``--chdir``
+    """
+
+    cwd: Path
+    identity: Tuple[int, int]
+    lineage: Tuple[Tuple[int, int], ...]
+    argv: Tuple[str, ...]
+
+
+def _identity(path: Path) -> Optional[Tuple[int, int]]:
+    """Get the (device, inode) a path currently refers to, if it exists."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+
+def _lineage(path: Path) -> Optional[Tuple[Tuple[int, int], ...]]:
+    """Get the (device, inode) of a path and each ancestor, as lstat sees them.
+
+    An ancestor replaced by a symlink, even one back to the same directory,
+    changes the result.
+    """
+    try:
+        stats = [os.lstat(p) for p in (path, *path.parents)]
+    except OSError:
+        return None
+    return tuple((st.st_dev, st.st_ino) for st in stats)
+
 
 class BubblewrapSandbox(SandboxExecutor):
     """Linux namespace-based sandbox using Bubblewrap.
@@ -32,6 +83,12 @@ class BubblewrapSandbox(SandboxExecutor):
     - IPC isolation (--unshare-ipc)
     - Resource enforcement via cgroups v2 (if available)
 
+    Each instance is a warm session for one agent: its cgroup is created and
+    limited once and kept until :meth:`close`, and the validated working
+    directory and bwrap arguments are reused for later commands in the same
+    directory. A reused directory must still be the same inode, otherwise it
+    is validated again.
+
     Requires: bwrap binary installed on system
     """
 
@@ -44,6 +101,12 @@ class BubblewrapSandbox(SandboxExecutor):
         super().__init__(config)
         self._cgroups_manager: Optional[CgroupsManager] = None
         self._cgroups_available: Optional[bool] = None
+        # Limits last written to the cgroup, rewritten only when they change
+        self._cgroup_limits: Optional[Tuple[int, int]] = None
+        # Removes the cgroup on close() or when the sandbox is collected
+        self._cgroup_finalizer: Optional[weakref.finalize] = None
+        # (requested cwd, network isolated) -> template, most recent last
+        self._templates: OrderedDict[Tuple[str, bool], _CommandTemplate] = OrderedDict()
 
     async def _init_cgroups(self) -> bool:
         """Initialize cgroups if available.
@@ -55,11 +118,22 @@ class BubblewrapSandbox(SandboxExecutor):
             return self._cgroups_available
 
         try:
-            self._cgroups_manager = CgroupsManager(cgroup_name="devloop-bwrap")
+            # One cgroup per sandbox so its usage can be attributed to the
+            # agent, and no other sandbox removes it while a command runs
+            cgroup_name = (
+                f"devloop-bwrap-{self.agent_name}"
+                if self.agent_name
+                else "devloop-bwrap"
+            )
+            cgroup_name += f"-{os.getpid()}-{next(_sandbox_ids)}"
+            self._cgroups_manager = CgroupsManager(cgroup_name=cgroup_name)
             self._cgroups_available = await self._cgroups_manager.is_available()
 
             if self._cgroups_available:
                 logger.debug("cgroups v2 available for resource enforcement")
+                self._cgroup_finalizer = weakref.finalize(
+                    self, self._cgroups_manager.cleanup
+                )
             else:
                 logger.info("cgroups v2 not available, resource limits not enforced")
 
@@ -69,6 +143,46 @@ class BubblewrapSandbox(SandboxExecutor):
 
         return self._cgroups_available
 
+    def _apply_cgroup_limits(self) -> bool:
+        """Write the configured limits to the cgroup unless already set.
+
+        Returns:
+            True if the cgroup enforces the configured limits
+        """
+        limits = (self.config.max_memory_mb, self.config.max_cpu_percent)
+        if limits == self._cgroup_limits:
+            return True
+        if self._cgroups_manager is None:
+            return False
+
+        try:
+            self._cgroups_manager.set_memory_limit(self.config.max_memory_mb)
+            self._cgroups_manager.set_cpu_limit(self.config.max_cpu_percent)
+        except RuntimeError as e:
+            logger.warning(f"Failed to set cgroups limits: {e}")
+            return False
+
+        self._cgroup_limits = limits
+        logger.debug(
+            f"cgroups limits set: {self.config.max_memory_mb}MB RAM, "
+            f"{self.config.max_cpu_percent}% CPU"
+        )
+        return True
+
+    async def close(self) -> None:
+        """Remove this sandbox's cgroup and forget its warm directories.
+
+        The sandbox can still be used afterwards; it is set up again on the
+        next command.
+        """
+        self._templates.clear()
+        if self._cgroup_finalizer is not None:
+            self._cgroup_finalizer()
+        self._cgroup_finalizer = None
+        self._cgroups_manager = None
+        self._cgroups_available = None
+        self._cgroup_limits = None
+
     async def is_available(self) -> bool:
         """Check if bwrap is installed.
 
@@ -142,25 +256,8 @@ class BubblewrapSandbox(SandboxExecutor):
         """
         audit_logger = get_audit_logger()
 
-        # Validate working directory for security
-        try:
-            cwd = Path(cwd).resolve()  # Resolve symlinks
-            if not cwd.exists():
-                raise PathValidationError(f"Working directory does not exist: {cwd}")
-            if not cwd.is_dir():
-                raise PathValidationError(
-                    f"Working directory is not a directory: {cwd}"
-                )
-            # Check for any symlink components in the path
-            for parent in cwd.parents:
-                if parent.is_symlink():
-                    raise PathValidationError(
-                        f"Working directory contains symlink component: {parent}"
-                    )
-        except (OSError, RuntimeError) as e:
-            raise PathValidationError(
-                f"Failed to validate working directory: {e}"
-            ) from e
+        template = self._template(Path(cwd))
+        cwd = template.cwd
 
         if not self.validate_command(cmd):
             # Log blocked command attempt
@@ -175,47 +272,43 @@ class BubblewrapSandbox(SandboxExecutor):
                 f"Must be in whitelist: {self.config.allowed_tools}"
             )
 
-        # Initialize cgroups if available
-        cgroups_enabled = await self._init_cgroups()
+        # cgroup is created and limited on first use, then reused
+        cgroups_enabled = await self._init_cgroups() and self._apply_cgroup_limits()
 
-        # Set up cgroups if available
-        if cgroups_enabled and self._cgroups_manager:
-            try:
-                self._cgroups_manager.set_memory_limit(self.config.max_memory_mb)
-                self._cgroups_manager.set_cpu_limit(self.config.max_cpu_percent)
-                logger.debug(
-                    f"cgroups limits set: {self.config.max_memory_mb}MB RAM, "
-                    f"{self.config.max_cpu_percent}% CPU"
-                )
-            except RuntimeError as e:
-                logger.warning(f"Failed to set cgroups limits: {e}")
-                cgroups_enabled = False
-
-        # Build bwrap command with strict isolation
-        bwrap_cmd = self._build_bwrap_command(cmd, cwd, env)
+        bwrap_cmd = [*template.argv, *self._env_args(env), *cmd]
 
         # Execute with timeout
         self._start_timer()
 
-        try:
-            process = await asyncio.create_subprocess_exec(
-                *bwrap_cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+        process = await asyncio.create_subprocess_exec(
+            *bwrap_cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+        # Add process to cgroup if enabled
+        if cgroups_enabled and self._cgroups_manager and process.pid:
+            try:
+                self._cgroups_manager.add_process(process.pid)
+                logger.debug(f"Added process {process.pid} to cgroup")
+            except RuntimeError as e:
+                logger.warning(f"Failed to add process to cgroup: {e}")
+                cgroups_enabled = False
 
-            # Add process to cgroup if enabled
-            if cgroups_enabled and self._cgroups_manager and process.pid:
-                try:
-                    self._cgroups_manager.add_process(process.pid)
-                    logger.debug(f"Added process {process.pid} to cgroup")
-                except RuntimeError as e:
-                    logger.warning(f"Failed to add process to cgroup: {e}")
-                    cgroups_enabled = False
+        self._process_started(
+            process.pid, self._cgroups_manager if cgroups_enabled else None
+        )
 
+        try:
             stdout, stderr = await asyncio.wait_for(
                 process.communicate(), timeout=self.config.timeout_seconds
             )
+            self._process_exited(process.pid)
+
+        except asyncio.CancelledError:
+            # Superseded by a newer run; don't leave the tool running
+            await self._terminate(process)
+            raise
 
         except asyncio.TimeoutError:
             # Kill process if it exceeds timeout
@@ -224,6 +317,7 @@ class BubblewrapSandbox(SandboxExecutor):
                 await process.wait()
             except ProcessLookupError:
                 pass  # Process already dead
+            self._process_exited(process.pid)
 
             duration_ms = self._get_duration_ms()
 
@@ -235,10 +329,6 @@ class BubblewrapSandbox(SandboxExecutor):
                 duration_ms=duration_ms,
             )
 
-            # Cleanup cgroups
-            if cgroups_enabled and self._cgroups_manager:
-                self._cgroups_manager.cleanup()
-
             raise SandboxTimeoutError(
                 f"Command exceeded {self.config.timeout_seconds}s timeout: {cmd}"
             )
@@ -261,10 +351,6 @@ class BubblewrapSandbox(SandboxExecutor):
             except Exception as e:
                 logger.warning(f"Failed to get cgroups metrics: {e}")
 
-        # Cleanup cgroups
-        if cgroups_enabled and self._cgroups_manager:
-            self._cgroups_manager.cleanup()
-
         result = SandboxResult(
             stdout=stdout.decode("utf-8", errors="replace") if stdout else "",
             stderr=stderr.decode("utf-8", errors="replace") if stderr else "",
@@ -284,6 +370,81 @@ class BubblewrapSandbox(SandboxExecutor):
 
         return result
 
+    def _template(self, cwd: Path) -> _CommandTemplate:
+        """Get the validated directory and bwrap arguments for a cwd.
+
+        Reuses the template from an earlier command while the directory is
+        still the same inode and no component of its resolved path has been
+        replaced; otherwise validates it again.
+
+        Args:
+            cwd: Requested working directory
+
+        Returns:
+            Template for the directory
+
+        Raises:
+            PathValidationError: If cwd path is invalid or malicious
+        """
+        key = (os.path.abspath(cwd), not self.config.allowed_network_domains)
+        template = self._templates.get(key)
+        if template is not None:
+            if (
+                _identity(cwd) == template.identity
+                and _lineage(template.cwd) == template.lineage
+            ):
+                self._templates.move_to_end(key)
+                return template
+            del self._templates[key]
+
+        resolved = self._validate_cwd(cwd)
+        identity = _identity(resolved)
+        lineage = _lineage(resolved)
+        if identity is None or lineage is None:
+            raise PathValidationError(f"Working directory does not exist: {cwd}")
+        template = _CommandTemplate(
+            cwd=resolved,
+            identity=identity,
+            lineage=lineage,
+            argv=tuple(self._bwrap_prefix(resolved)),
+        )
+        self._templates[key] = template
+        if len(self._templates) > MAX_WARM_DIRECTORIES:
+            self._templates.popitem(last=False)
+        return template
+
+    def _validate_cwd(self, cwd: Path) -> Path:
+        """Resolve a working directory and check it is safe to bind.
+
+        Args:
+            cwd: Requested working directory
+
+        Returns:
+            Resolved working directory
+
+        Raises:
+            PathValidationError: If cwd path is invalid or malicious
+        """
+        try:
+            cwd = Path(cwd).resolve()  # Resolve symlinks
+            if not cwd.exists():
+                raise PathValidationError(f"Working directory does not exist: {cwd}")
+            if not cwd.is_dir():
+                raise PathValidationError(
+                    f"Working directory is not a directory: {cwd}"
+                )
+            # Check for any symlink components in the path
+            for parent in cwd.parents:
+                if parent.is_symlink():
+                    raise PathValidationError(
+                        f"Working directory contains symlink component: {parent}"
+                    )
+        except (OSError, RuntimeError) as e:
+            raise PathValidationError(
+                f"Failed to validate working directory: {e}"
+            ) from e
+        return cwd
+
     def _build_bwrap_command(
         self, cmd: List[str], cwd: Path, env: Optional[Dict[str, str]]
     ) -> List[str]:
@@ -297,6 +458,17 @@ class BubblewrapSandbox(SandboxExecutor):
         Returns:
             Complete bwrap command list
         """
+        return [*self._bwrap_prefix(cwd), *self._env_args(env), *cmd]
+
+    def _bwrap_prefix(self, cwd: Path) -> List[str]:
+        """Build the bwrap arguments that depend only on the directory.
+
+        Args:
+            cwd: Working directory
+
+        Returns:
+            bwrap arguments up to and including ``--chdir``
+        """
         bwrap_cmd = [
             "bwrap",
             # Filesystem isolation - read-only system directories
@@ -363,12 +535,18 @@ class BubblewrapSandbox(SandboxExecutor):
         # Working directory
         bwrap_cmd.extend(["--chdir", str(cwd)])
 
-        # Environment variables (filtered to allowed list)
-        filtered_env = self._filter_env_vars(env)
-        for key, value in filtered_env.items():
-            bwrap_cmd.extend(["--setenv", key, value])
+        return bwrap_cmd
 
-        # Add the actual command to execute
-        bwrap_cmd.extend(cmd)
+    def _env_args(self, env: Optional[Dict[str, str]]) -> List[str]:
+        """Build ``--setenv`` arguments for the allowed environment variables.
 
-        return bwrap_cmd
+        Args:
+            env: Environment variables
+
+        Returns:
+            bwrap arguments setting each allowed variable
+        """
+        args: List[str] = []
+        for key, value in self._filter_env_vars(env).items():
+            args.extend(["--setenv", key, value])
+        return args
@@ -17,10 +17,12 @@ class CgroupsResources:
     Attributes:
         memory_peak_mb: Peak memory usage in megabytes
         cpu_usage_percent: CPU usage percentage
+        cpu_usage_usec: Cumulative CPU time of the cgroup in microseconds
     """
 
     memory_peak_mb: float
     cpu_usage_percent: float
+    cpu_usage_usec: int = 0
 
 
 class CgroupsManager:
@@ -197,10 +199,10 @@ class CgroupsManager:
             # Read CPU usage (simplified - actual usage tracking is complex)
             # cpu.stat contains usage_usec
             cpu_stat = cgroup_path / "cpu.stat"
-            _cpu_usage_usec = 0
+            cpu_usage_usec = 0
             for line in cpu_stat.read_text().strip().split("\n"):
                 if line.startswith("usage_usec"):
-                    _cpu_usage_usec = int(line.split()[1])
+                    cpu_usage_usec = int(line.split()[1])
                     break
 
             # Convert to percentage (simplified - would need delta over time)
@@ -208,7 +210,9 @@ class CgroupsManager:
             cpu_percent = 0.0
 
             return CgroupsResources(
-                memory_peak_mb=memory_mb, cpu_usage_percent=cpu_percent
+                memory_peak_mb=memory_mb,
+                cpu_usage_percent=cpu_percent,
+                cpu_usage_usec=cpu_usage_usec,
             )
 
         except (OSError, ValueError) as e:
@@ -91,18 +91,25 @@ class NoSandbox(SandboxExecutor):
 
         self._start_timer()
 
-        try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=cwd,
-                env=env,  # Don't filter env vars in no-sandbox mode
-            )
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            env=env,  # Don't filter env vars in no-sandbox mode
+        )
+        self._process_started(process.pid)
 
+        try:
             stdout, stderr = await asyncio.wait_for(
                 process.communicate(), timeout=self.config.timeout_seconds
             )
+            self._process_exited(process.pid)
+
+        except asyncio.CancelledError:
+            # Superseded by a newer run; don't leave the tool running
+            await self._terminate(process)
+            raise
 
         except asyncio.TimeoutError:
             try:
@@ -110,6 +117,7 @@ class NoSandbox(SandboxExecutor):
                 await process.wait()
             except ProcessLookupError:
                 pass
+            self._process_exited(process.pid)
 
             duration_ms = self._get_duration_ms()
 
@@ -2,12 +2,23 @@
 
 Prevents path traversal attacks, symlink exploits, and ensures all paths
 are within allowed boundaries.
+
+Validators created with ``cache_directories=True`` share a cache of
+resolved, symlink-checked directories. Validating a path in a cached
+directory then costs an ``lstat`` of the path and a ``stat`` of its
+directory instead of one ``lstat`` per path component. Entries are
+dropped when the directory's device/inode changes or when
+:meth:`PathValidator.invalidate` reports a directory create, delete or
+move.
 """
 
 import fnmatch
 import logging
+import os
+import stat
+import threading
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +41,75 @@ class SymlinkError(PathValidationError):
     pass
 
 
+class _DirectoryCache:
+    """Resolved directories shared by validators that cache directories.
+
+    Maps an absolute, normalized directory path to the (device, inode) it
+    had when resolved, its resolved path, and whether the resolved path
+    has a symlink component.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: Dict[str, Tuple[Tuple[int, int], Path, bool]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def lookup(
+        self, directory: str, identity: Tuple[int, int]
+    ) -> Optional[Tuple[Path, bool]]:
+        """Get a directory's resolved path if it is still the same directory."""
+        entry = self._entries.get(directory)
+        if entry is None or entry[0] != identity:
+            return None
+        return entry[1], entry[2]
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation."""
+        return self._generation
+
+    def store(
+        self,
+        directory: str,
+        identity: Tuple[int, int],
+        resolved: Path,
+        has_symlink: bool,
+        generation: int,
+    ) -> None:
+        """Cache a directory resolved while ``generation`` was current."""
+        with self._lock:
+            # An invalidation raced with resolving; the result may be stale
+            if generation != self._generation:
+                return
+            if len(self._entries) >= self.max_entries:
+                self._entries.clear()
+            self._entries[directory] = (identity, resolved, has_symlink)
+
+    def invalidate(self, path: str, directory: bool = True) -> None:
+        """Drop ``path`` and, if it is or was a directory, everything below it."""
+        path = os.path.normpath(os.path.abspath(path))
+        with self._lock:
+            if not directory and path not in self._entries:
+                return
+            self._generation += 1
+            prefix = path.rstrip(os.sep) + os.sep
+            for key in [k for k in self._entries if k == path or k.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_directory_cache = _DirectoryCache()
+
+
 class PathValidator:
     """Validates and sanitizes file paths for security.
 
@@ -51,6 +131,7 @@ class PathValidator:
         project_root: Union[Path, str],
         allow_symlinks: bool = False,
         blocked_patterns: Optional[List[str]] = None,
+        cache_directories: bool = False,
     ):
         """Initialize path validator.
 
@@ -58,6 +139,9 @@ class PathValidator:
             project_root: Root directory of the project (all paths must be within this)
             allow_symlinks: Whether to allow symlinks (default: False for security)
             blocked_patterns: List of fnmatch patterns to block (e.g., ["*.exe", "*.sh"])
+            cache_directories: Reuse resolved parent directories across calls.
+                Only enable where directory changes are reported through
+                :meth:`invalidate` (e.g. by the filesystem collector)
         """
         self.project_root = Path(project_root).resolve()
 
@@ -73,6 +157,7 @@ class PathValidator:
 
         self.allow_symlinks = allow_symlinks
         self.blocked_patterns = blocked_patterns or []
+        self.cache_directories = cache_directories
 
         logger.debug(f"PathValidator initialized for {self.project_root}")
 
@@ -89,6 +174,11 @@ class PathValidator:
             SymlinkError: If symlinks are not allowed and path contains symlinks
             PathValidationError: If path cannot be resolved
         """
+        if self.cache_directories:
+            cached = self._resolve_cached(path)
+            if cached is not None:
+                return cached
+
         try:
             path_obj = Path(path)
 
@@ -111,6 +201,66 @@ class PathValidator:
         except (OSError, RuntimeError) as e:
             raise PathValidationError(f"Failed to resolve path {path}: {e}") from e
 
+    def _resolve_cached(self, path: Union[Path, str]) -> Optional[Path]:
+        """Resolve a path through the directory cache.
+
+        Returns:
+            Resolved path, or None when the full resolution in
+            :meth:`resolve_path` must decide (symlinks, ``..``, errors)
+        """
+        raw = os.fspath(path)
+        if ".." in raw.split(os.sep):
+            return None
+        normalized = os.path.normpath(os.path.abspath(raw))
+        directory, name = os.path.split(normalized)
+        if not name:
+            return None
+
+        try:
+            if stat.S_ISLNK(os.lstat(normalized).st_mode):
+                return None
+        except FileNotFoundError:
+            pass  # Deleted files resolve like their directory
+        except OSError:
+            return None
+
+        try:
+            dir_stat = os.stat(directory)
+        except OSError:
+            return None
+        identity = (dir_stat.st_dev, dir_stat.st_ino)
+
+        entry = _directory_cache.lookup(directory, identity)
+        if entry is None:
+            generation = _directory_cache.generation
+            try:
+                resolved_dir = Path(directory).resolve()
+                has_symlink = any(
+                    p.is_symlink() for p in (resolved_dir, *resolved_dir.parents)
+                )
+            except (OSError, RuntimeError):
+                return None
+            _directory_cache.store(
+                directory, identity, resolved_dir, has_symlink, generation
+            )
+            entry = (resolved_dir, has_symlink)
+
+        resolved_dir, has_symlink = entry
+        if has_symlink and not self.allow_symlinks:
+            return None
+        return resolved_dir / name
+
+    def invalidate(self, path: Union[Path, str], directory: bool = True) -> None:
+        """Forget cached resolutions affected by a filesystem change.
+
+        Args:
+            path: Path that was created, deleted or moved
+            directory: Whether ``path`` is a directory. For files only a
+                cached directory at the same path (e.g. replaced by a
+                symlink) is dropped.
+        """
+        _directory_cache.invalidate(os.fspath(path), directory)
+
     def is_within_project(self, path: Union[Path, str]) -> bool:
         """Check if path is within project directory.
 
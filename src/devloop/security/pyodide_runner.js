@@ -8,6 +8,12 @@
  * Usage:
  *   echo '{"command": ["python3", "script.py"], "cwd": "/path"}' | node pyodide_runner.js
  *
+ * Worker mode (--serve) loads the runtime once and answers requests until
+ * stdin closes. Each request and response is one JSON document per line;
+ * the first line written is {"ready": true}, and each response carries the
+ * request's "id" and the process's resident memory ("rssMb"):
+ *   node pyodide_runner.js --serve
+ *
  * Requirements:
  *   - Node.js 18+
  *   - pyodide npm package
@@ -15,6 +21,7 @@
 
 const fs = require('fs').promises;
 const path = require('path');
+const readline = require('readline');
 
 // Constants
 const DEFAULT_TIMEOUT_MS = 30000;
@@ -42,17 +49,61 @@ async function main() {
 
     } catch (error) {
         // Output error as JSON result
-        const errorResult = {
-            stdout: "",
-            stderr: `Pyodide runner error: ${error.message}\n${error.stack}`,
-            exitCode: 1,
-            durationMs: Date.now() - startTime,
-            memoryPeakMb: process.memoryUsage().heapUsed / 1024 / 1024
-        };
+        console.log(JSON.stringify(errorResult(error, startTime)));
+        process.exit(1);
+    }
+}
+
+/**
+ * Worker mode: answer one request per stdin line until stdin closes
+ */
+async function serve() {
+    // stdout carries protocol lines only; send stray logging to stderr
+    const writeLine = (message) => process.stdout.write(JSON.stringify(message) + '\n');
+    console.log = console.info = console.debug = console.error;
 
-        console.log(JSON.stringify(errorResult));
+    let runtime;
+    try {
+        runtime = await loadRuntime();
+    } catch (error) {
+        writeLine({ ready: false, error: error.message });
         process.exit(1);
     }
+    writeLine({ ready: true });
+
+    const lines = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+    for await (const line of lines) {
+        if (!line.trim()) {
+            continue;
+        }
+        const startTime = Date.now();
+        let id = null;
+        let result;
+        try {
+            const params = JSON.parse(line);
+            id = params.id === undefined ? null : params.id;
+            validateParams(params);
+            result = await executePyodide(params, startTime, runtime);
+        } catch (error) {
+            result = errorResult(error, startTime);
+        }
+        result.id = id;
+        result.rssMb = process.memoryUsage().rss / 1024 / 1024;
+        writeLine(result);
+    }
+}
+
+/**
+ * Result reported when the runner itself fails
+ */
+function errorResult(error, startTime) {
+    return {
+        stdout: "",
+        stderr: `Pyodide runner error: ${error.message}\n${error.stack}`,
+        exitCode: 1,
+        durationMs: Date.now() - startTime,
+        memoryPeakMb: process.memoryUsage().heapUsed / 1024 / 1024
+    };
 }
 
 /**
@@ -104,8 +155,10 @@ function validateParams(params) {
 
 /**
  * Execute Python code in Pyodide WASM environment
+ *
+ * @param runtime Pyodide instance loaded by a worker; loaded here if omitted
  */
-async function executePyodide(params, startTime) {
+async function executePyodide(params, startTime, runtime) {
     // NOTE: This is a POC implementation
     // Full implementation requires:
     // 1. Install pyodide: npm install pyodide
@@ -121,14 +174,33 @@ async function executePyodide(params, startTime) {
     const timeout = params.timeout || DEFAULT_TIMEOUT_MS / 1000;
     const maxMemoryMb = params.maxMemoryMb || DEFAULT_MAX_MEMORY_MB;
 
-    // Check if this is a real Pyodide execution or POC mode
-    const pocMode = process.env.PYODIDE_POC_MODE === '1' || !isPyodideInstalled();
-
-    if (pocMode) {
+    if (isPocMode()) {
         return await executePOC(command, cwd, startTime);
     } else {
-        return await executeRealPyodide(command, cwd, timeout, maxMemoryMb, startTime);
+        const pyodide = runtime || await loadRuntime();
+        return await executeRealPyodide(pyodide, command, cwd, timeout, maxMemoryMb, startTime);
+    }
+}
+
+/**
+ * Check if this is a real Pyodide execution or POC mode
+ */
+function isPocMode() {
+    return process.env.PYODIDE_POC_MODE === '1' || !isPyodideInstalled();
+}
+
+/**
+ * Load the Pyodide runtime (null in POC mode)
+ */
+async function loadRuntime() {
+    if (isPocMode()) {
+        return null;
     }
+    // Load Pyodide (lazy loaded only when needed)
+    const { loadPyodide } = require('pyodide');
+    return await loadPyodide({
+        indexURL: "https://cdn.jsdelivr.net/pyodide/v0.25.0/full/",
+    });
 }
 
 /**
@@ -205,15 +277,7 @@ async function executePOC(command, cwd, startTime) {
 /**
  * Real Pyodide execution (requires pyodide npm package)
  */
-async function executeRealPyodide(command, cwd, timeout, maxMemoryMb, startTime) {
-    // Load Pyodide (lazy loaded only when needed)
-    const { loadPyodide } = require('pyodide');
-
-    // Initialize Pyodide runtime
-    const pyodide = await loadPyodide({
-        indexURL: "https://cdn.jsdelivr.net/pyodide/v0.25.0/full/",
-    });
-
+async function executeRealPyodide(pyodide, command, cwd, timeout, maxMemoryMb, startTime) {
     const args = command.slice(1);
     let code = '';
 
@@ -231,16 +295,22 @@ async function executeRealPyodide(command, cwd, timeout, maxMemoryMb, startTime)
         code = await fs.readFile(scriptPath, 'utf-8');
     }
 
+    // Capture Python output instead of letting it reach our stdout
+    const stdout = [];
+    const stderr = [];
+    pyodide.setStdout({ batched: (line) => stdout.push(line + '\n') });
+    pyodide.setStderr({ batched: (line) => stderr.push(line + '\n') });
+
     // Setup timeout
     const timeoutMs = timeout * 1000;
     const executionPromise = executeWithTimeout(pyodide, code, timeoutMs);
 
     try {
-        const output = await executionPromise;
+        await executionPromise;
 
         return {
-            stdout: output,
-            stderr: "",
+            stdout: stdout.join(''),
+            stderr: stderr.join(''),
             exitCode: 0,
             durationMs: Date.now() - startTime,
             memoryPeakMb: process.memoryUsage().heapUsed / 1024 / 1024
@@ -252,8 +322,8 @@ async function executeRealPyodide(command, cwd, timeout, maxMemoryMb, startTime)
         }
 
         return {
-            stdout: "",
-            stderr: `Python execution error: ${error.message}\n`,
+            stdout: stdout.join(''),
+            stderr: stderr.join('') + `Python execution error: ${error.message}\n`,
             exitCode: 1,
             durationMs: Date.now() - startTime,
             memoryPeakMb: process.memoryUsage().heapUsed / 1024 / 1024
@@ -270,7 +340,10 @@ async function executeWithTimeout(pyodide, code, timeoutMs) {
             reject(new Error('TIMEOUT'));
         }, timeoutMs);
 
-        pyodide.runPythonAsync(code)
+        // Fresh globals so a reused runtime does not leak state between runs
+        const globals = pyodide.globals.get('dict')();
+
+        pyodide.runPythonAsync(code, { globals })
             .then(result => {
                 clearTimeout(timer);
                 resolve(String(result));
@@ -278,13 +351,18 @@ async function executeWithTimeout(pyodide, code, timeoutMs) {
             .catch(error => {
                 clearTimeout(timer);
                 reject(error);
-            });
+            })
+            .finally(() => globals.destroy());
     });
 }
 
 // Run main function
 if (require.main === module) {
-    main();
+    if (process.argv.includes('--serve')) {
+        serve();
+    } else {
+        main();
+    }
 }
 
-module.exports = { executePyodide, isPyodideInstalled };
+module.exports = { executePyodide, isPyodideInstalled, loadRuntime };
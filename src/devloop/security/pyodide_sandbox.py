@@ -2,16 +2,24 @@
 
 Provides cross-platform sandboxed Python execution using Pyodide runtime
 running in Node.js subprocess.
+
+Loading the Pyodide runtime takes seconds, so starting a runner per command
+puts that cost on every event. With ``warm_workers`` set, the sandbox keeps
+long-lived runners (``pyodide_runner.js --serve``) that load the runtime once
+and answer one JSON request per line. A worker that times out or is
+cancelled is killed, and one that crashed, served ``warm_worker_max_runs``
+requests or grew past ``max_memory_mb`` is replaced by a fresh one.
 """
 
 from __future__ import annotations
 
 import asyncio
+import itertools
 import json
 import logging
 import shutil
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from devloop.security.sandbox import (
     CommandNotAllowedError,
@@ -24,6 +32,331 @@ from devloop.security.audit_logger import get_audit_logger
 
 logger = logging.getLogger(__name__)
 
+# Seconds a worker may take to load the runtime before it is given up on
+WORKER_START_TIMEOUT = 60.0
+
+# Response lines carry the command's whole output
+_STREAM_LIMIT = 16 * 1024 * 1024
+
+
+class PyodideWorkerError(RuntimeError):
+    """A Pyodide worker could not be started or stopped responding."""
+
+
+class PyodideWorker:
+    """One long-lived ``pyodide_runner.js --serve`` process.
+
+    Args:
+        node_path: Node.js executable
+        runner: Path to ``pyodide_runner.js``
+        max_memory_mb: V8 heap limit for the process
+        on_started: Called with the PID once the process runs
+        on_exited: Called with the PID once the process is gone
+    """
+
+    def __init__(
+        self,
+        node_path: str,
+        runner: Path,
+        max_memory_mb: int = 500,
+        on_started: Optional[Callable[[int], None]] = None,
+        on_exited: Optional[Callable[[int], None]] = None,
+    ):
+        self.node_path = node_path
+        self.runner = runner
+        self.max_memory_mb = max_memory_mb
+        self.on_started = on_started
+        self.on_exited = on_exited
+        self.runs = 0
+        self.rss_mb = 0.0
+        self._ids = itertools.count(1)
+        self._process: Optional[asyncio.subprocess.Process] = None
+
+    @property
+    def pid(self) -> Optional[int]:
+        """PID of the worker process, if running."""
+        return self._process.pid if self._process else None
+
+    @property
+    def alive(self) -> bool:
+        """Whether the process is still running."""
+        return self._process is not None and self._process.returncode is None
+
+    async def start(self, timeout: float = WORKER_START_TIMEOUT) -> None:
+        """Start the process and wait until the runtime is loaded.
+
+        Raises:
+            PyodideWorkerError: If the runner fails to start
+        """
+        self._process = await asyncio.create_subprocess_exec(
+            self.node_path,
+            f"--max-old-space-size={self.max_memory_mb}",
+            str(self.runner),
+            "--serve",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=_STREAM_LIMIT,
+        )
+        if self.on_started is not None:
+            self.on_started(self._process.pid)
+
+        try:
+            ready = await self._read(timeout)
+        except asyncio.TimeoutError as e:
+            raise PyodideWorkerError(
+                f"Pyodide worker not ready within {timeout}s"
+            ) from e
+        except asyncio.CancelledError:
+            await self.close()
+            raise
+        if not ready.get("ready"):
+            await self.close()
+            raise PyodideWorkerError(ready.get("error", "worker failed to start"))
+
+    async def request(self, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Execute one request.
+
+        Args:
+            params: Execution parameters (see ``pyodide_runner.js``)
+            timeout: Seconds to wait for the response
+
+        Returns:
+            The runner's result
+
+        Raises:
+            PyodideWorkerError: If the worker died or answered out of turn
+            asyncio.TimeoutError: If no response came in time; the worker is
+                killed, since running Python code cannot be interrupted
+            asyncio.CancelledError: If the caller was cancelled; the worker
+                is killed for the same reason
+        """
+        if self._process is None or self._process.stdin is None:
+            raise PyodideWorkerError("worker not started")
+
+        request_id = next(self._ids)
+        self.runs += 1
+        try:
+            line = json.dumps({**params, "id": request_id}).encode("utf-8")
+            self._process.stdin.write(line + b"\n")
+            await self._process.stdin.drain()
+        except (ConnectionError, RuntimeError) as e:
+            await self.close()
+            raise PyodideWorkerError(f"worker not accepting requests: {e}") from e
+
+        try:
+            response = await self._read(timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            await self.close()
+            raise
+        if response.get("id") != request_id:
+            await self.close()
+            raise PyodideWorkerError("worker answered a different request")
+
+        self.rss_mb = float(response.get("rssMb") or 0.0)
+        return response
+
+    async def _read(self, timeout: float) -> Dict[str, Any]:
+        """Read one message line."""
+        assert self._process is not None and self._process.stdout is not None
+        try:
+            line = await asyncio.wait_for(self._process.stdout.readline(), timeout)
+        except asyncio.TimeoutError:
+            await self.close()
+            raise
+        except ValueError as e:
+            await self.close()
+            raise PyodideWorkerError(f"invalid worker response: {e}") from e
+
+        if not line:
+            await self.close()
+            raise PyodideWorkerError("worker exited")
+        try:
+            response = json.loads(line)
+        except ValueError as e:
+            await self.close()
+            raise PyodideWorkerError(f"invalid worker response: {e}") from e
+        return response if isinstance(response, dict) else {}
+
+    async def close(self) -> None:
+        """Stop the worker process.
+
+        Requests are answered in order and cannot be interrupted, so the
+        process is killed rather than asked to finish.
+        """
+        process, self._process = self._process, None
+        if process is None:
+            return
+
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass  # Process already dead
+            await process.wait()
+        if self.on_exited is not None:
+            self.on_exited(process.pid)
+
+
+class PyodideWorkerPool:
+    """Hands requests to warm Pyodide workers, replacing spent ones.
+
+    Workers are started on demand up to ``size``. A worker that has served
+    ``max_runs`` requests or whose resident memory exceeds ``max_memory_mb``
+    is retired after answering; one that timed out, was cancelled or crashed
+    is retired at once. A replacement is started in the background so the
+    next request finds it loaded.
+
+    Args:
+        node_path: Node.js executable
+        runner: Path to ``pyodide_runner.js``
+        size: Number of workers kept warm
+        max_runs: Requests after which a worker is replaced
+        max_memory_mb: Memory cap per worker
+        on_started: Called with each worker's PID once it runs
+        on_exited: Called with each worker's PID once it is gone
+    """
+
+    def __init__(
+        self,
+        node_path: str,
+        runner: Path,
+        size: int = 1,
+        max_runs: int = 100,
+        max_memory_mb: int = 500,
+        on_started: Optional[Callable[[int], None]] = None,
+        on_exited: Optional[Callable[[int], None]] = None,
+    ):
+        self.node_path = node_path
+        self.runner = runner
+        self.size = max(1, size)
+        self.max_runs = max_runs
+        self.max_memory_mb = max_memory_mb
+        self.on_started = on_started
+        self.on_exited = on_exited
+        # None marks a slot whose replacement worker failed to start
+        self._idle: asyncio.Queue[Optional[PyodideWorker]] = asyncio.Queue()
+        self._workers: List[PyodideWorker] = []
+        self._starting = 0
+        self._replacements: Set[asyncio.Task] = set()
+        self.recycled = 0
+
+    async def run(self, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Execute a request on an idle worker.
+
+        See :meth:`PyodideWorker.request` for arguments and errors.
+
+        Raises:
+            PyodideWorkerError: If no worker could be started, or the worker
+                died during the request
+        """
+        worker = await self._acquire()
+        try:
+            response = await worker.request(params, timeout)
+        except BaseException:
+            await self._retire(worker)
+            raise
+
+        if worker.runs >= self.max_runs:
+            logger.debug(f"Replacing Pyodide worker {worker.pid}: {worker.runs} runs")
+            await self._retire(worker)
+        elif worker.rss_mb > self.max_memory_mb:
+            logger.info(
+                f"Replacing Pyodide worker {worker.pid}: {worker.rss_mb:.0f}MB "
+                f"over {self.max_memory_mb}MB limit"
+            )
+            await self._retire(worker)
+        else:
+            self._idle.put_nowait(worker)
+        return response
+
+    async def close(self) -> None:
+        """Stop all workers, including ones still starting."""
+        for task in list(self._replacements):
+            task.cancel()
+        await asyncio.gather(*self._replacements, return_exceptions=True)
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            await worker.close()
+        self._idle = asyncio.Queue()
+
+    async def _acquire(self) -> PyodideWorker:
+        """Get an idle live worker, starting one if the pool has room."""
+        while True:
+            if self._idle.empty() and len(self._workers) + self._starting < self.size:
+                return await self._spawn()
+            worker = await self._idle.get()
+            if worker is None:
+                continue  # Slot is free again; start a worker if still room
+            if worker.alive:
+                return worker
+            # Died while idle; start another instead
+            await self._retire(worker)
+
+    async def _spawn(self, reserved: bool = False) -> PyodideWorker:
+        """Start a new worker and add it to the pool.
+
+        Args:
+            reserved: The caller already counts the worker in ``_starting``
+        """
+        worker = PyodideWorker(
+            self.node_path,
+            self.runner,
+            max_memory_mb=self.max_memory_mb,
+            on_started=self.on_started,
+            on_exited=self.on_exited,
+        )
+        if not reserved:
+            self._starting += 1
+        try:
+            await worker.start()
+        except BaseException:
+            await worker.close()
+            raise
+        finally:
+            if not reserved:
+                self._starting -= 1
+        self._workers.append(worker)
+        return worker
+
+    async def _retire(self, worker: PyodideWorker) -> None:
+        """Close worker and start a replacement in the background."""
+        await worker.close()
+        if worker in self._workers:
+            self._workers.remove(worker)
+        self.recycled += 1
+
+        # Count the replacement at once so _acquire does not start another
+        self._starting += 1
+        task = asyncio.create_task(self._replenish())
+        self._replacements.add(task)
+        task.add_done_callback(self._replenished)
+
+    def _replenished(self, task: asyncio.Task) -> None:
+        """Release the slot of a replacement cancelled before it started."""
+        if task in self._replacements:
+            self._release_reservation(task)
+
+    def _release_reservation(self, task: asyncio.Task) -> None:
+        """Stop counting the replacement started by task in ``_starting``."""
+        self._replacements.discard(task)
+        self._starting -= 1
+
+    async def _replenish(self) -> None:
+        """Start a worker for the idle queue."""
+        task = asyncio.current_task()
+        assert task is not None
+        worker: Optional[PyodideWorker] = None
+        try:
+            worker = await self._spawn(reserved=True)
+        except (PyodideWorkerError, OSError) as e:
+            # Wake a waiting request so it starts one on demand
+            logger.warning(f"Could not restart Pyodide worker: {e}")
+        finally:
+            # Before waking a request, which checks the slots in use
+            self._release_reservation(task)
+        self._idle.put_nowait(worker)
+
 
 class PyodideSandbox(SandboxExecutor):
     """WASM-based sandbox using Pyodide runtime.
@@ -46,6 +379,7 @@ class PyodideSandbox(SandboxExecutor):
         self._node_path: Optional[str] = None
         self._pyodide_runner: Optional[Path] = None
         self._runner_checked: bool = False
+        self._pool: Optional[PyodideWorkerPool] = None
 
     async def is_available(self) -> bool:
         """Check if Node.js and Pyodide runner are available.
@@ -165,35 +499,15 @@ class PyodideSandbox(SandboxExecutor):
         # Prepare execution parameters
         exec_params = self._prepare_execution(cmd, cwd, env)
 
-        # Execute in Node.js subprocess
         self._start_timer()
 
-        assert self._node_path is not None
         try:
-            process = await asyncio.create_subprocess_exec(
-                self._node_path,
-                str(self._pyodide_runner),
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            # Send execution parameters via stdin
-            stdin_data = json.dumps(exec_params).encode("utf-8")
-
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(input=stdin_data),
-                timeout=self.config.timeout_seconds,
-            )
+            if self.config.warm_workers:
+                result_data = await self._execute_pooled(exec_params)
+            else:
+                result_data = await self._execute_once(exec_params)
 
         except asyncio.TimeoutError:
-            # Kill process if it exceeds timeout
-            try:
-                process.kill()
-                await process.wait()
-            except ProcessLookupError:
-                pass
-
             duration_ms = self._get_duration_ms()
 
             audit_logger.log_timeout(
@@ -209,29 +523,14 @@ class PyodideSandbox(SandboxExecutor):
 
         duration_ms = self._get_duration_ms()
 
-        # Parse result from stdout (JSON format)
-        try:
-            result_data = json.loads(stdout.decode("utf-8"))
-            result = SandboxResult(
-                stdout=result_data.get("stdout", ""),
-                stderr=result_data.get("stderr", ""),
-                exit_code=result_data.get("exitCode", process.returncode or 1),
-                duration_ms=duration_ms,
-                memory_peak_mb=result_data.get("memoryPeakMb", 0.0),
-                cpu_usage_percent=0.0,  # WASM doesn't provide CPU metrics
-            )
-
-        except (json.JSONDecodeError, KeyError) as e:
-            # If JSON parsing fails, treat as error
-            logger.error(f"Failed to parse Pyodide result: {e}")
-            result = SandboxResult(
-                stdout="",
-                stderr=f"Pyodide execution error: {stderr.decode('utf-8', errors='replace')}",
-                exit_code=1,
-                duration_ms=duration_ms,
-                memory_peak_mb=0.0,
-                cpu_usage_percent=0.0,
-            )
+        result = SandboxResult(
+            stdout=result_data.get("stdout", ""),
+            stderr=result_data.get("stderr", ""),
+            exit_code=result_data["exitCode"],
+            duration_ms=duration_ms,
+            memory_peak_mb=result_data.get("memoryPeakMb", 0.0),
+            cpu_usage_percent=0.0,  # WASM doesn't provide CPU metrics
+        )
 
         # Log execution
         audit_logger.log_execution(
@@ -243,6 +542,102 @@ class PyodideSandbox(SandboxExecutor):
 
         return result
 
+    async def close(self) -> None:
+        """Stop the warm workers."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            await pool.close()
+
+    async def _execute_once(self, exec_params: Dict) -> Dict[str, Any]:
+        """Run one request in a runner process started for it.
+
+        Returns:
+            The runner's result, with ``exitCode`` always set
+
+        Raises:
+            asyncio.TimeoutError: If execution exceeds the timeout
+        """
+        assert self._node_path is not None
+        process = await asyncio.create_subprocess_exec(
+            self._node_path,
+            str(self._pyodide_runner),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        self._process_started(process.pid)
+
+        # Send execution parameters via stdin
+        stdin_data = json.dumps(exec_params).encode("utf-8")
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(input=stdin_data),
+                timeout=self.config.timeout_seconds,
+            )
+            self._process_exited(process.pid)
+
+        except asyncio.CancelledError:
+            # Superseded by a newer run; don't leave the runtime running
+            await self._terminate(process)
+            raise
+
+        except asyncio.TimeoutError:
+            # Kill process if it exceeds timeout
+            try:
+                process.kill()
+                await process.wait()
+            except ProcessLookupError:
+                pass
+            self._process_exited(process.pid)
+            raise
+
+        # Parse result from stdout (JSON format)
+        try:
+            result_data: Dict[str, Any] = json.loads(stdout.decode("utf-8"))
+            result_data.setdefault("exitCode", process.returncode or 1)
+            return result_data
+
+        except (json.JSONDecodeError, AttributeError) as e:
+            # If JSON parsing fails, treat as error
+            logger.error(f"Failed to parse Pyodide result: {e}")
+            return {
+                "stderr": f"Pyodide execution error: {stderr.decode('utf-8', errors='replace')}",
+                "exitCode": 1,
+            }
+
+    async def _execute_pooled(self, exec_params: Dict) -> Dict[str, Any]:
+        """Run one request on a warm worker.
+
+        Returns:
+            The runner's result, with ``exitCode`` always set
+
+        Raises:
+            asyncio.TimeoutError: If execution exceeds the timeout
+        """
+        if self._pool is None:
+            assert self._node_path is not None and self._pyodide_runner is not None
+            self._pool = PyodideWorkerPool(
+                self._node_path,
+                self._pyodide_runner,
+                size=self.config.warm_workers,
+                max_runs=self.config.warm_worker_max_runs,
+                max_memory_mb=self.config.max_memory_mb,
+                on_started=self._process_started,
+                on_exited=self._process_exited,
+            )
+
+        try:
+            result_data = await self._pool.run(
+                exec_params, timeout=self.config.timeout_seconds
+            )
+        except PyodideWorkerError as e:
+            logger.error(f"Pyodide worker failed: {e}")
+            return {"stderr": f"Pyodide execution error: {e}", "exitCode": 1}
+
+        result_data.setdefault("exitCode", 1)
+        return result_data
+
     def _prepare_execution(
         self, cmd: List[str], cwd: Path, env: Optional[Dict[str, str]]
     ) -> Dict:
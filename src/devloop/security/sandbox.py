@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Literal, Optional
+from typing import Callable, Dict, List, Literal, Optional
+
+from devloop.security.cgroups_helper import CgroupsManager
 
 # Default tools allowed across all sandbox implementations
 DEFAULT_ALLOWED_TOOLS = [
@@ -45,6 +48,9 @@ class SandboxConfig:
         allowed_tools: Whitelist of executable names
         allowed_network_domains: Whitelist of network domains
         allowed_env_vars: Whitelist of environment variable names
+        warm_workers: Long-lived runner processes reused across commands
+            (Pyodide only; 0 starts a runner per command)
+        warm_worker_max_runs: Commands after which a warm worker is replaced
     """
 
     mode: Literal["capsule", "bubblewrap", "seccomp", "none", "auto"] = "auto"
@@ -56,6 +62,8 @@ class SandboxConfig:
     )
     allowed_network_domains: List[str] = field(default_factory=list)
     allowed_env_vars: List[str] = field(default_factory=list)
+    warm_workers: int = 0
+    warm_worker_max_runs: int = 100
 
     def __post_init__(self):
         """Validate configuration."""
@@ -65,6 +73,10 @@ class SandboxConfig:
             raise ValueError("max_cpu_percent must be between 1 and 100")
         if self.timeout_seconds <= 0:
             raise ValueError("timeout_seconds must be positive")
+        if self.warm_workers < 0:
+            raise ValueError("warm_workers must not be negative")
+        if self.warm_worker_max_runs <= 0:
+            raise ValueError("warm_worker_max_runs must be positive")
 
 
 @dataclass
@@ -108,6 +120,12 @@ class SandboxExecutor(ABC):
         """
         self.config = config
         self._start_time: Optional[float] = None
+        # Set by AgentSandboxHelper to attribute tool processes to its agent
+        self.agent_name: Optional[str] = None
+        self.on_process_started: Optional[
+            Callable[[int, Optional[CgroupsManager]], None]
+        ] = None
+        self.on_process_exited: Optional[Callable[[int], None]] = None
 
     @abstractmethod
     async def execute(
@@ -151,6 +169,44 @@ class SandboxExecutor(ABC):
         """
         pass
 
+    async def close(self) -> None:
+        """Release resources kept between executions.
+
+        Sandboxes that keep nothing warm have nothing to release.
+        """
+
+    def _process_started(
+        self, pid: int, cgroup: Optional[CgroupsManager] = None
+    ) -> None:
+        """Report a started tool process (and its cgroup, if any)."""
+        if self.on_process_started is not None:
+            self.on_process_started(pid, cgroup)
+
+    def _process_exited(self, pid: int) -> None:
+        """Report that a tool process has exited."""
+        if self.on_process_exited is not None:
+            self.on_process_exited(pid)
+
+    async def _terminate(
+        self, process: asyncio.subprocess.Process, grace: float = 2.0
+    ) -> None:
+        """Stop a tool process whose run was cancelled.
+
+        Sends SIGTERM so the tool can clean up, and SIGKILL if it is still
+        running after ``grace`` seconds.
+        """
+        try:
+            if process.returncode is None:
+                process.terminate()
+                try:
+                    await asyncio.wait_for(process.wait(), grace)
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+        except ProcessLookupError:
+            pass  # Process already dead
+        self._process_exited(process.pid)
+
     def _start_timer(self) -> None:
         """Start execution timer."""
         self._start_time = time.perf_counter()
@@ -8,6 +8,7 @@ Tests the hooks that run automatically in Claude Code:
 - claude-file-protection: Block protected file writes
 """
 
+import asyncio
 import json
 import os
 import subprocess
@@ -883,6 +884,58 @@ class TestPostToolUseHook:
         assert "5 issues" in stdout, "Should show count"
         assert "and 4 more" in stdout, "Should indicate more findings"
 
+    @pytest.mark.asyncio
+    async def test_uses_running_daemon(self, hook_tester):
+        """Hook should answer from the daemon's query socket when it runs."""
+        from devloop.core.context_store import ContextStore, Finding
+        from devloop.core.query_server import QueryServer
+
+        project_root = hook_tester.project_root
+        context_dir = project_root / ".devloop" / "context"
+        store = ContextStore(
+            context_dir=context_dir,
+            enable_path_validation=False,
+            index_debounce=60,  # Keep snapshot files from being written
+        )
+        await store.initialize()
+        await store.add_finding(
+            Finding(
+                id="live-1",
+                agent="linter",
+                timestamp="2025-01-01T00:00:00Z",
+                file=str(project_root / "live.py"),
+                line=7,
+                message="Found by the daemon",
+                blocking=True,
+            )
+        )
+        server = QueryServer(project_root, store)
+        if not await server.start():
+            pytest.skip("Query socket unavailable")
+
+        try:
+            env = dict(os.environ, CLAUDE_PROJECT_DIR=str(project_root))
+            proc = await asyncio.create_subprocess_exec(
+                str(hook_tester.hooks_dir / "claude-post-tool-use"),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                env=env,
+                cwd=project_root,
+            )
+            input_data = {
+                "tool_name": "Edit",
+                "tool_input": {"file_path": str(project_root / "live.py")},
+            }
+            stdout, _ = await proc.communicate(json.dumps(input_data).encode())
+            snapshot_written = (context_dir / "immediate.json").exists()
+        finally:
+            await server.stop()
+            await store.close()
+
+        assert proc.returncode == 0
+        assert not snapshot_written
+        assert "Line 7: Found by the daemon [linter]" in stdout.decode()
+
 
 class TestHooksDocumentation:
     """Test that hook documentation is accurate."""
@@ -162,6 +162,24 @@ class TestTestRunnerConfig:
         assert config.respect_site_packages is True
         assert "**/site-packages/**" in config.exclude_paths
 
+    def test_warm_workers_default_disabled(self):
+        """Warm pytest workers are opt-in."""
+        config = TestRunnerConfig({})
+
+        assert config.warm_workers is False
+        assert config.warm_worker_count == 1
+        assert config.warm_worker_max_runs == 100
+
+    def test_warm_workers_custom(self):
+        """Test custom warmWorkers configuration."""
+        config = TestRunnerConfig(
+            {"warmWorkers": {"enabled": True, "workers": 2, "maxRuns": 10}}
+        )
+
+        assert config.warm_workers is True
+        assert config.warm_worker_count == 2
+        assert config.warm_worker_max_runs == 10
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,102 @@
+"""Microbenchmarks for EventBus subscription dispatch.
+
+Measures emit cost as the number of subscriptions grows. With the dispatch
+index, emit cost should depend on the number of *matching* subscribers, not
+on the total number of subscription patterns.
+
+Run with: pytest tests/performance/test_event_dispatch_benchmarks.py -v -s
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+
+import pytest
+
+from devloop.core.event import Event, EventBus
+
+# Event store is not initialized here; keep its warnings out of the timings
+logging.getLogger("devloop.core.event_store").setLevel(logging.ERROR)
+
+SUBSCRIPTION_COUNTS = [10, 100, 1000]
+
+
+async def build_bus(num_subscriptions: int) -> EventBus:
+    """Create a bus with a realistic core plus N unrelated subscriptions."""
+    event_bus = EventBus()
+    for pattern in ("file:*", "agent:*", "*"):
+        await event_bus.subscribe(pattern, asyncio.Queue())
+    for i in range(num_subscriptions):
+        await event_bus.subscribe(f"custom:{i}:event", asyncio.Queue())
+        await event_bus.subscribe(f"plugin{i}:*", asyncio.Queue())
+    return event_bus
+
+
+def linear_fan_out(event_bus: EventBus, event_type: str) -> list:
+    """Reference implementation: scan every pattern (pre-index behaviour)."""
+    notified = []
+    for pattern, queues in event_bus._subscribers.items():
+        if event_bus._matches_pattern(event_type, pattern):
+            notified.extend(queues)
+    return notified
+
+
+async def time_emit(event_bus: EventBus, iterations: int = 500) -> float:
+    """Median emit cost in microseconds."""
+    times = []
+    for i in range(iterations):
+        event = Event(type="file:modified", payload={"index": i})
+        start = time.perf_counter()
+        await event_bus.emit(event)
+        times.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(times)
+
+
+class TestEmitScaling:
+    """Emit cost vs. number of subscriptions."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.benchmark
+    @pytest.mark.flaky(reruns=2, reruns_delay=1)
+    async def test_emit_cost_vs_subscriptions(self):
+        """Indexed emit stays flat as unrelated subscriptions grow."""
+        results = {}
+        for count in SUBSCRIPTION_COUNTS:
+            event_bus = await build_bus(count)
+            results[count] = await time_emit(event_bus)
+
+        print("\n=== EventBus.emit cost vs. subscriptions ===")
+        for count, cost in results.items():
+            print(f"{count * 2 + 3:>5} patterns: {cost:.1f}us per emit")
+
+        smallest, largest = SUBSCRIPTION_COUNTS[0], SUBSCRIPTION_COUNTS[-1]
+        assert results[largest] < results[smallest] * 3, (
+            f"Emit cost grew from {results[smallest]:.1f}us to "
+            f"{results[largest]:.1f}us with more subscriptions"
+        )
+
+    @pytest.mark.benchmark
+    def test_indexed_resolution_vs_linear_scan(self):
+        """Cached index lookup beats scanning every pattern."""
+        event_bus = asyncio.run(build_bus(SUBSCRIPTION_COUNTS[-1]))
+        iterations = 2000
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            linear_fan_out(event_bus, "file:modified")
+        linear_us = (time.perf_counter() - start) / iterations * 1_000_000
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            event_bus._resolve_queues("file:modified")
+        indexed_us = (time.perf_counter() - start) / iterations * 1_000_000
+
+        print("\n=== Fan-out resolution (2003 patterns) ===")
+        print(f"Linear scan: {linear_us:.2f}us")
+        print(f"Indexed:     {indexed_us:.2f}us")
+
+        assert sorted(map(id, linear_fan_out(event_bus, "file:modified"))) == sorted(
+            map(id, event_bus._resolve_queues("file:modified"))
+        )
+        assert indexed_us < linear_us
@@ -0,0 +1,232 @@
+"""Benchmarks for ImportGraph startup, queries and test selection.
+
+Startup: builds a synthetic project, then compares a cold build (nothing
+cached), a warm build (everything cached) and a build after editing a few
+files.
+
+Selection: for every module in this repository, compares the tests selected
+by name-level resolution and by module-level resolution (``from x import y``
+depends on ``x``) with the tests that import code defined in that module,
+as determined by importing the modules and asking where each imported object
+comes from.
+
+Run with: pytest tests/performance/test_import_graph_benchmarks.py -v -s
+"""
+
+import importlib
+import inspect
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from devloop.core.import_graph import ImportGraph
+
+NUM_PACKAGES = 20
+MODULES_PER_PACKAGE = 25
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+REPO_SRC = REPO_ROOT / "src"
+
+
+class ModuleLevelGraph(ImportGraph):
+    """Previous resolution: `from x import y` depends on x itself."""
+
+    def _resolve_name(
+        self, module_name, importing_file, is_relative, level, name, depth=0
+    ):
+        target = self._resolve_target(module_name, importing_file, is_relative, level)
+        return target, []
+
+
+class RuntimeGraph(ImportGraph):
+    """Reference resolution: import x and look up where y is defined."""
+
+    def _resolve_name(
+        self, module_name, importing_file, is_relative, level, name, depth=0
+    ):
+        static = super()._resolve_name(
+            module_name, importing_file, is_relative, level, name, depth
+        )
+        qualified = module_name
+        if is_relative:
+            if not importing_file.is_relative_to(REPO_SRC):
+                return static
+            package = list(importing_file.parent.relative_to(REPO_SRC).parts)
+            package = package[: len(package) - (level - 1)]
+            qualified = ".".join(package + ([module_name] if module_name else []))
+
+        try:
+            module = importlib.import_module(qualified)
+            obj = module if name == "*" else getattr(module, name)
+        except Exception:
+            return static
+
+        defining = module
+        if inspect.ismodule(obj):
+            defining = obj
+        elif isinstance(getattr(obj, "__module__", None), str):
+            defining = sys.modules.get(obj.__module__, module)
+
+        file = getattr(defining, "__file__", None)
+        if file and Path(file).resolve().is_relative_to(REPO_ROOT):
+            return Path(file).resolve(), []
+        return self._resolve_target(module_name, importing_file, is_relative, level), []
+
+
+def make_project(root: Path) -> Path:
+    """Create packages of inter-importing modules with one test per module."""
+    src = root / "src" / "app"
+    for p in range(NUM_PACKAGES):
+        package = src / f"pkg{p}"
+        package.mkdir(parents=True)
+        (package / "__init__.py").write_text("")
+        for m in range(MODULES_PER_PACKAGE):
+            imports = [f"from app.pkg{p} import mod{m - 1}"] if m else []
+            imports.append(f"from . import mod{(m + 1) % MODULES_PER_PACKAGE}")
+            body = "\n".join(
+                f"def func_{i}(value):\n    return value * {i}\n" for i in range(20)
+            )
+            (package / f"mod{m}.py").write_text("\n".join(imports) + "\n\n" + body)
+
+    tests = root / "tests"
+    tests.mkdir()
+    for p in range(NUM_PACKAGES):
+        for m in range(MODULES_PER_PACKAGE):
+            (tests / f"test_pkg{p}_mod{m}.py").write_text(
+                f"from app.pkg{p}.mod{m} import func_1\n\n"
+                "def test_func():\n    assert func_1(2) == 2\n"
+            )
+    return root
+
+
+def time_build(root: Path, cache_path: Path | None) -> tuple[float, ImportGraph]:
+    """Build a fresh graph and return (seconds, graph)."""
+    graph = ImportGraph(root, src_dirs=[root / "src"], cache_path=cache_path)
+    start = time.perf_counter()
+    graph.build()
+    return time.perf_counter() - start, graph
+
+
+class TestImportGraphStartup:
+    """Cold vs. warm ImportGraph.build()."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.flaky(reruns=2, reruns_delay=1)
+    def test_cold_vs_warm_build(self, tmp_path):
+        """A warm cache skips parsing and gives the same graph."""
+        root = make_project(tmp_path)
+        cache_path = root / ".devloop" / "import_graph.json"
+
+        uncached, reference = time_build(root, None)
+        cold, _ = time_build(root, cache_path)
+        warm, graph = time_build(root, cache_path)
+
+        edited = list((root / "src" / "app" / "pkg0").glob("mod*.py"))[:5]
+        for path in edited:
+            path.write_text(path.read_text() + "\nEXTRA = 1\n")
+        partial, _ = time_build(root, cache_path)
+
+        num_files = NUM_PACKAGES * (MODULES_PER_PACKAGE * 2 + 1)
+        print(f"\n=== ImportGraph.build() on {num_files} files ===")
+        print(f"No cache:          {uncached * 1000:.1f}ms")
+        print(f"Cold (fill cache): {cold * 1000:.1f}ms")
+        print(f"Warm:              {warm * 1000:.1f}ms")
+        print(f"Warm, {len(edited)} edited:    {partial * 1000:.1f}ms")
+
+        changed = root / "src" / "app" / "pkg3" / "mod7.py"
+        assert graph.get_affected_tests(changed) == reference.get_affected_tests(
+            changed
+        )
+        assert warm < cold
+        assert partial < cold
+
+
+class TestAffectedTestQueries:
+    """Repeated and changeset queries against a hub module."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.flaky(reruns=2, reruns_delay=1)
+    def test_memoized_hub_queries(self, tmp_path):
+        """Repeated saves of a hub module reuse its memoized closure."""
+        root = make_project(tmp_path)
+        _, graph = time_build(root, None)
+        hub = root / "src" / "app" / "pkg0" / "mod0.py"
+        iterations = 200
+
+        start = time.perf_counter()
+        first = graph.get_affected_tests(hub)
+        cold_us = (time.perf_counter() - start) * 1_000_000
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            graph.get_affected_tests(hub)
+        warm_us = (time.perf_counter() - start) / iterations * 1_000_000
+
+        changeset = [
+            root / "src" / "app" / f"pkg{p}" / f"mod{p}.py" for p in range(NUM_PACKAGES)
+        ]
+        fresh = ImportGraph(root, src_dirs=[root / "src"])
+        fresh.build()
+        start = time.perf_counter()
+        bulk = fresh.get_affected_tests_for(changeset)
+        bulk_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        union = {t for path in changeset for t in fresh.get_affected_tests(path)}
+        single_ms = (time.perf_counter() - start) * 1000
+
+        print(f"\n=== get_affected_tests() on a hub ({len(first)} tests) ===")
+        print(f"First query:    {cold_us:.0f}us")
+        print(f"Memoized query: {warm_us:.0f}us")
+        print(f"=== {len(changeset)}-file changeset ===")
+        print(f"One traversal:  {bulk_ms:.1f}ms")
+        print(f"Per-file union: {single_ms:.1f}ms")
+
+        assert bulk == sorted(union)
+        assert warm_us < cold_us
+
+
+class TestSelectionPrecision:
+    """Tests selected per changed module in this repository."""
+
+    @pytest.mark.benchmark
+    def test_selection_matches_runtime_dependencies(self):
+        """Name-level resolution selects exactly the affected tests."""
+        graphs = {}
+        for label, cls in (
+            ("actual", RuntimeGraph),
+            ("module-level", ModuleLevelGraph),
+            ("name-level", ImportGraph),
+        ):
+            graphs[label] = cls(REPO_ROOT, src_dirs=[REPO_SRC])
+            graphs[label].build()
+
+        modules = sorted((REPO_SRC / "devloop").rglob("*.py"))
+        selected = {label: [] for label in graphs}
+        recall = {label: [] for label in graphs}
+        extra = {label: 0 for label in graphs}
+        for module in modules:
+            actual = set(graphs["actual"].get_affected_tests(module))
+            for label, graph in graphs.items():
+                tests = set(graph.get_affected_tests(module))
+                selected[label].append(len(tests))
+                extra[label] += len(tests - actual)
+                if actual:
+                    recall[label].append(len(tests & actual) / len(actual))
+
+        print(f"\n=== Tests selected per change ({len(modules)} modules) ===")
+        for label in graphs:
+            print(
+                f"{label:>12}: mean {statistics.mean(selected[label]):.1f}, "
+                f"max {max(selected[label])}, "
+                f"recall {statistics.mean(recall[label]):.1%}, "
+                f"unneeded {extra[label]}"
+            )
+
+        assert statistics.mean(recall["name-level"]) == 1.0
+        assert extra["name-level"] <= extra["module-level"]
+        assert statistics.mean(selected["name-level"]) <= statistics.mean(
+            selected["module-level"]
+        )
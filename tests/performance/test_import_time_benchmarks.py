@@ -0,0 +1,89 @@
+"""Import-time budgets for DevLoop entry points.
+
+Each entry point is imported in a fresh interpreter under
+``python -X importtime``; the cumulative time of its top-level module must
+stay within budget, and the CLI must not pull in agents, subcommand
+modules or rich until a command needs them.
+
+Run with: pytest tests/performance/test_import_time_benchmarks.py -v -s
+"""
+
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+import pytest
+
+RUNS = 3
+
+# Entry point -> cumulative import budget in milliseconds
+BUDGETS_MS = {
+    "devloop": 20,
+    "devloop.core": 200,
+    "devloop.agents": 20,
+    "devloop.collectors": 20,
+    "devloop.security": 20,
+    "devloop.cli.main": 300,
+    "devloop.cli.commands.precommit": 500,
+}
+
+# Modules `import devloop.cli.main` must leave unloaded
+CLI_DEFERRED = (
+    "devloop.agents.",
+    "devloop.cli.commands.",
+    "devloop.collectors.",
+    "devloop.core.manager",
+    "psutil",
+    "rich.console",
+    "watchdog",
+)
+
+
+def import_times(module: str) -> Tuple[float, List[str]]:
+    """Import a module in a new interpreter.
+
+    Returns:
+        Cumulative import time of the module in ms, and every module loaded
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: Dict[str, float] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1000
+    return times[module], list(times)
+
+
+class TestImportTime:
+    """Import-time regression budgets."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.flaky(reruns=2, reruns_delay=1)
+    def test_entry_points_within_budget(self):
+        """Every entry point imports within its budget."""
+        print("\n=== Import time (median of {} runs) ===".format(RUNS))
+        over = []
+        for module, budget in BUDGETS_MS.items():
+            elapsed = statistics.median(import_times(module)[0] for _ in range(RUNS))
+            print(f"{module:35} {elapsed:6.0f}ms (budget {budget}ms)")
+            if elapsed > budget:
+                over.append(module)
+
+        assert not over, f"Over import budget: {over}"
+
+    @pytest.mark.benchmark
+    def test_cli_defers_heavy_imports(self):
+        """The CLI module loads no agents, subcommands or rich at import."""
+        _, loaded = import_times("devloop.cli.main")
+
+        eager = [name for name in loaded if name.startswith(CLI_DEFERRED)]
+
+        assert eager == []
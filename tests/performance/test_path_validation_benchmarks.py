@@ -0,0 +1,49 @@
+"""Benchmarks for path validation on the filesystem event hot path.
+
+Compares ``Path.resolve()`` on every event against the directory cache
+used by the filesystem collector, for files in a deep directory tree.
+
+Run with: pytest tests/performance/test_path_validation_benchmarks.py -v -s
+"""
+
+import time
+
+import pytest
+
+from devloop.security import path_validator
+from devloop.security.path_validator import PathValidator
+
+DEPTH = 12
+FILES = 50
+ROUNDS = 20
+
+
+class TestPathValidationHotPath:
+    """Uncached vs. cached project containment checks."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.flaky(reruns=2, reruns_delay=1)
+    def test_cached_validation_is_faster(self, tmp_path):
+        """Repeated events in one directory skip re-resolving its parents."""
+        deep = tmp_path.joinpath(*(f"level{i}" for i in range(DEPTH)))
+        deep.mkdir(parents=True)
+        paths = [str(deep / f"file{i}.py") for i in range(FILES)]
+        path_validator._directory_cache.clear()
+
+        def measure(validator):
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                for path in paths:
+                    assert validator.is_within_project(path)
+            return time.perf_counter() - start
+
+        uncached = measure(PathValidator(tmp_path))
+        cached = measure(PathValidator(tmp_path, cache_directories=True))
+        path_validator._directory_cache.clear()
+
+        checks = ROUNDS * FILES
+        print(f"\n=== {checks} checks at depth {DEPTH} ===")
+        print(f"Uncached: {uncached * 1e6 / checks:6.1f}us/check")
+        print(f"Cached:   {cached * 1e6 / checks:6.1f}us/check")
+
+        assert cached < uncached
@@ -0,0 +1,60 @@
+"""Benchmarks for Pyodide sandbox per-command cost.
+
+Compares starting ``pyodide_runner.js`` for every command against a warm
+worker that loaded the runtime once. Runs the runner in POC mode, so the
+saving shown is Node.js startup only; with the real runtime each cold start
+also loads Pyodide, which takes seconds.
+
+Run with: pytest tests/performance/test_pyodide_pool_benchmarks.py -v -s
+"""
+
+import statistics
+import time
+
+import pytest
+
+from devloop.security.pyodide_sandbox import PyodideSandbox
+from devloop.security.sandbox import SandboxConfig
+
+ITERATIONS = 20
+
+
+@pytest.fixture(autouse=True)
+def poc_mode(monkeypatch):
+    """Run without the Pyodide npm package."""
+    monkeypatch.setenv("PYODIDE_POC_MODE", "1")
+
+
+class TestPyodideWarmWorkers:
+    """Runner per command vs. warm worker."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.benchmark
+    @pytest.mark.flaky(reruns=2, reruns_delay=1)
+    async def test_warm_worker_per_command_overhead(self, tmp_path):
+        """A warm worker answers without starting a process."""
+        cold = PyodideSandbox(SandboxConfig(allowed_tools=["python3"]))
+        warm = PyodideSandbox(SandboxConfig(allowed_tools=["python3"], warm_workers=1))
+        if not await cold.is_available():
+            pytest.skip("Node.js not available")
+
+        async def median_ms(sandbox):
+            await sandbox.execute(["python3", "-c", "pass"], cwd=tmp_path)
+            times = []
+            for _ in range(ITERATIONS):
+                start = time.perf_counter()
+                await sandbox.execute(["python3", "-c", "pass"], cwd=tmp_path)
+                times.append((time.perf_counter() - start) * 1000)
+            return statistics.median(times)
+
+        try:
+            cold_ms = await median_ms(cold)
+            warm_ms = await median_ms(warm)
+        finally:
+            await warm.close()
+
+        print("\n=== Pyodide sandbox per command (POC mode) ===")
+        print(f"Runner per command: {cold_ms:.2f}ms")
+        print(f"Warm worker:        {warm_ms:.2f}ms")
+
+        assert warm_ms < cold_ms / 2
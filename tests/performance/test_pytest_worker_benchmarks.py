@@ -0,0 +1,149 @@
+"""Benchmarks for save-to-result latency with pytest workers.
+
+Compares the cold path (``pytest --version`` check plus a new ``pytest``
+process per save) with a warm worker re-running the same tests after a
+source edit, and measures how soon a known failure is reported when it is
+run first.
+
+Run with: pytest tests/performance/test_pytest_worker_benchmarks.py -v -s
+"""
+
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from devloop.agents.pytest_pool import PytestWorker, PytestWorkerPool
+
+ITERATIONS = 5
+
+
+def make_project(root: Path) -> Path:
+    """A package of modules with one test file per module."""
+    (root / "pytest.ini").write_text("[pytest]\npythonpath = .\n")
+    pkg = root / "app"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    tests = root / "tests"
+    tests.mkdir()
+    for i in range(20):
+        (pkg / f"mod{i}.py").write_text(
+            f"import json, decimal, dataclasses\n\ndef value():\n    return {i}\n"
+        )
+        (tests / f"test_mod{i}.py").write_text(
+            f"from app.mod{i} import value\n\n"
+            + "".join(
+                f"def test_{n}():\n    assert value() == {i}\n\n" for n in range(10)
+            )
+        )
+    return root
+
+
+def touch(path: Path) -> None:
+    """Simulate a save."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestWarmWorkerLatency:
+    """Cold pytest process vs. warm worker per save."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.flaky(reruns=2, reruns_delay=1)
+    def test_warm_worker_vs_new_process(self, tmp_path):
+        """A warm worker answers a small test run in well under a second."""
+        root = make_project(tmp_path)
+        env = os.environ.copy()
+        env["PATH"] = f"{Path(sys.executable).parent}{os.pathsep}{env['PATH']}"
+        env.pop("PYTEST_ADDOPTS", None)
+        source = root / "app" / "mod3.py"
+        target = "tests/test_mod3.py"
+
+        cold = []
+        for _ in range(ITERATIONS):
+            touch(source)
+            start = time.perf_counter()
+            subprocess.run(
+                ["pytest", "--version"], cwd=root, env=env, capture_output=True
+            )
+            proc = subprocess.run(
+                ["pytest", "-q", "--tb=short", target],
+                cwd=root,
+                env=env,
+                capture_output=True,
+            )
+            cold.append(time.perf_counter() - start)
+            assert proc.returncode == 0
+
+        async def run_warm() -> list:
+            pool = PytestWorkerPool(root, env)
+            try:
+                await pool.start()
+                await pool.run(["-q", target])
+                times = []
+                for _ in range(ITERATIONS):
+                    touch(source)
+                    start = time.perf_counter()
+                    response = await pool.run(["-q", "--tb=short", target], [source])
+                    times.append(time.perf_counter() - start)
+                    assert response["passed"] == 10
+                return times
+            finally:
+                await pool.close()
+
+        warm = asyncio.run(run_warm())
+
+        print("\n=== Save-to-result latency (10 tests) ===")
+        print(f"New pytest process: {statistics.median(cold) * 1000:.0f}ms")
+        print(f"Warm worker:        {statistics.median(warm) * 1000:.0f}ms")
+
+        assert statistics.median(warm) < statistics.median(cold)
+        assert statistics.median(warm) < 1.0
+
+
+class TestFailureFeedbackLatency:
+    """Time until a known failure is reported, in file order vs. failing first."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.flaky(reruns=2, reruns_delay=1)
+    def test_failing_first_reports_sooner(self, tmp_path):
+        """A failing test at the end of a file is reported within the first tests."""
+        (tmp_path / "pytest.ini").write_text("[pytest]\n")
+        (tmp_path / "test_slow.py").write_text(
+            "import time\n\n"
+            + "".join(f"def test_{n}():\n    time.sleep(0.02)\n\n" for n in range(50))
+            + "def test_broken():\n    assert False\n"
+        )
+        env = os.environ.copy()
+        env["PATH"] = f"{Path(sys.executable).parent}{os.pathsep}{env['PATH']}"
+        env.pop("PYTEST_ADDOPTS", None)
+
+        async def first_failure(order: list) -> float:
+            worker = PytestWorker(tmp_path, env)
+            reported = []
+
+            async def on_test(test: dict) -> None:
+                if test["outcome"] == "failed" and not reported:
+                    reported.append(time.perf_counter())
+
+            try:
+                await worker.start()
+                start = time.perf_counter()
+                await worker.run(["-q", "test_slow.py"], order=order, on_test=on_test)
+                return reported[0] - start
+            finally:
+                await worker.close()
+
+        file_order = asyncio.run(first_failure([]))
+        failing_first = asyncio.run(first_failure(["test_slow.py::test_broken"]))
+
+        print("\n=== Time to first failure (51 tests) ===")
+        print(f"File order:    {file_order * 1000:.0f}ms")
+        print(f"Failing first: {failing_first * 1000:.0f}ms")
+
+        assert failing_first < file_order / 2
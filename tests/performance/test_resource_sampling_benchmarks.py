@@ -0,0 +1,84 @@
+"""Benchmarks for event-loop latency under performance monitoring.
+
+Every ``Agent.handle`` call runs inside ``PerformanceMonitor.monitor_operation``.
+Taking resource snapshots with ``psutil``'s blocking ``cpu_percent(interval=0.1)``
+stalls the event loop for ~200ms per call; reading the background sampler's
+ring buffer should not stall it measurably.
+
+Run with: pytest tests/performance/test_resource_sampling_benchmarks.py -v -s
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import psutil
+import pytest
+
+from devloop.core.performance import PerformanceMonitor, ResourceUsage
+
+OPERATIONS = 5
+
+
+def blocking_snapshot() -> ResourceUsage:
+    """Reference implementation: the pre-sampler blocking snapshot."""
+    process = psutil.Process()
+    return ResourceUsage(
+        timestamp=time.time(),
+        cpu_percent=process.cpu_percent(interval=0.1),
+        memory_mb=process.memory_info().rss / (1024 * 1024),
+        memory_percent=process.memory_percent(),
+    )
+
+
+@asynccontextmanager
+async def loop_lag_probe(tick: float = 0.005):
+    """Record the worst scheduling delay of a ticker running alongside."""
+    lags = [0.0]
+    stop = asyncio.Event()
+
+    async def ticker():
+        while not stop.is_set():
+            expected = time.perf_counter() + tick
+            await asyncio.sleep(tick)
+            lags.append(max(0.0, time.perf_counter() - expected))
+
+    task = asyncio.create_task(ticker())
+    try:
+        yield lags
+    finally:
+        stop.set()
+        await task
+
+
+async def worst_lag_ms(monitor: PerformanceMonitor) -> float:
+    """Worst event-loop lag while running monitored no-op operations."""
+    async with loop_lag_probe() as lags:
+        for i in range(OPERATIONS):
+            async with monitor.monitor_operation(f"bench.{i}"):
+                await asyncio.sleep(0.01)
+    return max(lags) * 1000
+
+
+class TestMonitorOperationLatency:
+    """Event-loop latency before and after background sampling."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.benchmark
+    @pytest.mark.flaky(reruns=2, reruns_delay=1)
+    async def test_event_loop_lag_blocking_vs_sampled(self, tmp_path):
+        """Sampled snapshots keep the event loop responsive."""
+        monitor = PerformanceMonitor(tmp_path)
+        ResourceUsage.snapshot()  # Start the sampler outside the measurement
+
+        with patch.object(ResourceUsage, "snapshot", blocking_snapshot):
+            blocking = await worst_lag_ms(monitor)
+        sampled = await worst_lag_ms(monitor)
+
+        print("\n=== Worst event-loop lag during monitor_operation ===")
+        print(f"blocking snapshot: {blocking:.1f}ms")
+        print(f"sampled snapshot:  {sampled:.1f}ms")
+
+        assert blocking >= 90, "Reference snapshot should block ~100ms"
+        assert sampled < 50, f"Event loop stalled {sampled:.1f}ms with sampling"
@@ -316,3 +316,75 @@ class TestConcurrentExecution:
         assert all(r.exit_code == 0 for r in results)
         # Average shouldn't be much worse than single execution
         assert avg_per_task < 200, f"Concurrent overhead too high: {avg_per_task:.2f}ms"
+
+
+class TestWarmSessionOverhead:
+    """Per-command overhead of a reused sandbox session vs. a cold sandbox."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.flaky(reruns=2, reruns_delay=1)
+    def test_warm_directory_setup(self, sandbox_config, tmp_path):
+        """A warm session skips re-validating the directory and rebuilding argv."""
+        cwd = tmp_path.joinpath(*(f"level{i}" for i in range(12)))
+        cwd.mkdir(parents=True)
+        iterations = 200
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            BubblewrapSandbox(sandbox_config)._template(cwd)
+        cold_us = (time.perf_counter() - start) * 1e6 / iterations
+
+        warm = BubblewrapSandbox(sandbox_config)
+        warm._template(cwd)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            warm._template(cwd)
+        warm_us = (time.perf_counter() - start) * 1e6 / iterations
+
+        print("\n=== Working directory setup (depth 12) ===")
+        print(f"Cold: {cold_us:.1f}us/command")
+        print(f"Warm: {warm_us:.1f}us/command")
+
+        assert warm_us < cold_us
+
+    @pytest.mark.asyncio
+    @pytest.mark.benchmark
+    @pytest.mark.flaky(reruns=2, reruns_delay=1)
+    async def test_cold_vs_warm_command_overhead(self, sandbox_config, bench_workspace):
+        """Compare no sandbox, a fresh bwrap sandbox per command and a session."""
+        if not await BubblewrapSandbox(sandbox_config).is_available():
+            pytest.skip("Bubblewrap not available")
+
+        no_sandbox = NoSandbox(sandbox_config)
+        session = BubblewrapSandbox(sandbox_config)
+        iterations = 10
+
+        async def cold_execute(cmd, cwd):
+            sandbox = BubblewrapSandbox(sandbox_config)
+            try:
+                return await sandbox.execute(cmd, cwd=cwd)
+            finally:
+                await sandbox.close()
+
+        async def median_ms(execute):
+            await execute(["echo", "warmup"], cwd=bench_workspace)
+            times = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                await execute(["echo", "test"], cwd=bench_workspace)
+                times.append((time.perf_counter() - start) * 1000)
+            return statistics.median(times)
+
+        try:
+            baseline = await median_ms(no_sandbox.execute)
+            cold = await median_ms(cold_execute)
+            warm = await median_ms(session.execute)
+        finally:
+            await session.close()
+
+        print("\n=== Per-command overhead (echo) ===")
+        print(f"No sandbox:   {baseline:.2f}ms")
+        print(f"Cold bwrap:   {cold:.2f}ms (+{cold - baseline:.2f}ms)")
+        print(f"Warm session: {warm:.2f}ms (+{warm - baseline:.2f}ms)")
+
+        assert warm <= cold * 1.1
@@ -0,0 +1,44 @@
+"""Benchmarks for tool and runner discovery at startup.
+
+Compares probing every runner and tool with a ``--version`` process
+against a warm start served from the probe cache.
+
+Run with: pytest tests/performance/test_tool_discovery_benchmarks.py -v -s
+"""
+
+import time
+
+import pytest
+
+from devloop.core.tool_dependencies import ToolDependencyManager
+from devloop.core.tool_registry import ToolRegistry
+
+
+class TestToolDiscoveryStartup:
+    """Uncached vs. cached tool discovery."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.flaky(reruns=2, reruns_delay=1)
+    def test_warm_discovery_runs_no_processes(self, tmp_path):
+        """A warm start only stats binaries."""
+        cache = tmp_path / "tool_versions.json"
+
+        start = time.perf_counter()
+        ToolRegistry(cache_path=None)
+        ToolDependencyManager.check_all_tools(cache_path=None)
+        uncached = time.perf_counter() - start
+
+        ToolRegistry(cache_path=cache)
+        ToolDependencyManager.check_all_tools(cache_path=cache)
+
+        start = time.perf_counter()
+        ToolRegistry(cache_path=cache)
+        ToolDependencyManager.check_all_tools(cache_path=cache)
+        warm = time.perf_counter() - start
+
+        print("\n=== Runner and tool discovery ===")
+        print(f"Uncached (concurrent probes): {uncached * 1000:.0f}ms")
+        print(f"Warm cache:                   {warm * 1000:.0f}ms")
+
+        assert warm < uncached
+        assert warm < 0.1
@@ -1,6 +1,9 @@
 """Tests for path validation and symlink protection."""
 
+import os
+
 import pytest
+from devloop.security import path_validator
 from devloop.security.path_validator import (
     PathTraversalError,
     PathValidationError,
@@ -488,3 +491,104 @@ class TestMaliciousSymlinkScenarios:
         # Re-validation should fail
         with pytest.raises(SymlinkError):
             validator.validate(normal)
+
+
+@pytest.fixture
+def cached(tmp_path):
+    """A project with a nested file and a directory-caching validator."""
+    path_validator._directory_cache.clear()
+    project = tmp_path / "project"
+    (project / "src" / "pkg").mkdir(parents=True)
+    (project / "src" / "pkg" / "mod.py").write_text("x = 1\n")
+    yield project, PathValidator(project, cache_directories=True)
+    path_validator._directory_cache.clear()
+
+
+class TestDirectoryCache:
+    """Test validators that cache resolved directories."""
+
+    def test_matches_uncached_validation(self, cached, tmp_path):
+        """Cached and uncached validators agree, including on symlinks."""
+        project, validator = cached
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "data.txt").write_text("secret")
+        (project / "escape").symlink_to(outside)
+        (project / "link.py").symlink_to(project / "src" / "pkg" / "mod.py")
+        uncached = PathValidator(project)
+
+        for path in [
+            project / "src" / "pkg" / "mod.py",
+            project / "src" / "pkg" / "deleted.py",
+            project / "escape" / "data.txt",
+            project / "link.py",
+            str(project / "src" / ".." / "src" / "pkg" / "mod.py"),
+        ]:
+            for _ in range(2):  # Cold, then warm
+                assert validator.is_within_project(path) == (
+                    uncached.is_within_project(path)
+                ), path
+
+        with pytest.raises(SymlinkError):
+            validator.validate(project / "link.py")
+
+    def test_warm_lookup_uses_constant_syscalls(self, cached, monkeypatch):
+        """A cached directory costs one lstat and one stat per path."""
+        project, validator = cached
+        path = project / "src" / "pkg" / "mod.py"
+        validator.validate(path)
+        expected = path.resolve()
+        calls = []
+        for name in ("lstat", "stat"):
+            real = getattr(os, name)
+            monkeypatch.setattr(
+                os,
+                name,
+                lambda *args, _real=real, _name=name, **kwargs: (
+                    calls.append(_name) or _real(*args, **kwargs)
+                ),
+            )
+
+        assert validator.resolve_path(path) == expected
+        assert sorted(calls) == ["lstat", "stat"]
+
+    def test_replaced_directory_detected_by_identity(self, cached, tmp_path):
+        """A directory replaced by a symlink elsewhere is not trusted."""
+        project, validator = cached
+        pkg = project / "src" / "pkg"
+        assert validator.is_within_project(pkg / "mod.py")
+
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "mod.py").write_text("secret")
+        (pkg / "mod.py").unlink()
+        pkg.rmdir()
+        pkg.symlink_to(outside)
+
+        assert not validator.is_within_project(pkg / "mod.py")
+
+    def test_moved_directory_needs_invalidation(self, cached, tmp_path):
+        """Moving a directory out and linking it back is caught by invalidate."""
+        project, validator = cached
+        pkg = project / "src" / "pkg"
+        assert validator.is_within_project(pkg / "mod.py")
+
+        moved = tmp_path / "moved"
+        pkg.rename(moved)
+        pkg.symlink_to(moved)
+        validator.invalidate(pkg, directory=False)
+
+        assert not validator.is_within_project(pkg / "mod.py")
+
+    def test_invalidate_drops_subdirectories(self, cached):
+        """Invalidating a directory forgets everything below it."""
+        project, validator = cached
+        validator.validate(project / "src" / "pkg" / "mod.py")
+        validator.validate(project / "src" / "other.py")
+        assert len(path_validator._directory_cache) == 2
+
+        validator.invalidate(project / "src" / "pkg" / "mod.py", directory=False)
+        assert len(path_validator._directory_cache) == 2
+
+        validator.invalidate(project / "src")
+        assert len(path_validator._directory_cache) == 0
@@ -3,12 +3,18 @@
 Tests the PyodideSandbox implementation in POC mode (without full Pyodide installation).
 """
 
+import asyncio
 import pytest
 import shutil
 import os
 
-from devloop.security.sandbox import SandboxConfig
-from devloop.security.pyodide_sandbox import PyodideSandbox
+from devloop.security.sandbox import SandboxConfig, SandboxTimeoutError
+from devloop.security.pyodide_sandbox import (
+    PyodideSandbox,
+    PyodideWorker,
+    PyodideWorkerError,
+    PyodideWorkerPool,
+)
 
 
 @pytest.fixture
@@ -269,3 +275,224 @@ class TestPyodideSandboxIntegration:
         # so concurrent executions are independent
         # This is a documentation test, not a functional requirement
         pass
+
+
+# Speaks the worker protocol; "-c hang" never answers and "-c crash" exits
+FAKE_RUNNER = """
+const readline = require('readline');
+process.stdout.write(JSON.stringify({ ready: true }) + '\\n');
+readline.createInterface({ input: process.stdin }).on('line', (line) => {
+    const request = JSON.parse(line);
+    const code = request.command[2];
+    if (code === 'hang') return;
+    if (code === 'crash') process.exit(3);
+    process.stdout.write(JSON.stringify(
+        { id: request.id, stdout: code, exitCode: 0, rssMb: 1 }) + '\\n');
+});
+"""
+
+
+@pytest.fixture
+def node():
+    """Path to Node.js."""
+    path = shutil.which("node")
+    if path is None:
+        pytest.skip("Node.js not available for testing")
+    return path
+
+
+@pytest.fixture
+def fake_runner(tmp_path):
+    """A runner that can be made to hang or crash."""
+    path = tmp_path / "fake_runner.js"
+    path.write_text(FAKE_RUNNER)
+    return path
+
+
+def inline(code):
+    """Request parameters for ``python3 -c code``."""
+    return {"command": ["python3", "-c", code], "cwd": "/"}
+
+
+async def warm_sandbox(workspace, **config):
+    """A pooled sandbox that has served one command."""
+    sandbox = PyodideSandbox(
+        SandboxConfig(allowed_tools=["python3"], warm_workers=1, **config)
+    )
+    if not await sandbox.is_available():
+        pytest.skip("Pyodide sandbox not available")
+    await sandbox.execute(["python3", "-c", "pass"], cwd=workspace)
+    return sandbox
+
+
+def worker_pids(sandbox):
+    """PIDs of the sandbox's live workers."""
+    return [worker.pid for worker in sandbox._pool._workers]
+
+
+class TestPyodideWorkerPool:
+    """Test warm Pyodide workers."""
+
+    @pytest.mark.asyncio
+    async def test_pooled_matches_single_runs(self, test_workspace):
+        """Warm workers answer like a runner started per command."""
+        sandbox = await warm_sandbox(test_workspace)
+        single = PyodideSandbox(SandboxConfig(allowed_tools=["python3"]))
+        try:
+            pid = worker_pids(sandbox)
+            for cmd in (["python3", "-c", "print(1)"], ["python3", "missing.py"]):
+                pooled = await sandbox.execute(cmd, cwd=test_workspace)
+                expected = await single.execute(cmd, cwd=test_workspace)
+                assert (pooled.stdout, pooled.exit_code) == (
+                    expected.stdout,
+                    expected.exit_code,
+                )
+
+            assert worker_pids(sandbox) == pid
+        finally:
+            await sandbox.close()
+
+    @pytest.mark.asyncio
+    async def test_worker_recycled_after_max_runs(self, test_workspace):
+        """A worker is replaced once it has served warm_worker_max_runs."""
+        sandbox = await warm_sandbox(test_workspace, warm_worker_max_runs=2)
+        try:
+            first = worker_pids(sandbox)
+            await sandbox.execute(["python3", "-c", "pass"], cwd=test_workspace)
+            result = await sandbox.execute(
+                ["python3", "-c", "pass"], cwd=test_workspace
+            )
+
+            assert result.exit_code == 0
+            assert sandbox._pool.recycled == 1
+            assert worker_pids(sandbox) != first
+        finally:
+            await sandbox.close()
+
+    @pytest.mark.asyncio
+    async def test_worker_over_memory_cap_recycled(self, test_workspace):
+        """A worker whose resident memory exceeds max_memory_mb is replaced."""
+        sandbox = await warm_sandbox(test_workspace, max_memory_mb=16)
+        try:
+            await sandbox.execute(["python3", "-c", "pass"], cwd=test_workspace)
+
+            assert sandbox._pool.recycled == 2
+        finally:
+            await sandbox.close()
+
+    @pytest.mark.asyncio
+    async def test_worker_killed_while_idle_is_replaced(self, test_workspace):
+        """A command never lands on a worker that died between commands."""
+        sandbox = await warm_sandbox(test_workspace)
+        try:
+            worker = sandbox._pool._workers[0]
+            worker._process.kill()
+            await worker._process.wait()
+
+            result = await sandbox.execute(
+                ["python3", "-c", "pass"], cwd=test_workspace
+            )
+
+            assert result.exit_code == 0
+            assert worker_pids(sandbox) != [worker.pid]
+        finally:
+            await sandbox.close()
+
+    @pytest.mark.asyncio
+    async def test_replacing_idle_worker_keeps_pool_size(self, test_workspace):
+        """Replacing a worker that died while idle starts only one worker."""
+        sandbox = await warm_sandbox(test_workspace)
+        try:
+            pool = sandbox._pool
+            worker = pool._workers[0]
+            worker._process.kill()
+            await worker._process.wait()
+
+            await sandbox.execute(["python3", "-c", "pass"], cwd=test_workspace)
+            await asyncio.gather(*pool._replacements)
+
+            assert len(pool._workers) == 1
+            assert pool._starting == 0
+        finally:
+            await sandbox.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_worker(self, test_workspace, fake_runner):
+        """A request that runs too long times out and its worker is replaced."""
+        sandbox = PyodideSandbox(
+            SandboxConfig(allowed_tools=["python3"], warm_workers=1, timeout_seconds=1)
+        )
+        if not await sandbox.is_available():
+            pytest.skip("Pyodide sandbox not available")
+        sandbox._pyodide_runner = fake_runner
+        try:
+            with pytest.raises(SandboxTimeoutError):
+                await sandbox.execute(["python3", "-c", "hang"], cwd=test_workspace)
+            result = await sandbox.execute(["python3", "-c", "ok"], cwd=test_workspace)
+
+            assert (result.stdout, sandbox._pool.recycled) == ("ok", 1)
+        finally:
+            await sandbox.close()
+
+    @pytest.mark.asyncio
+    async def test_crash_reported_and_worker_replaced(self, node, fake_runner):
+        """A worker that dies mid-request fails that request only."""
+        pool = PyodideWorkerPool(node, fake_runner)
+        try:
+            with pytest.raises(PyodideWorkerError):
+                await pool.run(inline("crash"), timeout=5)
+            response = await pool.run(inline("ok"), timeout=5)
+
+            assert response["stdout"] == "ok"
+            assert pool.recycled == 1
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_replacement_frees_slot(self, node, fake_runner, monkeypatch):
+        """A request waiting on a replacement that fails to start starts one."""
+        start = PyodideWorker.start
+        failures = [PyodideWorkerError("replacement failed")]
+
+        async def start_failing_once(worker, *args, **kwargs):
+            if failures:
+                raise failures.pop()
+            await start(worker, *args, **kwargs)
+
+        pool = PyodideWorkerPool(node, fake_runner)
+        try:
+            await pool.run(inline("ok"), timeout=5)
+            monkeypatch.setattr(PyodideWorker, "start", start_failing_once)
+            with pytest.raises(PyodideWorkerError):
+                await pool.run(inline("crash"), timeout=5)
+            response = await asyncio.wait_for(pool.run(inline("ok"), timeout=5), 10)
+
+            assert response["stdout"] == "ok"
+            assert not failures
+            assert pool._starting == 0
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_limited_to_pool_size(self, node, fake_runner):
+        """Concurrent requests share the configured number of workers."""
+        pool = PyodideWorkerPool(node, fake_runner, size=2)
+        try:
+            responses = await asyncio.gather(
+                *(pool.run(inline(str(i)), timeout=5) for i in range(6))
+            )
+
+            assert [r["stdout"] for r in responses] == [str(i) for i in range(6)]
+            assert len(pool._workers) == 2
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_close_stops_workers(self, test_workspace):
+        """Closing the sandbox stops its worker processes."""
+        sandbox = await warm_sandbox(test_workspace)
+        process = sandbox._pool._workers[0]._process
+
+        await sandbox.close()
+
+        assert process.returncode is not None
@@ -0,0 +1,87 @@
+"""Unit tests for LinterAgent ruff handling."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from devloop.agents.linter import LinterAgent
+from devloop.core.result_cache import ResultCache
+from devloop.security.sandbox import SandboxResult
+
+
+def ruff_result(exit_code, stdout="", stderr=""):
+    """Build a sandbox result as returned for a ruff run."""
+    return SandboxResult(
+        stdout=stdout, stderr=stderr, exit_code=exit_code, duration_ms=1
+    )
+
+
+class TestRuffOutput:
+    """Test interpretation of ruff exit codes and output."""
+
+    @pytest.fixture
+    def agent(self):
+        """Create a linter agent with ruff available in its sandbox."""
+        agent = LinterAgent("linter", ["file:modified"], MagicMock())
+        agent.sandbox = MagicMock()
+        agent.sandbox.check_tool_available = AsyncMock(return_value=True)
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_issues_found(self, agent, tmp_path):
+        """Exit code 1 with a JSON list reports the issues."""
+        path = tmp_path / "a.py"
+        issue = {"code": "F401", "filename": str(path)}
+        agent._run_ruff_command = AsyncMock(
+            return_value=ruff_result(1, json.dumps([issue]))
+        )
+
+        result = (await agent._invoke_ruff([path]))[path]
+
+        assert result.success is True
+        assert result.issues == [issue]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "exit_code, stdout",
+        [(2, ""), (0, "not json"), (1, '{"error": "x"}')],
+    )
+    async def test_errors_are_failures(self, agent, tmp_path, exit_code, stdout):
+        """Crashes, config errors and unparsable output are not clean results."""
+        path = tmp_path / "a.py"
+        agent._run_ruff_command = AsyncMock(
+            return_value=ruff_result(exit_code, stdout, "ruff failed")
+        )
+
+        result = (await agent._invoke_ruff([path]))[path]
+
+        assert result.success is False
+        assert result.error
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, agent, tmp_path):
+        """A failed ruff run is retried on the next lint of the same content."""
+        path = tmp_path / "a.py"
+        path.write_text("import os\n")
+        cache = ResultCache(tmp_path / "cache.db")
+        await cache.initialize()
+        agent._run_ruff_command = AsyncMock(
+            side_effect=[ruff_result(2, stderr="bad config"), ruff_result(0, "[]")]
+        )
+
+        with (
+            patch("devloop.agents.linter.result_cache", cache),
+            patch(
+                "devloop.agents.linter.tool_version",
+                AsyncMock(return_value="ruff 0.5.0"),
+            ),
+        ):
+            first = await agent._run_ruff_batch([path])
+            second = await agent._run_ruff_batch([path])
+
+        await cache.close()
+
+        assert first[path].success is False
+        assert second[path].success is True
+        assert agent._run_ruff_command.call_count == 2
@@ -0,0 +1,394 @@
+"""Tests for pytest workers and the test runner's use of them."""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from devloop.agents.pytest_pool import (
+    PytestWorkerPool,
+    WorkerError,
+    _pytest_interpreter,
+)
+from devloop.agents.test_runner import TestRunnerAgent
+from devloop.core.event import EventBus
+
+
+def _write(path: Path, content: str) -> Path:
+    """Write a file, changing its size or mtime so workers notice."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    existed = path.exists()
+    path.write_text(content)
+    if existed:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    return path
+
+
+@pytest.fixture
+def env():
+    """Worker environment using this interpreter's python and pytest."""
+    environ = os.environ.copy()
+    environ["PATH"] = f"{Path(sys.executable).parent}{os.pathsep}{environ['PATH']}"
+    environ.pop("PYTEST_ADDOPTS", None)
+    return environ
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A project with one module and a test for it."""
+    _write(tmp_path / "app.py", "def value():\n    return 1\n")
+    _write(
+        tmp_path / "tests" / "test_app.py",
+        "from app import value\n\n"
+        "def test_value():\n    assert value() == 1\n\n"
+        "def test_other():\n    assert True\n",
+    )
+    _write(tmp_path / "pytest.ini", "[pytest]\npythonpath = .\n")
+    return tmp_path
+
+
+@pytest.fixture
+async def pool(project, env):
+    """A single-worker pool for the project."""
+    pool = PytestWorkerPool(project, env)
+    yield pool
+    await pool.close()
+
+
+class TestPytestInterpreter:
+    """Test finding the interpreter behind the pytest on PATH."""
+
+    def _script(self, directory: Path, name: str, content: str) -> Path:
+        """Write an executable script."""
+        path = _write(directory / name, content)
+        path.chmod(0o755)
+        return path
+
+    def test_shebang_interpreter(self, tmp_path):
+        """A pytest script's shebang names its interpreter."""
+        python = self._script(tmp_path / "venv", "python", "")
+        self._script(tmp_path, "pytest", f"#!{python}\nimport pytest\n")
+
+        assert _pytest_interpreter(str(tmp_path)) == str(python)
+
+    def test_env_shebang(self, tmp_path):
+        """``#!/usr/bin/env`` interpreters are looked up on PATH."""
+        python = self._script(tmp_path, "python3.11", "")
+        self._script(tmp_path, "pytest", "#!/usr/bin/env python3.11\n")
+
+        assert _pytest_interpreter(str(tmp_path)) == str(python)
+
+    def test_sh_launcher(self, tmp_path):
+        """pip's /bin/sh launcher for long interpreter paths is understood."""
+        python = self._script(tmp_path / "long dir", "python", "")
+        self._script(
+            tmp_path,
+            "pytest",
+            f"#!/bin/sh\n'''exec' \"{python}\" \"$0\" \"$@\"\n' '''\n",
+        )
+
+        assert _pytest_interpreter(str(tmp_path)) == str(python)
+
+    def test_falls_back_to_python3(self, tmp_path):
+        """Without pytest on PATH, python3 on PATH is used."""
+        python = self._script(tmp_path, "python3", "")
+
+        assert _pytest_interpreter(str(tmp_path)) == str(python)
+
+    def test_falls_back_to_running_interpreter(self, tmp_path):
+        """Without pytest or python3 on PATH, devloop's interpreter is used."""
+        assert _pytest_interpreter(str(tmp_path)) == sys.executable
+
+
+class TestPytestWorkerPool:
+    """Test runs served by warm workers."""
+
+    @pytest.mark.asyncio
+    async def test_reports_outcomes(self, project, pool):
+        """Counts and failure details come back from the worker."""
+        _write(
+            project / "tests" / "test_fail.py",
+            "import pytest\n\n"
+            "def test_broken():\n    assert 1 == 2\n\n"
+            "@pytest.mark.skip\ndef test_skipped():\n    pass\n",
+        )
+
+        response = await pool.run(["-q", "tests"])
+
+        assert response["exit_code"] == 1
+        assert (response["passed"], response["failed"], response["skipped"]) == (
+            2,
+            1,
+            1,
+        )
+        failure = response["failures"][0]
+        assert failure["test"] == "tests/test_fail.py::test_broken"
+        assert "assert 1 == 2" in failure["message"]
+
+    @pytest.mark.asyncio
+    async def test_streams_results_in_requested_order(self, project, pool):
+        """Listed tests run first and are reported before the response."""
+        streamed = []
+
+        async def on_test(test):
+            streamed.append(test)
+
+        response = await pool.run(
+            ["tests"], order=["tests/test_app.py::test_other"], on_test=on_test
+        )
+
+        assert [t["test"] for t in streamed] == [
+            "tests/test_app.py::test_other",
+            "tests/test_app.py::test_value",
+        ]
+        assert streamed[0]["outcome"] == "passed"
+        assert streamed[0]["line"] == 6
+        assert [t["test"] for t in response["tests"]] == [t["test"] for t in streamed]
+
+    @pytest.mark.asyncio
+    async def test_reruns_see_changed_code_without_restart(self, project, pool):
+        """Edited tests and modules are re-imported in the same worker."""
+        assert (await pool.run(["tests"]))["passed"] == 2
+        pid = pool._workers[0].pid
+
+        _write(project / "app.py", "def value():\n    return 2\n")
+        changed_source = await pool.run(["tests"], [project / "app.py"])
+        _write(
+            project / "tests" / "test_app.py",
+            "from app import value\n\ndef test_value():\n    assert value() == 2\n",
+        )
+        changed_test = await pool.run(["tests"])
+
+        assert changed_source["failed"] == 1
+        assert (changed_test["passed"], changed_test["failed"]) == (1, 0)
+        assert pool._workers[0].pid == pid
+        assert pool.recycled == 0
+
+    @pytest.mark.asyncio
+    async def test_unlisted_change_reimports_project(self, project, pool):
+        """Changes the caller did not report are found by modification time."""
+        await pool.run(["tests"])
+
+        _write(project / "app.py", "def value():\n    return 2\n")
+        response = await pool.run(["tests"], reload_files=[])
+
+        assert response["failed"] == 1
+        assert pool.recycled == 0
+
+    @pytest.mark.asyncio
+    async def test_changed_third_party_module_recycles_worker(
+        self, project, env, tmp_path_factory
+    ):
+        """Modules outside the project cannot be reloaded safely."""
+        libs = tmp_path_factory.mktemp("libs")
+        _write(libs / "extlib.py", "VALUE = 1\n")
+        _write(
+            project / "tests" / "test_lib.py",
+            "import extlib\n\ndef test_lib():\n    assert extlib.VALUE == 1\n",
+        )
+        env["PYTHONPATH"] = str(libs)
+        pool = PytestWorkerPool(project, env)
+        try:
+            assert (await pool.run(["tests/test_lib.py"]))["passed"] == 1
+            pid = pool._workers[0].pid
+
+            _write(libs / "extlib.py", "VALUE = 2\n")
+            response = await pool.run(["tests/test_lib.py"])
+
+            assert response["failed"] == 1
+            assert pool.recycled == 1
+            assert pool._workers[0].pid != pid
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_run_interrupts_but_keeps_worker(self, project, pool):
+        """Cancelling a run stops pytest without losing the warm worker."""
+        _write(
+            project / "tests" / "test_slow.py",
+            "import time\n\n"
+            "def test_fast():\n    pass\n\n"
+            "def test_slow():\n    time.sleep(30)\n",
+        )
+        await pool.start()
+        pid = pool._workers[0].pid
+        reported = asyncio.Event()
+
+        async def on_test(test):
+            reported.set()
+
+        run = asyncio.create_task(pool.run(["tests/test_slow.py"], on_test=on_test))
+        await asyncio.wait_for(reported.wait(), 10)
+        run.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(run, 10)
+
+        response = await pool.run(["tests/test_app.py"])
+        assert response["passed"] == 2
+        assert pool._workers[0].pid == pid
+
+    @pytest.mark.asyncio
+    async def test_worker_replaced_after_max_runs(self, project, env):
+        """Workers are recycled after serving max_runs requests."""
+        pool = PytestWorkerPool(project, env, max_runs=2)
+        try:
+            await pool.run(["tests"])
+            pid = pool._workers[0].pid
+            await pool.run(["tests"])
+
+            assert pool.recycled == 1
+            assert pool._workers[0].pid != pid
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_dead_worker_slot_refilled(self, project, pool, monkeypatch):
+        """Runs waiting on a worker that dies are woken, and its slot reused."""
+        await pool.start()
+        process = pool._workers[0]._process
+        process.kill()
+        await process.wait()
+        path = pool.env["PATH"]
+        pool.env["PATH"] = str(project)
+        monkeypatch.setattr(sys, "executable", "")
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                pool.run(["tests"]), pool.run(["tests"]), return_exceptions=True
+            ),
+            timeout=30,
+        )
+
+        assert all(isinstance(result, WorkerError) for result in results)
+        pool.env["PATH"] = path
+        response = await asyncio.wait_for(pool.run(["tests"]), timeout=30)
+        assert response["passed"] == 2
+        assert len(pool._workers) == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_interpreter(self, project, env, monkeypatch):
+        """Pools that cannot start a worker raise WorkerError."""
+        env["PATH"] = str(project)
+        monkeypatch.setattr(sys, "executable", "")
+        pool = PytestWorkerPool(project, env)
+
+        with pytest.raises(WorkerError):
+            await pool.run(["tests"])
+
+
+class TestTestRunnerStructuredResults:
+    """Test TestRunnerAgent's per-test results and history."""
+
+    @pytest.mark.asyncio
+    async def test_failures_first_with_events_and_findings(
+        self, project, env, monkeypatch
+    ):
+        """Known failures rerun first and are reported per test."""
+        from devloop.core.context_store import context_store
+
+        monkeypatch.chdir(project)
+        monkeypatch.setenv("PATH", env["PATH"])
+        monkeypatch.delenv("PYTEST_ADDOPTS", raising=False)
+        (project / ".devloop").mkdir()
+        findings = []
+
+        async def add_findings(new):
+            findings.extend(new)
+            return len(new)
+
+        monkeypatch.setattr(context_store, "add_findings", add_findings)
+        _write(
+            project / "tests" / "test_app.py",
+            "from app import value\n\n"
+            "def test_other():\n    assert True\n\n"
+            "def test_value():\n    assert value() == 2\n",
+        )
+        bus = EventBus()
+        events: asyncio.Queue = asyncio.Queue()
+        await bus.subscribe("agent:test-runner:test", events)
+        agent = TestRunnerAgent("test-runner", ["file:modified"], bus, {})
+        try:
+            first = await agent._run_pytest(
+                [project / "tests" / "test_app.py"], project / "app.py"
+            )
+            _write(project / "app.py", "def value():\n    return 2\n")
+            second = await agent._run_pytest(
+                [project / "tests" / "test_app.py"], project / "app.py"
+            )
+        finally:
+            await agent.stop()
+
+        assert (first.passed, first.failed) == (1, 1)
+        assert [t["test"] for t in second.tests] == [
+            "tests/test_app.py::test_value",
+            "tests/test_app.py::test_other",
+        ]
+        assert second.success
+
+        failed = events.get_nowait()
+        fixed = events.get_nowait()
+        assert (failed.payload["outcome"], failed.payload["previous"]) == (
+            "failed",
+            None,
+        )
+        assert "assert 1 == 2" in failed.payload["message"]
+        assert (fixed.payload["outcome"], fixed.payload["previous"]) == (
+            "passed",
+            "failed",
+        )
+        assert events.empty()
+
+        await agent._write_findings_to_context(project / "app.py", first, "pytest")
+        (finding,) = findings
+        assert finding.file == str(project / "tests" / "test_app.py")
+        assert finding.line == 6
+        assert finding.context["test"] == "tests/test_app.py::test_value"
+
+    @pytest.mark.asyncio
+    async def test_missing_pytest_is_reported(self, project, monkeypatch):
+        """Runs without a usable interpreter fail with an error."""
+        monkeypatch.chdir(project)
+        monkeypatch.setenv("PATH", str(project))
+        monkeypatch.setattr(sys, "executable", "")
+        agent = TestRunnerAgent("test-runner", ["file:modified"], EventBus(), {})
+
+        result = await agent._run_pytest(
+            [project / "tests" / "test_app.py"], project / "app.py"
+        )
+
+        assert not result.success
+        assert "no Python interpreter found" in result.error
+
+
+class TestTestRunnerWarmWorkers:
+    """Test TestRunnerAgent's warm-worker mode."""
+
+    @pytest.mark.asyncio
+    async def test_agent_runs_tests_in_warm_worker(self, project, env, monkeypatch):
+        """With warmWorkers enabled, runs go through the worker pool."""
+        monkeypatch.chdir(project)
+        monkeypatch.setenv("PATH", env["PATH"])
+        monkeypatch.delenv("PYTEST_ADDOPTS", raising=False)
+        agent = TestRunnerAgent(
+            "test-runner",
+            ["file:modified"],
+            EventBus(),
+            {"warmWorkers": {"enabled": True}},
+        )
+        await agent.start()
+        try:
+            result = await agent._run_pytest(
+                [project / "tests" / "test_app.py"], project / "app.py"
+            )
+
+            assert (result.passed, result.failed) == (2, 0)
+            assert result.success
+            assert agent._worker_pool is not None
+            assert agent._worker_pool._workers
+        finally:
+            await agent.stop()
+
+        assert agent._worker_pool is None
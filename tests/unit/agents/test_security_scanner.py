@@ -1,9 +1,13 @@
 """Unit tests for SecurityScannerAgent."""
 
+import asyncio
+import json
+import sys
 import pytest
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from devloop.agents.security_scanner import SecurityScannerAgent, SecurityConfig
+from devloop.core.result_cache import ResultCache
 from devloop.core.event import Event
 
 
@@ -201,3 +205,122 @@ class TestSecurityScannerAgent:
             result = await agent._run_bandit(Path("test.py"))
             assert result is not None
             assert "not installed" in result.errors[0]
+
+    @pytest.mark.asyncio
+    async def test_handle_batch_runs_bandit_once(self, agent, tmp_path):
+        """A batch is scanned with one bandit run and issues are split per file."""
+        a_file = tmp_path / "a.py"
+        b_file = tmp_path / "b.py"
+        a_file.write_text("import pickle\n")
+        b_file.write_text("x = 1\n")
+
+        bandit_output = {
+            "results": [
+                {
+                    "filename": str(a_file),
+                    "line_number": 1,
+                    "test_id": "B403",
+                    "issue_severity": "LOW",
+                    "issue_confidence": "HIGH",
+                    "issue_text": "Consider possible security implications.",
+                }
+            ]
+        }
+        process = MagicMock(returncode=1)  # bandit exits 1 when it reports issues
+        process.communicate = AsyncMock(
+            return_value=(json.dumps(bandit_output).encode(), b"")
+        )
+
+        events = [
+            Event(type="file:modified", payload={"path": str(path)})
+            for path in (a_file, b_file)
+        ]
+        with (
+            patch("subprocess.run", return_value=MagicMock(returncode=0)),
+            patch(
+                "devloop.agents.security_scanner.tool_version",
+                AsyncMock(return_value=""),
+            ),
+            patch(
+                "asyncio.create_subprocess_exec", AsyncMock(return_value=process)
+            ) as mock_exec,
+            patch.object(agent, "_write_findings_to_context", AsyncMock()),
+        ):
+            results = await agent.handle_batch(events)
+
+        mock_exec.assert_called_once()
+        cmd = mock_exec.call_args[0]
+        assert str(a_file) in cmd and str(b_file) in cmd
+
+        assert [r.data["issues_found"] for r in results] == [1, 0]
+        assert results[0].data["issues"][0]["test_id"] == "B403"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_scan_stops_bandit(self, agent, tmp_path):
+        """Cancelling a scan does not leave bandit running."""
+        path = tmp_path / "a.py"
+        path.write_text("x = 1\n")
+        started = []
+        create_subprocess_exec = asyncio.create_subprocess_exec
+
+        async def slow_bandit(*cmd, **kwargs):
+            process = await create_subprocess_exec(
+                sys.executable, "-c", "import time; time.sleep(30)", **kwargs
+            )
+            started.append(process)
+            return process
+
+        with (
+            patch("subprocess.run", return_value=MagicMock(returncode=0)),
+            patch("asyncio.create_subprocess_exec", slow_bandit),
+        ):
+            task = asyncio.create_task(agent._invoke_bandit([path]))
+            while not started:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert started[0].returncode is not None
+
+    @pytest.mark.asyncio
+    async def test_cached_results_skip_bandit(self, agent, tmp_path):
+        """Files whose content was already scanned are not passed to bandit."""
+        a_file = tmp_path / "a.py"
+        b_file = tmp_path / "b.py"
+        a_file.write_text("import pickle\n")
+        b_file.write_text("x = 1\n")
+
+        cache = ResultCache(tmp_path / "cache.db")
+        await cache.initialize()
+
+        process = MagicMock(returncode=0)
+        process.communicate = AsyncMock(
+            return_value=(json.dumps({"results": []}).encode(), b"")
+        )
+        with (
+            patch("subprocess.run", return_value=MagicMock(returncode=0)),
+            patch("devloop.agents.security_scanner.result_cache", cache),
+            patch(
+                "devloop.agents.security_scanner.tool_version",
+                AsyncMock(return_value="bandit 1.7.5"),
+            ),
+            patch(
+                "asyncio.create_subprocess_exec", AsyncMock(return_value=process)
+            ) as mock_exec,
+        ):
+            first = await agent._run_bandit_batch([a_file, b_file])
+            second = await agent._run_bandit_batch([a_file, b_file])
+            b_file.write_text("x = 2\n")
+            third = await agent._run_bandit_batch([a_file, b_file])
+
+        await cache.close()
+
+        assert mock_exec.call_count == 2
+        assert str(a_file) not in mock_exec.call_args[0]
+        assert str(b_file) in mock_exec.call_args[0]
+        for results in (first, second, third):
+            assert {path: r.issues for path, r in results.items()} == {
+                a_file: [],
+                b_file: [],
+            }
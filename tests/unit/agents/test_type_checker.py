@@ -255,3 +255,67 @@ Found 1 error in 1 file (checked 1 source file)
             assert (
                 "--strict" in cmd
             ), f"--strict not found in mypy command. Command: {cmd}"
+
+    @pytest.mark.asyncio
+    async def test_handle_batch_runs_mypy_once(self, agent, tmp_path):
+        """A batch is checked with one mypy run and issues are split per file."""
+        (tmp_path / "pkg").mkdir()
+        a_file = tmp_path / "a.py"
+        b_file = tmp_path / "pkg" / "b.py"
+        a_file.write_text("x: int = 'a'\n")
+        b_file.write_text("y = 1\nlen(y)\n")
+        txt_file = tmp_path / "notes.txt"
+        txt_file.write_text("notes")
+
+        mypy_output = (
+            "a.py:1: error: Incompatible types in assignment  [assignment]\n"
+            'pkg/b.py:2: error: Argument 1 to "len" has incompatible type  [arg-type]\n'
+        )
+        mock_check_result = MagicMock(exit_code=0, stdout="", stderr="")
+        mock_mypy_result = MagicMock(exit_code=1, stdout=mypy_output, stderr="")
+
+        events = [
+            Event(type="file:modified", payload={"path": str(path)})
+            for path in (a_file, txt_file, b_file)
+        ]
+        with patch.object(
+            agent.sandbox,
+            "run_sandboxed",
+            side_effect=[mock_check_result, mock_mypy_result],
+        ) as mock_sandbox:
+            results = await agent.handle_batch(events)
+
+        assert mock_sandbox.call_count == 2
+        cmd = mock_sandbox.call_args_list[1][0][0]
+        assert str(a_file) in cmd and str(b_file) in cmd
+
+        assert len(results) == 3
+        assert results[0].data["file"] == str(a_file)
+        assert [i["error_code"] for i in results[0].data["issues"]] == ["assignment"]
+        assert "Skipped non-Python file" in results[1].message
+        assert results[2].data["file"] == str(b_file)
+        assert [i["error_code"] for i in results[2].data["issues"]] == ["arg-type"]
+
+    @pytest.mark.asyncio
+    async def test_single_file_ignores_issues_in_imported_modules(
+        self, agent, tmp_path
+    ):
+        """A file checked alone gets the same issues as in a batch."""
+        a_file = tmp_path / "a.py"
+        a_file.write_text("import helpers\nx: int = 'a'\n")
+
+        mypy_output = (
+            "helpers.py:3: error: Name 'z' is not defined  [name-defined]\n"
+            "a.py:2: error: Incompatible types in assignment  [assignment]\n"
+        )
+        mock_check_result = MagicMock(exit_code=0, stdout="", stderr="")
+        mock_mypy_result = MagicMock(exit_code=1, stdout=mypy_output, stderr="")
+
+        with patch.object(
+            agent.sandbox,
+            "run_sandboxed",
+            side_effect=[mock_check_result, mock_mypy_result],
+        ):
+            result = await agent._run_mypy(a_file)
+
+        assert [i["error_code"] for i in result.issues] == ["assignment"]
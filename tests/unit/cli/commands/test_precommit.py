@@ -0,0 +1,202 @@
+"""Tests for the precommit command."""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from devloop.agents.linter import LinterAgent
+from devloop.cli.commands import precommit as precommit_module
+from devloop.cli.commands.precommit import (
+    check_lint,
+    check_types,
+    get_staged_files,
+    precommit,
+    run_precommit,
+)
+from devloop.core.result_cache import result_cache
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git required")
+
+requires_ruff = pytest.mark.skipif(shutil.which("ruff") is None, reason="needs ruff")
+
+
+def git(repo: Path, *args: str) -> None:
+    """Run a git command in the test repository."""
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A git repository with one committed module."""
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "config", "user.email", "dev@example.com")
+    git(tmp_path, "config", "user.name", "Dev")
+    (tmp_path / "app.py").write_text("VALUE = 1\n")
+    git(tmp_path, "add", "app.py")
+    git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+class TestStagedFiles:
+    """Test detection of staged Python files."""
+
+    @pytest.mark.asyncio
+    async def test_full_and_partial_staging(self, repo):
+        """Staged blobs are compared with the working tree."""
+        (repo / "app.py").write_text("VALUE = 2\n")
+        (repo / "new.py").write_text("OTHER = 1\n")
+        (repo / "notes.txt").write_text("not python\n")
+        git(repo, "add", "app.py", "new.py", "notes.txt")
+        (repo / "new.py").write_text("OTHER = 2\n")
+
+        staged = {f.name: f for f in await get_staged_files(repo)}
+
+        assert sorted(staged) == ["app.py", "new.py"]
+        assert staged["app.py"].matches_worktree
+        assert not staged["new.py"].matches_worktree
+        assert staged["new.py"].path == repo / "new.py"
+
+    @pytest.mark.asyncio
+    async def test_deleted_files_ignored(self, repo):
+        """Deletions have nothing to check."""
+        git(repo, "rm", "-q", "app.py")
+
+        assert await get_staged_files(repo) == []
+        assert await run_precommit(repo) == []
+
+
+@requires_ruff
+class TestLintCheck:
+    """Test ruff results reused from the result cache."""
+
+    @pytest.fixture
+    async def cache(self, tmp_path):
+        """The shared result cache, stored in a temporary database."""
+        original = result_cache.db_path
+        result_cache.db_path = tmp_path / "cache" / "result_cache.db"
+        await result_cache.initialize()
+        yield result_cache
+        await result_cache.close()
+        result_cache.db_path = original
+
+    @pytest.mark.asyncio
+    async def test_second_run_reuses_results(self, repo, cache, monkeypatch):
+        """Unchanged staged content is not linted again."""
+        (repo / "app.py").write_text("import os\nVALUE = 2\n")
+        git(repo, "add", "app.py")
+        files = await get_staged_files(repo)
+
+        calls = []
+        invoke_ruff = LinterAgent._invoke_ruff
+
+        async def counting_invoke(agent, paths):
+            calls.append(paths)
+            return await invoke_ruff(agent, paths)
+
+        monkeypatch.setattr(LinterAgent, "_invoke_ruff", counting_invoke)
+        first = await check_lint(repo, files, {})
+        second = await check_lint(repo, files, {})
+
+        assert calls == [[repo / "app.py"]]
+        assert not first.passed
+        assert second.problems == first.problems
+        assert any("F401" in problem for problem in second.problems)
+
+    @pytest.mark.asyncio
+    async def test_partially_staged_file_checks_staged_content(self, repo, cache):
+        """The staged blob is linted, not the working tree copy."""
+        (repo / "app.py").write_text("import os\nVALUE = 2\n")
+        git(repo, "add", "app.py")
+        (repo / "app.py").write_text("VALUE = 2\n")
+
+        result = await check_lint(repo, await get_staged_files(repo), {})
+
+        assert not result.passed
+        assert result.problems[0].startswith("app.py (staged):1:")
+
+    @pytest.mark.asyncio
+    async def test_ruff_error_on_staged_content_fails(self, repo, cache):
+        """A ruff error while linting a staged blob is not a clean result."""
+        (repo / "app.py").write_text("VALUE = 2\n")
+        git(repo, "add", "app.py")
+        (repo / "app.py").write_text("VALUE = 3\n")
+        (repo / "ruff.toml").write_text("not valid toml [\n")
+
+        result = await check_lint(repo, await get_staged_files(repo), {})
+
+        assert not result.passed
+        assert result.problems[0].startswith("app.py (staged): ")
+
+
+class TestTypeCheck:
+    """Test interpretation of mypy runs."""
+
+    @pytest.fixture
+    def mypy(self, monkeypatch):
+        """Replace the mypy run; set ``result`` to what it returns."""
+
+        class FakeMypy:
+            result = (0, b"", b"")
+
+        run = precommit_module._run
+
+        async def fake_run(cmd, cwd, stdin=None, env=None):
+            if cmd[0] != "mypy":
+                return await run(cmd, cwd, stdin, env)
+            return FakeMypy.result
+
+        monkeypatch.setattr(precommit_module, "_has_tool", lambda name, env: True)
+        monkeypatch.setattr(precommit_module, "_run", fake_run)
+        return FakeMypy
+
+    @pytest.mark.asyncio
+    async def test_usage_error_reports_stderr(self, repo, mypy):
+        """A config or usage error is not an empty list of problems."""
+        mypy.result = (2, b"", b"mypy.ini: [mypy]: invalid section\n")
+
+        result = await check_types(repo, await get_staged_files(repo))
+
+        assert not result.passed
+        assert result.problems == ["mypy.ini: [mypy]: invalid section"]
+
+    @pytest.mark.asyncio
+    async def test_partially_staged_files_noted(self, repo, mypy):
+        """The output says when the working tree differs from the commit."""
+        (repo / "app.py").write_text("VALUE = 2\n")
+        (repo / "new.py").write_text("OTHER = 1\n")
+        git(repo, "add", "app.py", "new.py")
+        (repo / "new.py").write_text("OTHER = 2\n")
+
+        result = await check_types(repo, await get_staged_files(repo))
+
+        assert result.passed
+        assert result.note.endswith("partially staged new.py")
+
+
+class TestPrecommitCommand:
+    """Test the CLI entry point."""
+
+    @pytest.fixture
+    def app(self):
+        """A Typer app exposing only the precommit command."""
+        app = typer.Typer()
+        app.command()(precommit)
+        return app
+
+    def test_rejects_unknown_check(self, app, repo):
+        """Unknown --skip values are reported."""
+        result = CliRunner().invoke(app, [str(repo), "--skip", "nope"])
+
+        assert result.exit_code == 2
+        assert "Unknown check" in result.output
+
+    def test_nothing_staged(self, app, repo):
+        """Commits without Python changes pass immediately."""
+        result = CliRunner().invoke(app, [str(repo)])
+
+        assert result.exit_code == 0
+        assert "No staged Python files" in result.output
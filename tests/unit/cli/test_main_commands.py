@@ -309,6 +309,32 @@ class TestSummaryCommand:
         assert result.exit_code == 0 or "Usage" in result.stdout
 
 
+class TestLazySubcommands:
+    """Tests for subcommands whose modules load on first use."""
+
+    def test_help_lists_lazy_subcommands_by_name(self, cli_runner):
+        """Top-level help names every subcommand group."""
+        result = cli_runner.invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        for name in ("summary", "agent", "doctor", "tools", "precommit"):
+            assert name in result.stdout
+
+    def test_lazy_group_runs_subcommand(self, cli_runner):
+        """Commands inside a lazily loaded group are reachable."""
+        result = cli_runner.invoke(app, ["tools", "list"])
+
+        assert result.exit_code == 0
+        assert "ruff" in result.stdout
+
+    def test_lazy_single_command(self, cli_runner):
+        """Function subcommands keep their own options."""
+        result = cli_runner.invoke(app, ["precommit", "--help"])
+
+        assert result.exit_code == 0
+        assert "Usage" in result.stdout
+
+
 class TestWatchCommand:
     """Tests for the watch command."""
 
@@ -0,0 +1,403 @@
+"""Tests for the Agent base class event processing."""
+
+import asyncio
+
+import pytest
+
+from devloop.core.agent import Agent, AgentResult
+from devloop.core.event import Event, EventBus
+
+
+class RecordingAgent(Agent):
+    """Agent that records the events it handles."""
+
+    def __init__(self, name: str, triggers, event_bus: EventBus):
+        super().__init__(name, triggers, event_bus)
+        self.handled: list[Event] = []
+
+    async def handle(self, event: Event) -> AgentResult:
+        self.handled.append(event)
+        return AgentResult(agent_name=self.name, success=True, duration=0.0)
+
+
+@pytest.fixture
+def event_bus():
+    """Create event bus."""
+    return EventBus()
+
+
+async def wait_for(predicate, timeout: float = 2.0) -> None:
+    """Poll until predicate() is true."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+class TestDebounce:
+    """Per-path debounce in the agent base."""
+
+    @pytest.mark.asyncio
+    async def test_burst_for_same_path_handled_once(self, event_bus):
+        """Only the latest event for a path within the window is handled."""
+        agent = RecordingAgent("recorder", ["file:*"], event_bus)
+        agent.debounce_ms = 50
+        await agent.start()
+        try:
+            for event_type in ("file:created", "file:modified", "file:modified"):
+                await event_bus.emit(Event(type=event_type, payload={"path": "a.py"}))
+            await event_bus.emit(Event(type="file:modified", payload={"path": "b.py"}))
+
+            await wait_for(lambda: len(agent.handled) == 2)
+            await asyncio.sleep(0.1)
+
+            assert sorted(e.payload["path"] for e in agent.handled) == ["a.py", "b.py"]
+            assert agent.debounce_suppressed == 2
+        finally:
+            await agent.stop()
+
+    @pytest.mark.asyncio
+    async def test_debounce_disabled_by_default(self, event_bus):
+        """Agents without a debounce setting handle every event."""
+        agent = RecordingAgent("recorder", ["file:*"], event_bus)
+        await agent.start()
+        try:
+            for _ in range(3):
+                await event_bus.emit(Event(type="file:modified", payload={"path": "a"}))
+            await wait_for(lambda: len(agent.handled) == 3)
+            assert agent.debounce_suppressed == 0
+        finally:
+            await agent.stop()
+
+    @pytest.mark.asyncio
+    async def test_events_without_path_not_debounced(self, event_bus):
+        """Events without a path bypass the debounce window."""
+        agent = RecordingAgent("recorder", ["git:*"], event_bus)
+        agent.debounce_ms = 10_000
+        await agent.start()
+        try:
+            await event_bus.emit(Event(type="git:commit", payload={}))
+            await wait_for(lambda: len(agent.handled) == 1)
+        finally:
+            await agent.stop()
+
+
+class BatchRecordingAgent(RecordingAgent):
+    """Agent that records the batches passed to handle_batch."""
+
+    def __init__(self, name: str, triggers, event_bus: EventBus):
+        super().__init__(name, triggers, event_bus)
+        self.batches: list[list[Event]] = []
+
+    async def handle_batch(self, events):
+        self.batches.append(list(events))
+        return await super().handle_batch(events)
+
+
+class TestBatchMode:
+    """Opt-in batching in the agent base."""
+
+    @pytest.mark.asyncio
+    async def test_events_within_window_handled_as_one_batch(self, event_bus):
+        """Events arriving within the window reach handle_batch together."""
+        agent = BatchRecordingAgent("batcher", ["file:*"], event_bus)
+        agent.batch_window_ms = 100
+        results = asyncio.Queue()
+        await event_bus.subscribe("agent:batcher:completed", results)
+        await agent.start()
+        try:
+            for name in ("a.py", "b.py", "c.py"):
+                await event_bus.emit(
+                    Event(type="file:modified", payload={"path": name})
+                )
+
+            await wait_for(lambda: len(agent.handled) == 3)
+            assert len(agent.batches) == 1
+            assert [e.payload["path"] for e in agent.batches[0]] == [
+                "a.py",
+                "b.py",
+                "c.py",
+            ]
+            # One completion event is still published per file
+            await wait_for(lambda: results.qsize() == 3)
+        finally:
+            await agent.stop()
+
+    @pytest.mark.asyncio
+    async def test_latest_event_per_path_kept(self, event_bus):
+        """Repeated events for a path within a batch collapse to the latest."""
+        agent = BatchRecordingAgent("batcher", ["file:*"], event_bus)
+        agent.batch_window_ms = 100
+        await agent.start()
+        try:
+            await event_bus.emit(Event(type="file:created", payload={"path": "a.py"}))
+            await event_bus.emit(Event(type="file:modified", payload={"path": "b.py"}))
+            await event_bus.emit(Event(type="file:modified", payload={"path": "a.py"}))
+
+            await wait_for(lambda: len(agent.batches) == 1)
+            batch = agent.batches[0]
+            assert [e.payload["path"] for e in batch] == ["b.py", "a.py"]
+            assert batch[1].type == "file:modified"
+        finally:
+            await agent.stop()
+
+    @pytest.mark.asyncio
+    async def test_max_batch_size_splits_batches(self, event_bus):
+        """A full batch is handled without waiting for the window to end."""
+        agent = BatchRecordingAgent("batcher", ["file:*"], event_bus)
+        agent.batch_window_ms = 10_000
+        agent.max_batch_size = 2
+        await agent.start()
+        try:
+            for name in ("a.py", "b.py", "c.py", "d.py"):
+                await event_bus.emit(
+                    Event(type="file:modified", payload={"path": name})
+                )
+
+            await wait_for(lambda: len(agent.batches) == 2)
+            assert [len(batch) for batch in agent.batches] == [2, 2]
+        finally:
+            await agent.stop()
+
+    @pytest.mark.asyncio
+    async def test_batching_disabled_by_default(self, event_bus):
+        """Without a batch window every event is handled on its own."""
+        agent = BatchRecordingAgent("batcher", ["file:*"], event_bus)
+        await agent.start()
+        try:
+            for name in ("a.py", "b.py"):
+                await event_bus.emit(
+                    Event(type="file:modified", payload={"path": name})
+                )
+            await wait_for(lambda: len(agent.handled) == 2)
+            assert agent.batches == []
+        finally:
+            await agent.stop()
+
+
+class TestEventQueueConfig:
+    """Agent inbox configuration."""
+
+    @pytest.mark.asyncio
+    async def test_configure_queue_before_start(self, event_bus):
+        """The inbox size and policy can be set until the agent starts."""
+        agent = RecordingAgent("recorder", ["file:*"], event_bus)
+        agent.configure_queue(5, "coalesce")
+        assert agent._event_queue.get_stats()["max_size"] == 5
+        assert agent._event_queue.get_stats()["policy"] == "coalesce"
+
+        await agent.start()
+        try:
+            with pytest.raises(RuntimeError):
+                agent.configure_queue(10)
+        finally:
+            await agent.stop()
+
+    def test_manager_status_reports_queue(self, event_bus, tmp_path):
+        """AgentManager.get_status includes queue depth and drop counts."""
+        from devloop.core.manager import AgentManager
+
+        manager = AgentManager(
+            event_bus,
+            project_dir=tmp_path,
+            enable_feedback=False,
+            enable_performance=False,
+        )
+        manager.register(RecordingAgent("recorder", ["file:*"], event_bus))
+
+        queue_status = manager.get_status()["recorder"]["queue"]
+        assert queue_status["depth"] == 0
+        assert queue_status["dropped"] == 0
+        assert queue_status["policy"] == "drop-oldest"
+
+
+class SlowAgent(RecordingAgent):
+    """Concurrency-safe agent that tracks how many handlers overlap."""
+
+    concurrent_handling = True
+
+    def __init__(self, name: str, triggers, event_bus: EventBus):
+        super().__init__(name, triggers, event_bus)
+        self.active: dict[str, int] = {}
+        self.max_active = 0
+        self.max_active_per_path = 0
+
+    async def handle(self, event: Event) -> AgentResult:
+        path = event.payload["path"]
+        self.active[path] = self.active.get(path, 0) + 1
+        self.max_active = max(self.max_active, sum(self.active.values()))
+        self.max_active_per_path = max(self.max_active_per_path, self.active[path])
+        await asyncio.sleep(0.05)
+        self.active[path] -= 1
+        return await super().handle(event)
+
+
+class TestConcurrency:
+    """Worker pool for concurrency-safe agents."""
+
+    @pytest.mark.asyncio
+    async def test_handles_events_in_parallel(self, event_bus):
+        """Up to max_concurrency events are handled at once."""
+        agent = SlowAgent("slow", ["file:*"], event_bus)
+        agent.max_concurrency = 3
+        await agent.start()
+        try:
+            for name in ("a.py", "b.py", "c.py", "d.py", "e.py", "f.py"):
+                await event_bus.emit(
+                    Event(type="file:modified", payload={"path": name})
+                )
+            await wait_for(lambda: len(agent.handled) == 6)
+            assert agent.max_active == 3
+        finally:
+            await agent.stop()
+
+    @pytest.mark.asyncio
+    async def test_same_path_never_overlaps(self, event_bus):
+        """Events for one file are handled one after another, in order."""
+        agent = SlowAgent("slow", ["file:*"], event_bus)
+        agent.max_concurrency = 4
+        agent.cancel_superseded = False
+        await agent.start()
+        try:
+            for n in range(3):
+                await event_bus.emit(
+                    Event(type="file:modified", payload={"path": "a.py", "n": n})
+                )
+            await event_bus.emit(Event(type="file:modified", payload={"path": "b.py"}))
+
+            await wait_for(lambda: len(agent.handled) == 4)
+            assert agent.max_active_per_path == 1
+            assert agent.max_active == 2
+            assert [
+                e.payload.get("n") for e in agent.handled if e.payload["path"] == "a.py"
+            ] == [0, 1, 2]
+        finally:
+            await agent.stop()
+
+    @pytest.mark.asyncio
+    async def test_ignored_without_concurrent_handling(self, event_bus):
+        """Agents that do not opt in keep handling one event at a time."""
+        agent = SlowAgent("slow", ["file:*"], event_bus)
+        agent.concurrent_handling = False
+        agent.max_concurrency = 4
+        await agent.start()
+        try:
+            for name in ("a.py", "b.py", "c.py"):
+                await event_bus.emit(
+                    Event(type="file:modified", payload={"path": name})
+                )
+            await wait_for(lambda: len(agent.handled) == 3)
+            assert agent.max_active == 1
+        finally:
+            await agent.stop()
+
+
+class BlockingAgent(RecordingAgent):
+    """Agent whose handler for ``block`` events waits until cancelled."""
+
+    def __init__(self, name: str, triggers, event_bus: EventBus):
+        super().__init__(name, triggers, event_bus)
+        self.started: list[Event] = []
+        self.cancelled: list[Event] = []
+
+    async def handle(self, event: Event) -> AgentResult:
+        self.started.append(event)
+        if event.payload.get("block"):
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                self.cancelled.append(event)
+                raise
+        return await super().handle(event)
+
+    async def handle_batch(self, events):
+        self.started.extend(events)
+        if any(event.payload.get("block") for event in events):
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                self.cancelled.extend(events)
+                raise
+        return [await RecordingAgent.handle(self, event) for event in events]
+
+
+class TestSupersededRuns:
+    """Cancelling handlers made stale by a newer event for the same path."""
+
+    @pytest.mark.asyncio
+    async def test_newer_event_cancels_running_handler(self, event_bus):
+        """A save during a run stops that run and handles the new one."""
+        agent = BlockingAgent("blocking", ["file:*"], event_bus)
+        await agent.start()
+        try:
+            await event_bus.emit(
+                Event(type="file:modified", payload={"path": "a.py", "block": True})
+            )
+            await wait_for(lambda: len(agent.started) == 1)
+            await event_bus.emit(Event(type="file:modified", payload={"path": "a.py"}))
+
+            await wait_for(lambda: len(agent.handled) == 1)
+            assert agent.cancelled == agent.started[:1]
+            assert agent.handled[0].payload == {"path": "a.py"}
+            assert agent.cancelled_runs == 1
+        finally:
+            await agent.stop()
+
+    @pytest.mark.asyncio
+    async def test_events_for_other_paths_do_not_cancel(self, event_bus):
+        """Only an event for the same path supersedes a run."""
+        agent = BlockingAgent("blocking", ["file:*"], event_bus)
+        await agent.start()
+        try:
+            await event_bus.emit(
+                Event(type="file:modified", payload={"path": "a.py", "block": True})
+            )
+            await wait_for(lambda: len(agent.started) == 1)
+            await event_bus.emit(Event(type="file:modified", payload={"path": "b.py"}))
+            await asyncio.sleep(0.05)
+
+            assert agent.cancelled == []
+            assert agent.cancelled_runs == 0
+        finally:
+            await agent.stop()
+
+    @pytest.mark.asyncio
+    async def test_batch_cancelled_once_every_path_is_superseded(self, event_bus):
+        """A batch keeps running while some of its files are still current."""
+        agent = BlockingAgent("blocking", ["file:*"], event_bus)
+        agent.batch_window_ms = 20
+        await agent.start()
+        try:
+            for path in ("a.py", "b.py"):
+                await event_bus.emit(
+                    Event(type="file:modified", payload={"path": path, "block": True})
+                )
+            await wait_for(lambda: len(agent.started) == 2)
+
+            await event_bus.emit(Event(type="file:modified", payload={"path": "a.py"}))
+            await asyncio.sleep(0.05)
+            assert agent.cancelled == []
+
+            await event_bus.emit(Event(type="file:modified", payload={"path": "b.py"}))
+            await wait_for(lambda: len(agent.handled) == 2)
+            assert len(agent.cancelled) == 2
+            assert agent.cancelled_runs == 1
+        finally:
+            await agent.stop()
+
+    @pytest.mark.asyncio
+    async def test_opt_out_lets_runs_finish(self, event_bus):
+        """Agents with cancel_superseded off are never interrupted."""
+        agent = SlowAgent("slow", ["file:*"], event_bus)
+        agent.cancel_superseded = False
+        await agent.start()
+        try:
+            for n in range(2):
+                await event_bus.emit(
+                    Event(type="file:modified", payload={"path": "a.py", "n": n})
+                )
+            await wait_for(lambda: len(agent.handled) == 2)
+            assert agent.cancelled_runs == 0
+        finally:
+            await agent.stop()
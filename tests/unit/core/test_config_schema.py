@@ -214,6 +214,64 @@ class TestConfigValidator:
             "agents.linter.config must be a dictionary" in e for e in validator.errors
         )
 
+    def test_agent_batch_settings_validation(self):
+        """Reject invalid batch mode settings on an agent."""
+        config = {
+            "version": "1.1.0",
+            "enabled": True,
+            "agents": {
+                "linter": {
+                    "enabled": True,
+                    "triggers": ["file:modified"],
+                    "config": {},
+                    "batchWindow": -5,
+                    "maxBatchSize": 0,
+                }
+            },
+            "global": {},
+        }
+
+        validator = ConfigValidator()
+        assert validator.validate(config) is False
+        assert any(
+            "agents.linter.batchWindow must be a non-negative integer" in e
+            for e in validator.errors
+        )
+        assert any(
+            "agents.linter.maxBatchSize must be a positive integer" in e
+            for e in validator.errors
+        )
+
+        config["agents"]["linter"]["batchWindow"] = 200
+        config["agents"]["linter"]["maxBatchSize"] = 100
+        assert validator.validate(config) is True
+
+    def test_agent_queue_settings_validation(self):
+        """Reject invalid queue settings on an agent."""
+        config = {
+            "version": "1.1.0",
+            "enabled": True,
+            "agents": {
+                "test-runner": {
+                    "enabled": True,
+                    "triggers": ["file:modified"],
+                    "config": {},
+                    "queueSize": -1,
+                    "overflowPolicy": "drop-newest",
+                }
+            },
+            "global": {},
+        }
+
+        validator = ConfigValidator()
+        assert validator.validate(config) is False
+        assert any("queueSize must be a non-negative" in e for e in validator.errors)
+        assert any("overflowPolicy must be one of" in e for e in validator.errors)
+
+        config["agents"]["test-runner"]["queueSize"] = 200
+        config["agents"]["test-runner"]["overflowPolicy"] = "coalesce"
+        assert validator.validate(config) is True
+
     def test_global_invalid_mode(self):
         """Reject config with invalid mode."""
         config = {
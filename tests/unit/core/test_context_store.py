@@ -1,5 +1,6 @@
 """Unit tests for context store."""
 
+import asyncio
 import json
 import shutil
 import tempfile
@@ -164,6 +165,7 @@ class TestContextStoreBasicOperations:
         )
 
         await store.add_finding(finding)
+        await store.flush()
 
         # Should be in immediate tier
         immediate_file = temp_context_dir / "immediate.json"
@@ -192,6 +194,7 @@ class TestContextStoreBasicOperations:
         )
 
         await store.add_finding(finding)
+        await store.flush()
 
         # Check index exists
         index_file = temp_context_dir / "index.json"
@@ -273,6 +276,251 @@ class TestContextStoreBasicOperations:
         assert len(findings) == 0
 
 
+class TestPersistentStorage:
+    """Test the findings database and debounced snapshots."""
+
+    @staticmethod
+    def make_finding(i: int, **kwargs) -> Finding:
+        """Create a relevant-tier finding."""
+        defaults = {
+            "id": f"f_{i:03d}",
+            "agent": "linter",
+            "timestamp": f"2025-11-28T10:00:{i % 60:02d}Z",
+            "file": f"src/module_{i % 3}.py",
+            "severity": Severity.WARNING,
+            "relevance_score": 0.5,
+        }
+        return Finding(**{**defaults, **kwargs})
+
+    @pytest.mark.asyncio
+    async def test_add_findings_batch(self, tmp_path):
+        """A batch is stored in memory and in the database."""
+        store = ContextStore(context_dir=tmp_path, enable_path_validation=False)
+        await store.initialize()
+
+        added = await store.add_findings([self.make_finding(i) for i in range(20)])
+
+        assert added == 20
+        assert len(await store.get_findings(tier=Tier.RELEVANT)) == 20
+        rows = store.connection.execute("SELECT COUNT(*) FROM findings").fetchone()
+        assert rows[0] == 20
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_findings_survive_restart(self, tmp_path):
+        """A new store loads findings persisted by an earlier one."""
+        store = ContextStore(context_dir=tmp_path, enable_path_validation=False)
+        await store.initialize()
+        await store.add_findings([self.make_finding(i) for i in range(3)])
+        await store.close()
+
+        reopened = ContextStore(context_dir=tmp_path, enable_path_validation=False)
+        await reopened.initialize()
+
+        findings = await reopened.get_findings(tier=Tier.RELEVANT)
+        assert [f.id for f in findings] == ["f_000", "f_001", "f_002"]
+        assert findings[0].severity == Severity.WARNING
+        await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_snapshots_are_debounced(self, tmp_path, monkeypatch):
+        """Many additions within the debounce window produce one snapshot write."""
+        store = ContextStore(
+            context_dir=tmp_path, enable_path_validation=False, index_debounce=0.05
+        )
+        await store.initialize()
+        writes = []
+        original = store._write_tier
+
+        async def counting_write(tier):
+            writes.append(tier)
+            await original(tier)
+
+        monkeypatch.setattr(store, "_write_tier", counting_write)
+
+        for i in range(10):
+            await store.add_finding(self.make_finding(i))
+        assert not (tmp_path / "relevant.json").exists()
+
+        await asyncio.sleep(0.2)
+
+        assert writes == [Tier.RELEVANT]
+        data = json.loads((tmp_path / "relevant.json").read_text())
+        assert data["count"] == 10
+        assert (tmp_path / "index.json").exists()
+        assert (tmp_path / ".last_update").exists()
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_clear_removes_rows(self, tmp_path):
+        """Clearing by file deletes the matching database rows only."""
+        store = ContextStore(context_dir=tmp_path, enable_path_validation=False)
+        await store.initialize()
+        await store.add_findings([self.make_finding(i) for i in range(6)])
+
+        cleared = await store.clear_findings(file_filter="src/module_0.py")
+
+        assert cleared == 2
+        rows = store.connection.execute(
+            "SELECT COUNT(*) FROM findings WHERE file = ?", ("src/module_0.py",)
+        ).fetchone()
+        assert rows[0] == 0
+        assert len(await store.get_findings()) == 4
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_trim_applies_to_database(self, tmp_path):
+        """Trimmed findings are removed from the database as well."""
+        store = ContextStore(context_dir=tmp_path, enable_path_validation=False)
+        await store.initialize()
+        await store.add_findings(
+            [
+                self.make_finding(
+                    i, timestamp=f"2025-11-28T10:{i // 60:02d}:{i % 60:02d}Z"
+                )
+                for i in range(501)
+            ]
+        )
+
+        rows = store.connection.execute("SELECT COUNT(*) FROM findings").fetchone()
+        assert rows[0] == 250
+        kept = {f.id for f in await store.get_findings()}
+        assert "f_500" in kept and "f_000" not in kept
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_imports_legacy_tier_files(self, tmp_path):
+        """Tier JSON files from before the database existed are imported."""
+        legacy = {
+            "tier": "immediate",
+            "count": 1,
+            "findings": [
+                {
+                    "id": "legacy_001",
+                    "agent": "linter",
+                    "timestamp": "2025-11-28T10:00:00Z",
+                    "file": "test.py",
+                    "severity": "error",
+                    "scope_type": "current_file",
+                    "blocking": True,
+                }
+            ],
+        }
+        (tmp_path / "immediate.json").write_text(json.dumps(legacy))
+
+        store = ContextStore(context_dir=tmp_path, enable_path_validation=False)
+        await store.initialize()
+
+        findings = await store.get_findings(tier=Tier.IMMEDIATE)
+        assert [f.id for f in findings] == ["legacy_001"]
+        rows = store.connection.execute("SELECT COUNT(*) FROM findings").fetchone()
+        assert rows[0] == 1
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_legacy_tier_files_imported_once(self, tmp_path):
+        """Cleared findings do not come back from a stale tier JSON file."""
+        legacy = {
+            "tier": "immediate",
+            "count": 1,
+            "findings": [
+                {
+                    "id": "legacy_001",
+                    "agent": "linter",
+                    "timestamp": "2025-11-28T10:00:00Z",
+                    "file": "test.py",
+                    "severity": "error",
+                    "scope_type": "current_file",
+                    "blocking": True,
+                }
+            ],
+        }
+        (tmp_path / "immediate.json").write_text(json.dumps(legacy))
+        store = ContextStore(context_dir=tmp_path, enable_path_validation=False)
+        await store.initialize()
+        await store.clear_findings()
+        await store.close()
+        # As if the process exited before the cleared snapshot was written
+        (tmp_path / "immediate.json").write_text(json.dumps(legacy))
+
+        store = ContextStore(context_dir=tmp_path, enable_path_validation=False)
+        await store.initialize()
+
+        assert await store.get_findings() == []
+        await store.close()
+
+
+class TestSecondaryIndexes:
+    """Test indexed queries in get_findings."""
+
+    @pytest.fixture
+    async def store(self, tmp_path):
+        """Create a store holding a mix of findings."""
+        store = ContextStore(context_dir=tmp_path, enable_path_validation=False)
+        await store.initialize()
+        findings = []
+        for i in range(12):
+            findings.append(
+                Finding(
+                    id=f"f_{i:02d}",
+                    agent="linter" if i % 2 else "security",
+                    timestamp=f"2025-11-28T10:00:{i:02d}Z",
+                    file=f"src/module_{i % 3}.py",
+                    severity=Severity.ERROR if i % 4 == 0 else Severity.WARNING,
+                    category="style" if i % 2 else "security",
+                    relevance_score=0.5,
+                )
+            )
+        await store.add_findings(findings)
+        yield store
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_combined_filters(self, store):
+        """Filters are combined and preserve insertion order."""
+        findings = await store.get_findings(
+            file_filter="src/module_0.py", severity="error"
+        )
+        assert [f.id for f in findings] == ["f_00"]
+
+        security = await store.get_findings(category="security", agent="security")
+        assert [f.id for f in security] == [f"f_{i:02d}" for i in range(0, 12, 2)]
+
+        assert await store.get_findings(category="missing") == []
+
+    @pytest.mark.asyncio
+    async def test_limit(self, store):
+        """A limit stops the query early."""
+        assert len(await store.get_findings(limit=5)) == 5
+        findings = await store.get_findings(agent="linter", limit=2)
+        assert [f.id for f in findings] == ["f_01", "f_03"]
+
+    @pytest.mark.asyncio
+    async def test_indexes_follow_clear(self, store):
+        """Cleared findings disappear from the indexes."""
+        await store.clear_findings(file_filter="src/module_1.py")
+
+        assert await store.get_findings(file_filter="src/module_1.py") == []
+        linter = await store.get_findings(agent="linter")
+        assert all(f.file != "src/module_1.py" for f in linter)
+        assert len(await store.get_findings(agent="security")) == 4
+
+    @pytest.mark.asyncio
+    async def test_findings_for_path_matches_resolved_paths(self, store):
+        """Relative and absolute spellings of a file find the same findings."""
+        absolute = Path.cwd() / "src" / "module_2.py"
+
+        by_relative = await store.get_findings_for_path("src/module_2.py")
+        by_absolute = await store.get_findings_for_path(absolute)
+        immediate_only = await store.get_findings_for_path(
+            "./src/../src/module_2.py", [Tier.IMMEDIATE]
+        )
+
+        assert [f.id for f in by_relative] == ["f_02", "f_05", "f_08", "f_11"]
+        assert by_absolute == by_relative
+        assert immediate_only == []
+
+
 class TestRelevanceScoring:
     """Test relevance scoring algorithm."""
 
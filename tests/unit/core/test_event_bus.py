@@ -0,0 +1,211 @@
+"""Tests for EventBus subscription dispatch."""
+
+import asyncio
+
+import pytest
+
+from devloop.core.event import Event, EventBus, EventQueue, OverflowPolicy, Priority
+
+
+@pytest.fixture
+def event_bus():
+    """Create event bus."""
+    return EventBus()
+
+
+def drain(queue: asyncio.Queue) -> list:
+    """Collect all events currently in a queue."""
+    events = []
+    while not queue.empty():
+        events.append(queue.get_nowait())
+    return events
+
+
+@pytest.mark.asyncio
+async def test_exact_prefix_and_wildcard_dispatch(event_bus):
+    """Each subscription kind receives only matching events."""
+    exact, prefix, wildcard = asyncio.Queue(), asyncio.Queue(), asyncio.Queue()
+    await event_bus.subscribe("file:created", exact)
+    await event_bus.subscribe("file:*", prefix)
+    await event_bus.subscribe("*", wildcard)
+
+    await event_bus.emit(Event(type="file:created", payload={}))
+    await event_bus.emit(Event(type="file:modified", payload={}))
+    await event_bus.emit(Event(type="git:commit", payload={}))
+
+    assert [e.type for e in drain(exact)] == ["file:created"]
+    assert [e.type for e in drain(prefix)] == ["file:created", "file:modified"]
+    assert [e.type for e in drain(wildcard)] == [
+        "file:created",
+        "file:modified",
+        "git:commit",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_queue_notified_once_for_overlapping_patterns(event_bus):
+    """A queue subscribed via several matching patterns gets one copy."""
+    queue = asyncio.Queue()
+    for pattern in ("file:modified", "file:*", "f*", "*"):
+        await event_bus.subscribe(pattern, queue)
+
+    await event_bus.emit(Event(type="file:modified", payload={}))
+
+    assert len(drain(queue)) == 1
+
+
+@pytest.mark.asyncio
+async def test_dispatch_cache_invalidated_on_subscription_change(event_bus):
+    """Cached fan-out lists are dropped when subscriptions change."""
+    first, second = asyncio.Queue(), asyncio.Queue()
+    await event_bus.subscribe("agent:*", first)
+    await event_bus.emit(Event(type="agent:linter:completed", payload={}))
+    assert "agent:linter:completed" in event_bus._dispatch_cache
+
+    await event_bus.subscribe("agent:linter:completed", second)
+    await event_bus.emit(Event(type="agent:linter:completed", payload={}))
+    assert len(drain(first)) == 2
+    assert len(drain(second)) == 1
+
+    await event_bus.unsubscribe("agent:*", first)
+    await event_bus.emit(Event(type="agent:linter:completed", payload={}))
+    assert drain(first) == []
+    assert len(drain(second)) == 1
+    assert "agent:*" not in event_bus._subscribers
+
+
+@pytest.mark.asyncio
+async def test_index_agrees_with_pattern_matching(event_bus):
+    """The dispatch index resolves the same queues as _matches_pattern."""
+    patterns = ["*", "file:*", "file:created", "agent:*", "agent:linter:*", "git:"]
+    queues = {pattern: asyncio.Queue() for pattern in patterns}
+    for pattern, queue in queues.items():
+        await event_bus.subscribe(pattern, queue)
+
+    for event_type in (
+        "file:created",
+        "file:deleted",
+        "agent:linter:completed",
+        "git:",
+    ):
+        expected = {
+            id(queue)
+            for pattern, queue in queues.items()
+            if event_bus._matches_pattern(event_type, pattern)
+        }
+        resolved = {id(queue) for queue in event_bus._resolve_queues(event_type)}
+        assert resolved == expected, event_type
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_waits_for_room(event_bus):
+    """Emit falls back to awaiting put when a bounded queue is full."""
+    queue = asyncio.Queue(maxsize=1)
+    await event_bus.subscribe("file:*", queue)
+
+    await event_bus.emit(Event(type="file:modified", payload={"n": 1}))
+    pending = asyncio.create_task(
+        event_bus.emit(Event(type="file:modified", payload={"n": 2}))
+    )
+    await asyncio.sleep(0.01)
+    assert not pending.done()
+
+    assert queue.get_nowait().payload["n"] == 1
+    await asyncio.wait_for(pending, timeout=1.0)
+    assert queue.get_nowait().payload["n"] == 2
+
+
+def file_event(path: str, priority: Priority = Priority.NORMAL) -> Event:
+    """Create a file event for queue tests."""
+    return Event(type="file:modified", payload={"path": path}, priority=priority)
+
+
+class TestEventQueue:
+    """Bounded priority queue used for agent inboxes."""
+
+    def test_served_by_priority_then_arrival(self):
+        """Higher priority events overtake queued lower priority ones."""
+        queue = EventQueue(maxsize=10)
+        queue.put_nowait(file_event("a.py", Priority.LOW))
+        queue.put_nowait(file_event("b.py"))
+        queue.put_nowait(
+            Event(type="git:pre-commit", payload={}, priority=Priority.CRITICAL)
+        )
+        queue.put_nowait(file_event("c.py"))
+
+        served = [queue.get_nowait() for _ in range(4)]
+        assert [e.type for e in served][0] == "git:pre-commit"
+        assert [e.payload.get("path") for e in served[1:]] == ["b.py", "c.py", "a.py"]
+
+    def test_drop_oldest_keeps_urgent_events(self):
+        """A full queue drops its oldest least urgent event."""
+        queue = EventQueue(maxsize=2, policy=OverflowPolicy.DROP_OLDEST)
+        queue.put_nowait(file_event("a.py"))
+        queue.put_nowait(file_event("b.py"))
+        queue.put_nowait(file_event("hook", Priority.CRITICAL))
+
+        assert queue.qsize() == 2
+        assert queue.dropped == 1
+        assert [queue.get_nowait().payload["path"] for _ in range(2)] == [
+            "hook",
+            "b.py",
+        ]
+
+    def test_drop_oldest_rejects_less_urgent_event(self):
+        """An event less urgent than everything queued is dropped itself."""
+        queue = EventQueue(maxsize=1)
+        queue.put_nowait(file_event("hook", Priority.CRITICAL))
+        queue.put_nowait(file_event("a.py", Priority.LOW))
+
+        assert queue.dropped == 1
+        assert queue.get_nowait().payload["path"] == "hook"
+
+    def test_coalesce_replaces_queued_event_for_path(self):
+        """A newer event for a queued path replaces it in place."""
+        queue = EventQueue(maxsize=10, policy=OverflowPolicy.COALESCE)
+        first = file_event("a.py")
+        latest = file_event("a.py")
+        queue.put_nowait(first)
+        queue.put_nowait(file_event("b.py"))
+        queue.put_nowait(latest)
+
+        assert queue.qsize() == 2
+        assert queue.coalesced == 1
+        assert queue.get_nowait() is latest
+        assert queue.get_nowait().payload["path"] == "b.py"
+
+    def test_block_policy_raises_queue_full(self):
+        """With the block policy put_nowait refuses and producers must wait."""
+        queue = EventQueue(maxsize=1, policy=OverflowPolicy.BLOCK)
+        queue.put_nowait(file_event("a.py"))
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait(file_event("b.py"))
+        assert queue.dropped == 0
+
+    def test_on_queued_skips_dropped_events(self):
+        """The queued hook sees queued and coalesced events, not dropped ones."""
+        queue = EventQueue(maxsize=1, policy=OverflowPolicy.COALESCE)
+        seen = []
+        queue.on_queued = seen.append
+        hook = file_event("hook", Priority.CRITICAL)
+        coalesced = file_event("hook", Priority.CRITICAL)
+        queue.put_nowait(hook)
+        queue.put_nowait(coalesced)
+        queue.put_nowait(file_event("a.py", Priority.LOW))
+
+        assert seen == [hook, coalesced]
+
+    def test_get_stats(self):
+        """Stats report depth, limits and counters."""
+        queue = EventQueue(maxsize=1, policy=OverflowPolicy.COALESCE)
+        queue.put_nowait(file_event("a.py"))
+        queue.put_nowait(file_event("a.py"))
+        queue.put_nowait(file_event("b.py"))
+
+        assert queue.get_stats() == {
+            "depth": 1,
+            "max_size": 1,
+            "policy": "coalesce",
+            "dropped": 1,
+            "coalesced": 1,
+        }
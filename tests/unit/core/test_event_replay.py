@@ -234,3 +234,81 @@ async def test_agent_tracks_last_sequence():
     agent._last_processed_sequence = event.sequence
 
     assert agent._last_processed_sequence == 5
+
+
+@pytest.mark.asyncio
+async def test_event_store_group_commits_batches(temp_db_path):
+    """Queued events are committed together rather than one per event."""
+    store = EventStore(temp_db_path, batch_size=50, flush_interval=10.0)
+    await store.initialize()
+    try:
+        for seq in range(1, 121):
+            assert store.enqueue(
+                Event(type="file:modified", payload={"n": seq}, sequence=seq)
+            )
+
+        # Reads flush pending writes first
+        events = await store.get_events(limit=200)
+        assert len(events) == 120
+
+        stats = store.get_write_stats()
+        assert stats["written"] == 120
+        assert stats["pending"] == 0
+        assert stats["batches"] <= 3
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_event_store_writer_flushes_after_interval(temp_db_path):
+    """The background writer commits a partial batch after flush_interval."""
+    store = EventStore(temp_db_path, batch_size=1000, flush_interval=0.01)
+    await store.initialize()
+    try:
+        store.enqueue(Event(type="file:modified", payload={}, sequence=1))
+        await asyncio.sleep(0.1)
+        assert store.get_write_stats()["written"] == 1
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_event_store_drops_when_queue_full(temp_db_path):
+    """enqueue drops and counts events beyond max_pending."""
+    store = EventStore(temp_db_path, flush_interval=10.0, max_pending=5)
+    await store.initialize()
+    try:
+        results = [
+            store.enqueue(Event(type="test", payload={}, sequence=seq))
+            for seq in range(1, 9)
+        ]
+        assert results.count(False) == 3
+        assert store.get_write_stats()["dropped"] == 3
+
+        # store_event applies backpressure instead of dropping
+        await store.store_event(Event(type="test", payload={}, sequence=100))
+        stats = store.get_write_stats()
+        assert stats["dropped"] == 3
+        assert stats["backpressure_waits"] == 1
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_event_store_close_flushes_pending(temp_db_path):
+    """Closing the store writes queued events and uses WAL mode."""
+    store = EventStore(temp_db_path, flush_interval=10.0)
+    await store.initialize()
+    journal_mode = store.connection.execute("PRAGMA journal_mode").fetchone()[0]
+    assert journal_mode == "wal"
+
+    for seq in range(1, 11):
+        store.enqueue(Event(type="test", payload={}, sequence=seq))
+    await store.close()
+
+    reopened = EventStore(temp_db_path)
+    await reopened.initialize()
+    try:
+        assert len(await reopened.get_events(limit=100)) == 10
+    finally:
+        await reopened.close()
@@ -187,6 +187,32 @@ class TestFileLockManager:
         assert len(lock_manager._lock_modes) == 0
         assert len(lock_manager._readers) == 0
 
+    @pytest.mark.asyncio
+    async def test_serialize_waits_for_same_owner(self, lock_manager, temp_file):
+        """serialize() queues work by the same owner on the same file."""
+        order = []
+
+        async def work(label: str, owner: str):
+            async with lock_manager.serialize(temp_file, owner):
+                order.append(f"{label}-start")
+                await asyncio.sleep(0.02)
+                order.append(f"{label}-end")
+
+        await asyncio.gather(work("a", "linter"), work("b", "linter"))
+        assert order == ["a-start", "a-end", "b-start", "b-end"]
+        assert lock_manager._serial_locks == {}
+
+    @pytest.mark.asyncio
+    async def test_serialize_independent_per_owner(self, lock_manager, temp_file):
+        """Different owners may process the same file at the same time."""
+
+        async def other_owner() -> bool:
+            async with lock_manager.serialize(temp_file, "formatter"):
+                return True
+
+        async with lock_manager.serialize(temp_file, "linter"):
+            assert await asyncio.wait_for(other_owner(), timeout=0.5)
+
 
 class TestFileLockContext:
     """Tests for FileLockContext async context manager."""
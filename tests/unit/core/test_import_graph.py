@@ -1,8 +1,14 @@
 """Tests for Python import graph analysis."""
 
+import json
+import os
+import sys
+import threading
+
 import pytest
 from pathlib import Path
 
+from devloop.core import import_graph
 from devloop.core.import_graph import ImportGraph
 
 
@@ -164,6 +170,44 @@ class TestIncrementalUpdate:
         # utils.py should no longer affect test_service.py
         assert graph.get_affected_tests(project / "src" / "utils.py") == []
 
+    def test_update_reexport_reresolves_importers(self, project):
+        """Changing what __init__.py re-exports moves importers' edges."""
+        pkg = project / "src" / "mypkg"
+        _write(pkg / "__init__.py", "from .old import thing\n")
+        _write(pkg / "old.py", "thing = 1")
+        _write(pkg / "new.py", "thing = 2")
+        test_file = _write(
+            project / "tests" / "test_mypkg.py", "from src.mypkg import thing\n"
+        )
+
+        graph = ImportGraph(project, src_dirs=[project / "src"])
+        graph.build()
+        assert graph.get_affected_tests(pkg / "old.py") == [test_file]
+
+        _write(pkg / "__init__.py", "from .new import thing\n")
+        graph.update_file(pkg / "__init__.py")
+
+        assert graph.get_affected_tests(pkg / "old.py") == []
+        assert graph.get_affected_tests(pkg / "new.py") == [test_file]
+
+    def test_new_submodule_reresolves_importers(self, project):
+        """A newly created submodule is found by existing `from` imports."""
+        pkg = project / "src" / "mypkg"
+        _write(pkg / "__init__.py", "")
+        test_file = _write(
+            project / "tests" / "test_mypkg.py", "from src.mypkg import helpers\n"
+        )
+
+        graph = ImportGraph(project, src_dirs=[project / "src"])
+        graph.build()
+        assert graph.get_affected_tests(pkg / "__init__.py") == [test_file]
+
+        _write(pkg / "helpers.py", "x = 1")
+        graph.update_file(pkg / "helpers.py")
+
+        assert graph.get_affected_tests(pkg / "helpers.py") == [test_file]
+        assert graph.get_affected_tests(pkg / "__init__.py") == []
+
 
 class TestRemoveFile:
     def test_remove_cleans_edges(self, project):
@@ -182,12 +226,72 @@ class TestRemoveFile:
         assert graph.get_affected_tests(project / "src" / "utils.py") == []
 
 
+class TestAffectedQueries:
+    """Tests for memoized closures and changeset queries."""
+
+    @pytest.fixture
+    def chain(self, project):
+        """base <- mid <- test_mid, and an unrelated test_other."""
+        _write(project / "src" / "base.py", "x = 1")
+        _write(project / "src" / "mid.py", "from src.base import x\n")
+        _write(project / "src" / "other.py", "y = 1")
+        _write(project / "tests" / "test_mid.py", "import src.mid\n")
+        _write(project / "tests" / "test_other.py", "import src.other\n")
+        graph = ImportGraph(project, src_dirs=[project / "src"])
+        graph.build()
+        return graph
+
+    def test_closure_reused_for_dependents(self, project, chain):
+        """Closures memoized for one file are reused by files below it."""
+        mid = project / "src" / "mid.py"
+        assert chain.get_affected_tests(mid) == [project / "tests" / "test_mid.py"]
+        assert mid.resolve() in chain._closures
+
+        affected = chain.get_affected_tests(project / "src" / "base.py")
+
+        assert affected == [project / "tests" / "test_mid.py"]
+
+    def test_edge_change_invalidates_only_touched_closures(self, project, chain):
+        base, other = project / "src" / "base.py", project / "src" / "other.py"
+        chain.get_affected_tests(base)
+        chain.get_affected_tests(other)
+
+        _write(project / "src" / "mid.py", "import src.base\nimport src.other\n")
+        chain.update_file(project / "src" / "mid.py")
+
+        assert other.resolve() not in chain._closures
+        assert chain.get_affected_tests(other) == [
+            project / "tests" / "test_mid.py",
+            project / "tests" / "test_other.py",
+        ]
+
+    def test_changeset_is_union_of_single_queries(self, project, chain):
+        changed = [project / "src" / "base.py", project / "src" / "other.py"]
+
+        expected = sorted(
+            {t for path in changed for t in chain.get_affected_tests(path)}
+        )
+
+        assert chain.get_affected_tests_for(changed) == expected
+        assert chain.get_affected_tests_for([]) == []
+
+    def test_changed_tests_included_only_when_reached(self, project, chain):
+        """A changed test counts only if it depends on another changed file."""
+        test_mid = project / "tests" / "test_mid.py"
+        test_other = project / "tests" / "test_other.py"
+
+        affected = chain.get_affected_tests_for(
+            [project / "src" / "base.py", test_mid, test_other]
+        )
+
+        assert affected == [test_mid]
+
+
 class TestPackageImports:
     def test_init_package_resolution(self, project):
-        """Importing a package resolves to __init__.py."""
+        """Importing a name defined in a package resolves to __init__.py."""
         pkg = project / "src" / "mypkg"
-        _write(pkg / "__init__.py", "from .core import thing\n")
-        _write(pkg / "core.py", "thing = 1")
+        _write(pkg / "__init__.py", "thing = 1\n")
         _write(
             project / "tests" / "test_mypkg.py",
             "from src.mypkg import thing\n",
@@ -216,6 +320,60 @@ class TestPackageImports:
         affected = graph.get_affected_tests(pkg / "utils.py")
         assert project / "tests" / "test_service.py" in affected
 
+    def test_reexported_name_resolves_to_defining_module(self, project):
+        """Names re-exported by __init__.py depend on the defining module only."""
+        pkg = project / "src" / "mypkg"
+        _write(pkg / "__init__.py", "from .core import thing\nfrom .other import y\n")
+        _write(pkg / "core.py", "thing = 1")
+        _write(pkg / "other.py", "y = 1")
+        test_file = _write(
+            project / "tests" / "test_mypkg.py",
+            "from src.mypkg import thing as renamed\n",
+        )
+
+        graph = ImportGraph(project, src_dirs=[project / "src"])
+        graph.build()
+
+        assert graph.get_affected_tests(pkg / "core.py") == [test_file]
+        assert graph.get_affected_tests(pkg / "other.py") == []
+        assert graph.get_affected_tests(pkg / "__init__.py") == []
+
+    def test_chained_reexports(self, project):
+        """Re-exports are followed through nested packages."""
+        pkg = project / "src" / "mypkg"
+        _write(pkg / "__init__.py", "from .sub import Thing as Public\n")
+        _write(pkg / "sub" / "__init__.py", "from .impl import Thing\n")
+        _write(pkg / "sub" / "impl.py", "class Thing: pass")
+        _write(pkg / "sub" / "unused.py", "x = 1")
+        test_file = _write(
+            project / "tests" / "test_mypkg.py", "from src.mypkg import Public\n"
+        )
+
+        graph = ImportGraph(project, src_dirs=[project / "src"])
+        graph.build()
+
+        assert graph.get_affected_tests(pkg / "sub" / "impl.py") == [test_file]
+        assert graph.get_affected_tests(pkg / "sub" / "__init__.py") == []
+
+    def test_from_package_import_submodule(self, project):
+        """`from package import module` depends on that module only."""
+        pkg = project / "src" / "mypkg"
+        _write(pkg / "__init__.py", "from .other import y\n")
+        _write(pkg / "event.py", "x = 1")
+        _write(pkg / "other.py", "y = 1")
+        _write(project / "tests" / "helpers.py", "x = 1")
+        test_file = _write(
+            project / "tests" / "test_event.py",
+            "from src.mypkg import event\nfrom . import helpers\n",
+        )
+
+        graph = ImportGraph(project, src_dirs=[project / "src"])
+        graph.build()
+
+        assert graph.get_affected_tests(pkg / "event.py") == [test_file]
+        assert graph.get_affected_tests(pkg / "other.py") == []
+        assert graph.get_affected_tests(project / "tests" / "helpers.py") == [test_file]
+
 
 class TestImportStatements:
     """Test various import statement forms."""
@@ -243,3 +401,118 @@ class TestImportStatements:
         graph.build()  # should not raise
 
         assert graph.get_affected_tests(project / "src" / "good.py") == []
+
+
+class TestGraphCache:
+    """Tests for the persistent parse cache."""
+
+    @pytest.fixture
+    def cache_path(self, project):
+        return project / ".devloop" / "import_graph.json"
+
+    def _build(self, project, cache_path) -> ImportGraph:
+        graph = ImportGraph(project, src_dirs=[project / "src"], cache_path=cache_path)
+        graph.build()
+        return graph
+
+    def _count_parses(self, monkeypatch) -> list:
+        parsed = []
+        original = import_graph._parse_source
+
+        def counting_parse(source, filename):
+            parsed.append(Path(filename).name)
+            return original(source, filename)
+
+        monkeypatch.setattr(import_graph, "_parse_source", counting_parse)
+        return parsed
+
+    def test_warm_build_reparses_only_changed_files(
+        self, project, cache_path, monkeypatch
+    ):
+        _write(project / "src" / "utils.py", "x = 1")
+        _write(project / "src" / "other.py", "y = 1")
+        test_file = _write(
+            project / "tests" / "test_utils.py", "from src.utils import x\n"
+        )
+        self._build(project, cache_path)
+        assert cache_path.exists()
+
+        _write(test_file, "from src.other import y\n")
+        parsed = self._count_parses(monkeypatch)
+        graph = self._build(project, cache_path)
+
+        assert parsed == ["test_utils.py"]
+        assert graph.get_affected_tests(project / "src" / "utils.py") == []
+        assert graph.get_affected_tests(project / "src" / "other.py") == [test_file]
+
+    def test_touched_file_matched_by_hash(self, project, cache_path, monkeypatch):
+        """A new mtime with unchanged content is not parsed again."""
+        utils = _write(project / "src" / "utils.py", "x = 1")
+        _write(project / "tests" / "test_utils.py", "import src.utils\n")
+        self._build(project, cache_path)
+
+        stat = utils.stat()
+        os.utime(utils, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        parsed = self._count_parses(monkeypatch)
+        graph = self._build(project, cache_path)
+
+        assert parsed == []
+        assert graph.get_affected_tests(utils) == [project / "tests" / "test_utils.py"]
+        cached = json.loads(cache_path.read_text())["files"][str(utils.resolve())]
+        assert cached["mtime_ns"] == stat.st_mtime_ns + 10**9
+
+    def test_deleted_file_dropped_from_cache(self, project, cache_path):
+        _write(project / "src" / "utils.py", "x = 1")
+        gone = _write(project / "src" / "gone.py", "import src.utils\n")
+        self._build(project, cache_path)
+
+        gone.unlink()
+        self._build(project, cache_path)
+
+        assert str(gone.resolve()) not in json.loads(cache_path.read_text())["files"]
+
+    def test_corrupt_cache_ignored(self, project, cache_path):
+        _write(project / "src" / "utils.py", "x = 1")
+        test_file = _write(project / "tests" / "test_utils.py", "import src.utils\n")
+        _write(cache_path, "{not json")
+
+        graph = self._build(project, cache_path)
+
+        assert graph.get_affected_tests(project / "src" / "utils.py") == [test_file]
+        version = json.loads(cache_path.read_text())["version"]
+        assert version == import_graph._CACHE_VERSION
+
+    def test_parallel_parse_matches_serial(self, project, cache_path, monkeypatch):
+        _write(project / "src" / "base.py", "x = 1")
+        for i in range(8):
+            _write(project / "src" / f"mod{i}.py", "from src.base import x\n")
+            _write(project / "tests" / f"test_mod{i}.py", f"import src.mod{i}\n")
+        serial = ImportGraph(project, src_dirs=[project / "src"])
+        serial.build()
+
+        monkeypatch.setattr(import_graph, "_PARALLEL_PARSE_THRESHOLD", 2)
+        parallel = self._build(project, cache_path)
+
+        base = project / "src" / "base.py"
+        assert len(parallel.get_affected_tests(base)) == 8
+        assert parallel.get_affected_tests(base) == serial.get_affected_tests(base)
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only")
+    def test_no_fork_with_other_threads(self, project, cache_path, monkeypatch):
+        """Parse workers are not forked from a multi-threaded process."""
+        _write(project / "src" / "base.py", "x = 1")
+        for i in range(4):
+            _write(project / "tests" / f"test_mod{i}.py", "import src.base\n")
+        monkeypatch.setattr(import_graph, "_PARALLEL_PARSE_THRESHOLD", 2)
+        monkeypatch.setattr(os, "cpu_count", lambda: 2)
+        stop = threading.Event()
+        thread = threading.Thread(target=stop.wait)
+        thread.start()
+        try:
+            assert import_graph._pool_context().get_start_method() != "fork"
+            graph = self._build(project, cache_path)
+        finally:
+            stop.set()
+            thread.join()
+
+        assert len(graph.get_affected_tests(project / "src" / "base.py")) == 4
@@ -0,0 +1,379 @@
+"""Tests for performance metrics, resource sampling and per-agent attribution."""
+
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from devloop.agents.sandbox_helper import AgentSandboxHelper
+from devloop.core.performance import (
+    AgentProcessRegistry,
+    AgentResourceTracker,
+    MetricsRollup,
+    PerformanceMetrics,
+    PerformanceMonitor,
+    ResourceSampler,
+    ResourceUsage,
+)
+from devloop.security.cgroups_helper import CgroupsResources
+from devloop.security.sandbox import SandboxConfig
+
+
+def make_metrics(
+    name: str, start: float, duration: float, success: bool = True
+) -> PerformanceMetrics:
+    """Create completed metrics without sampling the process."""
+    return PerformanceMetrics(
+        operation_name=name,
+        start_time=start,
+        end_time=start + duration,
+        duration=duration,
+        cpu_used=10.0,
+        memory_used_mb=2.0,
+        success=success,
+    )
+
+
+class TestMetricsRollup:
+    """Test rollup aggregation and percentile estimates."""
+
+    def test_percentiles_within_sketch_accuracy(self):
+        """p50/p95 come out within the sketch's relative error."""
+        rollup = MetricsRollup()
+        for i in range(1, 101):
+            rollup.add(make_metrics("op", 0.0, i / 100))
+
+        assert rollup.count == 100
+        assert rollup.duration_min == pytest.approx(0.01)
+        assert rollup.duration_max == pytest.approx(1.0)
+        assert rollup.duration_percentile(0.5) == pytest.approx(0.5, rel=0.06)
+        assert rollup.duration_percentile(0.95) == pytest.approx(0.95, rel=0.06)
+
+    def test_merge_and_row_round_trip(self):
+        """Merged rollups survive serialization to a database row."""
+        first, second = MetricsRollup(), MetricsRollup()
+        first.add(make_metrics("op", 0.0, 0.2))
+        second.add(make_metrics("op", 0.0, 0.4, success=False))
+        first.merge(second)
+
+        restored = MetricsRollup.from_row(first.to_row())
+
+        assert restored == first
+        assert restored.count == 2
+        assert restored.success_count == 1
+        assert restored.duration_sum == pytest.approx(0.6)
+
+
+class TestPerformanceMonitorStorage:
+    """Test summaries, trends, retention and migration."""
+
+    @pytest.mark.asyncio
+    async def test_summary_from_rollups(self, tmp_path: Path):
+        """Summaries aggregate stored rollups per operation."""
+        monitor = PerformanceMonitor(tmp_path)
+        now = time.time()
+        for i in range(10):
+            await monitor._store_metrics(make_metrics("lint", now - i * 60, 1.0))
+        await monitor._store_metrics(make_metrics("test", now, 3.0, success=False))
+
+        summary = await monitor.get_performance_summary("lint", hours=1)
+        assert summary["total_operations"] == 10
+        assert summary["success_rate"] == 100.0
+        assert summary["average_duration"] == 1.0
+        assert summary["p95_duration"] == pytest.approx(1.0, rel=0.06)
+
+        overall = await monitor.get_performance_summary(hours=1)
+        assert overall["total_operations"] == 11
+        assert overall["success_rate"] == pytest.approx(90.9)
+
+        rows = monitor.connection.execute("SELECT COUNT(*) FROM rollups").fetchone()
+        assert rows[0] <= 12  # one row per operation and minute
+
+    @pytest.mark.asyncio
+    async def test_resource_trends_grouped_by_hour(self, tmp_path: Path):
+        """Trends report operations and averages per hour."""
+        monitor = PerformanceMonitor(tmp_path)
+        hour_start = (time.time() // 3600) * 3600
+        await monitor._store_metrics(make_metrics("lint", hour_start + 1, 0.5))
+        await monitor._store_metrics(make_metrics("lint", hour_start + 120, 0.5))
+
+        trends = await monitor.get_resource_trends(hours=2)
+
+        assert trends[-1]["timestamp"] == hour_start
+        assert trends[-1]["operations"] == 2
+        assert trends[-1]["avg_cpu"] == 10.0
+        assert trends[-1]["avg_memory_mb"] == 2.0
+
+    @pytest.mark.asyncio
+    async def test_cleanup_drops_expired_rollups(self, tmp_path: Path):
+        """Rollups older than the retention period are removed."""
+        monitor = PerformanceMonitor(tmp_path, retention_days=1)
+        now = time.time()
+        await monitor._store_metrics(make_metrics("lint", now - 3 * 86400, 1.0))
+        await monitor._store_metrics(make_metrics("lint", now, 1.0))
+
+        await monitor._cleanup_old_metrics()
+
+        rows = monitor.connection.execute("SELECT COUNT(*) FROM rollups").fetchone()
+        assert rows[0] == 1
+
+    @pytest.mark.asyncio
+    async def test_migrates_legacy_jsonl(self, tmp_path: Path):
+        """An existing metrics.jsonl is imported once and set aside."""
+        now = time.time()
+        lines = [
+            {
+                "operation_name": "lint",
+                "start_time": now - 60,
+                "duration": 2.0,
+                "success": True,
+                "cpu_used": 5.0,
+                "memory_used_mb": 1.0,
+            },
+            {"operation_name": "lint", "start_time": now - 90 * 86400},
+        ]
+        legacy = tmp_path / "metrics.jsonl"
+        legacy.write_text(
+            "\n".join(json.dumps(line) for line in lines) + "\nnot json\n"
+        )
+
+        monitor = PerformanceMonitor(tmp_path)
+        summary = await monitor.get_performance_summary("lint")
+
+        assert summary["total_operations"] == 1
+        assert summary["average_duration"] == 2.0
+        assert not legacy.exists()
+        assert (tmp_path / "metrics.jsonl.migrated").exists()
+
+
+class TestResourceSampler:
+    """Test the background resource sampler."""
+
+    def test_sample_computes_cpu_from_cpu_time(self):
+        """Consecutive samples yield a CPU percentage and grow the buffer."""
+        sampler = ResourceSampler(interval=60, history=3)
+        first = sampler.sample()
+        deadline = time.monotonic() + 0.05
+        while time.monotonic() < deadline:
+            pass  # Burn CPU between samples
+        second = sampler.sample()
+
+        assert first.cpu_percent == 0.0
+        assert second.cpu_time >= first.cpu_time
+        assert second.cpu_percent > 0
+        assert len(sampler.samples()) == 2
+
+        sampler.sample()
+        sampler.sample()
+        assert len(sampler.samples()) == 3
+
+    def test_latest_starts_thread_without_blocking(self):
+        """latest() returns immediately and the thread keeps sampling."""
+        sampler = ResourceSampler(interval=0.01)
+        try:
+            start = time.perf_counter()
+            usage = sampler.latest()
+            assert time.perf_counter() - start < 0.05
+            assert usage.memory_mb > 0
+            assert sampler.running
+
+            time.sleep(0.1)
+            assert len(sampler.samples()) > 1
+        finally:
+            sampler.stop()
+        assert not sampler.running
+
+    def test_cpu_used_from_bracketing_samples(self):
+        """Operation CPU is the average between its start and end samples."""
+        start = ResourceUsage(
+            timestamp=100.0, cpu_percent=5.0, memory_mb=50.0, memory_percent=1.0
+        )
+        end = ResourceUsage(
+            timestamp=102.0,
+            cpu_percent=80.0,
+            memory_mb=60.0,
+            memory_percent=1.2,
+            cpu_time=1.0,
+        )
+        metrics = PerformanceMetrics(
+            operation_name="op",
+            start_time=time.time(),
+            resource_usage_start=start,
+            resource_usage_end=end,
+        )
+
+        metrics.complete(success=True)
+
+        assert metrics.cpu_used == pytest.approx(50.0)
+        assert metrics.memory_used_mb == pytest.approx(10.0)
+
+
+class TestAgentResourceAttribution:
+    """Test attribution of subprocess usage to agents."""
+
+    @pytest.fixture
+    def busy_process(self):
+        """A child process that burns CPU until killed."""
+        process = subprocess.Popen(
+            [sys.executable, "-c", "while True: pass"],
+        )
+        yield process
+        process.kill()
+        process.wait()
+
+    def test_usage_charged_to_spawning_agent(self, busy_process):
+        """Only the agent that spawned a process is charged for it."""
+        registry = AgentProcessRegistry()
+        tracker = AgentResourceTracker(cache_ttl_seconds=0, process_registry=registry)
+        registry.add("linter", busy_process.pid)
+        tracker.mark_agent_active("linter")
+        tracker.mark_agent_active("formatter")
+
+        tracker.get_agent_usage("linter")
+        time.sleep(0.3)
+        linter = tracker.get_agent_usage("linter")
+        formatter = tracker.get_agent_usage("formatter")
+
+        assert linter is not None and formatter is not None
+        assert linter.cpu_percent > 20
+        assert linter.memory_mb > 0
+        assert formatter.cpu_percent == 0.0
+        assert formatter.memory_mb == 0.0
+
+    def test_exited_process_keeps_cpu_time(self, busy_process):
+        """CPU time measured before exit stays charged to the agent."""
+        registry = AgentProcessRegistry()
+        registry.add("linter", busy_process.pid)
+        time.sleep(0.2)
+        cpu_seconds, _ = registry.measure("linter")
+
+        busy_process.kill()
+        busy_process.wait()
+        registry.remove("linter", busy_process.pid)
+
+        assert registry.pids("linter") == []
+        final_cpu_seconds, memory_mb = registry.measure("linter")
+        assert final_cpu_seconds >= cpu_seconds
+        assert memory_mb == 0.0
+
+    def test_final_sample_taken_on_removal(self, busy_process):
+        """A process reported before it is reaped is charged its final CPU time."""
+        registry = AgentProcessRegistry()
+        registry.add("linter", busy_process.pid)
+        time.sleep(0.3)
+
+        busy_process.kill()
+        time.sleep(0.1)  # Exited, not yet reaped
+        registry.remove("linter", busy_process.pid)
+
+        cpu_seconds, _ = registry.measure("linter")
+        assert cpu_seconds > 0.1
+
+    def test_untracked_children_not_charged(self, busy_process):
+        """CPU of the daemon's other children is not charged to an agent."""
+        idle = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        registry = AgentProcessRegistry()
+        registry.add("linter", idle.pid)
+        time.sleep(0.3)
+        busy_process.kill()
+        busy_process.wait()
+
+        idle.kill()
+        idle.wait()
+        registry.remove("linter", idle.pid)
+
+        cpu_seconds, _ = registry.measure("linter")
+        assert cpu_seconds < 0.1
+
+    def test_unreported_exit_is_pruned(self):
+        """Processes that exit without a report are dropped."""
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        registry = AgentProcessRegistry()
+        registry.add("linter", process.pid)
+        process.wait()
+
+        assert registry.pids("linter") == []
+
+    def test_reused_cgroup_charges_only_new_cpu_time(self):
+        """CPU used in a reused cgroup before a process started is not charged."""
+        cgroup = MagicMock()
+        cgroup.get_resource_usage.return_value = CgroupsResources(
+            memory_peak_mb=10.0, cpu_usage_percent=0.0, cpu_usage_usec=5_000_000
+        )
+        registry = AgentProcessRegistry()
+        registry.add("linter", 999_999_999, cgroup)
+        cgroup.get_resource_usage.return_value = CgroupsResources(
+            memory_peak_mb=10.0, cpu_usage_percent=0.0, cpu_usage_usec=5_500_000
+        )
+
+        assert registry.measure("linter") == (0.5, 10.0)
+
+    def test_shared_cgroup_measured_once(self):
+        """Concurrent processes in one cgroup are not each charged its usage."""
+        cgroup = MagicMock()
+        cgroup.get_resource_usage.return_value = CgroupsResources(
+            memory_peak_mb=10.0, cpu_usage_percent=0.0, cpu_usage_usec=1_000_000
+        )
+        registry = AgentProcessRegistry()
+        registry.add("linter", 999_999_998, cgroup)
+        registry.add("linter", 999_999_999, cgroup)
+        cgroup.get_resource_usage.return_value = CgroupsResources(
+            memory_peak_mb=10.0, cpu_usage_percent=0.0, cpu_usage_usec=3_000_000
+        )
+
+        assert registry.measure("linter") == (2.0, 10.0)
+
+    def test_cgroup_charged_final_usage_on_exit(self):
+        """CPU used in a cgroup after the last sample is charged on exit."""
+        cgroup = MagicMock()
+        cgroup.get_resource_usage.return_value = CgroupsResources(
+            memory_peak_mb=10.0, cpu_usage_percent=0.0, cpu_usage_usec=1_000_000
+        )
+        registry = AgentProcessRegistry()
+        registry.add("linter", 999_999_998, cgroup)
+        registry.add("linter", 999_999_999, cgroup)
+        cgroup.get_resource_usage.return_value = CgroupsResources(
+            memory_peak_mb=10.0, cpu_usage_percent=0.0, cpu_usage_usec=2_000_000
+        )
+        registry.remove("linter", 999_999_998)
+        cgroup.get_resource_usage.return_value = CgroupsResources(
+            memory_peak_mb=10.0, cpu_usage_percent=0.0, cpu_usage_usec=4_000_000
+        )
+        registry.remove("linter", 999_999_999)
+        cgroup.get_resource_usage.return_value = CgroupsResources(
+            memory_peak_mb=10.0, cpu_usage_percent=0.0, cpu_usage_usec=9_000_000
+        )
+
+        assert registry.measure("linter") == (3.0, 0.0)
+
+    def test_idle_agent_without_processes_has_no_usage(self):
+        """Agents that are neither active nor running tools report nothing."""
+        tracker = AgentResourceTracker(process_registry=AgentProcessRegistry())
+
+        assert tracker.get_agent_usage("linter") is None
+        assert tracker.report(["linter"])["linter"]["processes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_sandbox_helper_registers_processes(self, tmp_path, monkeypatch):
+        """Processes run through the sandbox helper are attributed to the agent."""
+        registry = AgentProcessRegistry()
+        monkeypatch.setattr(
+            "devloop.agents.sandbox_helper.get_agent_process_registry",
+            lambda: registry,
+        )
+        added, removed = [], []
+        monkeypatch.setattr(registry, "add", lambda a, pid, c: added.append((a, pid)))
+        monkeypatch.setattr(registry, "remove", lambda a, pid: removed.append((a, pid)))
+
+        helper = AgentSandboxHelper(
+            "linter", "linter", SandboxConfig(mode="none", allowed_tools=["python3"])
+        )
+        result = await helper.run_sandboxed(["python3", "-c", "pass"], cwd=tmp_path)
+
+        assert result.exit_code == 0
+        assert [agent for agent, _ in added] == ["linter"]
+        assert removed == added
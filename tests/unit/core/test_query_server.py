@@ -0,0 +1,170 @@
+"""Tests for the daemon query socket."""
+
+import asyncio
+import os
+import shutil
+import socket
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+from devloop.core.context_store import ContextStore, Finding, Severity
+from devloop.core.query_server import QueryServer, get_query_socket_path, query_daemon
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix sockets not supported"
+)
+
+
+def make_finding(id: str, file: str, **kwargs) -> Finding:
+    """Create a finding with test defaults."""
+    return Finding(
+        id=id,
+        agent="linter",
+        timestamp="2025-11-28T10:00:00Z",
+        file=file,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def project_dir():
+    """A project directory with a path short enough for a Unix socket."""
+    temp_dir = tempfile.mkdtemp(prefix="dlq")
+    yield Path(temp_dir).resolve()
+    shutil.rmtree(temp_dir)
+
+
+@pytest.fixture
+async def store(project_dir):
+    """A context store holding findings for two files."""
+    store = ContextStore(
+        context_dir=project_dir / ".devloop" / "context",
+        enable_path_validation=False,
+    )
+    await store.initialize()
+    app = project_dir / "src" / "app.py"
+    await store.add_findings(
+        [
+            make_finding("w1", str(app), line=30, severity=Severity.WARNING),
+            make_finding("e1", str(app), line=12, severity=Severity.ERROR),
+            make_finding("b1", str(app), relevance_score=0.1),
+            make_finding("o1", str(project_dir / "other.py"), blocking=True),
+        ]
+    )
+    yield store
+    await store.close()
+
+
+@pytest.fixture
+async def server(project_dir, store):
+    """A running query server."""
+    server = QueryServer(project_dir, store)
+    assert await server.start()
+    yield server
+    await server.stop()
+
+
+async def query(project_dir: Path, name: str, **params):
+    """Run the blocking client off the event loop."""
+    return await asyncio.to_thread(query_daemon, project_dir, name, **params)
+
+
+class TestQueryServer:
+    """Test queries answered over the socket."""
+
+    @pytest.mark.asyncio
+    async def test_findings_for_file(self, project_dir, server):
+        """Findings are matched on resolved paths and sorted by severity."""
+        response = await query(
+            project_dir, "findings", file=str(project_dir / "src" / ".." / "src/app.py")
+        )
+
+        assert response["ok"] is True
+        # Background findings are not shown to hooks
+        assert [f["id"] for f in response["findings"]] == ["e1", "w1"]
+        assert response["findings"][0]["severity"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_counts_and_status(self, project_dir, server):
+        """Counts are reported per tier; status includes the daemon PID."""
+        counts = await query(project_dir, "counts")
+        status = await query(project_dir, "status")
+
+        assert counts["counts"]["immediate"] == 1
+        assert counts["counts"]["relevant"] == 2
+        assert counts["counts"]["background"] == 1
+        assert status["pid"] == os.getpid()
+        assert status["counts"] == counts["counts"]
+
+    @pytest.mark.asyncio
+    async def test_tool_versions(self, project_dir, server, monkeypatch):
+        """The daemon reports the tool versions behind its cache keys."""
+        monkeypatch.setattr(
+            sys.modules["devloop.core.result_cache"],
+            "_tool_versions",
+            {("ruff", "--version"): "ruff 0.5.0"},
+        )
+
+        response = await query(project_dir, "tool_versions")
+
+        assert response["tool_versions"] == [[["ruff", "--version"], "ruff 0.5.0"]]
+
+    @pytest.mark.asyncio
+    async def test_invalid_requests(self, server):
+        """Unknown and malformed queries get an error response."""
+        assert (await server.handle_request({"query": "nope"}))["ok"] is False
+        assert (await server.handle_request({"query": "findings"}))["ok"] is False
+
+        reader, writer = await asyncio.open_unix_connection(str(server.socket_path))
+        writer.write(b"not json\n[]\n")
+        first, second = await reader.readline(), await reader.readline()
+        writer.close()
+
+        assert b"Invalid request" in first
+        assert b"Invalid request" in second
+
+    @pytest.mark.asyncio
+    async def test_stop_removes_socket(self, project_dir, store):
+        """Stopping the server removes the socket and clients get None."""
+        server = QueryServer(project_dir, store)
+        await server.start()
+        assert server.socket_path.exists()
+
+        await server.stop()
+
+        assert not server.socket_path.exists()
+        assert query_daemon(project_dir, "status") is None
+
+    @pytest.mark.asyncio
+    async def test_replaces_stale_socket(self, project_dir, store):
+        """A socket left behind by a crashed daemon is replaced."""
+        socket_path = get_query_socket_path(project_dir)
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_path))
+        stale.close()
+
+        server = QueryServer(project_dir, store)
+        try:
+            assert await server.start()
+            assert (await query(project_dir, "status"))["ok"] is True
+        finally:
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_does_not_take_over_live_socket(self, project_dir, store, server):
+        """A second server leaves a socket owned by a running daemon alone."""
+        second = QueryServer(project_dir, store)
+
+        assert not await asyncio.to_thread(asyncio.run, second.start())
+        assert (await query(project_dir, "status"))["ok"] is True
+
+    @pytest.mark.asyncio
+    async def test_path_too_long_disables_server(self, tmp_path, store):
+        """Projects whose socket path exceeds the AF_UNIX limit are skipped."""
+        server = QueryServer(tmp_path / ("x" * 120), store)
+
+        assert await server.start() is False
+        assert not server.running
@@ -0,0 +1,209 @@
+"""Tests for the content-addressed tool result cache."""
+
+import sys
+
+import pytest
+
+from devloop.core.result_cache import (
+    ResultCache,
+    config_hash,
+    find_config_files,
+    known_tool_versions,
+    remember_tool_versions,
+    tool_version,
+)
+
+
+@pytest.fixture
+async def cache(tmp_path):
+    """Create an initialized result cache."""
+    cache = ResultCache(tmp_path / "cache.db")
+    await cache.initialize()
+    yield cache
+    await cache.close()
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Create two source files."""
+    a_file = tmp_path / "a.py"
+    b_file = tmp_path / "b.py"
+    a_file.write_text("x = 1\n")
+    b_file.write_text("y = 2\n")
+    return a_file, b_file
+
+
+class TestResultCache:
+    """Tests for ResultCache."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_misses_then_hits(self, cache, files):
+        """Stored results are returned for unchanged files."""
+        lookup = await cache.lookup("linter", "1.0", "cfg", list(files))
+        assert lookup.hits == {}
+        assert lookup.misses == list(files)
+
+        await cache.store("linter", lookup, {files[0]: [{"code": "F401"}]})
+
+        lookup = await cache.lookup("linter", "1.0", "cfg", list(files))
+        assert lookup.hits == {files[0]: [{"code": "F401"}]}
+        assert lookup.misses == [files[1]]
+
+    @pytest.mark.asyncio
+    async def test_content_change_misses(self, cache, files):
+        """Changing a file's content invalidates its cached result."""
+        lookup = await cache.lookup("linter", "1.0", "cfg", [files[0]])
+        await cache.store("linter", lookup, {files[0]: []})
+
+        files[0].write_text("x = 2\n")
+        lookup = await cache.lookup("linter", "1.0", "cfg", [files[0]])
+        assert lookup.misses == [files[0]]
+
+        # Reverting the content hits the original entry again
+        files[0].write_text("x = 1\n")
+        lookup = await cache.lookup("linter", "1.0", "cfg", [files[0]])
+        assert lookup.hits == {files[0]: []}
+
+    @pytest.mark.asyncio
+    async def test_key_includes_version_config_and_agent(self, cache, files):
+        """Results are not shared across tool versions, configs or agents."""
+        lookup = await cache.lookup("linter", "1.0", "cfg", [files[0]])
+        await cache.store("linter", lookup, {files[0]: []})
+
+        for agent, version, settings in (
+            ("linter", "2.0", "cfg"),
+            ("linter", "1.0", "other"),
+            ("formatter", "1.0", "cfg"),
+        ):
+            lookup = await cache.lookup(agent, version, settings, [files[0]])
+            assert lookup.misses == [files[0]]
+
+    @pytest.mark.asyncio
+    async def test_unreadable_file_is_not_cached(self, cache, tmp_path):
+        """Missing files are always misses and are skipped on store."""
+        missing = tmp_path / "missing.py"
+        lookup = await cache.lookup("linter", "1.0", "cfg", [missing])
+        assert lookup.misses == [missing]
+
+        await cache.store("linter", lookup, {missing: []})
+        assert (await cache.get_stats())["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self, tmp_path):
+        """The least recently used entries are evicted over max_entries."""
+        cache = ResultCache(tmp_path / "cache.db", max_entries=2)
+        await cache.initialize()
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.py"
+            path.write_text(f"{name} = 1\n")
+            paths.append(path)
+
+        for path in paths[:2]:
+            lookup = await cache.lookup("linter", "1.0", "cfg", [path])
+            await cache.store("linter", lookup, {path: []})
+
+        # Touch a.py so b.py becomes the least recently used entry
+        await cache.lookup("linter", "1.0", "cfg", [paths[0]])
+
+        lookup = await cache.lookup("linter", "1.0", "cfg", [paths[2]])
+        await cache.store("linter", lookup, {paths[2]: []})
+
+        lookup = await cache.lookup("linter", "1.0", "cfg", paths)
+        assert set(lookup.hits) == {paths[0], paths[2]}
+        assert lookup.misses == [paths[1]]
+
+        stats = await cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_stats_persist_across_connections(self, tmp_path, files):
+        """Hit and miss counters survive reopening the database."""
+        cache = ResultCache(tmp_path / "cache.db")
+        await cache.initialize()
+        lookup = await cache.lookup("linter", "1.0", "cfg", list(files))
+        await cache.store("linter", lookup, {files[0]: []})
+        await cache.lookup("linter", "1.0", "cfg", list(files))
+        await cache.close()
+
+        reopened = ResultCache(tmp_path / "cache.db")
+        await reopened.initialize()
+        stats = await reopened.get_stats()
+        await reopened.close()
+
+        assert stats["hits"] == 1
+        assert stats["misses"] == 3
+        assert stats["hit_rate"] == pytest.approx(0.25)
+
+    @pytest.mark.asyncio
+    async def test_uninitialized_cache_is_a_no_op(self, tmp_path, files):
+        """Without initialize() every file misses and store does nothing."""
+        cache = ResultCache(tmp_path / "cache.db")
+        lookup = await cache.lookup("linter", "1.0", "cfg", list(files))
+        assert lookup.misses == list(files)
+
+        await cache.store("linter", lookup, {files[0]: []})
+        assert await cache.get_stats() == {}
+        assert not (tmp_path / "cache.db").exists()
+
+    @pytest.mark.asyncio
+    async def test_clear(self, cache, files):
+        """clear() drops entries and counters."""
+        lookup = await cache.lookup("linter", "1.0", "cfg", list(files))
+        await cache.store("linter", lookup, {files[0]: []})
+
+        await cache.clear()
+
+        stats = await cache.get_stats()
+        assert stats["entries"] == 0
+        assert stats["misses"] == 0
+
+
+class TestConfigHash:
+    """Tests for config hashing helpers."""
+
+    def test_config_file_content_changes_hash(self, tmp_path):
+        """Editing a tool config file changes the hash."""
+        config = tmp_path / "ruff.toml"
+        config.write_text("line-length = 88\n")
+        before = config_hash("ruff", config_files=[config])
+
+        config.write_text("line-length = 100\n")
+        assert config_hash("ruff", config_files=[config]) != before
+
+    def test_options_change_hash(self):
+        """Different options produce different hashes."""
+        assert config_hash("bandit", "low") != config_hash("bandit", "high")
+
+    def test_find_config_files_walks_parents(self, tmp_path):
+        """Config files are found in the start directory and its parents."""
+        (tmp_path / "pyproject.toml").write_text("")
+        nested = tmp_path / "src" / "pkg"
+        nested.mkdir(parents=True)
+        (nested / "ruff.toml").write_text("")
+
+        found = find_config_files(nested, ("ruff.toml", "pyproject.toml"))
+
+        assert nested.resolve() / "ruff.toml" in found
+        assert tmp_path.resolve() / "pyproject.toml" in found
+
+
+class TestToolVersions:
+    """Tests for the tool version memo."""
+
+    @pytest.mark.asyncio
+    async def test_remembered_versions_skip_probe(self, monkeypatch):
+        """Versions seeded from another process are used without probing."""
+        monkeypatch.setattr(
+            sys.modules["devloop.core.result_cache"], "_tool_versions", {}
+        )
+        remember_tool_versions([(["no-such-tool", "--version"], "no-such-tool 1.0")])
+        remember_tool_versions([(["other-tool", "--version"], "")])
+
+        assert await tool_version(["no-such-tool", "--version"]) == "no-such-tool 1.0"
+        assert await tool_version(["other-tool", "--version"]) == ""
+        assert known_tool_versions() == [
+            (["no-such-tool", "--version"], "no-such-tool 1.0")
+        ]
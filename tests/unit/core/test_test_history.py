@@ -0,0 +1,108 @@
+"""Tests for the per-test history used to order test runs."""
+
+import pytest
+
+from devloop.core.test_history import TestHistory, TestRecord, run_order
+
+
+@pytest.fixture
+async def history(tmp_path):
+    """Create an initialized test history."""
+    history = TestHistory(tmp_path / "history.db")
+    await history.initialize()
+    yield history
+    await history.close()
+
+
+def _result(test, outcome="passed", duration=0.1):
+    return {"test": test, "outcome": outcome, "duration": duration}
+
+
+class TestTestHistory:
+    """Tests for TestHistory."""
+
+    @pytest.mark.asyncio
+    async def test_records_outcome_duration_and_sources(self, history):
+        """Results are stored per node ID with the source they ran for."""
+        await history.record(
+            [
+                _result("tests/test_a.py::test_one", "failed", 0.5),
+                _result("tests/test_b.py::test_two"),
+            ],
+            source="src/app.py",
+        )
+
+        records = await history.get_for_files(["tests/test_a.py"])
+
+        assert list(records) == ["tests/test_a.py::test_one"]
+        record = records["tests/test_a.py::test_one"]
+        assert (record.file, record.outcome, record.duration) == (
+            "tests/test_a.py",
+            "failed",
+            0.5,
+        )
+        assert record.sources == ["src/app.py"]
+
+    @pytest.mark.asyncio
+    async def test_sources_accumulate_most_recent_first(self, history):
+        """Each run adds its source without losing earlier ones."""
+        test = "tests/test_a.py::test_one"
+        await history.record([_result(test)], source="src/a.py")
+        await history.record([_result(test)], source="src/b.py")
+        await history.record([_result(test, "failed")])
+
+        record = (await history.get_for_files(["tests/test_a.py"]))[test]
+
+        assert record.sources == ["src/b.py", "src/a.py"]
+        assert record.outcome == "failed"
+
+    @pytest.mark.asyncio
+    async def test_complete_files_forget_removed_tests(self, history):
+        """Tests missing from a full run of their file are dropped."""
+        await history.record(
+            [_result("tests/test_a.py::test_one"), _result("tests/test_a.py::gone")]
+        )
+
+        await history.record(
+            [_result("tests/test_a.py::test_one")], complete_files=["tests/test_a.py"]
+        )
+
+        records = await history.get_for_files(["tests/test_a.py"])
+        assert list(records) == ["tests/test_a.py::test_one"]
+
+    @pytest.mark.asyncio
+    async def test_collection_errors_not_recorded(self, history):
+        """Results without a test name (file-level errors) are skipped."""
+        await history.record([_result("tests/test_a.py", "failed")])
+
+        assert await history.get_for_files(["tests/test_a.py"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_uninitialized_history_is_empty(self, tmp_path):
+        """An unopened history neither stores nor returns records."""
+        history = TestHistory(tmp_path / "history.db")
+
+        await history.record([_result("tests/test_a.py::test_one")])
+
+        assert await history.get_for_files(["tests/test_a.py"]) == {}
+
+
+class TestRunOrder:
+    """Tests for run_order."""
+
+    def test_failing_then_covering_then_fastest(self):
+        """Failures lead, then tests that covered the source, fastest first."""
+        records = [
+            TestRecord("t::slow", "t", "passed", 2.0, 0, ["src/app.py"]),
+            TestRecord("t::fast", "t", "passed", 0.1, 0, []),
+            TestRecord("t::covers", "t", "passed", 1.0, 0, ["src/app.py"]),
+            TestRecord("t::failed", "t", "failed", 5.0, 0, []),
+        ]
+
+        assert run_order(records, "src/app.py") == [
+            "t::failed",
+            "t::covers",
+            "t::slow",
+            "t::fast",
+        ]
+        assert run_order(records) == ["t::failed", "t::fast", "t::covers", "t::slow"]
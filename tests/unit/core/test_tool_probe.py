@@ -0,0 +1,176 @@
+"""Tests for concurrent, cached tool version probes."""
+
+import os
+import time
+
+import pytest
+
+from devloop.core.tool_dependencies import ToolDependencyManager
+from devloop.core.tool_probe import ToolProbe
+from devloop.core.tool_registry import ToolRegistry
+
+
+def _tool(bin_dir, name, version="1.2.3", delay=0.0):
+    """Create a fake tool that logs each invocation and prints its version."""
+    path = bin_dir / name
+    path.write_text(
+        "#!/bin/sh\n"
+        f"echo run >> {bin_dir / (name + '.log')}\n"
+        f"sleep {delay}\n"
+        f"echo '{name} {version}'\n"
+    )
+    path.chmod(0o755)
+    return path
+
+
+def _runs(bin_dir, name):
+    log = bin_dir / f"{name}.log"
+    return len(log.read_text().splitlines()) if log.exists() else 0
+
+
+@pytest.fixture
+def bin_dir(tmp_path, monkeypatch):
+    """A directory of fake tools that is the only PATH entry."""
+    path = tmp_path / "bin"
+    path.mkdir()
+    monkeypatch.setenv("PATH", str(path))
+    return path
+
+
+class TestToolProbe:
+    """Tests for ToolProbe."""
+
+    def test_warm_start_runs_no_processes(self, bin_dir, tmp_path):
+        """Cached results are reused while the binary is unchanged."""
+        _tool(bin_dir, "poetry")
+        cache = tmp_path / "tool_versions.json"
+
+        first = ToolProbe(cache).run([["poetry", "--version"]])
+        probe = ToolProbe(cache)
+        second = probe.run([["poetry", "--version"]])
+
+        assert second == first
+        assert second["poetry --version"].stdout == "poetry 1.2.3\n"
+        assert probe.runs == 0
+        assert _runs(bin_dir, "poetry") == 1
+
+    def test_changed_binary_is_probed_again(self, bin_dir, tmp_path):
+        """Replacing a tool invalidates only that tool's result."""
+        _tool(bin_dir, "poetry")
+        _tool(bin_dir, "npm")
+        cache = tmp_path / "tool_versions.json"
+        commands = [["poetry", "--version"], ["npm", "--version"]]
+        ToolProbe(cache).run(commands)
+
+        tool = _tool(bin_dir, "poetry", version="2.0.0")
+        stat = tool.stat()
+        os.utime(tool, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        results = ToolProbe(cache).run(commands)
+
+        assert results["poetry --version"].stdout == "poetry 2.0.0\n"
+        assert (_runs(bin_dir, "poetry"), _runs(bin_dir, "npm")) == (2, 1)
+
+    def test_missing_tools_are_left_out(self, bin_dir, tmp_path):
+        """Commands whose binary is not on PATH are not run or cached."""
+        probe = ToolProbe(tmp_path / "tool_versions.json")
+
+        assert probe.run([["yarn", "--version"]]) == {}
+        assert probe.runs == 0
+
+        _tool(bin_dir, "yarn")
+        assert probe.run([["yarn", "--version"]])["yarn --version"].ok
+
+    def test_probes_run_concurrently(self, bin_dir):
+        """Slow probes overlap instead of adding up."""
+        names = ["poetry", "pip", "npm", "yarn"]
+        for name in names:
+            _tool(bin_dir, name, delay=0.5)
+
+        start = time.perf_counter()
+        results = ToolProbe(None).run([[name, "--version"] for name in names])
+        elapsed = time.perf_counter() - start
+
+        assert len(results) == 4
+        assert elapsed < 1.5
+
+    def test_module_of_unknown_interpreter_is_not_cached(self, bin_dir, tmp_path):
+        """``-m`` probes of a Python whose packages cannot be found rerun."""
+        _tool(bin_dir, "python")
+        cache = tmp_path / "tool_versions.json"
+
+        ToolProbe(cache).run([["python", "-m", "ruff", "--version"]])
+        probe = ToolProbe(cache)
+        probe.run([["python", "-m", "ruff", "--version"]])
+
+        assert probe.runs == 1
+        assert _runs(bin_dir, "python") == 2
+
+    def test_module_in_other_virtualenv_is_stamped(self, tmp_path, monkeypatch):
+        """Installing into another virtualenv re-probes its ``-m`` modules."""
+        venv = tmp_path / "venv"
+        site = venv / "lib" / "python3.11" / "site-packages"
+        site.mkdir(parents=True)
+        (venv / "pyvenv.cfg").write_text("home = /usr/bin\n")
+        (venv / "bin").mkdir()
+        _tool(venv / "bin", "python")
+        monkeypatch.setenv("PATH", str(venv / "bin"))
+        cache = tmp_path / "tool_versions.json"
+        command = ["python", "-m", "ruff", "--version"]
+
+        ToolProbe(cache).run([command])
+        warm = ToolProbe(cache)
+        warm.run([command])
+        (site / "ruff-0.6.0.dist-info").mkdir()
+        stat = site.stat()
+        os.utime(site, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        upgraded = ToolProbe(cache)
+        upgraded.run([command])
+
+        assert (warm.runs, upgraded.runs) == (0, 1)
+
+    def test_unreadable_cache_is_ignored(self, bin_dir, tmp_path):
+        """A corrupt cache file causes a fresh probe and is rewritten."""
+        _tool(bin_dir, "pip")
+        cache = tmp_path / "tool_versions.json"
+        cache.write_text("{not json")
+
+        results = ToolProbe(cache).run([["pip", "--version"]])
+
+        assert results["pip --version"].ok
+        assert ToolProbe(cache)._load_cache()
+
+
+class TestCachedDiscovery:
+    """Tests for registry and dependency checks using the probe cache."""
+
+    def test_registry_detects_runners_from_cache(self, bin_dir, tmp_path):
+        """A second registry finds the same runners without probing."""
+        _tool(bin_dir, "poetry", version="1.8.0")
+        cache = tmp_path / "tool_versions.json"
+
+        ToolRegistry(cache_path=cache)
+        registry = ToolRegistry(cache_path=cache)
+
+        assert registry.available_runners["poetry"].version == "poetry 1.8.0"
+        assert "pip" not in registry.available_runners
+        assert _runs(bin_dir, "poetry") == 1
+
+    def test_check_all_tools_probes_each_tool_once(self, bin_dir, tmp_path):
+        """Compatibility comes from the probed version, not a second run."""
+        _tool(bin_dir, "git", version="2.40.0")
+        _tool(bin_dir, "gh", version="1.0.0")
+        cache = tmp_path / "tool_versions.json"
+
+        ToolDependencyManager.check_all_tools(cache_path=cache)
+        results = ToolDependencyManager.check_all_tools(cache_path=cache)
+
+        assert (results["git"]["version"], results["git"]["compatible"]) == (
+            "2.40.0",
+            True,
+        )
+        assert (results["gh"]["available"], results["gh"]["compatible"]) == (
+            True,
+            False,
+        )
+        assert not results["snyk"]["available"]
+        assert (_runs(bin_dir, "git"), _runs(bin_dir, "gh")) == (1, 1)
@@ -11,7 +11,7 @@ from lsprotocol.types import (
     Range,
 )
 
-from devloop.core.context_store import Finding, Severity
+from devloop.core.context_store import Finding, Severity, Tier
 from devloop.core.event import Event
 from devloop.lsp.server import DevLoopLanguageServer
 
@@ -289,7 +289,7 @@ class TestDevLoopLanguageServer:
                 line=5,
             ),
         ]
-        mock_context_store.get_findings.return_value = findings
+        mock_context_store.get_findings.return_value = findings[:1]
         server.context_store = mock_context_store
         server.publish_diagnostics = Mock()
 
@@ -297,7 +297,10 @@ class TestDevLoopLanguageServer:
 
         await server._publish_diagnostics_for_uri(uri)
 
-        # Should only publish diagnostics for test.py
+        # The file filter is delegated to the context store
+        mock_context_store.get_findings.assert_called_once_with(
+            tier=Tier.IMMEDIATE, file_filter="/home/user/project/test.py"
+        )
         assert len(server.diagnostics_cache[uri]) == 1
         assert server.diagnostics_cache[uri][0].message == "Issue 1"
 
@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from devloop.security.bubblewrap_sandbox import BubblewrapSandbox
+from devloop.security.path_validator import PathValidationError
 from devloop.security.sandbox import SandboxConfig
 
 # ---------------------------------------------------------------------------
@@ -264,3 +265,151 @@ class TestBuildBwrapCommand:
                     ro_bind_pairs.append((result[i + 1], result[i + 2]))
             lib64_binds = [p for p in ro_bind_pairs if p[0] == "/lib64"]
             assert len(lib64_binds) >= 1
+
+
+# ---------------------------------------------------------------------------
+# Warm sessions
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def spawn():
+    """Stub out bwrap process creation and audit logging for execute()."""
+    process = MagicMock(pid=4242, returncode=0)
+    process.communicate = AsyncMock(return_value=(b"ok\n", b""))
+    with (
+        patch(
+            "devloop.security.bubblewrap_sandbox.asyncio.create_subprocess_exec",
+            AsyncMock(return_value=process),
+        ) as create,
+        patch("devloop.security.bubblewrap_sandbox.get_audit_logger"),
+        patch.object(BubblewrapSandbox, "validate_command", return_value=True),
+    ):
+        yield create
+
+
+@pytest.fixture
+def cgroup():
+    """A cgroups manager that reports itself available."""
+    mgr = MagicMock()
+    mgr.is_available = AsyncMock(return_value=True)
+    with patch(
+        "devloop.security.bubblewrap_sandbox.CgroupsManager", return_value=mgr
+    ) as cls:
+        mgr.cls = cls
+        yield mgr
+
+
+class TestWarmSession:
+    @pytest.mark.asyncio
+    async def test_directory_validated_once(
+        self, sandbox: BubblewrapSandbox, spawn: AsyncMock, tmp_path: Path
+    ) -> None:
+        with patch.object(
+            BubblewrapSandbox, "_validate_cwd", wraps=sandbox._validate_cwd
+        ) as validate:
+            await sandbox.execute(["python3", "-V"], cwd=tmp_path)
+            await sandbox.execute(["python3", "-c", "pass"], cwd=tmp_path)
+
+        assert validate.call_count == 1
+        first, second = (call.args for call in spawn.call_args_list)
+        assert first[-2:] == ("python3", "-V")
+        assert second[:-3] == first[:-2]
+
+    @pytest.mark.asyncio
+    async def test_replaced_directory_revalidated(
+        self, sandbox: BubblewrapSandbox, spawn: AsyncMock, tmp_path: Path
+    ) -> None:
+        cwd = tmp_path / "project"
+        cwd.mkdir()
+        await sandbox.execute(["python3"], cwd=cwd)
+
+        cwd.rename(tmp_path / "moved")
+        (tmp_path / "elsewhere").mkdir()
+        cwd.symlink_to(tmp_path / "elsewhere")
+        await sandbox.execute(["python3"], cwd=cwd)
+
+        argv = spawn.call_args.args
+        assert argv[argv.index("--chdir") + 1] == str(tmp_path / "elsewhere")
+
+    @pytest.mark.asyncio
+    async def test_ancestor_replaced_by_symlink_revalidated(
+        self, sandbox: BubblewrapSandbox, spawn: AsyncMock, tmp_path: Path
+    ) -> None:
+        cwd = tmp_path / "parent" / "project"
+        cwd.mkdir(parents=True)
+        await sandbox.execute(["python3"], cwd=cwd)
+
+        (tmp_path / "parent").rename(tmp_path / "moved")
+        (tmp_path / "parent").symlink_to(tmp_path / "moved")
+        with patch.object(
+            BubblewrapSandbox, "_validate_cwd", wraps=sandbox._validate_cwd
+        ) as validate:
+            await sandbox.execute(["python3"], cwd=cwd)
+
+        assert validate.call_count == 1
+        argv = spawn.call_args.args
+        assert argv[argv.index("--chdir") + 1] == str(tmp_path / "moved" / "project")
+
+    @pytest.mark.asyncio
+    async def test_removed_directory_rejected(
+        self, sandbox: BubblewrapSandbox, spawn: AsyncMock, tmp_path: Path
+    ) -> None:
+        cwd = tmp_path / "project"
+        cwd.mkdir()
+        await sandbox.execute(["python3"], cwd=cwd)
+        cwd.rmdir()
+
+        with pytest.raises(PathValidationError):
+            await sandbox.execute(["python3"], cwd=cwd)
+
+    @pytest.mark.asyncio
+    async def test_cgroup_kept_until_close(
+        self,
+        sandbox: BubblewrapSandbox,
+        spawn: AsyncMock,
+        cgroup: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        for _ in range(3):
+            await sandbox.execute(["python3"], cwd=tmp_path)
+
+        assert cgroup.cls.call_count == 1
+        assert cgroup.set_memory_limit.call_count == 1
+        assert cgroup.add_process.call_count == 3
+        cgroup.cleanup.assert_not_called()
+
+        await sandbox.close()
+
+        cgroup.cleanup.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_changed_limits_reapplied(
+        self,
+        sandbox: BubblewrapSandbox,
+        spawn: AsyncMock,
+        cgroup: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        await sandbox.execute(["python3"], cwd=tmp_path)
+        sandbox.config.max_memory_mb = 128
+        await sandbox.execute(["python3"], cwd=tmp_path)
+
+        assert [c.args for c in cgroup.set_memory_limit.call_args_list] == [
+            (256,),
+            (128,),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sandboxes_get_separate_cgroups(
+        self, config: SandboxConfig, cgroup: MagicMock
+    ) -> None:
+        first, second = BubblewrapSandbox(config), BubblewrapSandbox(config)
+        first.agent_name = second.agent_name = "linter"
+
+        await first._init_cgroups()
+        await second._init_cgroups()
+
+        names = [c.kwargs["cgroup_name"] for c in cgroup.cls.call_args_list]
+        assert names[0] != names[1]
+        assert all(name.startswith("devloop-bwrap-linter-") for name in names)
@@ -0,0 +1,99 @@
+"""Tests for stopping sandboxed tool processes when their run is cancelled."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import psutil
+import pytest
+
+from devloop.agents.sandbox_helper import AgentSandboxHelper
+from devloop.core.performance import get_agent_process_registry
+from devloop.security.no_sandbox import NoSandbox
+from devloop.security.sandbox import SandboxConfig
+
+SLEEP = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+
+@pytest.fixture
+def config():
+    """Sandbox config that allows this interpreter."""
+    return SandboxConfig(mode="none", allowed_tools=[sys.executable])
+
+
+async def wait_for(predicate, timeout: float = 2.0) -> None:
+    """Poll until predicate() is true."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+async def cancel(task: asyncio.Task) -> None:
+    """Cancel task and wait for it to finish."""
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+class TestSandboxCancellation:
+    """Cancelled executions terminate their process."""
+
+    @pytest.mark.asyncio
+    async def test_cancel_terminates_process(self, config, tmp_path):
+        """SIGTERM stops the tool and the exit is reported."""
+        sandbox = NoSandbox(config)
+        started, exited = [], []
+        sandbox.on_process_started = lambda pid, cgroup: started.append(pid)
+        sandbox.on_process_exited = exited.append
+
+        task = asyncio.create_task(sandbox.execute(SLEEP, tmp_path))
+        await wait_for(lambda: started)
+        await cancel(task)
+
+        assert exited == started
+        assert not psutil.pid_exists(started[0])
+
+    @pytest.mark.asyncio
+    async def test_cancel_kills_process_ignoring_sigterm(self, config, tmp_path):
+        """Tools that ignore SIGTERM are killed after the grace period."""
+        sandbox = NoSandbox(config)
+        started = []
+        sandbox.on_process_started = lambda pid, cgroup: started.append(pid)
+        stubborn = [
+            sys.executable,
+            "-c",
+            "import signal, time\n"
+            "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+            "time.sleep(30)\n",
+        ]
+
+        task = asyncio.create_task(sandbox.execute(stubborn, tmp_path))
+        await wait_for(lambda: started)
+        await asyncio.sleep(0.3)  # Let it install the handler
+        await cancel(task)
+
+        assert not psutil.pid_exists(started[0])
+
+
+class TestAgentSandboxHelperCancellation:
+    """AgentSandboxHelper counts cancelled commands."""
+
+    @pytest.mark.asyncio
+    async def test_cancelled_command_is_counted(self, config):
+        """Cancellations are counted on the helper and per agent."""
+        helper = AgentSandboxHelper("cancel-test", "linter", config)
+        helper._sandbox = NoSandbox(config)
+        helper._attribute_processes(helper._sandbox)
+        helper._sandbox_initialized = True
+        registry = get_agent_process_registry()
+        before = registry.cancelled("cancel-test")
+
+        task = asyncio.create_task(helper.run_sandboxed(SLEEP, cwd=Path.cwd()))
+        await wait_for(lambda: registry.pids("cancel-test"))
+        await cancel(task)
+
+        assert helper.cancelled == 1
+        assert registry.cancelled("cancel-test") == before + 1
+        assert registry.pids("cancel-test") == []
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from devloop.collectors.base import BaseCollector
+from devloop.collectors.coalescer import PathEventCoalescer
 from devloop.collectors.filesystem import FileSystemCollector
 from devloop.collectors.git import GitCollector
 from devloop.collectors.manager import CollectorManager
@@ -946,6 +947,47 @@ class TestFileSystemCollectorExtended:
         assert collector.should_ignore("/path/.venv/lib/python/site-packages")
         assert collector.should_ignore("/path/venv/bin/python")
 
+    def test_should_ignore_matches_components_not_substrings(self):
+        """Default patterns match whole directory names only."""
+        collector = FileSystemCollector(EventBus())
+
+        assert not collector.should_ignore("/path/.github/workflows/ci.yml")
+        assert not collector.should_ignore("/path/src/venv_tools.py")
+
+    def test_should_ignore_glob_patterns(self):
+        """Other patterns are globs on the full or project-relative path."""
+        collector = FileSystemCollector(
+            EventBus(), config={"ignore_patterns": ["*.pyc", "build/*"]}
+        )
+        root = collector.path_validator.project_root
+
+        assert collector.should_ignore(f"{root}/pkg/module.pyc")
+        assert collector.should_ignore(f"{root}/build/lib/app.py")
+        assert not collector.should_ignore(f"{root}/src/build/app.py")
+
+    def test_directory_events_invalidate_validator_cache(self, tmp_path):
+        """Directory create/delete/move events clear cached resolutions."""
+        collector = FileSystemCollector(EventBus())
+        collector.path_validator = MagicMock()
+
+        for handler in (collector.on_created, collector.on_deleted):
+            event = MagicMock(is_directory=True, src_path=str(tmp_path / "d"))
+            handler(event)
+        collector.on_moved(
+            MagicMock(
+                is_directory=True,
+                src_path=str(tmp_path / "a"),
+                dest_path=str(tmp_path / "b"),
+            )
+        )
+
+        assert [c.args for c in collector.path_validator.invalidate.call_args_list] == [
+            (str(tmp_path / "d"), True),
+            (str(tmp_path / "d"), True),
+            (str(tmp_path / "a"), True),
+            (str(tmp_path / "b"), True),
+        ]
+
     def test_on_created_directory(self):
         """Test that directory creation is ignored."""
         event_bus = EventBus()
@@ -1301,3 +1343,109 @@ class TestBaseCollectorExtended:
         assert event_bus.emit.called
         event = event_bus.emit.call_args[0][0]
         assert event.priority.value == 1  # NORMAL priority
+
+
+class TestPathEventCoalescer:
+    """Tests for per-path event coalescing."""
+
+    @staticmethod
+    def make_coalescer(window: float = 0.02):
+        emitted = []
+
+        async def emit(event_type, path, extra):
+            emitted.append((event_type, path, extra))
+
+        return PathEventCoalescer(emit, window=window), emitted
+
+    @pytest.mark.asyncio
+    async def test_modify_burst_collapses(self):
+        """Repeated modifications of one path emit a single event."""
+        coalescer, emitted = self.make_coalescer()
+        for _ in range(5):
+            coalescer.add("file:modified", "/p/a.py")
+        coalescer.add("file:modified", "/p/b.py")
+
+        await asyncio.sleep(0.1)
+
+        assert sorted(path for _, path, _ in emitted) == ["/p/a.py", "/p/b.py"]
+        a_event = next(e for e in emitted if e[1] == "/p/a.py")
+        assert a_event[0] == "file:modified"
+        assert a_event[2]["coalesced"] == 5
+        stats = coalescer.get_stats()
+        assert stats == {"received": 6, "emitted": 2, "suppressed": 4, "pending": 0}
+
+    @pytest.mark.asyncio
+    async def test_editor_temp_file_save(self):
+        """create tmp -> modify tmp -> move tmp over target emits one modified."""
+        coalescer, emitted = self.make_coalescer()
+        coalescer.add("file:created", "/p/.a.py.swp")
+        coalescer.add("file:modified", "/p/.a.py.swp")
+        coalescer.add("file:moved", "/p/.a.py.swp", {"dest_path": "/p/a.py"})
+
+        await coalescer.flush_all()
+
+        assert [(t, p) for t, p, _ in emitted] == [("file:modified", "/p/a.py")]
+        assert coalescer.get_stats()["suppressed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_created_then_deleted_is_dropped(self):
+        """A transient file produces no events at all."""
+        coalescer, emitted = self.make_coalescer()
+        coalescer.add("file:created", "/p/tmp.txt")
+        coalescer.add("file:modified", "/p/tmp.txt")
+        coalescer.add("file:deleted", "/p/tmp.txt")
+
+        await coalescer.flush_all()
+
+        assert emitted == []
+        assert coalescer.get_stats()["suppressed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_delete_then_create_is_modified(self):
+        """Atomic replace (delete + create) is reported as a modification."""
+        coalescer, emitted = self.make_coalescer()
+        coalescer.add("file:deleted", "/p/a.py")
+        coalescer.add("file:created", "/p/a.py")
+
+        await coalescer.flush_all()
+
+        assert [(t, p) for t, p, _ in emitted] == [("file:modified", "/p/a.py")]
+
+    @pytest.mark.asyncio
+    async def test_plain_move_passes_through(self):
+        """Moving an existing file keeps the moved event and destination."""
+        coalescer, emitted = self.make_coalescer()
+        coalescer.add("file:moved", "/p/old.py", {"dest_path": "/p/new.py"})
+        coalescer.add("file:modified", "/p/new.py")
+
+        await coalescer.flush_all()
+
+        assert len(emitted) == 1
+        event_type, path, extra = emitted[0]
+        assert (event_type, path, extra["dest_path"]) == (
+            "file:moved",
+            "/p/old.py",
+            "/p/new.py",
+        )
+        assert extra["coalesced"] == 2
+
+    @pytest.mark.asyncio
+    async def test_collector_routes_events_through_coalescer(self, tmp_path):
+        """Started collector coalesces and reports suppressed events."""
+        event_bus = EventBus()
+        event_bus.emit = AsyncMock()
+        collector = FileSystemCollector(
+            event_bus, config={"watch_paths": [str(tmp_path)], "debounce_ms": 20}
+        )
+        await collector.start()
+        try:
+            for _ in range(3):
+                collector._emit_event_sync("file:modified", str(tmp_path / "a.py"))
+            await asyncio.sleep(0.1)
+        finally:
+            await collector.stop()
+
+        assert event_bus.emit.call_count == 1
+        event = event_bus.emit.call_args[0][0]
+        assert event.payload["coalesced"] == 3
+        assert collector.get_stats()["suppressed"] == 2